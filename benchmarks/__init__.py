@@ -0,0 +1,14 @@
+"""Benchmarks of the hot paths of the
+PeonOrderSystem. Each module is a script that
+prints its results, run from the root of the
+repository with:
+
+    python -m benchmarks.<module>
+
+The benchmarks that build Gtk models need
+PyGObject, as the UI does.
+
+@author: Carl McGraw
+@contact: cjmcgraw@u.washington.edu
+@version: 1.0
+"""
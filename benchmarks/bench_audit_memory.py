@@ -0,0 +1,153 @@
+"""This module benchmarks the memory held by the
+orders that an audit decodes, for a year of
+stored orders.
+
+The orders are stored in an in memory database
+and decoded with get_stored_order_data, once as
+full MenuItems and once as the compact read only
+items that audits use.
+
+@author: Carl McGraw
+@contact: cjmcgraw@u.washington.edu
+@version: 1.0
+"""
+import random
+from copy import deepcopy
+from datetime import datetime, timedelta
+
+from peonordersystem.src.MenuItem import MenuItem, OptionItem
+from peonordersystem.src.confirmationSystem import ConfirmationSystem
+
+from benchmarks.timing import best_run, print_table
+from benchmarks.sizing import deep_size, megabytes
+
+NUM_OF_DAYS = 365
+
+ORDERS_PER_DAY = 40
+
+MAX_ITEMS_PER_ORDER = 8
+
+NUM_OF_MENU_ITEMS = 30
+
+OPTIONS_PER_MENU_ITEM = 8
+
+SEED = 30
+
+START_DATE = datetime(2014, 1, 1)
+
+
+def _generate_menu(rng):
+    """Private Function.
+
+    Generates the MenuItems of a menu, each with
+    its own option choices.
+
+    @param rng: random.Random object.
+
+    @return: list of MenuItem objects.
+    """
+    menu = []
+
+    for number in xrange(NUM_OF_MENU_ITEMS):
+        option_choices = [OptionItem('option ' + str(option_number), 'ADD',
+                                     rng.randint(0, 300) / 100.0)
+                          for option_number in xrange(OPTIONS_PER_MENU_ITEM)]
+        menu.append(MenuItem('item ' + str(number), rng.randint(500, 3000) / 100.0,
+                             option_choices=option_choices))
+
+    return menu
+
+
+def _generate_order(rng, menu):
+    """Private Function.
+
+    Generates an order of MenuItems from the
+    given menu, with options chosen from their
+    option choices.
+
+    @param rng: random.Random object.
+
+    @param menu: list of MenuItem objects.
+
+    @return: list of MenuItem objects.
+    """
+    order = []
+
+    for _ in xrange(rng.randint(1, MAX_ITEMS_PER_ORDER)):
+        menu_item = deepcopy(rng.choice(menu))
+        option_choices = menu_item.get_option_choices()
+        menu_item.options = rng.sample(option_choices, rng.randint(0, 3))
+        order.append(menu_item)
+
+    return order
+
+
+def _generate_database():
+    """Private Function.
+
+    Generates an in memory orders database with
+    a year of orders.
+
+    @return: sqlite3.Connection object.
+    """
+    rng = random.Random(SEED)
+    menu = _generate_menu(rng)
+    database = ConfirmationSystem._check_and_create_orders_database(':memory:')
+
+    for day in xrange(NUM_OF_DAYS):
+        for number in xrange(ORDERS_PER_DAY):
+            order_date = START_DATE + timedelta(days=day, hours=12,
+                                                minutes=number)
+            ConfirmationSystem._update_order_table(order_date,
+                                                   _generate_order(rng, menu),
+                                                   'table ' + str(number % 20),
+                                                   [], {}, database=database)
+
+    return database
+
+
+def _decode_orders(database, compact):
+    """Private Function.
+
+    Decodes every order stored in the database.
+
+    @param database: sqlite3.Connection object.
+
+    @param compact: bool value representing if the
+    orders are decoded as compact items.
+
+    @return: list of lists of MenuItem objects.
+    """
+    end_date = START_DATE + timedelta(days=NUM_OF_DAYS)
+    data = ConfirmationSystem.get_stored_order_data(START_DATE, end_date,
+                                                    database=database,
+                                                    compact=compact)
+    return [order_data.data for order_data in data]
+
+
+def main():
+    """Runs the benchmark.
+
+    @return: None
+    """
+    database = _generate_database()
+    rows = []
+
+    for compact in (False, True):
+        orders = _decode_orders(database, compact)
+        num_of_items = sum(len(order) for order in orders)
+
+        decode_time = best_run(lambda: (database, compact), _decode_orders, repeat=3)
+
+        rows.append(('compact' if compact else 'full',
+                     len(orders),
+                     num_of_items,
+                     megabytes(deep_size(orders)),
+                     decode_time))
+
+    print 'Memory held by {} days of decoded orders'.format(NUM_OF_DAYS)
+    print_table(('items', 'orders', 'menu items', 'memory (MB)', 'decode (s)'), rows)
+
+
+if __name__ == '__main__':
+    main()
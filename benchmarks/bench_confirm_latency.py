@@ -0,0 +1,127 @@
+"""This module benchmarks the latency of saving
+a confirmed order, as the file is written
+atomically and its directory is synced.
+
+Each writer saves its orders one after the other,
+as the UI does, and waits for each save to be
+durable. The directory syncs are made immediately,
+or batched with the other writers by group commit.
+
+@author: Carl McGraw
+@contact: cjmcgraw@u.washington.edu
+@version: 1.0
+"""
+import os
+import shutil
+import tempfile
+import threading
+import timeit
+
+import jsonpickle
+
+from peonordersystem.src.MenuItem import MenuItem
+from peonordersystem.src.AtomicWriter import atomic_write
+
+from benchmarks.timing import print_table
+
+NUM_OF_WRITERS = (1, 4, 16)
+
+WRITES_PER_WRITER = 20
+
+ITEMS_PER_ORDER = 10
+
+# keyword arguments of atomic_write for each sync mode
+SYNC_MODES = (('no directory sync', {'sync_directory': False}),
+              ('immediate sync', {'group_commit': False}),
+              ('group commit', {}))
+
+
+def _write_orders(directory, writer, data, latencies, **kwargs):
+    """Private Function.
+
+    Saves the given order data repeatedly,
+    recording the latency of each save.
+
+    @param directory: str representing the directory
+    the orders are saved in.
+
+    @param writer: int representing the writer, used
+    to name its files.
+
+    @param data: str representing the encoded order.
+
+    @param latencies: list that the latency of each
+    save is appended to, in seconds.
+
+    @return: None
+    """
+    for number in xrange(WRITES_PER_WRITER):
+        file_path = os.path.join(directory, '{}-{}'.format(writer, number))
+
+        start = timeit.default_timer()
+        atomic_write(file_path, data, **kwargs)
+        latencies.append(timeit.default_timer() - start)
+
+
+def _run_writers(num_of_writers, data, **kwargs):
+    """Private Function.
+
+    Runs the given number of writers at once.
+
+    @param num_of_writers: int
+
+    @param data: str representing the encoded order.
+
+    @return: 2-tuple of (list, float) representing
+    the latency of each save and the total time, in
+    seconds.
+    """
+    directory = tempfile.mkdtemp()
+    latencies = []
+
+    threads = [threading.Thread(target=_write_orders,
+                                args=(directory, writer, data, latencies),
+                                kwargs=kwargs)
+               for writer in xrange(num_of_writers)]
+
+    try:
+        start = timeit.default_timer()
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        return latencies, timeit.default_timer() - start
+    finally:
+        shutil.rmtree(directory)
+
+
+def main():
+    """Runs the benchmark.
+
+    @return: None
+    """
+    order = [MenuItem('item ' + str(number), 1.0 + number)
+             for number in xrange(ITEMS_PER_ORDER)]
+    data = jsonpickle.encode(order)
+    rows = []
+
+    for num_of_writers in NUM_OF_WRITERS:
+        for mode, kwargs in SYNC_MODES:
+            latencies, total_time = _run_writers(num_of_writers, data, **kwargs)
+            latencies.sort()
+
+            rows.append((num_of_writers, mode,
+                         sum(latencies) / len(latencies) * 1000,
+                         latencies[len(latencies) * 9 / 10] * 1000,
+                         len(latencies) / total_time))
+
+    print 'Latency of saving a confirmed order of {} items'.format(ITEMS_PER_ORDER)
+    print_table(('writers', 'sync', 'mean (ms)', '90th (ms)', 'saves per second'),
+                rows)
+
+
+if __name__ == '__main__':
+    main()
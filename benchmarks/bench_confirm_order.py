@@ -0,0 +1,113 @@
+"""This module benchmarks confirming orders of
+up to 500 MenuItems, with a fifth of them
+given priority.
+
+The confirmation is timed with the rows written
+out by OrderStore.flush, as they are on the next
+refresh. The priority matching is compared with
+the list membership and list.remove matching that
+it replaced, which compared MenuItems by value.
+
+@author: Carl McGraw
+@contact: cjmcgraw@u.washington.edu
+@version: 1.0
+"""
+from peonordersystem.src.MenuItem import MenuItem
+from peonordersystem.src.interface.Orders import Orders
+
+from benchmarks.timing import best_run, print_table
+
+NUM_OF_ITEMS = (10, 100, 500)
+
+PRIORITY_RATIO = 5
+
+
+def _list_priority_match(order_list, priority_order):
+    """Private Function.
+
+    Matches the priority MenuItems by list
+    membership and list.remove.
+
+    @param order_list: list of MenuItem objects.
+
+    @param priority_order: list of MenuItem objects.
+
+    @return: list of bool representing if each
+    MenuItem has priority.
+    """
+    matched = []
+
+    for menu_item in order_list:
+        has_priority = menu_item in priority_order
+
+        if has_priority:
+            priority_order.remove(menu_item)
+
+        matched.append(has_priority)
+
+    return matched
+
+
+def _generate_order(num_of_items):
+    """Private Function.
+
+    Generates an Orders object whose current
+    order holds the given number of MenuItems.
+
+    @param num_of_items: int
+
+    @return: 2-tuple of (Orders, list) representing
+    the Orders object and the priority MenuItems.
+    """
+    orders = Orders()
+    orders.set_current_table(0)
+
+    for number in xrange(num_of_items):
+        orders.add(MenuItem('item ' + str(number), 1.0 + number))
+
+    order_list = orders.get_current_order()
+    orders.current_order.flush()
+
+    return orders, order_list[::PRIORITY_RATIO]
+
+
+def _confirm(orders, priority_order):
+    """Private Function.
+
+    Confirms the current order and writes
+    out its rows.
+
+    @param orders: Orders object.
+
+    @param priority_order: list of MenuItem objects.
+
+    @return: None
+    """
+    orders.confirm_order(priority_order)
+    orders.current_order.flush()
+
+
+def main():
+    """Runs the benchmark.
+
+    @return: None
+    """
+    rows = []
+
+    for num_of_items in NUM_OF_ITEMS:
+
+        def setup():
+            orders, priority_order = _generate_order(num_of_items)
+            return list(orders.get_current_order()), priority_order
+
+        rows.append((num_of_items,
+                     best_run(lambda: _generate_order(num_of_items), _confirm) * 1000,
+                     best_run(setup, _list_priority_match) * 1000))
+
+    print 'Times in milliseconds per confirmation, 1 in {} items has ' \
+          'priority'.format(PRIORITY_RATIO)
+    print_table(('items', 'confirm order', 'list priority match'), rows)
+
+
+if __name__ == '__main__':
+    main()
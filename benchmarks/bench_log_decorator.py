@@ -0,0 +1,125 @@
+"""This module benchmarks the overhead of the
+log_func_data decorator on each call.
+
+A function is called directly, through the
+wrapper that only logs errors, and through the
+wrapper that traces each entry and exit, with
+the logger at the INFO and DEBUG levels. The
+records are placed on a queue and written by a
+QueueListener to a handler that discards them,
+so that only the cost to the caller is timed.
+
+@author: Carl McGraw
+@contact: cjmcgraw@u.washington.edu
+@version: 1.0
+"""
+import logging
+from Queue import Queue
+
+from peonordersystem.src import ErrorLogger
+from peonordersystem.src.ErrorLogger import QueueHandler, QueueListener
+
+from benchmarks.timing import best_time, print_table, microseconds
+
+NUM_OF_CALLS = 100000
+
+
+def _add(a, b):
+    """Private Function.
+
+    Function that is wrapped.
+
+    @return: int
+    """
+    return a + b
+
+
+def _generate_logger(level):
+    """Private Function.
+
+    Generates a logger that writes its records
+    through a queue to a handler that discards
+    them.
+
+    @param level: int representing the level
+    of the logger.
+
+    @return: 2-tuple of (logging.Logger, QueueListener)
+    """
+    log_queue = Queue()
+
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(asctime)s | %(levelname)s: '
+                                                 '%(message)s'))
+
+    new_logger = logging.getLogger('peon_benchmark_logger_' + str(level))
+    new_logger.setLevel(level)
+    new_logger.propagate = 0
+    new_logger.addHandler(queue_handler)
+
+    listener = QueueListener(log_queue, logging.NullHandler())
+    listener.start()
+
+    return new_logger, listener
+
+
+def _wrap(trace_calls):
+    """Private Function.
+
+    Wraps the function with log_func_data, as it
+    is wrapped when TRACE_CALLS is set to the
+    given value.
+
+    @param trace_calls: bool
+
+    @return: function
+    """
+    original = ErrorLogger.TRACE_CALLS
+    ErrorLogger.TRACE_CALLS = trace_calls
+
+    try:
+        return ErrorLogger.log_func_data(_add)
+    finally:
+        ErrorLogger.TRACE_CALLS = original
+
+
+def _time_call(func):
+    """Private Function.
+
+    Times a call of the given function.
+
+    @param func: function to be timed.
+
+    @return: float representing the time of a
+    call, in microseconds.
+    """
+    return microseconds(best_time(lambda: func(1, 2), number=NUM_OF_CALLS))
+
+
+def main():
+    """Runs the benchmark.
+
+    @return: None
+    """
+    original_logger = ErrorLogger.logger
+    rows = []
+
+    try:
+        for level in (logging.INFO, logging.DEBUG):
+            ErrorLogger.logger, listener = _generate_logger(level)
+
+            for name, func in (('direct call', _add),
+                               ('errors only', _wrap(False)),
+                               ('trace calls', _wrap(True))):
+                rows.append((logging.getLevelName(level), name, _time_call(func)))
+
+            listener.stop()
+    finally:
+        ErrorLogger.logger = original_logger
+
+    print 'Time per call in microseconds, over {} calls'.format(NUM_OF_CALLS)
+    print_table(('level', 'wrapper', 'time'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,179 @@
+"""This module benchmarks the signals that the
+order and reservation models emit as they are
+updated. Only the models are built, so no display
+is needed.
+
+Each row-changed signal makes an attached view
+redraw the row. The writes are coalesced through
+DirtyRows, so that each row emits at most one
+row-changed signal per refresh, and none if its
+values haven't changed. They are compared with
+writing each column of each row in turn, as the
+models did before.
+
+@author: Carl McGraw
+@contact: cjmcgraw@u.washington.edu
+@version: 1.0
+"""
+import random
+from collections import Counter
+from datetime import datetime, timedelta
+
+from peonordersystem.src.MenuItem import MenuItem
+from peonordersystem.src.interface.Orders import OrderStore
+from peonordersystem.src.interface.Reservations import Reserver, ReservationStore
+from peonordersystem.src.interface.RefreshScheduler import refresh_scheduler
+
+from benchmarks.timing import print_table
+
+NUM_OF_ROWS = (10, 100, 500)
+
+SIGNALS = ('row-changed', 'row-inserted', 'row-deleted')
+
+# the top level columns written for each MenuItem
+ORDER_COLUMNS = (0, 1, 3, 4, 5)
+
+SEED = 38
+
+
+class SignalCounter(object):
+    """Counts the signals emitted by
+    a model.
+    """
+
+    def __init__(self, model):
+        """Initializes the SignalCounter
+        and connects it to the model.
+
+        @param model: Gtk.TreeModel to be counted.
+        """
+        self.counts = Counter()
+
+        for signal in SIGNALS:
+            model.connect(signal, self._on_signal, signal)
+
+    def _on_signal(self, *args):
+        """Callback Method.
+
+        Counts the signal given as the
+        last argument.
+
+        @return: None
+        """
+        self.counts[args[-1]] += 1
+
+    def measure(self, func):
+        """Counts the signals emitted while the
+        given function runs and the pending
+        writes are refreshed.
+
+        @param func: function that takes no arguments.
+
+        @return: Counter of the signals emitted.
+        """
+        before = Counter(self.counts)
+        func()
+        refresh_scheduler.flush()
+        return self.counts - before
+
+
+def _write_columns(store):
+    """Private Function.
+
+    Writes each top level column of each row
+    of the given OrderStore in turn, with the
+    values already in the row.
+
+    @param store: OrderStore
+
+    @return: None
+    """
+    for row in store:
+        for column in ORDER_COLUMNS:
+            store.set_value(row.iter, column, row[column])
+
+
+def _measure_order(num_of_rows):
+    """Private Function.
+
+    Counts the signals of an OrderStore as
+    MenuItems are added, confirmed and updated.
+
+    @param num_of_rows: int
+
+    @return: list of tuple representing the
+    rows of the table.
+    """
+    store = OrderStore()
+    counter = SignalCounter(store)
+    menu_items = [MenuItem('item ' + str(number), 1.0) for number in
+                  xrange(num_of_rows)]
+
+    def add():
+        for menu_item in menu_items:
+            store.append(menu_item)
+
+    measurements = [('add items', counter.measure(add)),
+                    ('confirm order',
+                     counter.measure(lambda: store.confirm_order(
+                         store.get_iter_first(), menu_items[::5]))),
+                    ('update unchanged order', counter.measure(store.update_order)),
+                    ('write each column', counter.measure(
+                        lambda: _write_columns(store)))]
+
+    return [('order', num_of_rows, name) + tuple(counts[signal] for signal in SIGNALS)
+            for name, counts in measurements]
+
+
+def _measure_reservations(num_of_rows):
+    """Private Function.
+
+    Counts the signals of a ReservationStore as
+    reservations are added and their ETAs are
+    refreshed.
+
+    @param num_of_rows: int
+
+    @return: list of tuple representing the
+    rows of the table.
+    """
+    rng = random.Random(SEED)
+    start_time = datetime.now() + timedelta(hours=1)
+
+    store = ReservationStore()
+    counter = SignalCounter(store)
+    reservers = [Reserver(str(number), '555-0100',
+                          start_time + timedelta(minutes=rng.randint(0, 24 * 60)))
+                 for number in xrange(num_of_rows)]
+
+    def add():
+        for reserver in reservers:
+            store.add_reservation(reserver)
+
+    measurements = [('add reservations', counter.measure(add)),
+                    ('refresh ETAs', counter.measure(store._update_eta))]
+
+    return [('reservations', num_of_rows, name) +
+            tuple(counts[signal] for signal in SIGNALS)
+            for name, counts in measurements]
+
+
+def main():
+    """Runs the benchmark.
+
+    @return: None
+    """
+    rows = []
+
+    for num_of_rows in NUM_OF_ROWS:
+        rows.extend(_measure_order(num_of_rows))
+
+    for num_of_rows in NUM_OF_ROWS:
+        rows.extend(_measure_reservations(num_of_rows))
+
+    print 'Signals emitted by the models'
+    print_table(('model', 'rows', 'update') + SIGNALS, rows)
+
+
+if __name__ == '__main__':
+    main()
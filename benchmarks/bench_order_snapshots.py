@@ -0,0 +1,169 @@
+"""This module benchmarks the time and memory
+that the split check dialog spends on the order
+of a large tab, with three options per MenuItem.
+
+Opening the dialog on an OrderSnapshot is compared
+with copying every MenuItem, and splitting every
+MenuItem into shallow copies is compared with the
+deep copies that it replaced. The memory is that
+held by the new objects, not the order itself.
+
+@author: Carl McGraw
+@contact: cjmcgraw@u.washington.edu
+@version: 1.0
+"""
+from copy import copy, deepcopy
+
+from peonordersystem.src.MenuItem import MenuItem, OptionItem
+from peonordersystem.src.OrderSnapshot import OrderSnapshot
+
+from benchmarks.timing import best_time, print_table
+from benchmarks.sizing import deep_size
+
+NUM_OF_ITEMS = (100, 500, 2000)
+
+OPTIONS_PER_ITEM = 3
+
+NUM_OF_SHARES = 2
+
+
+def _generate_order(num_of_items):
+    """Private Function.
+
+    Generates an order of the given number of
+    MenuItems.
+
+    @param num_of_items: int
+
+    @return: list of MenuItem objects.
+    """
+    order_list = []
+
+    for number in xrange(num_of_items):
+        menu_item = MenuItem('item ' + str(number), 1.0 + number)
+        menu_item.options = [OptionItem('option ' + str(option), 'ADD', .5)
+                             for option in xrange(OPTIONS_PER_ITEM)]
+        order_list.append(menu_item)
+
+    return order_list
+
+
+def _copy_order(order_list):
+    """Private Function.
+
+    Copies every MenuItem of the order, as
+    the dialog did when it was opened.
+
+    @param order_list: list of MenuItem objects.
+
+    @return: list of MenuItem objects.
+    """
+    order_copy = []
+
+    for menu_item in order_list:
+        menu_item = copy(menu_item)
+        menu_item._hash = hash(menu_item)
+        order_copy.append(menu_item)
+
+    return order_copy
+
+
+def _snapshot_order(order_list):
+    """Private Function.
+
+    Takes a snapshot of the order, as the
+    dialog does when it is opened.
+
+    @param order_list: list of MenuItem objects.
+
+    @return: list of MenuItem objects.
+    """
+    return OrderSnapshot(order_list).get_items()
+
+
+def _split_order(order_list, copy_func):
+    """Private Function.
+
+    Splits every MenuItem of the order into
+    shares, as the dialog does when every
+    MenuItem is split between checks.
+
+    @param order_list: list of MenuItem objects.
+
+    @param copy_func: function that copies a
+    MenuItem.
+
+    @return: list of MenuItem objects.
+    """
+    shares = []
+
+    for menu_item in order_list:
+        cost = menu_item.get_price() / NUM_OF_SHARES
+
+        for _ in xrange(NUM_OF_SHARES):
+            share = copy_func(menu_item)
+            share.edit_price(cost)
+            shares.append(share)
+
+    return shares
+
+
+def _get_added_size(order_list, func):
+    """Private Function.
+
+    Gets the memory held by the objects that
+    the given function creates from the order.
+
+    @param order_list: list of MenuItem objects.
+
+    @param func: function that takes the order.
+
+    @return: float representing the size in
+    kilobytes.
+    """
+    added_size = deep_size((order_list, func(order_list))) - deep_size(order_list)
+    return added_size / 1024.0
+
+
+def main():
+    """Runs the benchmark.
+
+    @return: None
+    """
+    open_rows = []
+    split_rows = []
+
+    for num_of_items in NUM_OF_ITEMS:
+        order_list = _generate_order(num_of_items)
+
+        def deep_split(order):
+            return _split_order(order, deepcopy)
+
+        def shallow_split(order):
+            return _split_order(order, copy)
+
+        open_rows.append((num_of_items,
+                          best_time(lambda: _copy_order(order_list)) * 1000,
+                          best_time(lambda: _snapshot_order(order_list)) * 1000,
+                          _get_added_size(order_list, _copy_order),
+                          _get_added_size(order_list, _snapshot_order)))
+
+        split_rows.append((num_of_items,
+                           best_time(lambda: deep_split(order_list)) * 1000,
+                           best_time(lambda: shallow_split(order_list)) * 1000,
+                           _get_added_size(order_list, deep_split),
+                           _get_added_size(order_list, shallow_split)))
+
+    print 'Opening the split check dialog, times in milliseconds, memory in KB'
+    print_table(('items', 'copy time', 'snapshot time', 'copy memory',
+                 'snapshot memory'), open_rows)
+
+    print
+    print 'Splitting every item in {}, times in milliseconds, memory in ' \
+          'KB'.format(NUM_OF_SHARES)
+    print_table(('items', 'deepcopy time', 'copy time', 'deepcopy memory',
+                 'copy memory'), split_rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""This module benchmarks laying out and rendering
+the items of a receipt of 10, 100 and 500 items,
+and the size of the rendered PDF.
+
+The items are laid out as a single table and as a
+table for each item. A third of the item names wrap
+onto a second line and half of the items have
+options.
+
+@author: Carl McGraw
+@contact: cjmcgraw@u.washington.edu
+@version: 1.0
+"""
+import random
+from io import BytesIO
+
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import Frame
+
+from peonordersystem.src.MenuItem import MenuItem, OptionItem
+from peonordersystem.src.confirmationSystem.printers.formatters.PrinterSettings \
+    import DEFAULT_FRONT_PRINTER_WIDTH
+from peonordersystem.src.confirmationSystem.printers.formatters.containers.\
+    components.ItemsTable import ItemsTable
+
+from benchmarks.timing import best_time, print_table
+
+NUM_OF_ITEMS = (10, 100, 500)
+
+LONG_NAME = 'Slow Roasted Pork Shoulder with Seasonal Vegetables'
+
+SEED = 41
+
+
+def _generate_items(num_of_items):
+    """Private Function.
+
+    Generates the items of a receipt.
+
+    @param num_of_items: int
+
+    @return: list of MenuItem objects.
+    """
+    rng = random.Random(SEED)
+    items = []
+
+    for number in xrange(num_of_items):
+        name = LONG_NAME if number % 3 == 0 else 'Item ' + str(number)
+        menu_item = MenuItem(name, rng.randint(500, 3000) / 100.0)
+
+        if number % 2 == 0:
+            menu_item.options = [OptionItem('extra sauce', 'ADD', .5),
+                                 OptionItem('onions', 'NO', 0.0)]
+
+        items.append(menu_item)
+
+    return items
+
+
+def _render(items, single_table):
+    """Private Function.
+
+    Lays out the items and renders them to
+    a PDF held in memory.
+
+    @param items: list of MenuItem objects.
+
+    @param single_table: bool value representing
+    if the items are laid out as a single table.
+
+    @return: int representing the size of the
+    PDF in bytes.
+    """
+    items_table = ItemsTable(items, single_table=single_table)
+    page_height = items_table.height + 72
+
+    pdf = BytesIO()
+    canvas = Canvas(pdf, pagesize=(DEFAULT_FRONT_PRINTER_WIDTH, page_height))
+    frame = Frame(0, 0, DEFAULT_FRONT_PRINTER_WIDTH, page_height)
+
+    frame.addFromList(items_table.flowables, canvas)
+    canvas.save()
+
+    return len(pdf.getvalue())
+
+
+def main():
+    """Runs the benchmark.
+
+    @return: None
+    """
+    rows = []
+
+    for num_of_items in NUM_OF_ITEMS:
+        items = _generate_items(num_of_items)
+
+        for single_table in (False, True):
+            rows.append((num_of_items,
+                         'single table' if single_table else 'table per item',
+                         best_time(lambda: _render(items, single_table),
+                                   repeat=3) * 1000,
+                         _render(items, single_table) / 1024.0))
+
+    print 'Layout and render of the receipt items'
+    print_table(('items', 'layout', 'time (ms)', 'PDF size (KB)'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,143 @@
+"""This module benchmarks the reservations with
+thousands of reservations made over the next
+week.
+
+The ReservationStore is timed as the reservations
+are added and on each timeout, where the ETAs are
+refreshed and the upcoming reservations are moved
+to the notifications. The timeout is compared with
+the scan over every reservation that it replaced.
+The ReservationsRepository is timed importing the
+reservations and querying them from an in memory
+database.
+
+@author: Carl McGraw
+@contact: cjmcgraw@u.washington.edu
+@version: 1.0
+"""
+import random
+import sqlite3
+from datetime import datetime, timedelta
+
+from peonordersystem.src.Settings import (RESERVATION_NOTIFICATION_TIME_MAX,
+                                          RESERVATION_NOTIFICATION_TIME_MIN)
+from peonordersystem.src.interface.Reservations import Reserver, ReservationStore
+from peonordersystem.src.confirmationSystem.ReservationsRepository import \
+    ReservationsRepository
+
+from benchmarks.timing import best_time, best_run, print_table
+
+NUM_OF_RESERVATIONS = (1000, 5000, 10000)
+
+SEED = 36
+
+
+def _scan_notifications(reservation_list, notifications):
+    """Private Function.
+
+    Finds the reservations that have entered
+    the notification window by checking every
+    reservation.
+
+    @param reservation_list: list of Reserver objects.
+
+    @param notifications: list of Reserver objects
+    that have been found.
+
+    @return: None
+    """
+    for reserver in reservation_list:
+        until_reservation = reserver.get_time_until_arrival()
+
+        if (until_reservation <= RESERVATION_NOTIFICATION_TIME_MAX) and \
+           (until_reservation > RESERVATION_NOTIFICATION_TIME_MIN) and \
+           (reserver not in notifications):
+            notifications.append(reserver)
+
+
+def _generate_reservers(num_of_reservations):
+    """Private Function.
+
+    Generates reservations at random times
+    over the next week.
+
+    @param num_of_reservations: int
+
+    @return: list of Reserver objects.
+    """
+    rng = random.Random(SEED)
+    start_time = datetime.now() + timedelta(minutes=1)
+
+    return [Reserver('reserver ' + str(number), '555-0100',
+                     start_time + timedelta(minutes=rng.randint(0, 7 * 24 * 60)))
+            for number in xrange(num_of_reservations)]
+
+
+def _add_reservations(reservers):
+    """Private Function.
+
+    Adds the given reservations to a
+    new ReservationStore.
+
+    @param reservers: list of Reserver objects.
+
+    @return: ReservationStore
+    """
+    store = ReservationStore()
+
+    for reserver in reservers:
+        store.add_reservation(reserver)
+
+    return store
+
+
+def _on_timeout(store):
+    """Private Function.
+
+    Runs the timeout of the given ReservationStore
+    and writes out the refreshed rows.
+
+    @param store: ReservationStore
+
+    @return: None
+    """
+    store._on_timeout()
+    store._dirty_rows.flush()
+
+
+def main():
+    """Runs the benchmark.
+
+    @return: None
+    """
+    rows = []
+
+    for num_of_reservations in NUM_OF_RESERVATIONS:
+        reservers = _generate_reservers(num_of_reservations)
+        store = _add_reservations(reservers)
+        notifications = []
+
+        repository = ReservationsRepository(sqlite3.connect(':memory:'))
+        import_time = best_run(lambda: (reservers,), repository.bulk_import,
+                               repeat=3)
+        start_time = datetime.now()
+
+        rows.append((num_of_reservations,
+                     best_run(lambda: (reservers,), _add_reservations,
+                              repeat=3) * 1000,
+                     best_time(lambda: _on_timeout(store), repeat=3) * 1000,
+                     best_time(lambda: _scan_notifications(reservers, notifications),
+                               repeat=3) * 1000,
+                     import_time * 1000,
+                     best_time(lambda: repository.get_next_hours(3, start_time))
+                     * 1000,
+                     best_time(lambda: repository.get_page(
+                         start_time, start_time + timedelta(days=7), 0)) * 1000))
+
+    print 'Times in milliseconds'
+    print_table(('reservations', 'add all', 'timeout', 'scanned timeout',
+                 'import all', 'next 3 hours', 'first page'), rows)
+
+
+if __name__ == '__main__':
+    main()
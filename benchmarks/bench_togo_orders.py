@@ -0,0 +1,105 @@
+"""This module benchmarks the actions of the
+Orders object that look up the current order,
+with up to 200 togo orders open at once.
+
+The key of the current order and the names of
+the non-empty orders are compared with a scan
+over both order dicts, as they were found before
+Orders kept an index of its OrderStores. The
+indexed times stay flat as togo orders are
+added.
+
+@author: Carl McGraw
+@contact: cjmcgraw@u.washington.edu
+@version: 1.0
+"""
+from peonordersystem.src.MenuItem import MenuItem
+from peonordersystem.src.interface.Orders import Orders
+
+from benchmarks.timing import best_time, print_table, microseconds
+
+NUM_OF_TOGO_ORDERS = (10, 50, 100, 200)
+
+ITEMS_PER_ORDER = 5
+
+
+def _scan_order_key(orders):
+    """Private Function.
+
+    Finds the key of the current order by
+    scanning both order dicts.
+
+    @param orders: Orders object.
+
+    @return: str or tuple representing the key.
+    """
+    for order_dict in (orders.orders_dict, orders.to_go_dict):
+        for key, value in order_dict.iteritems():
+            if value is orders.current_order:
+                return key
+
+    return None
+
+
+def _scan_order_names(orders):
+    """Private Function.
+
+    Finds the keys of the non-empty orders by
+    scanning both order dicts.
+
+    @param orders: Orders object.
+
+    @return: list of keys.
+    """
+    return [name for name, model in
+            orders.orders_dict.items() + orders.to_go_dict.items()
+            if len(model)]
+
+
+def _generate_orders(num_of_togo_orders):
+    """Private Function.
+
+    Generates an Orders object with the given
+    number of togo orders open. The last togo
+    order is selected.
+
+    @param num_of_togo_orders: int
+
+    @return: Orders object.
+    """
+    orders = Orders()
+
+    for number in xrange(num_of_togo_orders):
+        orders.select_togo_order(('togo', str(number), '12:00'))
+
+        for item_number in xrange(ITEMS_PER_ORDER):
+            orders.add(MenuItem('item ' + str(item_number), 1.0))
+
+    return orders
+
+
+def main():
+    """Runs the benchmark.
+
+    @return: None
+    """
+    rows = []
+
+    for num_of_togo_orders in NUM_OF_TOGO_ORDERS:
+        orders = _generate_orders(num_of_togo_orders)
+
+        rows.append((num_of_togo_orders,
+                     microseconds(best_time(orders._get_order_key, 1000)),
+                     microseconds(best_time(lambda: _scan_order_key(orders), 1000)),
+                     microseconds(best_time(lambda: list(orders), 100)),
+                     microseconds(best_time(lambda: _scan_order_names(orders), 100)),
+                     microseconds(best_time(orders.get_order_info, 1000))))
+
+    print 'Times in microseconds per call, with {} items per order'.format(
+        ITEMS_PER_ORDER)
+    print_table(('togo orders', 'order key', 'scanned key', 'order names',
+                 'scanned names', 'order info'), rows)
+
+
+if __name__ == '__main__':
+    main()
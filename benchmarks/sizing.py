@@ -0,0 +1,64 @@
+"""This module provides the helper function
+that the benchmarks use to measure the memory
+held by objects.
+
+@author: Carl McGraw
+@contact: cjmcgraw@u.washington.edu
+@version: 1.0
+"""
+import sys
+import types
+
+# objects that are shared by the whole program, and not counted
+_SHARED_TYPES = (type, types.ModuleType, types.FunctionType,
+                 types.BuiltinFunctionType, types.ClassType)
+
+
+def deep_size(obj):
+    """Gets the memory held by the given object
+    and every object it references. Objects that
+    are referenced more than once are counted once.
+
+    @param obj: object to be measured.
+
+    @return: int representing the size in bytes.
+    """
+    seen = set()
+    pending = [obj]
+    size = 0
+
+    while pending:
+        current = pending.pop()
+
+        if id(current) in seen or isinstance(current, _SHARED_TYPES):
+            continue
+
+        seen.add(id(current))
+        size += sys.getsizeof(current)
+
+        if isinstance(current, dict):
+            pending.extend(current.iterkeys())
+            pending.extend(current.itervalues())
+
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            pending.extend(current)
+
+        if hasattr(current, '__dict__'):
+            pending.append(current.__dict__)
+
+        for slot in getattr(type(current), '__slots__', ()):
+            if hasattr(current, slot):
+                pending.append(getattr(current, slot))
+
+    return size
+
+
+def megabytes(num_of_bytes):
+    """Converts the given bytes to
+    megabytes.
+
+    @param num_of_bytes: int
+
+    @return: float
+    """
+    return num_of_bytes / float(2 ** 20)
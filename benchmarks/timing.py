@@ -0,0 +1,102 @@
+"""This module provides the helper functions
+that the benchmarks use to time and report
+their results.
+
+@author: Carl McGraw
+@contact: cjmcgraw@u.washington.edu
+@version: 1.0
+"""
+import timeit
+
+
+def best_time(func, number=1, repeat=5):
+    """Times the given function.
+
+    @param func: function that takes no arguments.
+
+    @keyword number: int representing the number
+    of calls timed together. Default is 1.
+
+    @keyword repeat: int representing the number of
+    times the calls are timed. Default is 5.
+
+    @return: float representing the best time of a
+    single call, in seconds.
+    """
+    timer = timeit.Timer(func)
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def print_table(header, rows):
+    """Prints the given rows as a table.
+
+    @param header: tuple of str representing the
+    column names.
+
+    @param rows: list of tuple representing the
+    values of each row.
+
+    @return: None
+    """
+    rows = [tuple(_format(value) for value in row) for row in rows]
+    widths = [max(len(str(value)) for value in column)
+              for column in zip(header, *rows)]
+
+    for row in [header] + rows:
+        print '  '.join(str(value).rjust(width) for
+                        value, width in zip(row, widths))
+
+
+def _format(value):
+    """Private Function.
+
+    Formats the given value for the table.
+
+    @param value: object to be formatted.
+
+    @return: str
+    """
+    if isinstance(value, float):
+        return '{:.2f}'.format(value)
+
+    return str(value)
+
+
+def microseconds(seconds):
+    """Converts the given seconds to
+    microseconds.
+
+    @param seconds: float
+
+    @return: float
+    """
+    return seconds * 10 ** 6
+
+
+def best_run(setup, func, repeat=5):
+    """Times the given function on fresh
+    arguments, for functions that change
+    their arguments.
+
+    @param setup: function that takes no arguments
+    and returns a tuple of the arguments of func.
+    It is not timed.
+
+    @param func: function to be timed.
+
+    @keyword repeat: int representing the number of
+    times the function is timed. Default is 5.
+
+    @return: float representing the best time of a
+    single call, in seconds.
+    """
+    times = []
+
+    for _ in xrange(repeat):
+        args = setup()
+
+        start = timeit.default_timer()
+        func(*args)
+        times.append(timeit.default_timer() - start)
+
+    return min(times)
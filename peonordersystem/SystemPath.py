@@ -16,6 +16,7 @@ SYSTEM_AUDIT_PATH = join(SYSTEM_DATA_PATH, 'audit')
 
 SYSTEM_TEMPLATE_PATH = join(SYSTEM_DATA_PATH, 'templates')
 SYSTEM_TEMP_PATH = join(SYSTEM_DATA_PATH, 'temp')
+SYSTEM_PRINT_SPOOL_PATH = join(SYSTEM_TEMP_PATH, 'spool')
 SYSTEM_MEDIA_PATH = join(SYSTEM_DATA_PATH, 'media')
 SYSTEM_FONT_PATH = join(SYSTEM_MEDIA_PATH, 'fonts')
 
@@ -28,6 +29,7 @@ SYSTEM_TEMPLATE_RECEIPT_MAIN_PATH = join(SYSTEM_TEMPLATE_RECEIPT_PATH, 'main')
 
 SYSTEM_ORDERS_CONFIRMED_DIRECTORY = join(SYSTEM_ORDERS_PATH, 'Confirmed')
 SYSTEM_ORDERS_CHECKOUT_DIRECTORY = join(SYSTEM_ORDERS_PATH, 'Checkout')
+SYSTEM_ORDERS_JOURNAL = join(SYSTEM_ORDERS_PATH, 'Orders.journal')
 
 SYSTEM_DATABASE_PATH = join(SYSTEM_DATA_PATH, 'databases')
 SYSTEM_ORDERS_DATABASE = join(SYSTEM_DATABASE_PATH, 'Orders.db')
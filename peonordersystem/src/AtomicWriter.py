@@ -0,0 +1,232 @@
+"""This module provides functions that are used
+to write files atomically and durably. Data is
+written to a temporary file in the same directory
+as the target, flushed to disk and then renamed
+over the target. A crash mid-write therefore
+leaves either the previous contents or the new
+contents, never a truncated file.
+
+Directory syncs, which make the rename itself
+durable, may be batched so that writes made at
+the same time share a single sync. A batched
+write still returns only once its sync is done.
+
+@author: Carl McGraw
+@contact: cjmcgraw( at )u.washington.edu
+@version: 1.0
+"""
+import os
+import tempfile
+import threading
+
+TEMP_FILE_PREFIX = '.'
+TEMP_FILE_SUFFIX = '.tmp'
+
+
+def atomic_write(file_path, data, sync_directory=True, group_commit=True):
+    """Writes the given data to the given
+    file path atomically.
+
+    @param file_path: str representing the path
+    to the file that is to be written.
+
+    @param data: str representing the data to be
+    written.
+
+    @keyword sync_directory: bool value representing
+    if the directory containing the file should be
+    synced so that the rename is durable. Default
+    is True.
+
+    @keyword group_commit: bool value representing
+    if the directory sync should be batched with other
+    pending directory syncs rather than performed
+    immediately. In both cases the directory has been
+    synced when this function returns. Default is True.
+
+    @return: None
+    """
+    directory = os.path.dirname(os.path.abspath(file_path))
+    temp_path = _write_temp_file(directory, data)
+
+    try:
+        _set_file_mode(file_path, temp_path)
+        os.rename(temp_path, file_path)
+    except OSError:
+        os.remove(temp_path)
+        raise
+
+    if sync_directory:
+        if group_commit:
+            directory_syncer.request_sync(directory)
+        else:
+            sync_directory_now(directory)
+
+
+def _write_temp_file(directory, data):
+    """Private Function.
+
+    Writes the given data in a single write
+    to a new temporary file in the given
+    directory and flushes it to disk.
+
+    @param directory: str representing the
+    directory the temporary file is created in.
+
+    @param data: str representing the data
+    to be written.
+
+    @return: str representing the path to the
+    temporary file.
+    """
+    file_descriptor, temp_path = tempfile.mkstemp(prefix=TEMP_FILE_PREFIX,
+                                                  suffix=TEMP_FILE_SUFFIX,
+                                                  dir=directory)
+    try:
+        with os.fdopen(file_descriptor, 'wb') as temp_file:
+            temp_file.write(data)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+    except Exception:
+        os.remove(temp_path)
+        raise
+
+    return temp_path
+
+
+def _set_file_mode(file_path, temp_path):
+    """Private Function.
+
+    Sets the permissions of the temporary file
+    to those of the file it will replace, or to
+    the default permissions for a new file if
+    it doesn't exist.
+
+    @param file_path: str representing the path
+    to the file that is to be replaced.
+
+    @param temp_path: str representing the path
+    to the temporary file.
+
+    @return: None
+    """
+    try:
+        mode = os.stat(file_path).st_mode & 0777
+    except OSError:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0666 & ~umask
+
+    os.chmod(temp_path, mode)
+
+
+def sync_directory_now(directory):
+    """Syncs the given directory so that
+    any renames performed in it are durable.
+
+    @note: Platforms that do not support
+    syncing directories are ignored.
+
+    @param directory: str representing the
+    directory to be synced.
+
+    @return: None
+    """
+    try:
+        directory_descriptor = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+
+    try:
+        os.fsync(directory_descriptor)
+    except OSError:
+        pass
+    finally:
+        os.close(directory_descriptor)
+
+
+class DirectorySyncer(object):
+    """Batches directory sync requests. The first
+    request syncs its directory at once, and the
+    requests made while a sync is running are
+    collected and synced together by the next.
+    Each request waits until the batch that
+    covers it has been synced.
+    """
+
+    def __init__(self):
+        """Initializes the DirectorySyncer."""
+        self._pending = set()
+        self._condition = threading.Condition()
+        self._is_syncing = False
+
+        # the batch that is collecting requests, and the last synced batch
+        self._batch = 1
+        self._synced_batch = 0
+
+    def request_sync(self, directory):
+        """Requests that the given directory
+        be synced with the next batch, and waits
+        until that batch has been synced.
+
+        @param directory: str representing the
+        directory to be synced.
+
+        @return: None
+        """
+        with self._condition:
+            self._pending.add(directory)
+            batch = self._batch
+
+            while self._synced_batch < batch:
+                if self._is_syncing:
+                    self._condition.wait()
+                else:
+                    # no sync is running, so this request syncs the batch
+                    self._sync_batch()
+
+    def flush(self):
+        """Syncs all pending directories
+        immediately.
+
+        @return: None
+        """
+        with self._condition:
+            while self._is_syncing:
+                self._condition.wait()
+
+            if self._pending:
+                self._sync_batch()
+
+    def _sync_batch(self):
+        """Private Method.
+
+        Syncs the pending directories as a
+        batch, and wakes the requests that
+        were waiting on them.
+
+        @note: The condition must be held when
+        this method is called. It is released
+        while the directories are synced.
+
+        @return: None
+        """
+        pending = self._pending
+        batch = self._batch
+
+        self._pending = set()
+        self._batch += 1
+        self._is_syncing = True
+
+        self._condition.release()
+        try:
+            for directory in pending:
+                sync_directory_now(directory)
+        finally:
+            self._condition.acquire()
+            self._is_syncing = False
+            self._synced_batch = batch
+            self._condition.notify_all()
+
+
+directory_syncer = DirectorySyncer()
@@ -2,16 +2,148 @@
 that calculate the total and taxes on any
 given check.
 
+Amounts are summed as integer cents, so that
+totals are exact. The float functions convert
+their results from cents.
+
+The tax of an order is calculated by the tax
+engine, which taxes each tax class of items at
+its own rate.
+
 @author: Carl McGraw
 @contact: cjmcgraw@u.washington.edu
 @version: 1.0
 """
-import math
+from decimal import Decimal, ROUND_HALF_UP
+from fractions import Fraction
+
+from Settings import SALES_TAX, ORDER_TYPE_STANDARD
+from .TaxEngine import tax_engine
+
+# exact rate of the SALES_TAX, as the float is inexact.
+SALES_TAX_RATE = Fraction(repr(SALES_TAX))
+
+CENT = Decimal('0.01')
+
+
+#====================================================================================
+# This block represents functions that convert amounts to and from integer cents.
+#====================================================================================
+def to_cents(amount):
+    """Converts the given amount to integer
+    cents. Amounts are rounded to the nearest
+    cent, with half cents rounded away from
+    zero.
+
+    @param amount: float, int or Decimal
+    representing the amount in dollars.
+
+    @return: int representing the amount
+    in cents.
+    """
+    if not isinstance(amount, Decimal):
+        cents = round(amount * 100)
+
+        # amounts that are whole cents are converted without a Decimal
+        if abs(amount * 100 - cents) < 1e-6:
+            return int(cents)
+
+        amount = Decimal(repr(amount))
+
+    return int(amount.quantize(CENT, rounding=ROUND_HALF_UP) * 100)
+
+
+def from_cents(cents):
+    """Converts the given integer cents to
+    an amount in dollars.
+
+    @param cents: int representing the amount
+    in cents.
+
+    @return: float representing the amount
+    in dollars.
+    """
+    return cents / 100.0
+
+
+#====================================================================================
+# This block represents functions that calculate the totals in integer cents.
+#====================================================================================
+def get_totals_cents(order_list, order_type=ORDER_TYPE_STANDARD):
+    """Gets the totals of the given
+    order list in integer cents.
+
+    @param order_list: list of MenuItem
+    objects representing the data to parse.
+
+    @keyword order_type: str representing the
+    type of the order. Default is
+    ORDER_TYPE_STANDARD.
+
+    @return: three tuple of (int, int, int)
+    representing the subtotal, tax, and total
+    in cents respectively.
+    """
+    class_subtotals, discount = tax_engine.get_order_subtotals_cents(order_list)
+    taxed_subtotals = tax_engine.allocate_discount_cents(class_subtotals, discount)
+    tax_breakdown = tax_engine.get_tax_breakdown_cents(taxed_subtotals,
+                                                       order_type)
+
+    subtotal = sum(class_subtotals.itervalues()) + discount
+    tax = sum(tax_breakdown.itervalues())
+
+    return subtotal, tax, subtotal + tax
+
 
-from Settings import SALES_TAX
+def get_tax_breakdown_cents(order_list, order_type=ORDER_TYPE_STANDARD):
+    """Gets the tax of each tax class of
+    the given order list in integer cents.
 
+    @param order_list: list of MenuItem
+    objects representing the data to parse.
 
-def get_totals(order_list):
+    @keyword order_type: str representing the
+    type of the order. Default is
+    ORDER_TYPE_STANDARD.
+
+    @return: dict of str tax classes mapped
+    to the int tax of the class in cents.
+    """
+    class_subtotals = tax_engine.get_class_subtotals_cents(order_list)
+    return tax_engine.get_tax_breakdown_cents(class_subtotals, order_type)
+
+
+def get_order_subtotal_cents(order_list):
+    """Gets the subtotal of the given
+    order list in integer cents.
+
+    @param order_list: list of MenuItems
+    that comprise an order.
+
+    @return: int representing the sum of
+    each MenuItem's price in cents.
+    """
+    return sum(menu_item.get_price_cents() for menu_item in order_list)
+
+
+def get_total_tax_cents(subtotal):
+    """Gets the tax to be added to the given
+    subtotal in integer cents, at the SALES_TAX
+    rate. The tax is rounded up to the next cent.
+
+    @param subtotal: int representing the
+    subtotal in cents.
+
+    @return: int representing the tax in
+    cents.
+    """
+    return -(-subtotal * SALES_TAX_RATE.numerator // SALES_TAX_RATE.denominator)
+
+
+#====================================================================================
+# This block represents functions that calculate the totals in dollars.
+#====================================================================================
+def get_totals(order_list, order_type=ORDER_TYPE_STANDARD):
     """Gets a tuple of totals
     that represent the totals
     associated with the given
@@ -21,57 +153,75 @@ def get_totals(order_list):
     MenuItem objects representing
     the data to parse.
 
+    @keyword order_type: str
+    representing the type of the
+    order. Default is
+    ORDER_TYPE_STANDARD.
+
     @return: three tuple of
     (float, float, float)
     representing the subtotal,
     tax, and total respectively.
     """
-    subtotal = get_order_subtotal(order_list)
-    tax = get_total_tax(subtotal)
+    totals = get_totals_cents(order_list, order_type)
+    return tuple(from_cents(cents) for cents in totals)
+
 
-    return subtotal, tax, round(subtotal + tax, 2)
+def get_tax_breakdown(order_list, order_type=ORDER_TYPE_STANDARD):
+    """Gets the tax of each tax class
+    of the given order list.
+
+    @param order_list: list of MenuItem
+    objects representing the data to parse.
+
+    @keyword order_type: str representing the
+    type of the order. Default is
+    ORDER_TYPE_STANDARD.
+
+    @return: dict of str tax classes mapped
+    to the float tax of the class.
+    """
+    tax_breakdown = get_tax_breakdown_cents(order_list, order_type)
+    return dict((tax_class, from_cents(tax)) for
+                tax_class, tax in tax_breakdown.iteritems())
 
 
 def get_order_subtotal(order_list):
     """Gets the current subtotal of the given
-    order_list. 
-    
+    order_list.
+
     @param order_list: list of MenuItems that comprise
     an order.
-    
+
     @return: double value representing the subtotal obtained
     by combining each MenuItem's price.
     """
-    total = 0.0
-    
-    for menu_item in order_list:
-        total = total + menu_item.get_price()
-        
-    return round(total, 2)
+    return from_cents(get_order_subtotal_cents(order_list))
 
 
 def get_total_tax(subtotal):
     """Gets the total tax to be added from
-    a given subtotal.
-    
-    @param subtotal: double representing the 
+    a given subtotal, at the SALES_TAX rate.
+
+    @param subtotal: double representing the
     subtotal of an order.
-    
+
     @return: double representing the tax to be added
     to the total.
     """
-    tax = math.ceil(subtotal * SALES_TAX * 100) / 100
-    return round(tax, 2)
+    return from_cents(get_total_tax_cents(to_cents(subtotal)))
 
 
-def get_total(order_list):
+def get_total(order_list, order_type=ORDER_TYPE_STANDARD):
     """Gets the total of the order, tax included.
-    
+
     @param order_list: list of MenuItem objects that
     comprise an order.
-    
+
+    @keyword order_type: str representing the type of
+    the order. Default is ORDER_TYPE_STANDARD.
+
     @return: double representing the total value to be
     charged to the customer
     """
-    sub_total = get_order_subtotal(order_list)
-    return sub_total + get_total_tax(sub_total)
\ No newline at end of file
+    return from_cents(get_totals_cents(order_list, order_type)[2])
@@ -12,24 +12,147 @@ the method.
 import traceback
 import logging
 import inspect
+import atexit
+import time
+from Queue import Queue
+from threading import Thread
+from logging.handlers import RotatingFileHandler
 
 from peonordersystem.SystemPath import SYSTEM_LOG_PATH
+from .Settings import (LOG_LEVEL, LOG_FILE_NAME, LOG_MAX_BYTES,
+                       LOG_BACKUP_COUNT)
 from .CustomExceptions import (NoSuchSelectionError, InvalidReservationError,
                                InvalidOrderError, InvalidItemError)
 
 
-def generate_logger(log_type=logging.DEBUG, file_name='debug.log'):
+class QueueHandler(logging.Handler):
+    """Logging handler that places each record
+    on a queue rather than writing it, so that
+    logging does not block the caller. The records
+    are written by a QueueListener.
+    """
+
+    def __init__(self, queue):
+        """Initializes the QueueHandler.
+
+        @param queue: Queue object that the
+        records are placed on.
+        """
+        logging.Handler.__init__(self)
+        self.queue = queue
+
+    def prepare(self, record):
+        """Prepares the given record to be placed
+        on the queue. The message is formatted now,
+        as the arguments may change before the record
+        is written. The formatted message includes any
+        traceback, so the traceback is removed from the
+        record so that it isn't written twice.
+
+        @param record: logging.LogRecord object.
+
+        @return: logging.LogRecord object.
+        """
+        record.msg = self.format(record)
+        record.args = None
+        record.exc_info = None
+        record.exc_text = None
+        return record
+
+    def emit(self, record):
+        """Places the given record on the queue.
+
+        @param record: logging.LogRecord object.
+
+        @return: None
+        """
+        try:
+            self.queue.put_nowait(self.prepare(record))
+        except Exception:
+            self.handleError(record)
+
+
+class QueueListener(object):
+    """Writes the records placed on a queue
+    by a QueueHandler to the given handlers
+    on a background thread.
+    """
+
+    _STOP = None
+
+    def __init__(self, queue, *handlers):
+        """Initializes the QueueListener.
+
+        @param queue: Queue object that the
+        records are taken from.
+
+        @param handlers: logging.Handler objects
+        that the records are written to.
+        """
+        self.queue = queue
+        self.handlers = handlers
+        self._thread = None
+
+    def start(self):
+        """Starts writing records on the
+        background thread.
+
+        @return: None
+        """
+        self._thread = Thread(target=self._monitor, name='peon_log_listener')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _monitor(self):
+        """Private Method.
+
+        Writes each record taken from the queue
+        until the listener is stopped.
+
+        @return: None
+        """
+        while True:
+            record = self.queue.get()
+
+            if record is self._STOP:
+                break
+
+            for handler in self.handlers:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+
+    def stop(self):
+        """Writes all remaining records and
+        stops the background thread.
+
+        @return: None
+        """
+        if self._thread is not None:
+            self.queue.put(self._STOP)
+            self._thread.join()
+            self._thread = None
+
+            for handler in self.handlers:
+                handler.flush()
+
+
+def generate_logger(log_type=logging.getLevelName(LOG_LEVEL),
+                    file_name=LOG_FILE_NAME):
     """Generates the logger object and stores it in the
     module wide variable logger.
+
+    @note: Records are written to a rotating log file on
+    a background thread.
     
     @keyword log_type: int value representing the log type that
-    this logger will utilize. By default log_type=logging.DEBUG
+    this logger will utilize. By default the LOG_LEVEL setting.
     
     @keyword file_name: str representing the name of the log
     that the logger will output to.
     
-    @return: logging.Logger object that represents the newly
-    created logger.
+    @return: 2-tuple of (logging.Logger, QueueListener) that
+    represents the newly created logger and the listener
+    that writes its records.
     """
     fmt = '%(asctime)s | %(levelname)s: %(message)s'
     date_fmt = "%Y-%m-%d, %H:%M:%S"
@@ -41,16 +164,31 @@ def generate_logger(log_type=logging.DEBUG, file_name='debug.log'):
     
     directory = SYSTEM_LOG_PATH + '/' + file_name
     
-    file_handler = logging.FileHandler(directory)
+    file_handler = RotatingFileHandler(directory, maxBytes=LOG_MAX_BYTES,
+                                       backupCount=LOG_BACKUP_COUNT)
     file_handler.setLevel(log_type)
-    file_handler.setFormatter(formatter)
-    
-    new_logger.addHandler(file_handler)
+
+    log_queue = Queue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setLevel(log_type)
+    queue_handler.setFormatter(formatter)
+
+    new_logger.addHandler(queue_handler)
+
+    listener = QueueListener(log_queue, file_handler)
+    listener.start()
     
-    return new_logger
+    return new_logger, listener
     
 
-logger = generate_logger()
+logger, log_listener = generate_logger()
+atexit.register(log_listener.stop)
+
+# entry and exit of logged methods are only traced at the DEBUG level.
+TRACE_CALLS = logger.isEnabledFor(logging.DEBUG)
+
+# time at which initialization began, used by the startup timing probe.
+_initializing_start_time = None
 
 
 def initializing_fencepost_begin():
@@ -59,6 +197,8 @@ def initializing_fencepost_begin():
     notification to the logger.info that initialization
     has begun.
     """
+    global _initializing_start_time
+    _initializing_start_time = time.time()
     logger.info('Beginning Initialization')
 
 
@@ -71,9 +211,90 @@ def initializing_fencepost_finish():
     logger.info('End initialization')
 
 
+def first_window_fencepost(start_time=None):
+    """Used when the main window is first displayed
+    to notify the logger of the time taken from the
+    beginning of initialization until the first window
+    was shown. Outputs the time to the logger.info.
+
+    @keyword start_time: float representing the time
+    to measure from if initialization was never begun
+    through initializing_fencepost_begin. Default is None.
+
+    @return: float representing the number of seconds
+    until the first window was shown, or None if no
+    start time was available.
+    """
+    start_time = _initializing_start_time or start_time
+
+    if start_time is None:
+        return None
+
+    elapsed = time.time() - start_time
+    logger.info('Time to first window: {:.3f} seconds'.format(elapsed))
+    return elapsed
+
+
+def _log_non_fatal_error(e):
+    """Private Function.
+
+    Logs the given non fatal error.
+
+    @param e: Exception that was raised.
+
+    @return: None
+    """
+    logger.info('')
+    logger.info('NON-FATAL-ERROR: ' + str(type(e)))
+    logger.info(e)
+    logger.info('')
+
+
+def _log_error(e, args, kwargs):
+    """Private Function.
+
+    Logs the given error, its traceback
+    and the parameters of the call that
+    raised it.
+
+    @param e: Exception that was raised.
+
+    @param args: tuple of the parameters given
+    to the function.
+
+    @param kwargs: dict of the keyword parameters
+    given to the function.
+
+    @return: None
+    """
+    logger.error(e)
+    spaces = '   '
+    logger.error('')
+    logger.error('TRACEBACK')
+    logger.error(traceback.format_exc())
+    logger.error('')
+    logger.error(spaces + 'Parameters: ')
+
+    spaces *= 2
+    if len(args) > 0 or len(kwargs) > 0:
+        for param_set in (args, kwargs):
+            for arg in param_set:
+                arg_type = str(type(arg))
+                arg_value = str(arg)
+                logger.error(spaces + 'type = ' + arg_type)
+                logger.error(spaces + 'value = ' + arg_value)
+                logger.error('')
+    else:
+        logger.error(spaces + 'No Parameters given to function')
+
+
 def log_func_data(func):
     """Wrapper function that is wrapped around
     a method.
+
+    @note: The entry and exit of each call are only
+    logged if TRACE_CALLS is set when the method is
+    wrapped. Otherwise only errors are logged.
     
     @param func: func representing the function
     to be wrapped with the interior wrapper function
@@ -89,6 +310,8 @@ def log_func_data(func):
         function_info += func.im_class.__name__ + '.'
 
     function_info += func.__name__ + ' : '
+    entering_message = function_info + 'Entering ' + func.__name__
+    exiting_message = function_info + 'Exiting ' + func.__name__
 
     def log_wrapper(*args, **kwargs):
         """Wrapper sub function that is used to
@@ -109,51 +332,44 @@ def log_func_data(func):
         one.
         """
         try:
-            if logger.getEffectiveLevel() == logging.DEBUG:
-                logger.debug(function_info + 'Entering ' + func.__name__)
-                
-            try:
-                return func(*args, **kwargs)
-
-            except (NoSuchSelectionError, InvalidItemError,
-                    InvalidOrderError, InvalidReservationError) as e:
-                logger.info('')
-                logger.info('NON-FATAL-ERROR: ' + str(type(e)))
-                logger.info(e)
-                logger.info('')
-                raise
-
-            except Exception as e:
-                logger.error(e)
-                spaces = '   '
-                logger.error('')
-                logger.error('TRACEBACK')
-                logger.error(traceback.format_exc())
-                logger.error('')
-                logger.error(spaces + 'Parameters: ')
-                
-                spaces *= 2
-                if len(args) > 0 or len(kwargs) > 0:
-                    for param_set in (args, kwargs):
-                        for arg in param_set:
-                            arg_type = str(type(arg))
-                            arg_value = str(arg)
-                            logger.error(spaces + 'type = ' + arg_type)
-                            logger.error(spaces + 'value = ' + arg_value)
-                            logger.error('')
-                else:
-                    logger.error(spaces + 'No Parameters given to function')
-                
-                raise
-        
+            return func(*args, **kwargs)
+
+        except (NoSuchSelectionError, InvalidItemError,
+                InvalidOrderError, InvalidReservationError) as e:
+            _log_non_fatal_error(e)
+            raise
+
+        except Exception as e:
+            _log_error(e, args, kwargs)
+            raise
+
+    def trace_wrapper(*args, **kwargs):
+        """Wrapper sub function that is used to
+        wrap the method when it is called, logging
+        its entry and exit.
+
+        @param *args: list of parameters that represents
+        the standard arguments given to the function.
+
+        @param **kwargs: list of keyword parameters that
+        represents the standard keyword arguments given to
+        the function.
+
+        @return: func stored in the function that wraps this
+        one.
+        """
+        logger.debug(entering_message)
+        try:
+            return log_wrapper(*args, **kwargs)
         finally:
-            if logger.getEffectiveLevel() == logging.DEBUG:
-                logger.debug(function_info + 'Exiting ' + func.__name__)
-        
+            logger.debug(exiting_message)
+
+    wrapper = trace_wrapper if TRACE_CALLS else log_wrapper
+
     for attr in "__module__", "__name__", "__doc__":
-        setattr(log_wrapper, attr, getattr(func, attr))
+        setattr(wrapper, attr, getattr(func, attr))
     
-    return log_wrapper
+    return wrapper
 
 
 def error_logging(cls):
@@ -7,8 +7,11 @@ stores information about OptionItems
 @version: 1.0
 """
 
+from uuid import uuid4
 from copy import deepcopy as copy
 
+from .CheckOperations import to_cents, from_cents
+
 
 class MenuItem(object):
     """ This object stores information regarding a MenuItem.
@@ -36,11 +39,22 @@ class MenuItem(object):
     @var _option_choices: dict of str, float pairs where
     each key represents a potential option choice for
     the item, each value pair is the cost of said choice. 
+
+    @var _item_id: private attribute. str representing the
+    unique id of this MenuItem. The id is assigned on creation,
+    is serialized with the MenuItem and is regenerated when the
+    MenuItem is copied. Equality and hashing are based on it.
+
+    @var _price_cents: private attribute. int representing the
+    cached price of the MenuItem in cents, or None if it must be
+    computed. It is cleared when the options are set, or the item
+    is comped or has its price edited. It isn't serialized.
     """
     
     def __init__(self, name, price, stars=0, editable=True,
                  confirmed=False, option_choices=[]):
 
+        self._item_id = _generate_item_id()
         self._name = name
         self._price = price
         self._option_choices = option_choices
@@ -55,6 +69,27 @@ class MenuItem(object):
         self.options = []
         self.confirmed = bool(confirmed)
 
+    @property
+    def options(self):
+        """Property getter for options.
+
+        @return: list of OptionItem objects
+        representing the chosen options.
+        """
+        return self._options
+
+    @options.setter
+    def options(self, options):
+        """Property setter for options.
+
+        @param options: list of OptionItem
+        objects to be set as the chosen options.
+        The list should not be modified afterwards
+        unless it is set again.
+        """
+        self._options = options
+        self.invalidate_price()
+
     @property
     def notes(self):
         """Property getter for notes.
@@ -116,6 +151,8 @@ class MenuItem(object):
         else:
             self._price_scalar = 1.0
             self._notification_message = None
+
+        self.invalidate_price()
     
     def is_locked(self):
         """Returns the value of the locked attribute.
@@ -138,6 +175,8 @@ class MenuItem(object):
         if self._price_scalar > 1.0:
             self._price_scalar = 1.0
 
+        self.invalidate_price()
+
     def get_name(self):
         """Gets the name of the MenuItem.
         
@@ -152,11 +191,33 @@ class MenuItem(object):
         
         @return: float representing the price.
         """
-        price = self._price
-        for option in self.options:
-            price += option.get_price()
+        return from_cents(self.get_price_cents())
+
+    def get_price_cents(self):
+        """Gets the price associated with the
+        MenuItem in integer cents. The price is
+        cached until the options are set or the
+        item is comped or has its price edited.
+
+        @return: int representing the price.
+        """
+        price_cents = self.__dict__.get('_price_cents')
 
-        return self._price_scalar * price
+        if price_cents is None:
+            price_cents = _get_price_cents(self)
+            self._price_cents = price_cents
+
+        return price_cents
+
+    def invalidate_price(self):
+        """Clears the cached price of the
+        MenuItem. This must be called whenever
+        the price is changed other than through
+        the options, comp or edit_price.
+
+        @return: None
+        """
+        self._price_cents = None
     
     def is_editable(self):
         """Checks if the item is editable.
@@ -182,6 +243,11 @@ class MenuItem(object):
         an option, and each value is a float that represents
         the cost.
         """
+        # choices decoded without ids are given them before they are
+        # copied, so that every copy shares the id of its choice.
+        for option in self._option_choices:
+            _get_item_id(option)
+
         options_copy = copy(self._option_choices)
 
         for option in options_copy:
@@ -228,10 +294,106 @@ class MenuItem(object):
         """
         return str(self.__dict__)
 
+    def get_item_id(self):
+        """Gets the unique id associated with
+        this MenuItem.
+
+        @note: MenuItems serialized before ids
+        were introduced are given a new id the
+        first time it is requested.
+
+        @return: str representing the id.
+        """
+        return _get_item_id(self)
+
+    def is_equal_value(self, other):
+        """Checks if the given MenuItem stores
+        the same values as this MenuItem, without
+        regard to their ids.
+
+        @param other: MenuItem object that is to
+        be compared.
+
+        @return: bool value representing True if
+        the two items store the same values, False
+        otherwise.
+        """
+        return _is_equal_value(self, other)
+
+    def __copy__(self):
+        """Gets a shallow copy of this MenuItem.
+        The copy is a new MenuItem and is given
+        a new id. The copy has its own list of
+        options, the options themselves are
+        shared.
+
+        @return: MenuItem object that is the copy.
+        """
+        return _copy_item(self)
+
+    def clone(self):
+        """Gets a shallow copy of this MenuItem
+        that keeps its id. The clone is a new
+        version of the same item, that may be
+        edited and then replace this MenuItem
+        in its order.
+
+        @return: MenuItem object that is the clone.
+        """
+        return _clone_item(self)
+
+    def __deepcopy__(self, memo):
+        """Gets a deep copy of this MenuItem.
+        The copy is a new MenuItem and is given
+        a new id.
+
+        @param memo: dict used by the copy module
+        to track copied objects.
+
+        @return: MenuItem object that is the copy.
+        """
+        return _deepcopy_item(self, memo)
+
+    def __getstate__(self):
+        """Gets the state of this object for
+        serialization. The cached price isn't
+        included and the options are stored under
+        their public name, as they were before the
+        options became a property.
+
+        @return: dict of attribute names mapped
+        to their values.
+        """
+        state = dict(self.__dict__)
+        state.pop('_price_cents', None)
+        state['options'] = state.pop('_options')
+        return state
+
+    def __setstate__(self, state):
+        """Sets the state of this object after
+        deserialization.
+
+        @param state: dict of attribute names mapped
+        to their values.
+
+        @return: None
+        """
+        state = dict(state)
+
+        if 'options' in state:
+            state['_options'] = state.pop('options')
+
+        self.__dict__.update(state)
+        self._price_cents = None
+
     def __eq__(self, other):
         """Gets a bool representation of whether
         this MenuItem is equal to another MenuItem
-        given
+        given. MenuItems are equal if they share
+        the same id.
+
+        @see: is_equal_value for comparing the values
+        stored in the MenuItems.
 
         @param other: MenuItem object that is to
         be checked if equal.
@@ -240,7 +402,36 @@ class MenuItem(object):
         the two items are considered equal, false
         otherwise.
         """
-        return self.__dict__ == other.__dict__
+        if not isinstance(other, MenuItem):
+            return NotImplemented
+
+        return self.get_item_id() == other.get_item_id()
+
+    def __ne__(self, other):
+        """Gets a bool representation of whether
+        this MenuItem is not equal to the other
+        MenuItem given.
+
+        @param other: MenuItem object that is to
+        be checked.
+
+        @return: bool value representing True if
+        the two items are not equal, False otherwise.
+        """
+        result = self.__eq__(other)
+
+        if result is NotImplemented:
+            return result
+
+        return not result
+
+    def __hash__(self):
+        """Gets the hash of this MenuItem.
+
+        @return: int representing the hash of
+        this MenuItems id.
+        """
+        return hash(self.get_item_id())
 
 
 class DiscountItem(MenuItem):
@@ -308,6 +499,11 @@ class OptionItem(object):
     the this option from a MenuItem, or "SUB" and thus signifies a
     substitution made on this MenuItem
 
+    @var _item_id: private field. str representing the unique id
+    of this option choice. The id is assigned on creation and is
+    serialized with the OptionItem. Unlike MenuItems, copies of an
+    OptionItem keep its id since they represent the same choice.
+    Equality and hashing are based on it.
     """
     def __init__(self, name, category, price):
         """Initializes a new OptionItem
@@ -320,6 +516,7 @@ class OptionItem(object):
         @param price: float representing
         the cost associated with this option
         """
+        self._item_id = _generate_item_id()
         self._name = name
         self._price = price
         self._category = category
@@ -413,9 +610,40 @@ class OptionItem(object):
         """
         return str(self.get_option_relation()) + ': ' + self._name
 
+    def get_item_id(self):
+        """Gets the unique id associated
+        with this option choice.
+
+        @note: OptionItems serialized before
+        ids were introduced are given a new
+        id the first time it is requested.
+
+        @return: str representing the id.
+        """
+        return _get_item_id(self)
+
+    def is_equal_value(self, other):
+        """Checks if the given OptionItem
+        stores the same values as this
+        OptionItem, without regard to their
+        ids.
+
+        @param other: OptionItem object that
+        is to be compared.
+
+        @return: bool value that is True if
+        the two OptionItems store the same
+        values, False otherwise.
+        """
+        return _is_equal_value(self, other)
+
     def __eq__(self, other):
         """Compares this option item to
-        the given option item.
+        the given option item. OptionItems
+        are equal if they share the same id.
+
+        @see: is_equal_value for comparing the
+        values stored in the OptionItems.
 
         @param other: OptionItem object that
         is to be compared to this OptionItem
@@ -423,7 +651,36 @@ class OptionItem(object):
         @return: bool value that is True if the
         two OptionItems are equal, False otherwise.
         """
-        return self.__dict__ == other.__dict__
+        if not isinstance(other, OptionItem):
+            return NotImplemented
+
+        return self.get_item_id() == other.get_item_id()
+
+    def __ne__(self, other):
+        """Compares this option item to
+        the given option item.
+
+        @param other: OptionItem object that
+        is to be compared to this OptionItem
+
+        @return: bool value that is True if the
+        two OptionItems are not equal, False
+        otherwise.
+        """
+        result = self.__eq__(other)
+
+        if result is NotImplemented:
+            return result
+
+        return not result
+
+    def __hash__(self):
+        """Gets the hash of this OptionItem.
+
+        @return: int representing the hash
+        of this OptionItems id.
+        """
+        return hash(self.get_item_id())
 
     def __cmp__(self, other):
         """Compares to OptionItem
@@ -453,6 +710,666 @@ class OptionItem(object):
         return cmp_value
 
 
+class CompactOptionItem(object):
+    """CompactOptionItem is a read only representation
+    of an OptionItem. It stores its values in __slots__
+    instead of a per instance __dict__ and is used where
+    large numbers of stored options are materialized,
+    such as audits over the orders database.
+
+    @see: compact_option_item for creating a
+    CompactOptionItem from an OptionItem.
+    """
+
+    __slots__ = ('_item_id', '_name', '_price', '_category',
+                 '_price_scalar', '_relation')
+
+    def __init__(self, item_id, name, category, price, price_scalar=1.0,
+                 relation=None):
+        """Initializes a new CompactOptionItem.
+
+        @param item_id: str representing the id of the
+        option choice.
+
+        @param name: str representing the name associated
+        with this option.
+
+        @param category: str representing the category of
+        this option.
+
+        @param price: float representing the cost associated
+        with this option.
+
+        @keyword price_scalar: float representing the
+        multiplicative price of this option. Default is 1.0
+
+        @keyword relation: str representing the relation
+        of this option. "ADD", "NO", "SUB" or None.
+        """
+        self._item_id = item_id
+        self._name = name
+        self._category = category
+        self._price = price
+        self._price_scalar = price_scalar
+        self._relation = relation
+
+    def get_item_id(self):
+        """Gets the id associated with this option.
+
+        @return: str representing the id.
+        """
+        return self._item_id
+
+    def get_name(self):
+        """Gets the name associated with this option.
+
+        @return: str representing the name.
+        """
+        return self._name
+
+    def get_price(self):
+        """Gets the price associated with this option.
+
+        @return: float representing the price.
+        """
+        return self._price * self._price_scalar
+
+    def get_category(self):
+        """Gets the category associated with this option.
+
+        @return: str representing the category.
+        """
+        return self._category
+
+    def get_option_relation(self):
+        """Gets the relation of this option.
+
+        @return: str representing the relation.
+        "ADD", "NO" or "SUB".
+        """
+        return self._relation
+
+    def to_option_item(self):
+        """Expands this CompactOptionItem into
+        an OptionItem.
+
+        @return: OptionItem object that stores
+        the same values and id.
+        """
+        option_item = OptionItem.__new__(OptionItem)
+        option_item.__dict__.update(self.__getstate__())
+        return option_item
+
+    def __getstate__(self):
+        """Gets the state of this object for
+        serialization.
+
+        @return: dict of slot names mapped to
+        their values.
+        """
+        return dict((slot, getattr(self, slot)) for slot in self.__slots__)
+
+    def __setstate__(self, state):
+        """Sets the state of this object after
+        deserialization.
+
+        @param state: dict of slot names mapped
+        to their values.
+
+        @return: None
+        """
+        for slot in self.__slots__:
+            setattr(self, slot, state[slot])
+
+    def __repr__(self):
+        """Get a string representation of this
+        CompactOptionItem.
+
+        @return: str representing the option
+        """
+        return str(self._relation) + ': ' + self._name
+
+    def __eq__(self, other):
+        """Compares this option to the given option
+        by id.
+
+        @param other: CompactOptionItem or OptionItem.
+
+        @return: bool value representing if the two
+        options share the same id.
+        """
+        if not isinstance(other, (CompactOptionItem, OptionItem)):
+            return NotImplemented
+
+        return self._item_id == other.get_item_id()
+
+    def __ne__(self, other):
+        """Compares this option to the given option
+        by id.
+
+        @param other: CompactOptionItem or OptionItem.
+
+        @return: bool value representing if the two
+        options do not share the same id.
+        """
+        result = self.__eq__(other)
+
+        if result is NotImplemented:
+            return result
+
+        return not result
+
+    def __hash__(self):
+        """Gets the hash of this option.
+
+        @return: int representing the hash of the id.
+        """
+        return hash(self._item_id)
+
+
+class CompactMenuItem(object):
+    """CompactMenuItem is a read only representation
+    of a MenuItem. It stores its values in __slots__
+    instead of a per instance __dict__, stores its
+    options as a tuple of CompactOptionItems and shares
+    its option choices by reference. It is used where
+    large numbers of stored items are materialized, such
+    as audits over the orders database.
+
+    @see: compact_menu_item for creating a
+    CompactMenuItem from a MenuItem.
+    """
+
+    __slots__ = ('_item_id', '_name', '_price', '_price_scalar',
+                 '_notification_message', '_default_stars', '_notes',
+                 '_locked', '_option_choices', 'editable', 'stars',
+                 'confirmed', 'options')
+
+    def get_item_id(self):
+        """Gets the id associated with this item.
+
+        @return: str representing the id.
+        """
+        return self._item_id
+
+    def get_name(self):
+        """Gets the name of the item.
+
+        @return: str representing the name.
+        """
+        return self._name
+
+    def get_price(self):
+        """Gets the price associated with the item.
+
+        @return: float representing the price.
+        """
+        return from_cents(self.get_price_cents())
+
+    def get_price_cents(self):
+        """Gets the price associated with the item
+        in integer cents.
+
+        @return: int representing the price.
+        """
+        return _get_price_cents(self)
+
+    @property
+    def notes(self):
+        """Property getter for notes.
+
+        @return: str representing the note.
+        """
+        return self._notes
+
+    def has_note(self):
+        """Checks if the item has a note.
+
+        @return: bool, True if there is a
+        non-empty note.
+        """
+        return len(self._notes) > 0
+
+    def has_options(self):
+        """Checks if the item has options.
+
+        @return: bool representing if options
+        have been selected for the item.
+        """
+        return len(self.options) > 0
+
+    def has_stars(self):
+        """Checks if the item has a new stars
+        rating associated with it.
+
+        @return: bool value representing if the
+        stars rating differs from the default.
+        """
+        return not self.stars == self._default_stars
+
+    def is_comped(self):
+        """Checks if the item is comped.
+
+        @return: bool value representing if the
+        item has been comped.
+        """
+        return self._price_scalar == 0.0 and bool(self._notification_message)
+
+    def get_comp_message(self):
+        """Gets the comp message associated with
+        the item.
+
+        @return: str representing the message, None
+        if the item isn't comped.
+        """
+        return self._notification_message
+
+    def is_locked(self):
+        """Checks if the item is locked.
+
+        @return: bool representing if the item
+        is locked.
+        """
+        return self._locked
+
+    def is_editable(self):
+        """Checks if the item is editable.
+
+        @return: bool, True if the item is editable.
+        """
+        return self.editable and not self._locked
+
+    def is_notification(self):
+        """Checks if the item is a notification item.
+
+        @return: bool representing if the item is a
+        notification item.
+        """
+        return self.is_comped()
+
+    def get_option_choices(self):
+        """Gets the shared option choices of the item.
+
+        @return: tuple of CompactOptionItems.
+        """
+        return self._option_choices
+
+    def to_menu_item(self):
+        """Expands this CompactMenuItem into a
+        MenuItem that can be edited.
+
+        @return: MenuItem object that stores the
+        same values and id.
+        """
+        menu_item = MenuItem.__new__(MenuItem)
+        self._expand(menu_item)
+        return menu_item
+
+    def _expand(self, menu_item):
+        """Private Method.
+
+        Stores the values of this item in the given
+        uninitialized MenuItem.
+
+        @param menu_item: MenuItem object to be filled.
+
+        @return: None
+        """
+        state = self.__getstate__()
+        del state['options']
+        state['_option_choices'] = [option.to_option_item()
+                                    for option in self._option_choices]
+        menu_item.__dict__.update(state)
+        menu_item.options = [option.to_option_item() for option in self.options]
+
+    def __getstate__(self):
+        """Gets the state of this object for
+        serialization.
+
+        @return: dict of slot names mapped to
+        their values.
+        """
+        return dict((slot, getattr(self, slot)) for slot in
+                    CompactMenuItem.__slots__)
+
+    def __setstate__(self, state):
+        """Sets the state of this object after
+        deserialization.
+
+        @param state: dict of slot names mapped
+        to their values.
+
+        @return: None
+        """
+        for slot in CompactMenuItem.__slots__:
+            value = state[slot]
+
+            if slot in ('options', '_option_choices'):
+                value = tuple(value)
+
+            setattr(self, slot, value)
+
+    def __repr__(self):
+        """Gets a string representation of the item.
+
+        @return: str representing the stored values.
+        """
+        return str(self.__getstate__())
+
+    def __eq__(self, other):
+        """Compares this item to the given item by id.
+
+        @param other: CompactMenuItem or MenuItem.
+
+        @return: bool value representing if the two
+        items share the same id.
+        """
+        if not isinstance(other, (CompactMenuItem, MenuItem)):
+            return NotImplemented
+
+        return self._item_id == other.get_item_id()
+
+    def __ne__(self, other):
+        """Compares this item to the given item by id.
+
+        @param other: CompactMenuItem or MenuItem.
+
+        @return: bool value representing if the two
+        items do not share the same id.
+        """
+        result = self.__eq__(other)
+
+        if result is NotImplemented:
+            return result
+
+        return not result
+
+    def __hash__(self):
+        """Gets the hash of this item.
+
+        @return: int representing the hash of the id.
+        """
+        return hash(self._item_id)
+
+
+class CompactDiscountItem(CompactMenuItem):
+    """CompactDiscountItem is the read only
+    representation of a DiscountItem.
+    """
+
+    __slots__ = ()
+
+    def get_discount_message(self):
+        """Gets the discount message associated
+        with this item.
+
+        @return: str representing the message.
+        """
+        return self._notes
+
+    def is_notification(self):
+        """Checks if the item is a notification
+        item.
+
+        @return: True because all DiscountItems
+        are notification items.
+        """
+        return True
+
+    def to_menu_item(self):
+        """Expands this CompactDiscountItem into
+        a DiscountItem.
+
+        @return: DiscountItem object that stores
+        the same values and id.
+        """
+        discount_item = DiscountItem.__new__(DiscountItem)
+        self._expand(discount_item)
+        return discount_item
+
+
+#====================================================================================
+# This block represents functions that are used to convert MenuItems, DiscountItems
+# and OptionItems to and from their compact representations.
+#====================================================================================
+def compact_option_item(option_item, cache=None):
+    """Gets the compact representation of the given
+    OptionItem.
+
+    @param option_item: OptionItem object.
+
+    @keyword cache: dict used to share identical
+    CompactOptionItems between calls. Default is
+    None in which case nothing is shared.
+
+    @note: OptionItems serialized before ids were
+    introduced are shared by their values alone, and
+    the shared CompactOptionItem is given a new id.
+
+    @return: CompactOptionItem object.
+    """
+    if isinstance(option_item, CompactOptionItem):
+        return option_item
+
+    if cache is None:
+        return CompactOptionItem(option_item.get_item_id(), option_item._name,
+                                 option_item._category, option_item._price,
+                                 option_item._price_scalar,
+                                 option_item._relation)
+
+    values = (option_item.__dict__.get('_item_id'), option_item._name,
+              option_item._category, option_item._price,
+              option_item._price_scalar, option_item._relation)
+
+    compact_item = cache.get(values)
+
+    if compact_item is None:
+        item_id = values[0]
+
+        if item_id is None:
+            item_id = _generate_item_id()
+
+        compact_item = cache[values] = CompactOptionItem(item_id, *values[1:])
+
+    return compact_item
+
+
+def compact_menu_item(menu_item, option_choices=None, cache=None):
+    """Gets the compact representation of the given
+    MenuItem or DiscountItem.
+
+    @param menu_item: MenuItem object.
+
+    @keyword option_choices: dict of str representing
+    item names mapped to tuples of CompactOptionItems
+    that represent the option choices from the menu
+    definition. Items found here share these option
+    choices by reference. Items that are not found have
+    their option choices compacted and added to the dict.
+    Default is None.
+
+    @keyword cache: dict used to share identical
+    CompactOptionItems between calls. Default is None.
+
+    @return: CompactMenuItem or CompactDiscountItem
+    object.
+    """
+    if isinstance(menu_item, CompactMenuItem):
+        return menu_item
+
+    if option_choices is None:
+        option_choices = {}
+
+    name = menu_item.get_name()
+    choices = option_choices.get(name)
+
+    if choices is None:
+        choices = tuple(compact_option_item(option, cache=cache) for
+                        option in menu_item.__dict__.get('_option_choices', ()))
+        option_choices[name] = choices
+
+    if isinstance(menu_item, DiscountItem):
+        compact_item = CompactDiscountItem.__new__(CompactDiscountItem)
+    else:
+        compact_item = CompactMenuItem.__new__(CompactMenuItem)
+
+    state = dict((slot, menu_item.__dict__.get(slot)) for slot in
+                 CompactMenuItem.__slots__)
+    state['_item_id'] = menu_item.get_item_id()
+    state['options'] = tuple(compact_option_item(option, cache=cache)
+                             for option in menu_item.options)
+    state['_option_choices'] = choices
+
+    compact_item.__setstate__(state)
+    return compact_item
+
+
+def compact_order(order_data, option_choices=None, cache=None):
+    """Gets the compact representation of each
+    MenuItem in the given order.
+
+    @param order_data: iterable of MenuItem objects.
+
+    @keyword option_choices: dict shared between
+    calls. See compact_menu_item.
+
+    @keyword cache: dict shared between calls. See
+    compact_menu_item.
+
+    @return: list of CompactMenuItem objects.
+    """
+    return [compact_menu_item(menu_item, option_choices=option_choices,
+                              cache=cache) for menu_item in order_data]
+
+
+#====================================================================================
+# This block represents helper functions that are used to identify, compare and
+# copy the objects defined in this module.
+#====================================================================================
+def _generate_item_id():
+    """Generates a new unique item id.
+
+    @return: str representing the id.
+    """
+    return uuid4().hex
+
+
+def _get_item_id(item):
+    """Gets the id stored in the given item. If
+    the item has no id stored, as is the case for
+    items serialized before ids were introduced,
+    then a new id is generated and stored.
+
+    @param item: MenuItem or OptionItem object.
+
+    @return: str representing the id.
+    """
+    item_id = item.__dict__.get('_item_id')
+
+    if item_id is None:
+        item_id = _generate_item_id()
+        item._item_id = item_id
+
+    return item_id
+
+
+def _get_price_cents(item):
+    """Computes the price of the given item
+    in integer cents.
+
+    @param item: MenuItem or CompactMenuItem
+    object.
+
+    @return: int representing the price.
+    """
+    price = item._price
+    for option in item.options:
+        price += option.get_price()
+
+    return to_cents(item._price_scalar * price)
+
+
+def _is_equal_value(item, other):
+    """Checks if the two given items store the
+    same values, without regard to their ids.
+
+    @param item: MenuItem or OptionItem object.
+
+    @param other: object that is to be compared.
+
+    @return: bool value representing if the
+    values are equal.
+    """
+    if type(item) is not type(other):
+        return False
+
+    item_values = dict(item.__dict__)
+    other_values = dict(other.__dict__)
+
+    for values in (item_values, other_values):
+        values.pop('_item_id', None)
+        values.pop('_price_cents', None)
+
+    return item_values == other_values
+
+
+def _copy_item(item):
+    """Creates a shallow copy of the given item
+    that is given a new id.
+
+    @param item: MenuItem object.
+
+    @return: copy of the given item.
+    """
+    item_copy = _clone_item(item)
+    item_copy._item_id = _generate_item_id()
+
+    return item_copy
+
+
+def _clone_item(item):
+    """Creates a shallow copy of the given item
+    that keeps its id. The copy is given its own
+    list of options, so that options added to or
+    removed from the copy don't change the item.
+
+    @param item: MenuItem object.
+
+    @return: copy of the given item.
+    """
+    cls = item.__class__
+    item_copy = cls.__new__(cls)
+    item_copy.__dict__.update(item.__dict__)
+
+    if '_options' in item_copy.__dict__:
+        item_copy._options = list(item_copy._options)
+
+    return item_copy
+
+
+def _deepcopy_item(item, memo):
+    """Creates a deep copy of the given item
+    that is given a new id.
+
+    @param item: MenuItem object.
+
+    @param memo: dict used by the copy module to
+    track copied objects.
+
+    @return: copy of the given item.
+    """
+    cls = item.__class__
+    item_copy = cls.__new__(cls)
+    memo[id(item)] = item_copy
+
+    for key, value in item.__dict__.items():
+        item_copy.__dict__[key] = copy(value, memo)
+
+    item_copy._item_id = _generate_item_id()
+
+    return item_copy
+
+
 #====================================================================================
 # This block represents tests that may be performed to ensure that a given object
 # is one of the objects defined in this module
@@ -461,14 +1378,14 @@ def is_menu_item(menu_item):
     """Checks if the given item is a MenuItem.
 
     @raise ValueError: If the given item is not
-    a MenuItem instance or subclass.
+    a MenuItem or CompactMenuItem instance or subclass.
 
     @param menu_item: object to be tested.
 
     @return: bool value representing if the test
     was passed.
     """
-    if not menu_item or not isinstance(menu_item, MenuItem):
+    if not menu_item or not isinstance(menu_item, (MenuItem, CompactMenuItem)):
         raise ValueError('Expected a MenuItem instance or subclass. Got '
                          '{} instead'.format(type(menu_item)))
     return True
@@ -478,14 +1395,16 @@ def is_option_item(option_item):
     """Checks if the given item is an OptionItem
 
     @raise ValueError: If the given item is not
-    an OptionItem instance or subclass.
+    an OptionItem or CompactOptionItem instance or
+    subclass.
 
     @param option_item: object to be tested.
 
     @return: bool value representing if the test
     was passed.
     """
-    if not option_item or not isinstance(option_item, OptionItem):
+    if not option_item or not isinstance(option_item, (OptionItem,
+                                                       CompactOptionItem)):
         raise ValueError('Expected an OptionItem instance or subclass. Got '
                          '{} instead.'.format(type(option_item)))
     return True
@@ -495,14 +1414,16 @@ def is_discount_item(discount_item):
     """Checks if the given item is a DiscountItem.
 
     @raise ValueError: If the given item is
-    not a DiscountItem or subclass.
+    not a DiscountItem or CompactDiscountItem or
+    subclass.
 
     @param discount_item: object to be tested.
 
     @return: bool value representing if the test
     was passed.
     """
-    if not discount_item or not isinstance(discount_item, DiscountItem):
+    if not discount_item or not isinstance(discount_item, (DiscountItem,
+                                                           CompactDiscountItem)):
         raise ValueError('Expected a DiscountItem instance or subclass. Got '
                          '{} instead.'.format(type(discount_item)))
     return True
\ No newline at end of file
@@ -0,0 +1,293 @@
+"""This module provides the latency instrumentation
+that is used to measure how long the operations on
+the hot paths of the system take.
+
+Operations are timed with spans or the timed decorator
+and their latencies are kept in per operation histograms.
+The summaries of the histograms, including the p50, p95
+and p99 latencies, are periodically exported to the
+metrics file.
+
+@author: Carl McGraw
+@contact: cjmcgraw( at )u.washington.edu
+@version: 1.0
+"""
+import os
+import json
+import math
+import atexit
+import threading
+from functools import wraps
+from collections import deque
+from timeit import default_timer
+
+from peonordersystem.SystemPath import SYSTEM_LOG_PATH
+from peonordersystem.src.AtomicWriter import atomic_write
+from peonordersystem.src.Settings import (METRICS_FILE_NAME,
+                                          METRICS_SAMPLE_SIZE,
+                                          METRICS_EXPORT_INTERVAL)
+
+METRICS_FILE_PATH = os.path.join(SYSTEM_LOG_PATH, METRICS_FILE_NAME)
+
+
+class LatencyHistogram(object):
+    """Keeps the latencies recorded for a
+    single operation. The most recent latencies
+    are kept to compute percentiles, while the
+    count, total and maximum cover every latency
+    recorded.
+    """
+
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(self, sample_size=METRICS_SAMPLE_SIZE):
+        """Initializes the LatencyHistogram.
+
+        @keyword sample_size: int representing the
+        number of most recent latencies kept. Default
+        is METRICS_SAMPLE_SIZE.
+        """
+        self._samples = deque(maxlen=sample_size)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds):
+        """Records the given latency.
+
+        @param seconds: float representing the
+        latency in seconds.
+
+        @return: None
+        """
+        self._samples.append(seconds)
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    @staticmethod
+    def _get_percentile(samples, percentile):
+        """Private Method.
+
+        Gets the given percentile of the given
+        samples by the nearest rank.
+
+        @param samples: sorted list of float.
+
+        @param percentile: number representing
+        the percentile.
+
+        @return: float
+        """
+        rank = int(math.ceil(percentile / 100.0 * len(samples)))
+        return samples[max(rank, 1) - 1]
+
+    def summary(self):
+        """Gets the summary of the recorded
+        latencies. Latencies are given in
+        milliseconds.
+
+        @return: dict of str keys mapped to number
+        values. Keys are 'count', 'mean', 'max' and
+        'p50', 'p95', 'p99'.
+        """
+        samples = sorted(self._samples)
+        summary = {'count': self.count,
+                   'mean': 0.0,
+                   'max': self.max * 1000}
+
+        if self.count:
+            summary['mean'] = self.total / self.count * 1000
+
+        for percentile in self.PERCENTILES:
+            value = 0.0
+            if samples:
+                value = self._get_percentile(samples, percentile) * 1000
+            summary['p{}'.format(percentile)] = value
+
+        return summary
+
+
+class Span(object):
+    """Context manager that times the
+    enclosed block and records its latency
+    under the given operation, even if the
+    block raises.
+    """
+
+    __slots__ = ('_registry', 'name', '_start')
+
+    def __init__(self, registry, name):
+        """Initializes the Span.
+
+        @param registry: MetricsRegistry that the
+        latency is recorded in.
+
+        @param name: str representing the operation.
+        """
+        self._registry = registry
+        self.name = name
+        self._start = None
+
+    def __enter__(self):
+        self._start = default_timer()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._registry.record(self.name, default_timer() - self._start)
+        return False
+
+
+class MetricsRegistry(object):
+    """Stores the LatencyHistogram of each
+    operation and exports their summaries.
+    """
+
+    def __init__(self, sample_size=METRICS_SAMPLE_SIZE):
+        """Initializes the MetricsRegistry.
+
+        @keyword sample_size: int representing the
+        number of most recent latencies kept for each
+        operation. Default is METRICS_SAMPLE_SIZE.
+        """
+        self._sample_size = sample_size
+        self._histograms = {}
+        self._lock = threading.Lock()
+        self._export_thread = None
+        self._stop_event = threading.Event()
+
+    def record(self, name, seconds):
+        """Records the given latency for the
+        given operation.
+
+        @param name: str representing the operation.
+
+        @param seconds: float representing the latency
+        in seconds.
+
+        @return: None
+        """
+        with self._lock:
+            histogram = self._histograms.get(name)
+
+            if histogram is None:
+                histogram = LatencyHistogram(self._sample_size)
+                self._histograms[name] = histogram
+
+            histogram.record(seconds)
+
+    def span(self, name):
+        """Creates a span that times the
+        given operation.
+
+        @param name: str representing the operation.
+
+        @return: Span
+        """
+        return Span(self, name)
+
+    def timed(self, name):
+        """Decorator Function.
+
+        Times each call of the decorated function
+        under the given operation.
+
+        @param name: str representing the operation.
+
+        @return: function that decorates the function.
+        """
+        def decorator(func):
+            @wraps(func)
+            def timed_wrapper(*args, **kwargs):
+                with Span(self, name):
+                    return func(*args, **kwargs)
+            return timed_wrapper
+        return decorator
+
+    def snapshot(self):
+        """Gets the summary of each operation.
+
+        @return: dict of str keys representing the
+        operation mapped to the dict summary of its
+        LatencyHistogram.
+        """
+        with self._lock:
+            return {name: histogram.summary()
+                    for name, histogram in self._histograms.iteritems()}
+
+    def export(self, file_path=METRICS_FILE_PATH):
+        """Writes the summary of each operation to
+        the given file as json.
+
+        @keyword file_path: str representing the path of
+        the file. Default is METRICS_FILE_PATH.
+
+        @return: None
+        """
+        data = json.dumps(self.snapshot(), sort_keys=True, indent=4)
+        atomic_write(file_path, data)
+
+    def start_export(self, file_path=METRICS_FILE_PATH,
+                     interval=METRICS_EXPORT_INTERVAL):
+        """Starts exporting the summaries to the
+        given file on a background thread at the
+        given interval, and once more at exit.
+
+        @keyword file_path: str representing the path of
+        the file. Default is METRICS_FILE_PATH.
+
+        @keyword interval: number representing the seconds
+        between exports. Default is METRICS_EXPORT_INTERVAL.
+
+        @return: None
+        """
+        if self._export_thread is not None:
+            return
+
+        self._stop_event.clear()
+        self._export_thread = threading.Thread(target=self._run_export,
+                                               args=(file_path, interval))
+        self._export_thread.daemon = True
+        self._export_thread.start()
+        atexit.register(self.stop_export, file_path)
+
+    def _run_export(self, file_path, interval):
+        """Private Method.
+
+        Runs the loop that exports the summaries
+        until the export is stopped.
+
+        @param file_path: str representing the path
+        of the file.
+
+        @param interval: number representing the
+        seconds between exports.
+
+        @return: None
+        """
+        while not self._stop_event.wait(interval):
+            self.export(file_path)
+
+    def stop_export(self, file_path=METRICS_FILE_PATH):
+        """Stops the periodic export and exports
+        the summaries a final time.
+
+        @keyword file_path: str representing the path of
+        the file. Default is METRICS_FILE_PATH.
+
+        @return: None
+        """
+        if self._export_thread is None:
+            return
+
+        self._stop_event.set()
+        self._export_thread.join()
+        self._export_thread = None
+        self.export(file_path)
+
+
+registry = MetricsRegistry()
+
+span = registry.span
+timed = registry.timed
+snapshot = registry.snapshot
@@ -0,0 +1,134 @@
+"""This module defines the OrderSnapshot
+class which gives dialogs a read only view
+of an order, that is copied on write.
+
+The snapshot shares the MenuItems of the
+order. A MenuItem is only cloned when it is
+edited, so opening a dialog on a large order
+doesn't copy the order.
+
+@author: Carl McGraw
+@contact: cjmcgraw( at )u.washington.edu
+@version: 1.0
+"""
+
+
+class OrderSnapshot(object):
+    """Represents the order as it was when
+    the snapshot was taken. MenuItems are read
+    from the snapshot and edited through the
+    edit method, which clones the MenuItem the
+    first time it is edited. The order is never
+    changed by the snapshot.
+
+    @var _items: tuple of MenuItem objects that
+    represents the order when the snapshot was
+    taken.
+
+    @var _edited: dict of str item ids mapped to
+    the edited clone of the MenuItem.
+    """
+
+    def __init__(self, order_list):
+        """Initializes the OrderSnapshot.
+
+        @param order_list: list of MenuItem objects
+        that represents the order. The list isn't
+        copied beyond its references.
+        """
+        self._items = tuple(order_list)
+        self._edited = {}
+
+    def edit(self, menu_item):
+        """Gets the version of the given MenuItem
+        that may be edited. The MenuItem is cloned
+        the first time it is edited, later edits
+        are made to the same clone.
+
+        @param menu_item: MenuItem object in the
+        snapshot, or its edited clone.
+
+        @return: MenuItem object that is the clone
+        to be edited. It keeps the id of the given
+        MenuItem.
+        """
+        item_id = menu_item.get_item_id()
+
+        try:
+            return self._edited[item_id]
+
+        except KeyError:
+            clone = menu_item.clone()
+            self._edited[item_id] = clone
+            return clone
+
+    def is_edited(self, menu_item):
+        """Checks if the given MenuItem has
+        been edited.
+
+        @param menu_item: MenuItem object.
+
+        @return: bool value representing if the
+        MenuItem has an edited clone.
+        """
+        return menu_item.get_item_id() in self._edited
+
+    def get_edited(self):
+        """Gets the edited clones, in the order
+        of the snapshot.
+
+        @return: list of MenuItem objects that
+        represent the edited MenuItems.
+        """
+        edited = self._edited
+        return [edited[menu_item.get_item_id()] for menu_item in self._items
+                if menu_item.get_item_id() in edited]
+
+    def get_items(self):
+        """Gets the current version of each
+        MenuItem in the snapshot. Unedited
+        MenuItems are those of the order.
+
+        @return: list of MenuItem objects.
+        """
+        return list(self)
+
+    def __getitem__(self, index):
+        """Gets the current version of the
+        MenuItem at the given index.
+
+        @param index: int representing the
+        index.
+
+        @return: MenuItem object.
+        """
+        menu_item = self._items[index]
+        return self._edited.get(menu_item.get_item_id(), menu_item)
+
+    def __iter__(self):
+        """Iterates over the current version
+        of each MenuItem in the snapshot.
+
+        @return: iterator of MenuItem objects.
+        """
+        edited = self._edited
+
+        for menu_item in self._items:
+            yield edited.get(menu_item.get_item_id(), menu_item)
+
+    def __len__(self):
+        """Gets the number of MenuItems in
+        the snapshot.
+
+        @return: int
+        """
+        return len(self._items)
+
+    def __repr__(self):
+        """Gets a string representation of
+        the snapshot.
+
+        @return: str
+        """
+        return 'OrderSnapshot({} items, {} edited)'.format(len(self._items),
+                                                           len(self._edited))
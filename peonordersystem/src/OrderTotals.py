@@ -0,0 +1,263 @@
+"""This module defines the OrderTotals class
+which maintains the totals of an order as
+its items are changed, so that the totals
+are available without summing the order.
+
+@author: Carl McGraw
+@contact: cjmcgraw( at )u.washington.edu
+@version: 1.0
+"""
+from .CheckOperations import from_cents
+from .Settings import ORDER_TYPE_STANDARD
+from .TaxEngine import tax_engine
+
+
+class OrderTotals(object):
+    """Maintains the subtotal, tax and total
+    of an order. Items are added, removed and
+    updated as the order changes, and each
+    change only adjusts the totals by the price
+    of the item changed.
+
+    Items are tracked by their item id, since
+    each MenuItem appears at most once in an
+    order. The subtotal of each tax class and
+    the sum of the discounts are kept so that the
+    tax is calculated by the tax engine without
+    summing the order.
+
+    @var order_type: str representing the type
+    of the order, which the tax rates depend on.
+
+    @var _item_prices: dict of str item ids mapped
+    to 2 tuple of (str, int) representing the tax
+    class of the item and the price, in cents, that
+    the item was last counted at. The tax class of
+    a discount is None.
+
+    @var _class_subtotals: dict of str tax classes
+    mapped to the int subtotal of the class in cents.
+
+    @var _discount: int representing the sum of the
+    discounts in cents.
+
+    @var _subtotal: int representing the subtotal
+    in cents.
+    """
+
+    def __init__(self, order_list=(), order_type=ORDER_TYPE_STANDARD,
+                 engine=tax_engine):
+        """Initializes the OrderTotals.
+
+        @keyword order_list: list of MenuItem objects
+        that represents the initial order. Default is
+        an empty order.
+
+        @keyword order_type: str representing the type
+        of the order. Default is ORDER_TYPE_STANDARD.
+
+        @keyword engine: TaxEngine used to calculate the
+        tax. Default is the tax_engine.
+        """
+        self.order_type = order_type
+        self._engine = engine
+
+        self._item_prices = {}
+        self._class_subtotals = {}
+        self._discount = 0
+        self._subtotal = 0
+
+        for menu_item in order_list:
+            self.add(menu_item)
+
+    def add(self, menu_item):
+        """Adds the price of the given MenuItem
+        to the totals. If the MenuItem is already
+        counted it is updated instead.
+
+        @param menu_item: MenuItem object.
+
+        @return: None
+        """
+        self.update(menu_item)
+
+    def remove(self, menu_item):
+        """Removes the given MenuItem from the
+        totals. The price it was last counted at
+        is subtracted. MenuItems that aren't
+        counted are ignored.
+
+        @param menu_item: MenuItem object.
+
+        @return: None
+        """
+        counted = self._item_prices.pop(menu_item.get_item_id(), None)
+
+        if counted is not None:
+            self._add_price(-counted[1], counted[0])
+
+    def update(self, menu_item):
+        """Updates the totals with the current
+        price of the given MenuItem. This should be
+        called after the MenuItem is comped, has its
+        price edited or has its options changed.
+
+        @param menu_item: MenuItem object.
+
+        @return: None
+        """
+        item_id = menu_item.get_item_id()
+        price_cents = menu_item.get_price_cents()
+
+        if price_cents < 0:
+            tax_class = None
+        else:
+            tax_class = self._engine.get_tax_class(menu_item)
+
+        counted = self._item_prices.get(item_id)
+
+        if counted is not None:
+            self._add_price(-counted[1], counted[0])
+
+        self._add_price(price_cents, tax_class)
+        self._item_prices[item_id] = tax_class, price_cents
+
+    def _add_price(self, price_cents, tax_class):
+        """Private Method.
+
+        Adds the given price to the subtotal
+        and the subtotal of the given tax class,
+        or the discounts if there is no tax class.
+
+        @param price_cents: int representing the
+        price in cents.
+
+        @param tax_class: str representing the tax
+        class, or None for a discount.
+
+        @return: None
+        """
+        self._subtotal += price_cents
+
+        if tax_class is None:
+            self._discount += price_cents
+        else:
+            self._class_subtotals[tax_class] = (self._class_subtotals.get(tax_class, 0)
+                                                + price_cents)
+
+    def reset(self, order_list=()):
+        """Resets the totals to those of the
+        given order.
+
+        @keyword order_list: list of MenuItem objects
+        that represents the order. Default is an empty
+        order.
+
+        @return: None
+        """
+        self._item_prices.clear()
+        self._class_subtotals.clear()
+        self._discount = 0
+        self._subtotal = 0
+
+        for menu_item in order_list:
+            self.add(menu_item)
+
+    def get_subtotal_cents(self):
+        """Gets the subtotal in integer cents.
+
+        @return: int
+        """
+        return self._subtotal
+
+    def get_tax_breakdown_cents(self):
+        """Gets the tax of each tax class in
+        integer cents.
+
+        @return: dict of str tax classes mapped
+        to the int tax of the class in cents.
+        """
+        class_subtotals = self._engine.allocate_discount_cents(self._class_subtotals,
+                                                               self._discount)
+        return self._engine.get_tax_breakdown_cents(class_subtotals,
+                                                    self.order_type)
+
+    def get_tax_cents(self):
+        """Gets the tax in integer cents.
+
+        @return: int
+        """
+        return sum(self.get_tax_breakdown_cents().itervalues())
+
+    def get_total_cents(self):
+        """Gets the total, tax included, in
+        integer cents.
+
+        @return: int
+        """
+        return self._subtotal + self.get_tax_cents()
+
+    def get_totals_cents(self):
+        """Gets the totals in integer cents.
+
+        @return: three tuple of (int, int, int)
+        representing the subtotal, tax, and total
+        respectively.
+        """
+        tax = self.get_tax_cents()
+        return self._subtotal, tax, self._subtotal + tax
+
+    def get_subtotal(self):
+        """Gets the subtotal.
+
+        @return: float
+        """
+        return from_cents(self._subtotal)
+
+    def get_tax(self):
+        """Gets the tax.
+
+        @return: float
+        """
+        return from_cents(self.get_tax_cents())
+
+    def get_tax_breakdown(self):
+        """Gets the tax of each tax class.
+
+        @return: dict of str tax classes mapped
+        to the float tax of the class.
+        """
+        return dict((tax_class, from_cents(tax)) for tax_class, tax in
+                    self.get_tax_breakdown_cents().iteritems())
+
+    def get_total(self):
+        """Gets the total, tax included.
+
+        @return: float
+        """
+        return from_cents(self.get_total_cents())
+
+    def get_totals(self):
+        """Gets the totals.
+
+        @return: three tuple of (float, float, float)
+        representing the subtotal, tax, and total
+        respectively.
+        """
+        return tuple(from_cents(cents) for cents in self.get_totals_cents())
+
+    def __len__(self):
+        """Gets the number of MenuItems counted.
+
+        @return: int
+        """
+        return len(self._item_prices)
+
+    def __repr__(self):
+        """Gets a string representation of
+        the totals.
+
+        @return: str
+        """
+        return 'OrderTotals(subtotal={}, tax={}, total={})'.format(
+            *self.get_totals())
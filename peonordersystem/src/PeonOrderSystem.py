@@ -7,14 +7,17 @@ the PeonOrderSystem GUI.
 @version: 1.0
 """
 
-from gi.repository import Gtk  # IGNORE:E0611 @UnresolvedImport
+from gi.repository import Gtk, GObject  # IGNORE:E0611 @UnresolvedImport
 
 from . import ErrorLogger
+from . import Metrics
 from .audit import Auditor
 from .interface.UI import UI
 from .interface import Editor
-from .Settings import SYSTEM_TITLE
+from .Settings import (SYSTEM_TITLE, QUICK_ADD_NUM_OF_ITEMS,
+                       QUICK_ADD_UPDATE_TIME_FRAME)
 from .confirmationSystem import ConfirmationSystem
+from .confirmationSystem.printers.PrinterManager import printer_manager
 
 
 @ErrorLogger.error_logging
@@ -33,12 +36,45 @@ class PeonOrderSystem(UI):
 
         load_data = ConfirmationSystem.unpack_order_data()
         reservation_data = ConfirmationSystem.unpack_reservations_data()
+        ConfirmationSystem.index_checkout_files()
 
         super(PeonOrderSystem, self).__init__(title, load_data=load_data,
-                                              reservation_data=reservation_data)
+                                              reservation_data=reservation_data,
+                                              journal=ConfirmationSystem.order_journal)
+        self.recover_order_edits()
 
         self._auditor = Auditor.Auditor()
+        Metrics.registry.start_export()
+        printer_manager.start()
+
+        self.update_quick_add_panel()
+        self._quick_add_timeout_id = GObject.timeout_add(
+            QUICK_ADD_UPDATE_TIME_FRAME, self.update_quick_add_panel)
+
         ErrorLogger.initializing_fencepost_finish()
+
+    def recover_order_edits(self):
+        """Replays the edits of each order that were
+        recorded in the order journal after the order
+        was last saved, then compacts the journal.
+
+        @return: None
+        """
+        journal = ConfirmationSystem.order_journal
+        self.orders.replay_journal(journal.get_pending_records())
+        journal.compact()
+
+    def update_quick_add_panel(self):
+        """Updates the quick add panel to display
+        the most popular MenuItems for the current
+        hour and day of the week.
+
+        @return: bool True so that the update
+        continues to be scheduled.
+        """
+        item_names = ConfirmationSystem.get_popular_items(QUICK_ADD_NUM_OF_ITEMS)
+        self.builder.update_quick_add_items(item_names)
+        return True
     
     def order_confirmed(self, priority_order, non_priority_order):
         """Callback Method. Called when the order has been confirmed.
@@ -58,6 +94,7 @@ class PeonOrderSystem(UI):
                                           self).order_confirmed(priority_order)
         ConfirmationSystem.order_confirmed(order_name, priority_order,
                                            non_priority_order, current_order)
+        self.update_quick_add_panel()
     
     def checkout_confirm(self, order):
         """Callback Method. Called when the order checkout has been
@@ -94,6 +131,25 @@ class PeonOrderSystem(UI):
         ConfirmationSystem.add_reservation_to_database(reserver)
         return reserver
 
+    def cancel_selected_reservation(self, *args):
+        """Override Method.
+
+        Cancels the selected reservation and
+        deletes it from the stored reservations.
+
+        @param args: wildcard catchall that is used
+        to catch the Gtk.Widget that called this
+        method.
+
+        @return: Reserver object that was cancelled.
+        """
+        reserver = super(PeonOrderSystem, self).cancel_selected_reservation(*args)
+
+        if reserver:
+            ConfirmationSystem.remove_reservation_from_database(reserver)
+
+        return reserver
+
     def add_checkout_order(self, imported_order, undone_checkouts):
         """Override Method.
 
@@ -106,30 +162,30 @@ class PeonOrderSystem(UI):
         These keys are mapped to values of list of MenuItem
         objects that represent the associated undone order.
 
-        @param checkout_keys: list of tuples that
-        (str, str, time.struct_time) that represent
-        the order_name, the new order name, and
-        the order time of the orders that were undone.
+        @param undone_checkouts: list of 2 tuple of
+        (CheckoutEntry, str) that represent the checkout
+        history entry and the new order name of the orders
+        that were undone. Only orders still stored as
+        checkout files may be undone.
 
         @return: None
         """
         super(PeonOrderSystem, self).add_checkout_order(imported_order,
                                                         undone_checkouts)
 
-        for original_name, original_time, new_name in undone_checkouts:
-            ConfirmationSystem.undo_checkout_file(original_name, original_time,
-                                                  new_name)
+        for entry, new_name in undone_checkouts:
+            ConfirmationSystem.undo_checkout(entry, new_name)
 
     def undo_checkout_order(self, *args):
         """Override Method
 
         This method is called whenever the
         associated widget is clicked. This method
-        obtains the stored checked out order data
-        and initiates the requisite dialog window
-        that allows the user to interact with, and
-        retrieve stored orders that were previously
-        checked out.
+        passes the checkout history to the requisite
+        dialog window that allows the user to browse,
+        and retrieve stored orders that were previously
+        checked out. Orders are only decoded as they
+        are selected.
 
         @param args: wildcard catchall that is used
         to catch the Gtk.Widget that called this
@@ -137,8 +193,8 @@ class PeonOrderSystem(UI):
 
         @return: None
         """
-        load_data = ConfirmationSystem.unpack_checkout_data()
-        super(PeonOrderSystem, self).undo_checkout_order(load_data)
+        super(PeonOrderSystem, self).undo_checkout_order(
+            ConfirmationSystem.checkout_history)
 
     def initiate_response_dialog(self, response_type):
         """Override Method
@@ -168,7 +224,9 @@ class PeonOrderSystem(UI):
         @return: None
         """
         order_name, order_list = self.get_order_info()
-        ConfirmationSystem.print_check(order_name, (order_list,))
+        order_totals = self.orders.get_current_totals()
+        ConfirmationSystem.print_check(order_name, (order_list,),
+                                       order_totals=(order_totals,))
 
     def perform_audit(self, start_date, end_date, **kwargs):
         """Override Method.
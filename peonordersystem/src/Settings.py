@@ -43,7 +43,26 @@ FRONT_RECEIPT_FILE_NAME = 'front.receipt'
 KITCHEN_TICKET_FILE_NAME = 'back.ticket'
 
 KITCHEN_PRINTER_NAME = "KitchenPrinter"
-FRONT_PRINTER_NAME = "KitchenPrinter"
+FRONT_PRINTER_NAME = "FrontPrinter"
+
+# printers that jobs are routed to while the primary printer is unavailable.
+KITCHEN_FALLBACK_PRINTER_NAME = "FrontPrinter"
+FRONT_FALLBACK_PRINTER_NAME = "KitchenPrinter"
+
+# backend the printers are accessed through, either 'cups' or 'simulated'.
+PRINTER_BACKEND = 'cups'
+
+# in seconds, the time between polls of the printers and their jobs.
+PRINTER_POLL_INTERVAL = 5
+
+# in seconds, the time a job may remain unprinted before it is re-queued.
+PRINT_JOB_TIMEOUT = 60
+
+# number of times a job may fail or time out before it is given up on.
+PRINT_JOB_MAX_FAILURES = 3
+
+# number of finished jobs kept in the job ledger.
+PRINT_JOB_LEDGER_SIZE = 200
 
 #====================================================================================
 # This block represents constants used for Reserver objects and displaying those
@@ -61,6 +80,14 @@ RESERVATION_NOTIFICATION_TIME_MIN = timedelta(seconds=0.0)
 RESERVATION_NOTIFICATION_TIME_FRAME_STR = \
     str(round(RESERVATION_UPDATE_TIME_FRAME / 1000)) + ' minutes'
 
+#====================================================================================
+# This block represents constants used for the quick add panel that displays the
+# most popular MenuItems.
+#====================================================================================
+QUICK_ADD_NUM_OF_ITEMS = 6
+# in milliseconds, 1 minute by default
+QUICK_ADD_UPDATE_TIME_FRAME = 1000 * 60
+
 #====================================================================================
 # This block represents constants used for MenuItem objects and the displaying of
 # those MenuItem objects.
@@ -78,6 +105,24 @@ MENU_ITEM_CONFIRMED_COLOR_HEXADECIMAL = '#999999'
 #====================================================================================
 SALES_TAX = .10
 
+ORDER_TYPE_STANDARD = 'standard'
+ORDER_TYPE_TOGO = 'togo'
+
+# tax class of items whose menu category has no tax class, and of items,
+# such as discounts, that aren't on the menu.
+DEFAULT_TAX_CLASS = 'sales'
+
+# tax classes mapped to their rates.
+TAX_CLASS_RATES = {DEFAULT_TAX_CLASS: SALES_TAX}
+
+# menu categories mapped to the tax class of their items,
+# e.g. {'BEER': 'alcohol'} with 'alcohol' given a rate above.
+CATEGORY_TAX_CLASSES = {}
+
+# order types mapped to dicts of tax classes mapped to the rates that replace
+# the TAX_CLASS_RATES for orders of that type, e.g. {ORDER_TYPE_TOGO: {'sales': .08}}
+ORDER_TYPE_TAX_RATES = {ORDER_TYPE_TOGO: {}}
+
 #==============================================================================
 # This block represents constants that are utilized by the audit dialogs when
 # generating audit files.
@@ -157,7 +202,8 @@ ORDER_DATA_COLS = {'OrderNumber': 'INT',
                    'OrderItemFrequency_json': 'TEXT',
                    'OrderType_standard': 'INT',
                    'OrderType_togo': 'INT',
-                   'OrderData_json': 'TEXT'}
+                   'OrderData_json': 'TEXT',
+                   'OrderTaxBreakdown_json': 'TEXT'}
 
 ITEM_DATA_COLS = {'OrderNumber': 'INT',
                   'ItemName': 'TEXT',
@@ -165,10 +211,16 @@ ITEM_DATA_COLS = {'OrderNumber': 'INT',
                   'ItemIsNotification': 'INT',
                   'ItemData_json': 'TEXT'}
 
+ITEM_POPULARITY_DATA_COLS = {'PopularityDay': 'INT',
+                             'PopularityHour': 'INT',
+                             'ItemName': 'TEXT',
+                             'PopularityFrequency': 'INT'}
+
 RESERVATIONS_DATA_COLS = {'ReservationName': 'TEXT',
                           'ReservationTime': 'NUMERIC',
                           'ReservationNumber': 'TEXT',
-                          'ReservationData_json': 'TEXT'}
+                          'ReservationData_json': 'TEXT',
+                          'ReservationID': 'TEXT'}
 
 #====================================================================================
 # This block represents constants that are utilized in accordance with time
@@ -183,3 +235,27 @@ SQLITE_DATE_FORMAT_STR = '%Y-%m-%d'
 MAX_DATETIME = datetime(2038, 1, 1)
 MIN_DATETIME = datetime.fromtimestamp(0)
 
+
+#====================================================================================
+# This block represents constants that are utilized by the ErrorLogger.
+#====================================================================================
+LOG_FILE_NAME = 'debug.log'
+
+# name of the logging level. Entry and exit of each logged method is only
+# traced at 'DEBUG'.
+LOG_LEVEL = 'INFO'
+
+# in bytes, 5 megabytes by default
+LOG_MAX_BYTES = 1024 * 1024 * 5
+LOG_BACKUP_COUNT = 5
+
+#====================================================================================
+# This block represents constants that are utilized by the latency metrics.
+#====================================================================================
+METRICS_FILE_NAME = 'metrics.json'
+
+# number of most recent latencies kept for each operation
+METRICS_SAMPLE_SIZE = 1000
+
+# in seconds, 60 seconds by default
+METRICS_EXPORT_INTERVAL = 60
@@ -0,0 +1,298 @@
+"""This module defines the TaxEngine class
+which is used to calculate the tax on an
+order when items are taxed at different
+rates.
+
+Each item belongs to a tax class, which is
+given by the menu category the item is in.
+Each tax class has a rate, which may differ
+by the type of the order. The tax of an
+order is the sum of the tax of each class,
+with the tax of each class rounded up to
+the next cent.
+
+Discounts, which are items with a negative
+price, don't belong to a tax class. They are
+allocated across the tax classes in proportion
+to the subtotal of each class, so that no class
+is taxed on less than nothing.
+
+@author: Carl McGraw
+@contact: cjmcgraw( at )u.washington.edu
+@version: 1.0
+"""
+from fractions import Fraction
+
+from peonordersystem.src.Settings import (TAX_CLASS_RATES, CATEGORY_TAX_CLASSES,
+                                          ORDER_TYPE_TAX_RATES, DEFAULT_TAX_CLASS,
+                                          ORDER_TYPE_STANDARD)
+
+
+class TaxEngine(object):
+    """Calculates the tax of orders by tax
+    class. The tax class of each menu category
+    and the rate of each tax class and order
+    type are cached as they are looked up.
+
+    @var default_tax_class: str representing the
+    tax class of items whose category has no tax
+    class.
+
+    @var _item_categories: dict of str item names
+    mapped to the str menu category of the item.
+
+    @var _category_classes: dict of str menu
+    categories mapped to their cached str tax class.
+
+    @var _rates: dict of 2 tuple (str, str) of the
+    tax class and order type mapped to the cached
+    Fraction rate.
+    """
+
+    def __init__(self, class_rates=TAX_CLASS_RATES,
+                 category_classes=CATEGORY_TAX_CLASSES,
+                 order_type_rates=ORDER_TYPE_TAX_RATES,
+                 default_tax_class=DEFAULT_TAX_CLASS):
+        """Initializes the TaxEngine.
+
+        @keyword class_rates: dict of str tax classes
+        mapped to their float rates. Default is
+        TAX_CLASS_RATES.
+
+        @keyword category_classes: dict of str menu
+        categories mapped to their str tax class.
+        Default is CATEGORY_TAX_CLASSES.
+
+        @keyword order_type_rates: dict of str order
+        types mapped to dicts of str tax classes mapped
+        to the float rates that replace the class_rates
+        for orders of that type. Default is
+        ORDER_TYPE_TAX_RATES.
+
+        @keyword default_tax_class: str representing
+        the tax class of items whose category has no
+        tax class. Default is DEFAULT_TAX_CLASS.
+        """
+        if default_tax_class not in class_rates:
+            raise ValueError('Expected a rate for the default tax class '
+                             '{}'.format(default_tax_class))
+
+        self.default_tax_class = default_tax_class
+
+        self._class_rates = dict(class_rates)
+        self._category_tax_classes = dict(category_classes)
+        self._order_type_rates = dict((order_type, dict(rates)) for
+                                      order_type, rates in
+                                      order_type_rates.iteritems())
+
+        self._item_categories = {}
+        self._category_classes = {}
+        self._rates = {}
+
+    def set_menu_categories(self, menu_items):
+        """Sets the menu category of each item
+        on the menu.
+
+        @param menu_items: iterable of 2 tuple of
+        (str, MenuItem) representing the category
+        and the item, such as MenuSnapshot.items
+
+        @return: None
+        """
+        self._item_categories = dict((menu_item.get_name(), category) for
+                                     category, menu_item in menu_items)
+
+    def get_category_tax_class(self, category):
+        """Gets the tax class of the items in
+        the given menu category.
+
+        @param category: str representing the
+        menu category, or None if the item isn't
+        on the menu.
+
+        @return: str representing the tax class.
+        """
+        try:
+            return self._category_classes[category]
+
+        except KeyError:
+            tax_class = self._category_tax_classes.get(category,
+                                                       self.default_tax_class)
+
+            if tax_class not in self._class_rates:
+                tax_class = self.default_tax_class
+
+            self._category_classes[category] = tax_class
+            return tax_class
+
+    def get_tax_class(self, menu_item):
+        """Gets the tax class of the given item.
+
+        @param menu_item: MenuItem object.
+
+        @return: str representing the tax class.
+        """
+        category = self._item_categories.get(menu_item.get_name())
+        return self.get_category_tax_class(category)
+
+    def get_rate(self, tax_class, order_type=ORDER_TYPE_STANDARD):
+        """Gets the rate of the given tax class for
+        orders of the given type.
+
+        @param tax_class: str representing the tax
+        class.
+
+        @keyword order_type: str representing the type
+        of the order. Default is ORDER_TYPE_STANDARD.
+
+        @return: Fraction representing the exact rate.
+        """
+        key = tax_class, order_type
+
+        try:
+            return self._rates[key]
+
+        except KeyError:
+            rates = self._order_type_rates.get(order_type, {})
+            rate = rates.get(tax_class, self._class_rates[tax_class])
+
+            # the repr of the float is the rate as it was written
+            rate = Fraction(repr(rate))
+            self._rates[key] = rate
+            return rate
+
+    def get_class_tax_cents(self, tax_class, subtotal,
+                            order_type=ORDER_TYPE_STANDARD):
+        """Gets the tax of the given subtotal of
+        the given tax class in integer cents. The
+        tax is rounded up to the next cent.
+
+        @param tax_class: str representing the tax
+        class.
+
+        @param subtotal: int representing the subtotal
+        of the tax class in cents.
+
+        @keyword order_type: str representing the type
+        of the order. Default is ORDER_TYPE_STANDARD.
+
+        @return: int representing the tax in cents.
+        """
+        rate = self.get_rate(tax_class, order_type)
+        return -(-subtotal * rate.numerator // rate.denominator)
+
+    def get_order_subtotals_cents(self, order_list):
+        """Groups the given items by their tax
+        class and sums their prices, in one pass.
+        Discounts are summed separately.
+
+        @param order_list: list of MenuItem objects.
+
+        @return: 2 tuple of (dict, int) representing
+        the str tax classes mapped to the int subtotal
+        of the class in cents, and the sum of the
+        discounts in cents, which is never positive.
+        """
+        item_categories = self._item_categories
+        get_category_tax_class = self.get_category_tax_class
+        class_subtotals = {}
+        discount = 0
+
+        for menu_item in order_list:
+            price_cents = menu_item.get_price_cents()
+
+            if price_cents < 0:
+                discount += price_cents
+                continue
+
+            category = item_categories.get(menu_item.get_name())
+            tax_class = get_category_tax_class(category)
+
+            class_subtotals[tax_class] = (class_subtotals.get(tax_class, 0) +
+                                          price_cents)
+
+        return class_subtotals, discount
+
+    def allocate_discount_cents(self, class_subtotals, discount):
+        """Allocates the given discount across the
+        given tax class subtotals, in proportion to
+        each subtotal. Cents that don't divide evenly
+        go to the classes with the largest remainders.
+        A discount larger than the subtotals reduces
+        every class to zero.
+
+        @param class_subtotals: dict of str tax classes
+        mapped to the int subtotal of the class in cents.
+
+        @param discount: int representing the sum of the
+        discounts in cents, which is never positive.
+
+        @return: dict of str tax classes mapped to the
+        int subtotal of the class in cents, after the
+        discount.
+        """
+        total = sum(class_subtotals.itervalues())
+        discount = min(-discount, total)
+
+        if discount <= 0:
+            return dict(class_subtotals)
+
+        shares = {}
+        remainders = []
+
+        for tax_class, subtotal in class_subtotals.iteritems():
+            share, remainder = divmod(discount * subtotal, total)
+            shares[tax_class] = share
+            remainders.append((-remainder, tax_class))
+
+        remainders.sort()
+
+        for _, tax_class in remainders[:discount - sum(shares.itervalues())]:
+            shares[tax_class] += 1
+
+        return dict((tax_class, subtotal - shares[tax_class]) for
+                    tax_class, subtotal in class_subtotals.iteritems())
+
+    def get_class_subtotals_cents(self, order_list):
+        """Gets the subtotal of each tax class of
+        the given items, with the discounts allocated
+        across the classes.
+
+        @param order_list: list of MenuItem objects.
+
+        @return: dict of str tax classes mapped to the
+        int subtotal of the class in cents.
+        """
+        return self.allocate_discount_cents(*self.get_order_subtotals_cents(order_list))
+
+    def get_tax_breakdown_cents(self, class_subtotals,
+                                order_type=ORDER_TYPE_STANDARD):
+        """Gets the tax of each of the given tax
+        class subtotals in integer cents.
+
+        @param class_subtotals: dict of str tax classes
+        mapped to the int subtotal of the class in cents.
+
+        @keyword order_type: str representing the type
+        of the order. Default is ORDER_TYPE_STANDARD.
+
+        @return: dict of str tax classes mapped to the
+        int tax of the class in cents. Classes with a
+        subtotal of zero are omitted.
+        """
+        return dict((tax_class,
+                     self.get_class_tax_cents(tax_class, subtotal, order_type))
+                    for tax_class, subtotal in class_subtotals.iteritems()
+                    if subtotal)
+
+    def clear(self):
+        """Clears the cached tax classes
+        and rates.
+
+        @return: None
+        """
+        self._category_classes.clear()
+        self._rates.clear()
+
+
+tax_engine = TaxEngine()
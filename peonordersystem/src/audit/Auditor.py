@@ -10,6 +10,7 @@ import os
 from datetime import datetime, date, time
 
 from peonordersystem.SystemPath import SYSTEM_AUDIT_PATH
+from peonordersystem.src import Metrics
 from peonordersystem.src.Settings import (FILENAME_TEMPLATE,
                                           DEFAULT_AUDIT_NAME,
                                           AUDIT_FILE_TYPE,
@@ -79,6 +80,7 @@ class Auditor(object):
             os.makedirs(dirs)
         return dirs
 
+    @Metrics.timed('Auditor.audit_range')
     def audit_range(self, start_datetime, end_datetime, **kwargs):
         """Creates an audit over the given data range with the
         given keywords.
@@ -218,5 +220,5 @@ class Auditor(object):
         else:
             start_date = datetime.combine(date.today(), time.min)
             end_date = datetime.combine(date.today(), time.max)
-        generator = get_stored_order_data(start_date, end_date)
+        generator = get_stored_order_data(start_date, end_date, compact=True)
         return generator
@@ -37,6 +37,7 @@ class MutableData(AuditData):
         self._total = 0.0
         self._subtotal = 0.0
         self._tax = 0.0
+        self._tax_breakdown = Counter()
 
         self._standard_orders = 0
         self._togo_orders = 0
@@ -74,6 +75,7 @@ class MutableData(AuditData):
         self.total += update_data.total
         self.subtotal += update_data.subtotal
         self.tax += update_data.tax
+        self.tax_breakdown.update(update_data.tax_breakdown)
 
         self.standard_orders += update_data.standard_orders
         self.togo_orders += update_data.togo_orders
@@ -257,6 +259,31 @@ class MutableData(AuditData):
         """
         self._tax = tax
 
+    @property
+    def tax_breakdown(self):
+        """Gets a Counter representing
+        the tax of each tax class associated
+        with the data.
+
+        @return: collections.Counter of str
+        tax classes mapped to the float tax
+        of the class.
+        """
+        return self._tax_breakdown
+
+    @tax_breakdown.setter
+    def tax_breakdown(self, tax_breakdown):
+        """Sets the tax of each tax class
+        associated with the data.
+
+        @param tax_breakdown: Counter of str
+        tax classes mapped to the float tax of
+        the class.
+
+        @return: None
+        """
+        self._tax_breakdown = tax_breakdown
+
     @property
     def standard_orders(self):
         """Gets the standard orders
@@ -100,6 +100,16 @@ class OrderData(AuditData):
         """
         return self._data.tax
 
+    @property
+    def tax_breakdown(self):
+        """Gets the tax of each tax class
+        associated with the data.
+
+        @return: dict of str tax classes
+        mapped to the float tax of the class.
+        """
+        return self._data.tax_breakdown
+
     @property
     def togo_orders(self):
         """Gets the value representing
@@ -106,6 +106,16 @@ class AuditData(CollectionDataBundle):
         """
         pass
 
+    @abstractproperty
+    def tax_breakdown(self):
+        """Gets the tax of each tax class
+        associated with the data.
+
+        @return: dict of str tax classes
+        mapped to the float tax of the class.
+        """
+        pass
+
     @abstractproperty
     def subtotal(self):
         """Gets the subtotal associated
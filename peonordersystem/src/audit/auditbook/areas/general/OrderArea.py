@@ -4,9 +4,7 @@
 """
 from .abc.GeneralArea import GeneralArea
 from peonordersystem.src.MenuItem import is_menu_item
-from peonordersystem.src.CheckOperations import (get_order_subtotal,
-                                                 get_total_tax,
-                                                 get_total)
+from peonordersystem.src.CheckOperations import get_totals, get_tax_breakdown
 
 
 class OrderArea(GeneralArea):
@@ -49,6 +47,7 @@ class OrderArea(GeneralArea):
         self.update_title_data()
         self.update_total_data()
         self._update_items_data()
+        self._write_tax_breakdown(self.packaged_data.tax_breakdown)
         return values
 
     def _update_items_data(self):
@@ -172,16 +171,52 @@ class OrderArea(GeneralArea):
         representing the total, tax, and subtotal
         associated with the MenuItem respectively.
         """
-        subtotal = get_order_subtotal((menu_item,))
-        tax = get_total_tax(subtotal)
-        total = get_total((menu_item,))
+        subtotal, tax, total = get_totals((menu_item,))
 
         self.packaged_data.total += total
         self.packaged_data.tax += tax
         self.packaged_data.subtotal += subtotal
+        self.packaged_data.tax_breakdown.update(get_tax_breakdown((menu_item,)))
 
         return total, tax, subtotal
 
+    def _write_tax_breakdown(self, tax_breakdown):
+        """Writes the tax of each tax class to
+        the data area, after the items. Orders
+        with a single tax class have no breakdown
+        written, as it is the tax in the total
+        area.
+
+        @param tax_breakdown: dict of str tax classes
+        mapped to the float tax of the class.
+
+        @return: 2 tuple of (int, int) representing
+        the row and column that it is safe to
+        append more data to after this procedure.
+        """
+        if len(tax_breakdown) <= 1:
+            return self.row, self.col
+
+        col = self.col + 1
+        row_counter = self.row
+
+        format = self._get_item_options_title_format()
+        self.write_data('tax', format=format)
+
+        for tax_class in sorted(tax_breakdown):
+            format = self._get_item_option_name_format()
+            self.write_data(tax_class, row=row_counter, col=col,
+                            format=format)
+
+            format = self._get_item_option_price_format()
+            self.write_data(tax_breakdown[tax_class], row=row_counter,
+                            col=self.area_end_col, format=format)
+
+            row_counter += 1
+
+        self.row = row_counter
+        return self.row, self.col
+
     def _write_item(self, menu_item):
         """Writes the MenuItems data to the data
         area.
@@ -0,0 +1,467 @@
+"""This module provides the CheckoutHistory
+class that is used to browse the orders that
+have been checked out.
+
+Orders checked out today are stored as files in
+the checkout directory until they are moved into
+the OrderData table of the orders database. The
+name, time and totals of each checkout file are
+indexed in the CheckoutData table as the file is
+saved, so that the checkouts of any day are listed
+from the CheckoutData and OrderData tables without
+decoding any order. An order is only decoded once
+it is selected.
+
+@author: Carl McGraw
+@contact: cjmcgraw( at )u.washington.edu
+@version: 1.0
+"""
+import os
+import jsonpickle
+from datetime import datetime, timedelta
+
+from peonordersystem.src.Settings import SQLITE_DATE_TIME_FORMAT_STR
+
+# sources that a checked out order may be stored in
+CHECKOUT_FILE_SOURCE = 'file'
+CHECKOUT_DATABASE_SOURCE = 'database'
+
+
+def create_checkout_table(database):
+    """Creates the CheckoutData table and its
+    index if they do not exist.
+
+    @param database: sqlite3.Connection pointing
+    to the orders database.
+
+    @return: None
+    """
+    db = database.cursor()
+
+    db.execute('CREATE TABLE IF NOT EXISTS CheckoutData '
+               '    (   CheckoutFile TEXT,'
+               '        CheckoutName TEXT,'
+               '        CheckoutDate NUMERIC,'
+               '        CheckoutSubtotal REAL,'
+               '        CheckoutTax REAL,'
+               '        CheckoutTotal REAL,'
+               '        PRIMARY KEY (CheckoutFile)'
+               '    );')
+
+    db.execute('CREATE INDEX IF NOT EXISTS CheckoutDataDate '
+               '    ON CheckoutData (CheckoutDate);')
+
+    database.commit()
+
+
+class CheckoutEntry(object):
+    """Represents a checked out order as it is
+    listed in the history. The order itself isn't
+    stored in the entry.
+
+    @var source: str representing where the order
+    is stored. Either CHECKOUT_FILE_SOURCE or
+    CHECKOUT_DATABASE_SOURCE.
+
+    @var key: str representing the checkout file name
+    if the order is stored in a file, or int representing
+    the order number if it is stored in the database.
+
+    @var name: str representing the name of the order.
+
+    @var checkout_time: datetime object representing
+    the time the order was checked out.
+
+    @var subtotal: float representing the subtotal.
+
+    @var tax: float representing the tax.
+
+    @var total: float representing the total.
+    """
+    __slots__ = ('source', 'key', 'name', 'checkout_time',
+                 'subtotal', 'tax', 'total')
+
+    def __init__(self, source, key, name, checkout_time, subtotal, tax, total):
+        """Initializes the CheckoutEntry.
+
+        @param source: str representing where the
+        order is stored.
+
+        @param key: str or int representing the key
+        the order is stored under.
+
+        @param name: str representing the name of
+        the order.
+
+        @param checkout_time: datetime object
+        representing the checkout time.
+
+        @param subtotal: float representing the
+        subtotal.
+
+        @param tax: float representing the tax.
+
+        @param total: float representing the total.
+        """
+        self.source = source
+        self.key = key
+        self.name = name
+        self.checkout_time = checkout_time
+        self.subtotal = subtotal
+        self.tax = tax
+        self.total = total
+
+    def is_stored(self):
+        """Checks if the order has been moved
+        into the orders database.
+
+        @return: bool
+        """
+        return self.source == CHECKOUT_DATABASE_SOURCE
+
+    def get_id(self):
+        """Gets a str that identifies the entry,
+        which may be stored in a Gtk.TreeModel.
+
+        @return: str
+        """
+        return '{}:{}'.format(self.source, self.key)
+
+    def __eq__(self, other):
+        """Checks if the given entry refers
+        to the same order.
+
+        @param other: object to be compared.
+
+        @return: bool
+        """
+        return (isinstance(other, CheckoutEntry) and
+                self.source == other.source and self.key == other.key)
+
+    def __ne__(self, other):
+        """Checks if the given entry doesn't
+        refer to the same order.
+
+        @param other: object to be compared.
+
+        @return: bool
+        """
+        return not self == other
+
+    def __hash__(self):
+        """Gets the hash of the entry.
+
+        @return: int
+        """
+        return hash((self.source, self.key))
+
+    def __repr__(self):
+        """Gets a string representation of
+        the entry.
+
+        @return: str
+        """
+        return 'CheckoutEntry({}, {}, {}, {})'.format(self.get_id(), self.name,
+                                                      self.checkout_time,
+                                                      self.total)
+
+
+class CheckoutHistory(object):
+    """Indexes the checkout files and queries
+    the checked out orders of each day from the
+    index and the orders database.
+    """
+
+    DEFAULT_PAGE_SIZE = 50
+
+    def __init__(self, database, checkout_directory):
+        """Initializes the CheckoutHistory.
+
+        @param database: sqlite3.Connection pointing
+        to the orders database. The CheckoutData table
+        is created if it doesn't exist.
+
+        @param checkout_directory: str representing
+        the directory the checkout files are stored in.
+        """
+        self._database = database
+        self._checkout_directory = checkout_directory
+        create_checkout_table(database)
+
+    @staticmethod
+    def _format_time(set_time):
+        """Private Method.
+
+        Formats the given datetime as it is
+        stored in the date columns.
+
+        @param set_time: datetime object.
+
+        @return: str
+        """
+        return set_time.strftime(SQLITE_DATE_TIME_FORMAT_STR)
+
+    #==========================================================================
+    # This block contains methods that alter the index of checkout files.
+    #==========================================================================
+    def add(self, file_name, order_name, checkout_time, totals):
+        """Indexes the given checkout file.
+
+        @param file_name: str representing the name
+        of the checkout file.
+
+        @param order_name: str representing the name
+        of the order.
+
+        @param checkout_time: datetime object
+        representing the checkout time.
+
+        @param totals: 3 tuple of (float, float, float)
+        representing the subtotal, tax and total.
+
+        @return: None
+        """
+        db = self._database.cursor()
+        db.execute('INSERT OR REPLACE INTO CheckoutData '
+                   '    (CheckoutFile, CheckoutName, CheckoutDate,'
+                   '     CheckoutSubtotal, CheckoutTax, CheckoutTotal) '
+                   'VALUES (?, ?, datetime(?), ?, ?, ?);',
+                   (file_name, order_name, self._format_time(checkout_time))
+                   + tuple(totals))
+        self._database.commit()
+
+    def discard(self, file_name):
+        """Removes the given checkout file from
+        the index, as it has been undone or moved
+        into the orders database.
+
+        @param file_name: str representing the name
+        of the checkout file.
+
+        @return: bool value representing if the file
+        was indexed.
+        """
+        db = self._database.cursor()
+        db.execute('DELETE FROM CheckoutData WHERE CheckoutFile = ?;',
+                   (file_name,))
+        self._database.commit()
+
+        return db.rowcount > 0
+
+    def get_indexed_files(self):
+        """Gets the names of the indexed
+        checkout files.
+
+        @return: set of str
+        """
+        db = self._database.cursor()
+        rows = db.execute('SELECT CheckoutFile FROM CheckoutData;')
+        return set(str(file_name) for file_name, in rows)
+
+    #==========================================================================
+    # This block contains methods that query the checked out orders.
+    #==========================================================================
+    def get_day(self, set_date=None, limit=None, offset=0):
+        """Gets the orders checked out on the
+        given day, most recent first. No order is
+        decoded.
+
+        @keyword set_date: date object representing
+        the day. Default is None, which is today.
+
+        @keyword limit: int representing the maximum
+        number of entries to get. Default is None, for
+        every order of the day.
+
+        @keyword offset: int representing the number
+        of entries to skip. Default is 0.
+
+        @return: list of CheckoutEntry objects.
+        """
+        start_time, end_time = self._get_day_range(set_date)
+
+        if limit is None:
+            limit = -1
+
+        db = self._database.cursor()
+        rows = db.execute('SELECT ?, CheckoutFile, CheckoutName, CheckoutDate, '
+                          '       CheckoutSubtotal, CheckoutTax, CheckoutTotal '
+                          'FROM CheckoutData '
+                          'WHERE CheckoutDate >= ? AND CheckoutDate < ? '
+                          'UNION ALL '
+                          'SELECT ?, OrderNumber, OrderName, OrderDate, '
+                          '       OrderSubtotal, OrderTax, OrderTotal '
+                          'FROM OrderData '
+                          'WHERE OrderDate >= ? AND OrderDate < ? '
+                          'ORDER BY 4 DESC, 1, 2 '
+                          'LIMIT ? OFFSET ?;',
+                          (CHECKOUT_FILE_SOURCE, start_time, end_time,
+                           CHECKOUT_DATABASE_SOURCE, start_time, end_time,
+                           limit, offset))
+
+        return [self._get_entry(row) for row in rows]
+
+    def get_page(self, page, set_date=None, page_size=DEFAULT_PAGE_SIZE):
+        """Gets a page of the orders checked
+        out on the given day.
+
+        @param page: int representing the page to
+        get, starting from 0.
+
+        @keyword set_date: date object representing
+        the day. Default is None, which is today.
+
+        @keyword page_size: int representing the number
+        of entries on each page. Default is
+        DEFAULT_PAGE_SIZE.
+
+        @return: list of CheckoutEntry objects.
+        """
+        return self.get_day(set_date, limit=page_size, offset=page * page_size)
+
+    def count_day(self, set_date=None):
+        """Counts the orders checked out on
+        the given day.
+
+        @keyword set_date: date object representing
+        the day. Default is None, which is today.
+
+        @return: int
+        """
+        start_time, end_time = self._get_day_range(set_date)
+
+        db = self._database.cursor()
+        rows = db.execute('SELECT '
+                          '    (SELECT COUNT(*) FROM CheckoutData '
+                          '     WHERE CheckoutDate >= ? AND CheckoutDate < ?) + '
+                          '    (SELECT COUNT(*) FROM OrderData '
+                          '     WHERE OrderDate >= ? AND OrderDate < ?);',
+                          (start_time, end_time, start_time, end_time))
+        return rows.fetchone()[0]
+
+    def get_previous_day(self, set_date=None):
+        """Gets the most recent day before the
+        given day that has orders checked out.
+
+        @keyword set_date: date object representing
+        the day. Default is None, which is today.
+
+        @return: date object, or None if there is
+        no such day.
+        """
+        start_time, _ = self._get_day_range(set_date)
+
+        db = self._database.cursor()
+        rows = db.execute('SELECT MAX(CheckoutDate) FROM ('
+                          '    SELECT MAX(CheckoutDate) AS CheckoutDate '
+                          '    FROM CheckoutData WHERE CheckoutDate < ? '
+                          '    UNION ALL '
+                          '    SELECT MAX(OrderDate) '
+                          '    FROM OrderData WHERE OrderDate < ?'
+                          ');', (start_time, start_time))
+        return self._parse_date(rows.fetchone()[0])
+
+    def get_next_day(self, set_date=None):
+        """Gets the earliest day after the given
+        day that has orders checked out.
+
+        @keyword set_date: date object representing
+        the day. Default is None, which is today.
+
+        @return: date object, or None if there is
+        no such day.
+        """
+        _, end_time = self._get_day_range(set_date)
+
+        db = self._database.cursor()
+        rows = db.execute('SELECT MIN(CheckoutDate) FROM ('
+                          '    SELECT MIN(CheckoutDate) AS CheckoutDate '
+                          '    FROM CheckoutData WHERE CheckoutDate >= ? '
+                          '    UNION ALL '
+                          '    SELECT MIN(OrderDate) '
+                          '    FROM OrderData WHERE OrderDate >= ?'
+                          ');', (end_time, end_time))
+        return self._parse_date(rows.fetchone()[0])
+
+    def get_order(self, entry):
+        """Gets the order of the given entry.
+        Only this order is decoded.
+
+        @param entry: CheckoutEntry object.
+
+        @return: list of MenuItem objects that
+        represents the order.
+        """
+        if entry.is_stored():
+            db = self._database.cursor()
+            rows = db.execute('SELECT OrderData_json FROM OrderData '
+                              'WHERE OrderNumber = ?;', (entry.key,))
+            data = rows.fetchone()[0]
+
+        else:
+            file_path = os.path.join(self._checkout_directory, entry.key)
+
+            with open(file_path, 'r') as file_data:
+                data = file_data.read()
+
+        return jsonpickle.decode(data)
+
+    def _get_day_range(self, set_date):
+        """Private Method.
+
+        Gets the range of the given day as it
+        is compared against the date columns.
+
+        @param set_date: date object representing
+        the day, or None for today.
+
+        @return: 2 tuple of (str, str) representing
+        the inclusive start and exclusive end of the
+        day.
+        """
+        if set_date is None:
+            set_date = datetime.now().date()
+
+        start_time = datetime.combine(set_date, datetime.min.time())
+        end_time = start_time + timedelta(days=1)
+
+        return self._format_time(start_time), self._format_time(end_time)
+
+    @staticmethod
+    def _parse_date(date_str):
+        """Private Method.
+
+        Parses the date of the given stored
+        datetime.
+
+        @param date_str: str representing the stored
+        datetime, or None.
+
+        @return: date object, or None.
+        """
+        if date_str is None:
+            return None
+
+        return datetime.strptime(date_str, SQLITE_DATE_TIME_FORMAT_STR).date()
+
+    @staticmethod
+    def _get_entry(row):
+        """Private Method.
+
+        Gets the entry of the given row.
+
+        @param row: tuple of the source, key, name,
+        checkout time, subtotal, tax and total.
+
+        @return: CheckoutEntry object.
+        """
+        source, key, name, checkout_time, subtotal, tax, total = row
+
+        if source == CHECKOUT_FILE_SOURCE:
+            key = str(key)
+
+        checkout_time = datetime.strptime(checkout_time,
+                                          SQLITE_DATE_TIME_FORMAT_STR)
+
+        return CheckoutEntry(source, key, name, checkout_time,
+                             subtotal, tax, total)
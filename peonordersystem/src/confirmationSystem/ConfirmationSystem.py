@@ -19,12 +19,16 @@ import os
 import sqlite3
 import jsonpickle
 from datetime import datetime
+from functools import partial
 from collections import Counter
 
 jsonpickle.set_encoder_options('simplejson', sort_keys=True, indent=4)
 
 from peonordersystem import SystemPath
-from peonordersystem.src import CheckOperations
+from peonordersystem.src import Metrics
+from peonordersystem.src.AtomicWriter import atomic_write
+from peonordersystem.src.OrderTotals import OrderTotals
+from peonordersystem.src.MenuItem import compact_order, compact_menu_item
 from peonordersystem.src.standardoperations import (check_date,
                                                     check_datetime,
                                                     check_date_range,
@@ -42,12 +46,20 @@ from peonordersystem.src.Settings import (TOGO_SEPARATOR,
                                           TRANSLATION_FROM_CHARS_TO_BLACKLIST_CHARS
                                           as CHARS_TO_BLACKLIST,
                                           FILENAME_PATTERN,
-                                          FILENAME_TEMPLATE)
+                                          FILENAME_TEMPLATE,
+                                          ORDER_TYPE_STANDARD,
+                                          ORDER_TYPE_TOGO)
 
 from .bundlers.OrderDataBundle import OrderDataBundle
 from .bundlers.DateDataBundle import DateDataBundle
 from .bundlers.ItemDataBundle import ItemDataBundle
 
+from .PopularityRollup import PopularityRollup
+from .OrderJournal import OrderJournal
+from .CheckoutHistory import CheckoutHistory
+from .ReservationsRepository import (ReservationsRepository,
+                                     create_reservations_table)
+
 from .printers.adapters.DataAdapter import DataAdapter
 from .printers.Printer import Printer
 
@@ -65,6 +77,8 @@ RESERVATIONS_DATABASE_PATH = SystemPath.SYSTEM_RESERVATIONS_DATABASE
 CONFIRMED_DIRECTORY = SystemPath.SYSTEM_ORDERS_CONFIRMED_DIRECTORY
 CHECKOUT_DIRECTORY = SystemPath.SYSTEM_ORDERS_CHECKOUT_DIRECTORY
 
+ORDERS_JOURNAL_PATH = SystemPath.SYSTEM_ORDERS_JOURNAL
+
 
 for dirs in (DIRECTORY, CHECKOUT_DIRECTORY, CONFIRMED_DIRECTORY,
              SystemPath.SYSTEM_DATABASE_PATH):
@@ -77,6 +91,7 @@ STANDARD_TIME_FORMAT = SQLITE_DATE_TIME_FORMAT_STR
 
 # global module wide variables
 ticket_printer = Printer()
+order_journal = OrderJournal(ORDERS_JOURNAL_PATH)
 
 
 #====================================================================================
@@ -100,6 +115,15 @@ ticket_printer = Printer()
 #                information regarding any given MenuItem. This is duplicate data
 #                compiled from OrderData tables OrderData.
 #
+#       4. ItemPopularityData: Represents the number of times each MenuItem has been
+#                confirmed for each hour of each day of the week. This is created
+#                and seeded from OrderData by the PopularityRollup, and updated as
+#                orders are confirmed.
+#
+#       5. CheckoutData: Represents the name, time and totals of each checkout
+#                file that hasn't yet been added to the OrderData table. This is
+#                updated as orders are checked out.
+#
 # Reservations Database
 #
 #       1. ReservationsData: Represents all reservations data that has been
@@ -141,9 +165,18 @@ def _check_and_create_orders_database(database_directory=ORDERS_DATABASE_PATH):
                '        OrderType_standard INT,'
                '        OrderType_togo INT,'
                '        OrderData_json TEXT,'
+               '        OrderTaxBreakdown_json TEXT,'
                '        PRIMARY KEY (OrderNumber)'
                '    );')
 
+    columns = [row[1] for row in db.execute('PRAGMA table_info(OrderData);')]
+
+    if 'OrderTaxBreakdown_json' not in columns:
+        db.execute('ALTER TABLE OrderData ADD COLUMN OrderTaxBreakdown_json TEXT;')
+
+    db.execute('CREATE INDEX IF NOT EXISTS OrderDataDate '
+               '    ON OrderData (OrderDate);')
+
     db.execute('CREATE TABLE IF NOT EXISTS ItemData '
                '    (   OrderNumber INT,'
                '        ItemName TEXT, '
@@ -167,21 +200,16 @@ def _check_and_create_reservations_database(directory=RESERVATIONS_DATABASE_PATH
     @return: sqlite3.Connection pointing to the database.
     """
     reservations_database = sqlite3.connect(directory)
-    db = reservations_database.cursor()
-
-    db.execute('CREATE TABLE IF NOT EXISTS ReservationsData '
-               '    (   ReservationName TEXT,'
-               '        ReservationTime NUMERIC,'
-               '        ReservationNumber TEXT,'
-               '        ReservationData_json TEXT'
-               '    );')
-
-    reservations_database.commit()
+    create_reservations_table(reservations_database)
     return reservations_database
 
 ORDERS_DATABASE = _check_and_create_orders_database()
 RESERVATIONS_DATABASE = _check_and_create_reservations_database()
 
+popularity_rollup = PopularityRollup(ORDERS_DATABASE)
+reservations_repository = ReservationsRepository(RESERVATIONS_DATABASE)
+checkout_history = CheckoutHistory(ORDERS_DATABASE, CHECKOUT_DIRECTORY)
+
 
 #====================================================================================
 # This block contains functions that are helper functions utilized in interpreting,
@@ -283,6 +311,23 @@ def is_parseable_file_name(file_name):
     return True
 
 
+def get_order_type(order_name):
+    """Gets the type of the order with
+    the given name.
+
+    @param order_name: str representing the
+    name of the order.
+
+    @return: str representing the order type.
+    ORDER_TYPE_TOGO if the order is a togo order,
+    ORDER_TYPE_STANDARD otherwise.
+    """
+    if TOGO_SEPARATOR in order_name:
+        return ORDER_TYPE_TOGO
+
+    return ORDER_TYPE_STANDARD
+
+
 def _load_data(file_path):
     """Loads the json serialized object
     data stored in the given file path.
@@ -416,6 +461,86 @@ def unpack_checkout_data():
     return order_data
 
 
+def _get_checkout_history(database):
+    """Gets the CheckoutHistory for
+    the given database.
+
+    @param database: sqlite3.Connection pointing
+    to an orders database.
+
+    @return: CheckoutHistory
+    """
+    if database is ORDERS_DATABASE:
+        return checkout_history
+    return CheckoutHistory(database, CHECKOUT_DIRECTORY)
+
+
+def _get_checkout_totals(order_name, order_data):
+    """Gets the totals of the given checked
+    out order.
+
+    @param order_name: str representing the name
+    of the order.
+
+    @param order_data: list of MenuItem objects
+    that represents the order.
+
+    @return: 3 tuple of (float, float, float)
+    representing the subtotal, tax and total.
+    """
+    order_type = get_order_type(order_name)
+    return OrderTotals(order_data, order_type=order_type).get_totals()
+
+
+def index_checkout_files(database=ORDERS_DATABASE):
+    """Brings the index of the checkout files
+    up to date with the checkout directory. Only
+    files that aren't indexed are decoded, such as
+    those checked out before the index existed.
+
+    @keyword database: sqlite3.Connection that
+    stores the index. Default is ORDERS_DATABASE.
+
+    @return: None
+    """
+    history = _get_checkout_history(database)
+    indexed_files = history.get_indexed_files()
+    dirpath, dirnames, filenames = os.walk(CHECKOUT_DIRECTORY).next()
+
+    for filename in filenames:
+        if filename in indexed_files:
+            indexed_files.remove(filename)
+            continue
+
+        try:
+            order_time, order_name, _ = parse_standardized_file_name(filename,
+                togo_separator=TOGO_SEPARATOR)
+            order_data = _load_data(dirpath + '/' + filename)
+
+        except ValueError:
+            continue
+
+        history.add(filename, order_name, order_time,
+                    _get_checkout_totals(order_name, order_data))
+
+    for filename in indexed_files:
+        history.discard(filename)
+
+
+def _get_reservations_repository(database):
+    """Gets the ReservationsRepository for
+    the given database.
+
+    @param database: sqlite3.Connection pointing
+    to a reservations database.
+
+    @return: ReservationsRepository
+    """
+    if database is RESERVATIONS_DATABASE:
+        return reservations_repository
+    return ReservationsRepository(database)
+
+
 def unpack_reservations_data(curr_date=None, database=RESERVATIONS_DATABASE):
     """Unpacks the reservation data on
     the specified date.
@@ -436,23 +561,8 @@ def unpack_reservations_data(curr_date=None, database=RESERVATIONS_DATABASE):
     except ValueError:
         curr_date = datetime.now()
 
-    db = database.cursor()
-
-    data = db.execute('SELECT '
-                      '     ReservationData_json '
-                      'FROM '
-                      '     ReservationsData '
-                      'WHERE    '
-                      '     date(ReservationTime) = date(?) '
-                      'AND  '
-                      '     ReservationTime >= datetime(?)'
-                      'ORDER BY'
-                      '     ReservationTime;',
-                      (curr_date.strftime(SQLITE_DATE_FORMAT_STR),
-                       curr_date.strftime(SQLITE_DATE_TIME_FORMAT_STR)))
-    database.commit()
-
-    return [jsonpickle.decode(value[0]) for value in data]
+    repository = _get_reservations_repository(database)
+    return repository.get_today(curr_date)
 
 
 #====================================================================================
@@ -505,9 +615,8 @@ def _save_order_file_data(order_data, file_path):
     @return: None
     """
     is_parseable_file_name(file_path)
-    with open(file_path, 'w') as data_file:
-        order_data_str = jsonpickle.encode(order_data)
-        data_file.write(order_data_str)
+    order_data_str = jsonpickle.encode(order_data)
+    atomic_write(file_path, order_data_str)
 
 
 def undo_checkout_file(original_checkout_name, checkout_time, new_name):
@@ -528,20 +637,72 @@ def undo_checkout_file(original_checkout_name, checkout_time, new_name):
     respectively.
     """
     check_datetime(checkout_time)
-    new_name += TOGO_SEPARATOR + UNDONE_CHECKOUT_SEPARATOR
     standardized_name = standardize_file_name(original_checkout_name,
                                               is_checkout=True,
                                               set_time=checkout_time)
 
+    return _restore_checkout_file(standardized_name, new_name)
+
+
+def _restore_checkout_file(standardized_name, new_name):
+    """Private Function.
+
+    Moves the given checkout file from the CHECKOUT_DIRECTORY
+    to the CONFIRMED_DIRECTORY under the given new name.
+
+    @param standardized_name: str representing the name of
+    the checkout file.
+
+    @param new_name: str representing the new name that the
+    order should be stored as.
+
+    @return: 2 tuple representing the file_path and a
+    list of items that represents the undone checkout
+    respectively.
+    """
+    new_name += TOGO_SEPARATOR + UNDONE_CHECKOUT_SEPARATOR
+
     data = _remove_order_file(standardized_name, directory=CHECKOUT_DIRECTORY)
+    checkout_history.discard(standardized_name)
+
     file_name = _save_confirmed_order(data, new_name, CONFIRMED_DIRECTORY)
     return CONFIRMED_DIRECTORY + '/' + file_name, data
 
 
+def undo_checkout(entry, new_name):
+    """Undoes the checkout of the given entry of
+    the checkout history.
+
+    @note: Orders that have been moved into the
+    orders database may only be browsed. Their
+    totals and item counts are part of the stored
+    history, so they aren't undone.
+
+    @param entry: CheckoutEntry object that represents
+    the checked out order.
+
+    @param new_name: str representing the new name that
+    the order should be stored as.
+
+    @raise ValueError: If the order has been moved into
+    the orders database.
+
+    @return: 2 tuple representing the file_path and a
+    list of items that represents the undone checkout
+    respectively.
+    """
+    if entry.is_stored():
+        raise ValueError('Expected a checkout file, orders moved into the '
+                         'database may only be browsed: {}'.format(entry))
+
+    return _restore_checkout_file(entry.key, new_name)
+
+
 #====================================================================================
 # This block represents functions that are used to modify and update the databases
 # that store the orders information beyond the standard single day period.
 #====================================================================================
+@Metrics.timed('ConfirmationSystem.update_orders_database')
 def update_orders_database(database=ORDERS_DATABASE):
     """Updates the databases to include
     all currently checked out information.
@@ -581,6 +742,7 @@ def update_orders_database(database=ORDERS_DATABASE):
                                 database=database)
 
             _remove_order_file(filename, directory=dirpath)
+            _get_checkout_history(database).discard(filename)
 
             dates_list.add(order_time)
 
@@ -641,6 +803,9 @@ def _update_date_table(curr_date, database=ORDERS_DATABASE):
                        '                                    DateTotal'
                        '                                ) '
                        '    VALUES (   ?, ?, ?, ?, ?, ?);', (dates,) + curr_data)
+    else:
+        # every order of the date has been undone
+        db.execute('DELETE FROM DateData WHERE Date = ?;', (dates,))
     database.commit()
 
     return (str(dates), ) + data[0]
@@ -675,7 +840,8 @@ def _update_order_table(curr_date, order_data, order_name, notification_data,
         OrderItemFrequency_json TEXT,
         OrderType_standard INT (bool),
         OrderType_togo INT (bool),
-        OrderData_json TEXT
+        OrderData_json TEXT,
+        OrderTaxBreakdown_json TEXT
 
     @return: tuple representing the entries
     placed in the table.
@@ -687,16 +853,12 @@ def _update_order_table(curr_date, order_data, order_name, notification_data,
         raise ValueError('Expected list of MenuItems for order data. Got empty '
                          'list or none type instead.')
 
-    subtotal = CheckOperations.get_order_subtotal(order_data)
-    tax = CheckOperations.get_total_tax(subtotal)
-    total = CheckOperations.get_total(order_data)
+    order_type = get_order_type(order_name)
+    totals = OrderTotals(order_data, order_type=order_type)
+    subtotal, tax, total = totals.get_totals()
 
-    is_standard = True
-    is_togo = False
-
-    if TOGO_SEPARATOR in order_name:
-        is_togo = True
-        is_standard = False
+    is_togo = order_type == ORDER_TYPE_TOGO
+    is_standard = not is_togo
 
     data = (current_order_counter,
             curr_date.strftime(SQLITE_DATE_TIME_FORMAT_STR),
@@ -709,7 +871,8 @@ def _update_order_table(curr_date, order_data, order_name, notification_data,
             jsonpickle.encode(item_frequency),
             is_standard,
             is_togo,
-            jsonpickle.encode(order_data))
+            jsonpickle.encode(order_data),
+            jsonpickle.encode(totals.get_tax_breakdown()))
 
     current_order_counter += 1
 
@@ -727,6 +890,7 @@ def _update_order_table(curr_date, order_data, order_name, notification_data,
                '            ?, '
                '            ?, '
                '            ?, '
+               '            ?, '
                '            ?'
                '        );', data)
     database.commit()
@@ -785,24 +949,22 @@ def add_reservation_to_database(reserver, database=RESERVATIONS_DATABASE):
 
     @return: None
     """
-    name = reserver.name
-    number = reserver.number
-    arrival_time = reserver._arrival_time
-    reserver_data_json = jsonpickle.encode(reserver)
+    repository = _get_reservations_repository(database)
+    repository.add(reserver)
 
-    data = (name,
-            arrival_time.strftime(SQLITE_DATE_TIME_FORMAT_STR),
-            number,
-            reserver_data_json)
 
-    db = database.cursor()
-    db.execute('INSERT INTO ReservationsData'
-               '    VALUES (    ?,'
-               '                datetime(?),'
-               '                ?,'
-               '                ?'
-               '           );', data)
-    database.commit()
+def remove_reservation_from_database(reserver, database=RESERVATIONS_DATABASE):
+    """Removes the given reservation from the database.
+
+    @param reserver: Reserver object that
+    represents the reservation that is to be
+    removed.
+
+    @return: bool value representing if the
+    reservation was stored and removed.
+    """
+    repository = _get_reservations_repository(database)
+    return repository.delete(reserver.get_reservation_id())
 
 
 #====================================================================================
@@ -853,7 +1015,8 @@ def get_stored_date_data(start_date, end_date, database=ORDERS_DATABASE):
         yield DateDataBundle(data)
 
 
-def get_stored_order_data(start_date, end_date, database=ORDERS_DATABASE):
+def get_stored_order_data(start_date, end_date, database=ORDERS_DATABASE,
+                          compact=False):
     """Gets the stored order data that is stored
     in the given database, between the given datetime
     ranges, inclusive.
@@ -869,6 +1032,11 @@ def get_stored_order_data(start_date, end_date, database=ORDERS_DATABASE):
     for the data to be pulled from. By default is
     ORDERS_DATABASE.
 
+    @keyword compact: bool value representing if the
+    orders should be stored as read only CompactMenuItem
+    objects that share their options between orders.
+    Default is False.
+
     @return: Generator
 
     @yield: OrderDataBundle objects that represent
@@ -891,11 +1059,17 @@ def get_stored_order_data(start_date, end_date, database=ORDERS_DATABASE):
                          '      OrderDate <= ? '
                          'ORDER BY '
                          '      OrderDate;', dates)
+
+    order_parser = None
+    if compact:
+        order_parser = partial(compact_order, option_choices={}, cache={})
+
     for data in row_data:
-        yield OrderDataBundle(data)
+        yield OrderDataBundle(data, order_parser=order_parser)
 
 
-def get_stored_item_data(start_date, end_date, database=ORDERS_DATABASE):
+def get_stored_item_data(start_date, end_date, database=ORDERS_DATABASE,
+                         compact=False):
     """Gets the stored item data that is
     stored in the given database, between
     the given time range, inclusive.
@@ -911,6 +1085,11 @@ def get_stored_item_data(start_date, end_date, database=ORDERS_DATABASE):
     @keyword database: Testing keyword argument.
     Default is ORDERS_DATABASE
 
+    @keyword compact: bool value representing if
+    the items should be stored as read only
+    CompactMenuItem objects that share their
+    options between items. Default is False.
+
     @return: Generator
 
     @yield: ItemDataBundle that represents the
@@ -934,8 +1113,12 @@ def get_stored_item_data(start_date, end_date, database=ORDERS_DATABASE):
                           'ORDER BY '
                           '      ItemDate;', dates)
 
+    item_parser = None
+    if compact:
+        item_parser = partial(compact_menu_item, option_choices={}, cache={})
+
     for data in row_data:
-        yield ItemDataBundle(data)
+        yield ItemDataBundle(data, item_parser=item_parser)
 
 
 #====================================================================================
@@ -943,6 +1126,7 @@ def get_stored_item_data(start_date, end_date, database=ORDERS_DATABASE):
 # being processed by the databases. These functions are used to store their
 # respective data in the respective areas.
 #====================================================================================
+@Metrics.timed('ConfirmationSystem.order_confirmed')
 def order_confirmed(order_name, priority_list, non_priority_list, full_order,
                     set_time=None):
     """Confirms an order by dumping the data into a text
@@ -962,13 +1146,40 @@ def order_confirmed(order_name, priority_list, non_priority_list, full_order,
     previous confirmed and non-kitchen MenuItem objects. This
     is included for purposes of printing and retrieving
     accurate data.
+
+    @note: Once the order is saved a checkpoint is recorded
+    in the order journal, as the edits journaled before are
+    saved with it.
     """
     for file_paths in _find_order_name_paths(order_name, CONFIRMED_DIRECTORY):
         os.remove(file_paths)
 
     print_order(order_name, non_priority_list, priority_list=priority_list)
-    return _save_confirmed_order(full_order, order_name,
-                                 directory=CONFIRMED_DIRECTORY, set_time=set_time)
+    popularity_rollup.record(list(priority_list) + list(non_priority_list),
+                             set_time=set_time)
+    file_name = _save_confirmed_order(full_order, order_name,
+                                      directory=CONFIRMED_DIRECTORY,
+                                      set_time=set_time)
+    order_journal.checkpoint(order_name)
+    return file_name
+
+
+def get_popular_items(limit, set_time=None):
+    """Gets the names of the most popular
+    MenuItems for the current hour and day
+    of the week.
+
+    @param limit: int representing the maximum
+    number of item names to get.
+
+    @keyword set_time: datetime object representing
+    the time to get the popular items for. Default
+    is None, which is the current time.
+
+    @return: list of str representing the item
+    names ordered from most to least popular.
+    """
+    return popularity_rollup.get_popular_items(limit, set_time=set_time)
 
 
 def _save_confirmed_order(order_data, order_name, directory=CONFIRMED_DIRECTORY,
@@ -995,6 +1206,7 @@ def _save_confirmed_order(order_data, order_name, directory=CONFIRMED_DIRECTORY,
     return order_name
 
 
+@Metrics.timed('ConfirmationSystem.checkout_confirmed')
 def checkout_confirmed(order_name, orders, order_list, set_time=None):
     """Generates the necessary checkout files
     and adds the given order to that file for
@@ -1013,19 +1225,31 @@ def checkout_confirmed(order_name, orders, order_list, set_time=None):
     @param order_list: list of MenuItem objects
     that comprises the total order. This is utilized
     for logging purposes.
+
+    @note: Once the order is saved a checkpoint is recorded
+    in the order journal, and it is indexed in the checkout
+    history.
     """
     for file_paths in _find_order_name_paths(order_name, CONFIRMED_DIRECTORY):
         os.remove(file_paths)
 
     print_check(order_name, orders)
-    return _save_confirmed_order(order_list, order_name, directory=CHECKOUT_DIRECTORY,
-                                 set_time=set_time)
+    file_name = _save_confirmed_order(order_list, order_name,
+                                      directory=CHECKOUT_DIRECTORY,
+                                      set_time=set_time)
+    order_journal.checkpoint(order_name)
+
+    checkout_time, _, _ = parse_standardized_file_name(file_name)
+    checkout_history.add(file_name, order_name, checkout_time,
+                         _get_checkout_totals(order_name, order_list))
+    return file_name
 
 
 #====================================================================================
 # This block represents functions that are used to send the data to external
 # procedures such as printing.
 #====================================================================================
+@Metrics.timed('ConfirmationSystem.print_order')
 def print_order(order_name, order_list, priority_list=()):
     """Send the given order to the order
     printer. If given a priority order the
@@ -1044,15 +1268,19 @@ def print_order(order_name, order_list, priority_list=()):
     objects that represents the priority order to
     be sent to the order printer.
 
-    @return: None
+    @return: bool value representing if the order
+    was sent to a printer. Orders that could not be
+    sent are queued until a printer is available.
     """
     data = _wrap_printer_data(order_name, order_list, priority_data=priority_list)
-    ticket_printer.print_to_kitchen(data)
+    return ticket_printer.print_to_kitchen(data)
 
 
-def print_check(order_name, order_data):
+@Metrics.timed('ConfirmationSystem.print_check')
+def print_check(order_name, order_data, order_totals=None):
     """Send the given order to the check
-    printer.
+    printer. Each of the split checks is
+    printed as a page of a single job.
 
     @param order_name: str representation
     of the orders name
@@ -1061,17 +1289,28 @@ def print_check(order_name, order_data):
     represents a list of Menuitem objects
     that represents an order.
 
-    @return: None
+    @keyword order_totals: list where each index
+    is the OrderTotals object that maintains the
+    totals of the order at the same index of
+    order_data. Default is None, which computes
+    the totals from the orders.
+
+    @return: bool value representing if the checks
+    were sent to a printer. Checks that could not be
+    sent are queued until a printer is available.
     """
     global ticket_number
     ticket_number += 1
 
-    for order in order_data:
-        data = _wrap_printer_data(order_name, order)
-        ticket_printer.print_to_front(data)
+    if order_totals is None:
+        order_totals = [None] * len(order_data)
 
+    data_list = [_wrap_printer_data(order_name, order, totals=totals)
+                 for order, totals in zip(order_data, order_totals)]
+    return ticket_printer.print_batch_to_front(data_list)
 
-def _wrap_printer_data(order_name, order_data, priority_data=()):
+
+def _wrap_printer_data(order_name, order_data, priority_data=(), totals=None):
     """Wraps the given order data into
     printer data that is capable of being
     passed to the printer system
@@ -1085,11 +1324,18 @@ def _wrap_printer_data(order_name, order_data, priority_data=()):
     @keyword priority_data: list of MenuItem objects
     representing the priority order.
 
+    @keyword totals: OrderTotals object that maintains
+    the totals of the order. Default is None, which
+    computes the totals from the order_data.
+
     @return: DataAdapter object that encapsulates the
     given data for passed to the printer to format
     and print.
     """
-    subtotal, tax, total = CheckOperations.get_totals(order_data)
+    if totals is None:
+        totals = OrderTotals(order_data, order_type=get_order_type(order_name))
+
+    subtotal, tax, total = totals.get_totals()
 
     data = {
         'name'          :   order_name,
@@ -1098,7 +1344,8 @@ def _wrap_printer_data(order_name, order_data, priority_data=()):
         'priority_order':   priority_data,
         'total'         :   total,
         'tax'           :   tax,
-        'subtotal'      :   subtotal
+        'subtotal'      :   subtotal,
+        'tax_breakdown' :   totals.get_tax_breakdown()
     }
 
     return DataAdapter(data)
\ No newline at end of file
@@ -0,0 +1,339 @@
+"""This module provides the OrderJournal class
+that records each edit of an order as it is
+made, so that edits that haven't been saved
+with the order are recovered after a crash.
+
+The journal is a file that is only appended to.
+Each line records one step taken on the history
+of an order, as a json object with the order name
+and key, the step and the command, which is
+encoded with jsonpickle. When an order is saved
+a checkpoint is recorded for it, and the steps
+before the checkpoint are no longer needed. Only
+the commands after the last checkpoint of each
+order are decoded.
+
+Lines are flushed to the operating system as they
+are written, which keeps them if the program
+crashes. They are synced to disk on a background
+thread, so that recording a step doesn't wait on
+the disk, and lines written while a sync runs are
+synced together by the next one.
+
+@author: Carl McGraw
+@contact: cjmcgraw( at )u.washington.edu
+@version: 1.0
+"""
+import os
+import json
+import atexit
+import threading
+import jsonpickle
+from collections import OrderedDict
+
+from peonordersystem.src.AtomicWriter import atomic_write
+from peonordersystem.src.ErrorLogger import logger
+
+CHECKPOINT_STEP = 'checkpoint'
+
+
+class OrderJournal(object):
+    """Records the steps taken on the history
+    of each order in an append only file.
+
+    @var file_path: str representing the path to
+    the journal file.
+
+    @var _file: file object that the journal is
+    appended to, or None if it isn't open.
+
+    @var _sync_event: threading.Event that is set
+    when lines have been written that aren't synced.
+    """
+
+    def __init__(self, file_path, sync=True):
+        """Initializes the OrderJournal.
+
+        @param file_path: str representing the path
+        to the journal file, which is created if it
+        doesn't exist.
+
+        @keyword sync: bool value representing if the
+        lines are synced to disk on a background thread
+        after they are written. Default is True.
+        """
+        self.file_path = file_path
+        self._sync = sync
+        self._file = None
+
+        self._lock = threading.Lock()
+        self._sync_event = threading.Event()
+        self._sync_thread = None
+
+    def record(self, order_name, order_key, step, command=None):
+        """Records the given step taken on the
+        history of the given order.
+
+        @param order_name: str representing the name
+        of the order.
+
+        @param order_key: str or tuple representing
+        the key the order is stored under.
+
+        @param step: str representing the step taken,
+        such as DO_STEP.
+
+        @keyword command: OrderCommand object of the
+        step. Default is None, for undo and redo steps.
+
+        @return: None
+        """
+        if command is not None:
+            command = jsonpickle.encode(command)
+
+        self._write_line({'name': order_name,
+                          'key': order_key,
+                          'step': step,
+                          'command': command})
+
+    def checkpoint(self, order_name):
+        """Records that the given order has been
+        saved, so the steps recorded before are no
+        longer needed to recover it.
+
+        @param order_name: str representing the name
+        of the order.
+
+        @return: None
+        """
+        self._write_line({'name': order_name,
+                          'step': CHECKPOINT_STEP})
+
+    def _write_line(self, entry):
+        """Private Method.
+
+        Appends the given entry to the journal
+        as a single line.
+
+        @param entry: dict that represents the
+        entry.
+
+        @return: None
+        """
+        line = json.dumps(entry) + '\n'
+
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.file_path, 'a')
+
+            self._file.write(line)
+            self._file.flush()
+
+        if self._sync:
+            self._request_sync()
+
+    #==========================================================================
+    # This block contains methods that sync the journal to disk.
+    #==========================================================================
+    def _request_sync(self):
+        """Private Method.
+
+        Requests that the lines written so far
+        be synced by the background thread, which
+        is started if it isn't running.
+
+        @return: None
+        """
+        with self._lock:
+            if self._sync_thread is None:
+                self._sync_thread = threading.Thread(target=self._run_sync)
+                self._sync_thread.daemon = True
+                self._sync_thread.start()
+                atexit.register(self.close)
+
+        self._sync_event.set()
+
+    def _run_sync(self):
+        """Private Method.
+
+        Runs the loop that syncs the journal
+        whenever lines have been written.
+
+        @return: None
+        """
+        while True:
+            self._sync_event.wait()
+            self._sync_event.clear()
+
+            try:
+                self.sync()
+            except Exception as e:
+                logger.exception('order journal sync failed: %s', e)
+
+    def sync(self):
+        """Syncs the lines written so far to
+        disk. The sync is made on a duplicate of
+        the file descriptor, so that lines may be
+        written while it runs.
+
+        @return: None
+        """
+        with self._lock:
+            if self._file is None:
+                return
+
+            file_descriptor = os.dup(self._file.fileno())
+
+        try:
+            os.fsync(file_descriptor)
+        finally:
+            os.close(file_descriptor)
+
+    def _get_pending_lines(self):
+        """Private Method.
+
+        Gets the lines of the journal that were
+        recorded after the last checkpoint of each
+        order. Lines that can't be read, such as a
+        line cut off by a crash, are skipped.
+
+        @return: OrderedDict of str order names mapped
+        to a list of 2 tuple of (str, dict) representing
+        each pending line and its entry, in the order
+        they were recorded.
+        """
+        pending = OrderedDict()
+
+        if not os.path.isfile(self.file_path):
+            return pending
+
+        with open(self.file_path, 'r') as journal_file:
+            for line in journal_file:
+                try:
+                    entry = json.loads(line)
+                    name = entry['name']
+                    step = entry['step']
+
+                except (ValueError, KeyError, TypeError):
+                    continue
+
+                if step == CHECKPOINT_STEP:
+                    pending.pop(name, None)
+                else:
+                    pending.setdefault(name, []).append((line, entry))
+
+        return pending
+
+    def get_pending_records(self):
+        """Gets the steps recorded after the last
+        checkpoint of each order. The steps of an
+        order that can't be decoded are logged and
+        dropped from the journal, so that the other
+        orders are still recovered.
+
+        @return: list of 3 tuple of (str, str or tuple,
+        list) representing the order name, the key of
+        the order and a list of 2 tuple of (str,
+        OrderCommand) representing each step and its
+        command, or None for undo and redo steps.
+        """
+        records = []
+
+        for order_name, lines in self._get_pending_lines().iteritems():
+            try:
+                records.append(_decode_record(order_name, lines))
+
+            except Exception as e:
+                logger.exception('dropped the journal steps of order %s, they '
+                                 'could not be decoded: %s', order_name, e)
+                self.checkpoint(order_name)
+
+        return records
+
+    def compact(self):
+        """Rewrites the journal so that it only
+        contains the steps recorded after the last
+        checkpoint of each order.
+
+        @return: None
+        """
+        pending = self._get_pending_lines()
+        data = ''.join(line for lines in pending.itervalues()
+                       for line, _ in lines)
+
+        self.close()
+        atomic_write(self.file_path, data)
+
+    def close(self):
+        """Closes the journal file. It is opened
+        again when the next line is recorded.
+
+        @return: None
+        """
+        with self._lock:
+            if self._file is None:
+                return
+
+            if self._sync:
+                os.fsync(self._file.fileno())
+
+            self._file.close()
+            self._file = None
+
+
+def _decode_record(order_name, lines):
+    """Private Function.
+
+    Decodes the given pending lines of the
+    given order.
+
+    @param order_name: unicode representing the
+    name of the order, as read from the journal.
+
+    @param lines: list of 2 tuple of (str, dict)
+    representing each pending line and its entry.
+
+    @return: 3 tuple of (str, str or tuple, list)
+    representing the order name, the key of the
+    order and a list of 2 tuple of (str, OrderCommand)
+    representing each step and its command.
+    """
+    order_key = None
+    steps = []
+
+    for _, entry in lines:
+        key = _decode_key(entry.get('key'))
+
+        if key is not None:
+            order_key = key
+
+        command = entry.get('command')
+
+        if command is not None:
+            command = jsonpickle.decode(command)
+
+        steps.append((entry['step'], command))
+
+    return _decode_key(order_name), order_key, steps
+
+
+def _decode_key(key):
+    """Private Function.
+
+    Converts the given name or key read from
+    the journal back to the type it was recorded
+    as. json reads strings as unicode, which are
+    encoded as utf-8 str, and tuples as lists.
+
+    @param key: unicode, list or None read from
+    the journal.
+
+    @return: str, tuple of str or None.
+    """
+    if isinstance(key, unicode):
+        return key.encode('utf-8')
+
+    if isinstance(key, list):
+        return tuple(_decode_key(value) for value in key)
+
+    return key
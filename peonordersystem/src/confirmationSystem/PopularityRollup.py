@@ -0,0 +1,267 @@
+"""This module provides the PopularityRollup
+class that is used to keep track of how often
+each MenuItem is ordered for each hour of each
+day of the week.
+
+The counts are loaded from the database once
+and then maintained in memory as orders are
+confirmed, with each confirmed order written
+through to the database. When the table is
+first created it is seeded from the orders
+already stored in the database.
+
+@author: Carl McGraw
+@contact: cjmcgraw( at )u.washington.edu
+@version: 1.0
+"""
+import jsonpickle
+from datetime import datetime
+from collections import Counter, defaultdict
+
+from peonordersystem.src.Settings import SQLITE_DATE_TIME_FORMAT_STR
+
+
+def create_popularity_table(database):
+    """Creates the ItemPopularityData table if it
+    does not exist. An empty table is seeded from
+    the item frequencies of the orders stored in
+    the OrderData table, so that the orders made
+    before the table existed are counted.
+
+    @param database: sqlite3.Connection pointing
+    to the orders database.
+
+    @return: None
+    """
+    db = database.cursor()
+
+    db.execute('CREATE TABLE IF NOT EXISTS ItemPopularityData '
+               '    (   PopularityDay INT,'
+               '        PopularityHour INT,'
+               '        ItemName TEXT,'
+               '        PopularityFrequency INT,'
+               '        PRIMARY KEY (PopularityDay, PopularityHour, ItemName)'
+               '    );')
+
+    has_popularity = db.execute('SELECT '
+                                '     1 '
+                                'FROM '
+                                '     ItemPopularityData '
+                                'LIMIT 1;').fetchone()
+    has_orders = db.execute('SELECT '
+                            '     1 '
+                            'FROM '
+                            '     sqlite_master '
+                            'WHERE '
+                            '     type = \'table\' '
+                            'AND '
+                            '     name = \'OrderData\';').fetchone()
+
+    if not has_popularity and has_orders:
+        _seed_popularity_table(database)
+
+    database.commit()
+
+
+def _seed_popularity_table(database):
+    """Private Function.
+
+    Adds the item frequencies of each order
+    stored in the OrderData table to the
+    ItemPopularityData table.
+
+    @note: Orders are stored with the time they
+    were checked out, which stands in for the
+    time they were confirmed. Rows that can't be
+    decoded are skipped.
+
+    @param database: sqlite3.Connection pointing
+    to the orders database.
+
+    @return: None
+    """
+    db = database.cursor()
+    slots = defaultdict(Counter)
+
+    rows = db.execute('SELECT '
+                      '     OrderDate, '
+                      '     OrderItemFrequency_json, '
+                      '     OrderNotifications_json '
+                      'FROM '
+                      '     OrderData;').fetchall()
+
+    for order_date, frequency_json, notification_json in rows:
+        try:
+            set_time = datetime.strptime(order_date, SQLITE_DATE_TIME_FORMAT_STR)
+            frequency = Counter(jsonpickle.decode(frequency_json))
+
+            # notification items are not counted as they are confirmed
+            frequency.subtract(menu_item.get_name() for menu_item in
+                               jsonpickle.decode(notification_json))
+        except (ValueError, TypeError, AttributeError):
+            continue
+
+        slots[PopularityRollup._get_slot(set_time)].update(
+            dict((item_name, count) for item_name, count in frequency.iteritems()
+                 if count > 0))
+
+    db.executemany('INSERT INTO ItemPopularityData '
+                   '    (PopularityDay, PopularityHour, ItemName, '
+                   '     PopularityFrequency) '
+                   'VALUES (?, ?, ?, ?);',
+                   [(day, hour, item_name, count)
+                    for (day, hour), frequency in slots.iteritems()
+                    for item_name, count in frequency.iteritems()])
+
+
+class PopularityRollup(object):
+    """Maintains the frequency that each
+    MenuItem has been ordered grouped by
+    day of the week and hour.
+    """
+
+    def __init__(self, database):
+        """Initializes the PopularityRollup
+        and loads the stored frequencies.
+
+        @param database: sqlite3.Connection pointing
+        to the orders database. The ItemPopularityData
+        table is created if it doesn't exist.
+        """
+        self._database = database
+        create_popularity_table(database)
+
+        self._slots = defaultdict(Counter)
+        self._totals = Counter()
+        self._load()
+
+    def _load(self):
+        """Private Method.
+
+        Loads the stored frequencies from
+        the database.
+
+        @return: None
+        """
+        db = self._database.cursor()
+        rows = db.execute('SELECT '
+                          '     PopularityDay, '
+                          '     PopularityHour, '
+                          '     ItemName, '
+                          '     PopularityFrequency '
+                          'FROM '
+                          '     ItemPopularityData;')
+
+        for day, hour, item_name, frequency in rows:
+            self._slots[day, hour][item_name] += frequency
+            self._totals[item_name] += frequency
+
+    @staticmethod
+    def _get_slot(set_time):
+        """Private Method.
+
+        Gets the slot that the given time
+        falls into.
+
+        @param set_time: datetime object.
+
+        @return: tuple of (int, int) representing
+        the day of the week and the hour.
+        """
+        return set_time.weekday(), set_time.hour
+
+    def record(self, order_list, set_time=None):
+        """Records the given confirmed
+        MenuItems.
+
+        @param order_list: list of MenuItem objects
+        that were confirmed. Notification items
+        are not counted.
+
+        @keyword set_time: datetime object representing
+        the time the items were confirmed. Default is
+        None, which is the current time.
+
+        @return: None
+        """
+        if set_time is None:
+            set_time = datetime.now()
+
+        day, hour = slot = self._get_slot(set_time)
+        frequency = Counter(menu_item.get_name() for menu_item in order_list
+                            if not menu_item.is_notification())
+
+        self._slots[slot].update(frequency)
+        self._totals.update(frequency)
+        self._store(day, hour, frequency)
+
+    def _store(self, day, hour, frequency):
+        """Private Method.
+
+        Adds the given frequencies to those
+        stored in the database.
+
+        @param day: int representing the day
+        of the week.
+
+        @param hour: int representing the hour.
+
+        @param frequency: Counter of str keys
+        representing the item names mapped to
+        the number of times they were ordered.
+
+        @return: None
+        """
+        db = self._database.cursor()
+
+        for item_name, count in frequency.iteritems():
+            db.execute('INSERT OR IGNORE INTO ItemPopularityData '
+                       '    (PopularityDay, PopularityHour, ItemName, '
+                       '     PopularityFrequency) '
+                       'VALUES (?, ?, ?, 0);', (day, hour, item_name))
+            db.execute('UPDATE '
+                       '    ItemPopularityData '
+                       'SET '
+                       '    PopularityFrequency = PopularityFrequency + ? '
+                       'WHERE '
+                       '    PopularityDay = ? '
+                       'AND '
+                       '    PopularityHour = ? '
+                       'AND '
+                       '    ItemName = ?;', (count, day, hour, item_name))
+
+        self._database.commit()
+
+    def get_popular_items(self, limit, set_time=None):
+        """Gets the most popular item names for
+        the hour and day of the week of the
+        given time. If there are fewer than the
+        limit for that hour, the remainder are
+        filled with the most popular items overall.
+
+        @param limit: int representing the maximum
+        number of item names to return.
+
+        @keyword set_time: datetime object representing
+        the time to get the popular items for. Default
+        is None, which is the current time.
+
+        @return: list of str representing the item
+        names ordered from most to least popular.
+        """
+        if set_time is None:
+            set_time = datetime.now()
+
+        slot = self._get_slot(set_time)
+        item_names = [name for name, count in
+                      self._slots.get(slot, Counter()).most_common(limit)]
+
+        if len(item_names) < limit:
+            found = set(item_names)
+            for name, count in self._totals.most_common(limit + len(found)):
+                if len(item_names) >= limit:
+                    break
+                if name not in found:
+                    item_names.append(name)
+
+        return item_names
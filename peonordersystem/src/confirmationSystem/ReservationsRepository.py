@@ -0,0 +1,434 @@
+"""This module provides the ReservationsRepository
+class that is used to store and query the reservations
+held in the reservations database.
+
+Reservations are identified by the stable id of their
+Reserver object. Queries are performed over ranges of
+the indexed ReservationTime column and may be paginated.
+
+@author: Carl McGraw
+@contact: cjmcgraw( at )u.washington.edu
+@version: 1.0
+"""
+import jsonpickle
+from datetime import datetime, timedelta
+
+from peonordersystem.src.Settings import SQLITE_DATE_TIME_FORMAT_STR
+
+jsonpickle.set_encoder_options('simplejson', sort_keys=True, indent=4)
+
+
+def create_reservations_table(database):
+    """Creates the ReservationsData table and its
+    indexes if they do not exist. Tables created
+    before reservation ids were introduced are
+    updated to include the ReservationID column
+    and their rows are given ids.
+
+    @param database: sqlite3.Connection pointing
+    to the reservations database.
+
+    @return: None
+    """
+    db = database.cursor()
+
+    db.execute('CREATE TABLE IF NOT EXISTS ReservationsData '
+               '    (   ReservationName TEXT,'
+               '        ReservationTime NUMERIC,'
+               '        ReservationNumber TEXT,'
+               '        ReservationData_json TEXT,'
+               '        ReservationID TEXT'
+               '    );')
+
+    columns = [row[1] for row in db.execute('PRAGMA table_info(ReservationsData);')]
+
+    if 'ReservationID' not in columns:
+        db.execute('ALTER TABLE ReservationsData ADD COLUMN ReservationID TEXT;')
+
+    db.execute('UPDATE '
+               '    ReservationsData '
+               'SET '
+               '    ReservationID = lower(hex(randomblob(16))) '
+               'WHERE '
+               '    ReservationID IS NULL;')
+
+    db.execute('CREATE UNIQUE INDEX IF NOT EXISTS ReservationsDataID '
+               '    ON ReservationsData (ReservationID);')
+    db.execute('CREATE INDEX IF NOT EXISTS ReservationsDataTime '
+               '    ON ReservationsData (ReservationTime);')
+
+    database.commit()
+
+
+class ReservationsRepository(object):
+    """Stores and queries reservations in
+    the reservations database.
+    """
+
+    DEFAULT_PAGE_SIZE = 50
+
+    def __init__(self, database):
+        """Initializes the repository.
+
+        @param database: sqlite3.Connection pointing
+        to the reservations database. The ReservationsData
+        table is created if it doesn't exist.
+        """
+        self._database = database
+        create_reservations_table(database)
+
+    @staticmethod
+    def _format_time(set_time):
+        """Private Method.
+
+        Formats the given datetime as it is
+        stored in the ReservationTime column.
+
+        @param set_time: datetime object.
+
+        @return: str
+        """
+        return set_time.strftime(SQLITE_DATE_TIME_FORMAT_STR)
+
+    def _get_row_data(self, reserver):
+        """Private Method.
+
+        Gets the column values stored for
+        the given reservation.
+
+        @param reserver: Reserver object.
+
+        @return: tuple of (str, str, str, str, str)
+        representing the name, arrival time, number,
+        serialized reservation and id respectively.
+        """
+        reservation_id = reserver.get_reservation_id()
+        return (reserver.name,
+                self._format_time(reserver.get_arrival_time()),
+                reserver.number,
+                jsonpickle.encode(reserver),
+                reservation_id)
+
+    #==========================================================================
+    # This block contains methods that alter the stored reservations.
+    #==========================================================================
+    def add(self, reserver):
+        """Adds the given reservation.
+
+        @param reserver: Reserver object that
+        represents the reservation.
+
+        @return: str representing the id of
+        the reservation.
+        """
+        self.bulk_import((reserver,))
+        return reserver.get_reservation_id()
+
+    def bulk_import(self, reservers):
+        """Adds all of the given reservations
+        in a single transaction. Reservations
+        that are already stored are replaced.
+
+        @param reservers: iterable of Reserver
+        objects.
+
+        @return: int representing the number of
+        reservations that were imported.
+        """
+        rows = [self._get_row_data(reserver) for reserver in reservers]
+
+        db = self._database.cursor()
+        db.executemany('INSERT OR REPLACE INTO ReservationsData '
+                       '    (ReservationName, ReservationTime, ReservationNumber,'
+                       '     ReservationData_json, ReservationID) '
+                       'VALUES (?, datetime(?), ?, ?, ?);', rows)
+        self._database.commit()
+
+        return len(rows)
+
+    def update(self, reserver):
+        """Updates the stored data of the given
+        reservation.
+
+        @param reserver: Reserver object that has
+        previously been added.
+
+        @return: bool value representing if the
+        reservation was found and updated.
+        """
+        name, arrival_time, number, data, reservation_id = \
+            self._get_row_data(reserver)
+
+        db = self._database.cursor()
+        db.execute('UPDATE '
+                   '    ReservationsData '
+                   'SET '
+                   '    ReservationName = ?, '
+                   '    ReservationTime = datetime(?), '
+                   '    ReservationNumber = ?, '
+                   '    ReservationData_json = ? '
+                   'WHERE '
+                   '    ReservationID = ?;',
+                   (name, arrival_time, number, data, reservation_id))
+        self._database.commit()
+
+        return db.rowcount > 0
+
+    def delete(self, reservation_id):
+        """Deletes the reservation with the
+        given id.
+
+        @param reservation_id: str representing
+        the id of the reservation.
+
+        @return: bool value representing if the
+        reservation was found and deleted.
+        """
+        db = self._database.cursor()
+        db.execute('DELETE FROM ReservationsData WHERE ReservationID = ?;',
+                   (reservation_id,))
+        self._database.commit()
+
+        return db.rowcount > 0
+
+    #==========================================================================
+    # This block contains methods that query the stored reservations.
+    #==========================================================================
+    def get(self, reservation_id):
+        """Gets the reservation with the
+        given id.
+
+        @param reservation_id: str representing
+        the id of the reservation.
+
+        @return: Reserver object or None if no
+        reservation has the given id.
+        """
+        db = self._database.cursor()
+        rows = db.execute('SELECT ReservationData_json, ReservationID '
+                          'FROM ReservationsData '
+                          'WHERE ReservationID = ?;', (reservation_id,))
+
+        for data, stored_id in rows:
+            return self._decode(data, stored_id)
+        return None
+
+    def get_range(self, start_time, end_time, limit=None, offset=0):
+        """Gets the reservations that arrive within
+        the given range, ordered by arrival time.
+
+        @param start_time: datetime object representing
+        the inclusive start of the range.
+
+        @param end_time: datetime object representing
+        the exclusive end of the range.
+
+        @keyword limit: int representing the maximum
+        number of reservations to get. Default is None,
+        for all reservations in the range.
+
+        @keyword offset: int representing the number of
+        reservations in the range to skip. Default is 0.
+
+        @return: list of Reserver objects.
+        """
+        rows = self._select_range('ReservationData_json, ReservationID',
+                                  start_time, end_time, limit, offset)
+        return [self._decode(data, reservation_id)
+                for data, reservation_id in rows]
+
+    @staticmethod
+    def _decode(data, reservation_id):
+        """Private Method.
+
+        Decodes the given serialized reservation
+        and gives it the stored id. Reservations
+        that were stored before ids were introduced
+        are given their id by the database.
+
+        @param data: str representing the serialized
+        Reserver object.
+
+        @param reservation_id: str representing the
+        stored id of the reservation.
+
+        @return: Reserver object.
+        """
+        reserver = jsonpickle.decode(data)
+        reserver._reservation_id = reservation_id
+        return reserver
+
+    def get_range_summary(self, start_time, end_time, limit=None, offset=0):
+        """Gets the summary of the reservations that
+        arrive within the given range, ordered by arrival
+        time. The stored Reserver objects aren't decoded.
+
+        @param start_time: datetime object representing
+        the inclusive start of the range.
+
+        @param end_time: datetime object representing
+        the exclusive end of the range.
+
+        @keyword limit: int representing the maximum
+        number of reservations to get. Default is None,
+        for all reservations in the range.
+
+        @keyword offset: int representing the number of
+        reservations in the range to skip. Default is 0.
+
+        @return: list of tuple of (str, str, str, datetime)
+        representing the id, name, number and arrival time
+        of each reservation.
+        """
+        rows = self._select_range('ReservationID, ReservationName, '
+                                  'ReservationNumber, ReservationTime',
+                                  start_time, end_time, limit, offset)
+
+        return [(reservation_id, name, number,
+                 datetime.strptime(arrival_time, SQLITE_DATE_TIME_FORMAT_STR))
+                for reservation_id, name, number, arrival_time in rows]
+
+    def get_page(self, start_time, end_time, page, page_size=DEFAULT_PAGE_SIZE):
+        """Gets a page of the reservations that
+        arrive within the given range.
+
+        @param start_time: datetime object representing
+        the inclusive start of the range.
+
+        @param end_time: datetime object representing
+        the exclusive end of the range.
+
+        @param page: int representing the page to get,
+        starting from 0.
+
+        @keyword page_size: int representing the number
+        of reservations on each page. Default is
+        DEFAULT_PAGE_SIZE.
+
+        @return: list of Reserver objects.
+        """
+        return self.get_range(start_time, end_time, limit=page_size,
+                              offset=page * page_size)
+
+    def count_range(self, start_time, end_time):
+        """Counts the reservations that arrive
+        within the given range.
+
+        @param start_time: datetime object representing
+        the inclusive start of the range.
+
+        @param end_time: datetime object representing
+        the exclusive end of the range.
+
+        @return: int
+        """
+        rows = self._select_range('COUNT(*)', start_time, end_time,
+                                  None, 0, ordered=False)
+        return rows.next()[0]
+
+    def _select_range(self, columns, start_time, end_time, limit, offset,
+                      ordered=True):
+        """Private Method.
+
+        Selects the given columns of the reservations
+        that arrive within the given range.
+
+        @param columns: str representing the columns
+        to select.
+
+        @param start_time: datetime object representing
+        the inclusive start of the range.
+
+        @param end_time: datetime object representing
+        the exclusive end of the range.
+
+        @param limit: int representing the maximum number
+        of rows, or None for all rows.
+
+        @param offset: int representing the number of
+        rows to skip.
+
+        @keyword ordered: bool value representing if the
+        rows should be ordered by arrival time. Default
+        is True.
+
+        @return: sqlite3.Cursor over the selected rows.
+        """
+        query = ('SELECT ' + columns + ' FROM ReservationsData '
+                 'WHERE ReservationTime >= ? AND ReservationTime < ?')
+
+        if ordered:
+            query += ' ORDER BY ReservationTime'
+
+        query += ' LIMIT ? OFFSET ?;'
+
+        if limit is None:
+            limit = -1
+
+        db = self._database.cursor()
+        return db.execute(query, (self._format_time(start_time),
+                                  self._format_time(end_time),
+                                  limit, offset))
+
+    def get_today(self, curr_time=None, limit=None, offset=0):
+        """Gets the reservations that arrive from the
+        given time until the end of its day.
+
+        @keyword curr_time: datetime object representing
+        the start of the range. Default is None, which is
+        the current time.
+
+        @keyword limit: int representing the maximum
+        number of reservations to get. Default is None.
+
+        @keyword offset: int representing the number of
+        reservations to skip. Default is 0.
+
+        @return: list of Reserver objects.
+        """
+        curr_time = curr_time or datetime.now()
+        end_of_day = datetime.combine(curr_time.date() + timedelta(days=1),
+                                      datetime.min.time())
+        return self.get_range(curr_time, end_of_day, limit=limit, offset=offset)
+
+    def get_next_hours(self, hours, curr_time=None, limit=None, offset=0):
+        """Gets the reservations that arrive within
+        the given number of hours of the given time.
+
+        @param hours: number representing the hours.
+
+        @keyword curr_time: datetime object representing
+        the start of the range. Default is None, which is
+        the current time.
+
+        @keyword limit: int representing the maximum
+        number of reservations to get. Default is None.
+
+        @keyword offset: int representing the number of
+        reservations to skip. Default is 0.
+
+        @return: list of Reserver objects.
+        """
+        curr_time = curr_time or datetime.now()
+        return self.get_range(curr_time, curr_time + timedelta(hours=hours),
+                              limit=limit, offset=offset)
+
+    def get_next_week(self, curr_time=None, limit=None, offset=0):
+        """Gets the reservations that arrive within
+        a week of the given time.
+
+        @keyword curr_time: datetime object representing
+        the start of the range. Default is None, which is
+        the current time.
+
+        @keyword limit: int representing the maximum
+        number of reservations to get. Default is None.
+
+        @keyword offset: int representing the number of
+        reservations to skip. Default is 0.
+
+        @return: list of Reserver objects.
+        """
+        curr_time = curr_time or datetime.now()
+        return self.get_range(curr_time, curr_time + timedelta(weeks=1),
+                              limit=limit, offset=offset)
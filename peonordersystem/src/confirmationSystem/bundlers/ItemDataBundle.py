@@ -15,12 +15,18 @@ class ItemDataBundle(ItemDataBundle):
     data into an easier to use format.
     """
 
-    def __init__(self, database_stored_data):
+    def __init__(self, database_stored_data, item_parser=None):
         """Packages the item data that is stored in
         a database row into an easier to operate format.
 
         @param database_stored_data: tuple representing
         the columns associated with the database.
+
+        @keyword item_parser: function that takes the
+        decoded MenuItem object and returns the item to
+        be stored, such as MenuItem.compact_menu_item.
+        Default is None in which case the decoded item is
+        stored.
         """
         (OrderNumber,
          ItemName,
@@ -30,6 +36,10 @@ class ItemDataBundle(ItemDataBundle):
 
         self._date = datetime.datetime.strptime(ItemDate, SQLITE_DATE_TIME_FORMAT_STR)
         self.data = jsonpickle.decode(ItemData_json)
+
+        if item_parser:
+            self.data = item_parser(self.data)
+
         self.order_number = OrderNumber
 
     @property
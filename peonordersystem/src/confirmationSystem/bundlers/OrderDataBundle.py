@@ -16,13 +16,20 @@ class OrderDataBundle(CollectionDataBundle):
     format.
     """
 
-    def __init__(self, database_stored_data):
+    def __init__(self, database_stored_data, order_parser=None):
         """Packages the order data that is stored
         in the database in a easy to access format.
 
         @param database_stored_data: tuple representing
         the database columns that is to be interpreted
-        and stored in this class.
+        and stored in this class. Rows stored before the
+        tax breakdown column was added may omit it.
+
+        @keyword order_parser: function that takes the
+        decoded list of MenuItem objects and returns the
+        list to be stored, such as MenuItem.compact_order.
+        Default is None in which case the decoded list is
+        stored.
         """
         super(OrderDataBundle, self).__init__()
         (unpacked_number,
@@ -36,7 +43,12 @@ class OrderDataBundle(CollectionDataBundle):
         unpacked_item_freq_json,
         unpacked_type_is_standard,
         unpacked_type_is_togo,
-        unpacked_data_json) = database_stored_data
+        unpacked_data_json) = database_stored_data[:12]
+
+        unpacked_tax_breakdown_json = None
+
+        if len(database_stored_data) > 12:
+            unpacked_tax_breakdown_json = database_stored_data[12]
 
         order_date = datetime.datetime.strptime(unpacked_date,
                                                 SQLITE_DATE_TIME_FORMAT_STR)
@@ -44,6 +56,11 @@ class OrderDataBundle(CollectionDataBundle):
         self._date = order_date
         self.data = jsonpickle.decode(unpacked_data_json)
         self.notification_data = jsonpickle.decode(unpacked_notification_json)
+
+        if order_parser:
+            self.data = order_parser(self.data)
+            self.notification_data = order_parser(self.notification_data)
+
         self.item_frequency = jsonpickle.decode(unpacked_item_freq_json)
         self._name = unpacked_name
         self.order_number = unpacked_number
@@ -51,6 +68,11 @@ class OrderDataBundle(CollectionDataBundle):
                        'tax': unpacked_tax,
                        'total': unpacked_total}
 
+        self._tax_breakdown = None
+
+        if unpacked_tax_breakdown_json:
+            self._tax_breakdown = jsonpickle.decode(unpacked_tax_breakdown_json)
+
         self._is_standard = unpacked_type_is_standard
         self._is_togo = unpacked_type_is_togo
 
@@ -122,6 +144,21 @@ class OrderDataBundle(CollectionDataBundle):
         """
         return self._totals['tax']
 
+    @property
+    def tax_breakdown(self):
+        """Gets the tax of each tax class
+        associated with the OrderDataBundle.
+        Orders stored without a breakdown have
+        all of their tax in the default class.
+
+        @return: dict of str tax classes mapped
+        to the float tax of the class.
+        """
+        if self._tax_breakdown is None:
+            return super(OrderDataBundle, self).tax_breakdown
+
+        return self._tax_breakdown
+
     @property
     def togo_orders(self):
         """Gets the value representing
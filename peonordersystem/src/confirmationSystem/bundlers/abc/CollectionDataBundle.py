@@ -8,6 +8,7 @@ a bundle.
 """
 from abc import ABCMeta, abstractproperty
 
+from peonordersystem.src.Settings import DEFAULT_TAX_CLASS
 from .DataBundle import DataBundle
 
 
@@ -29,6 +30,18 @@ class CollectionDataBundle(DataBundle):
         """
         pass
 
+    @property
+    def tax_breakdown(self):
+        """Gets the tax of each tax class
+        associated with the CollectionDataBundle.
+        By default all of the tax is of the
+        DEFAULT_TAX_CLASS.
+
+        @return: dict of str tax classes mapped
+        to the float tax of the class.
+        """
+        return {DEFAULT_TAX_CLASS: self.tax}
+
     @abstractproperty
     def subtotal(self):
         """Gets the subtotal associated
@@ -49,6 +49,28 @@ class Printer(AbstractPrinter):
         file_path = self._front_formatter.file_path
         return self._front_printer.send_to_printer(file_path)
 
+    def print_batch_to_front(self, data_list):
+        """Prints each of the given data to
+        the front. The data are formatted as
+        the pages of a single file, which is
+        sent as a single job.
+
+        @param data_list: list of DataAdapter
+        class that each represents the data of
+        a receipt to be formatted and printed.
+
+        @return: bool value representing
+        if the job succeeded or not.
+        """
+        if not data_list:
+            return True
+
+        for data in data_list:
+            self._check_data_type(data)
+
+        file_path = self._front_formatter.format_batch(data_list)
+        return self._front_printer.send_to_printer(file_path)
+
     def print_to_kitchen(self, data):
         """Prints the given data to the
         kitchen.
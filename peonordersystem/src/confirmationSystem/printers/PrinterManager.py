@@ -0,0 +1,573 @@
+"""This module defines the PrinterManager class
+which routes print jobs to the printers and
+monitors them until they are printed.
+
+Every job is recorded in the job ledger along with
+a spooled copy of its file. Jobs are submitted to the
+first available printer of their route, so that jobs
+for a printer that is down are sent to its fallback.
+The printers and the unfinished jobs are polled in
+the background, and jobs that fail or are not printed
+in time are re-queued.
+
+The lock of the PrinterManager only guards its own
+state. Calls to the printer adapters, which may wait
+on the print server, are made outside of it, so that
+submitting a job is never held up by a poll.
+
+@author: Carl McGraw
+@contact: cjmcgraw( at )u.washington.edu
+@version: 1.0
+"""
+import os
+import atexit
+import shutil
+import threading
+from time import time
+from itertools import count
+from collections import OrderedDict
+
+from peonordersystem.SystemPath import SYSTEM_PRINT_SPOOL_PATH
+from peonordersystem.src.ErrorLogger import logger
+from peonordersystem.src.Settings import (PRINTER_BACKEND,
+                                          PRINTER_POLL_INTERVAL,
+                                          PRINT_JOB_TIMEOUT,
+                                          PRINT_JOB_MAX_FAILURES,
+                                          PRINT_JOB_LEDGER_SIZE)
+
+from .adapters.abc.AbstractPrinterAdapter import AbstractPrinterAdapter
+from .adapters.SimulatedPrinterAdapter import SimulatedPrinterAdapter
+
+
+def create_printer_adapter(printer_name, backend=PRINTER_BACKEND):
+    """Creates the adapter for the given
+    printer.
+
+    @param printer_name: str representing the
+    name of the printer.
+
+    @keyword backend: str representing the backend
+    the printer is accessed through. Either 'cups'
+    or 'simulated'. Default is PRINTER_BACKEND.
+
+    @raise ValueError: if the backend is unknown.
+
+    @return: AbstractPrinterAdapter
+    """
+    if backend == 'simulated':
+        return SimulatedPrinterAdapter(printer_name, auto_complete=True)
+
+    if backend == 'cups':
+        # imported here so that the simulated backend doesn't require pycups
+        from .adapters.PrinterAdapter import PrinterAdapter
+        return PrinterAdapter(printer_name)
+
+    raise ValueError('Unknown printer backend {}'.format(backend))
+
+
+class PrintJob(object):
+    """Record of a job in the job ledger."""
+
+    QUEUED = 'queued'
+    SUBMITTED = 'submitted'
+    COMPLETED = 'completed'
+    FAILED = 'failed'
+
+    def __init__(self, ledger_id, file_path, title, options, printer_names):
+        """Initializes the PrintJob.
+
+        @param ledger_id: int representing the id
+        of the job in the ledger.
+
+        @param file_path: str representing the spooled
+        file to be printed.
+
+        @param title: str representing the title of
+        the job.
+
+        @param options: dict of options of the job.
+
+        @param printer_names: tuple of str representing
+        the printers the job may be printed on, in order
+        of preference.
+        """
+        self.ledger_id = ledger_id
+        self.file_path = file_path
+        self.title = title
+        self.options = options
+        self.printer_names = printer_names
+
+        self.state = self.QUEUED
+        self.printer_name = None
+        self.job_id = 0
+        self.attempts = 0
+        self.failures = 0
+
+        self.created_time = time()
+        self.submitted_time = None
+
+    @property
+    def is_finished(self):
+        """Checks if the job has either
+        been printed or been given up on.
+
+        @return: bool
+        """
+        return self.state in (self.COMPLETED, self.FAILED)
+
+    def to_dict(self):
+        """Gets the record of the job.
+
+        @return: dict of str keys mapped to
+        the values of the job.
+        """
+        return {'ledger_id': self.ledger_id,
+                'title': self.title,
+                'state': self.state,
+                'printer_name': self.printer_name,
+                'printer_names': self.printer_names,
+                'job_id': self.job_id,
+                'attempts': self.attempts,
+                'failures': self.failures,
+                'created_time': self.created_time,
+                'submitted_time': self.submitted_time}
+
+
+class PrinterManager(object):
+    """Routes jobs to the available printers,
+    keeps the job ledger and monitors the
+    printers and jobs in the background.
+    """
+
+    def __init__(self, adapter_factory=create_printer_adapter,
+                 spool_path=SYSTEM_PRINT_SPOOL_PATH,
+                 job_timeout=PRINT_JOB_TIMEOUT,
+                 max_failures=PRINT_JOB_MAX_FAILURES,
+                 ledger_size=PRINT_JOB_LEDGER_SIZE):
+        """Initializes the PrinterManager.
+
+        @keyword adapter_factory: function that takes
+        the name of a printer and returns its
+        AbstractPrinterAdapter. Default is
+        create_printer_adapter.
+
+        @keyword spool_path: str representing the
+        directory the files of the jobs are copied
+        to. Default is SYSTEM_PRINT_SPOOL_PATH.
+
+        @keyword job_timeout: number representing the
+        seconds a submitted job may remain unprinted
+        before it is re-queued. Default is
+        PRINT_JOB_TIMEOUT.
+
+        @keyword max_failures: int representing the
+        number of times a job may fail or not be printed
+        in time before it is given up on. Default is
+        PRINT_JOB_MAX_FAILURES.
+
+        @keyword ledger_size: int representing the
+        number of finished jobs kept in the ledger.
+        Default is PRINT_JOB_LEDGER_SIZE.
+        """
+        self._adapter_factory = adapter_factory
+        self._spool_path = spool_path
+        self._job_timeout = job_timeout
+        self._max_failures = max_failures
+        self._ledger_size = ledger_size
+
+        self._adapters = {}
+        self._available = {}
+
+        self._ledger = OrderedDict()
+        self._ledger_ids = count(1)
+
+        # ids of the jobs that a thread is submitting or polling
+        self._claimed_jobs = set()
+
+        self._lock = threading.RLock()
+        self._poll_lock = threading.Lock()
+        self._poll_thread = None
+        self._stop_event = threading.Event()
+
+    def get_adapter(self, printer_name):
+        """Gets the adapter of the given
+        printer, creating it if necessary.
+
+        @param printer_name: str representing
+        the name of the printer.
+
+        @return: AbstractPrinterAdapter
+        """
+        with self._lock:
+            adapter = self._adapters.get(printer_name)
+
+        if adapter is None:
+            adapter = self._adapter_factory(printer_name)
+
+            with self._lock:
+                adapter = self._adapters.setdefault(printer_name, adapter)
+
+        return adapter
+
+    def is_available(self, printer_name):
+        """Checks if the given printer was
+        available when it was last polled. Printers
+        that have not been polled are polled now.
+
+        @param printer_name: str representing
+        the name of the printer.
+
+        @return: bool
+        """
+        with self._lock:
+            available = self._available.get(printer_name)
+
+        if available is None:
+            available = self._poll_printer(printer_name)
+
+        return available
+
+    #==========================================================================
+    # This block contains methods that submit jobs.
+    #==========================================================================
+    def submit(self, file_path, title, options, printer_names):
+        """Submits the given file to the first
+        available printer of the given printers.
+        The file is spooled, so that the job may
+        be re-queued after the file has changed.
+
+        @param file_path: str representing the file
+        to be printed.
+
+        @param title: str representing the title of
+        the job.
+
+        @param options: dict of options of the job.
+
+        @param printer_names: iterable of str representing
+        the printers the job may be printed on, in order
+        of preference.
+
+        @return: PrintJob representing the job. If no
+        printer was available it is queued until one is.
+        """
+        with self._lock:
+            ledger_id = next(self._ledger_ids)
+
+        spool_file = self._spool(ledger_id, file_path)
+        job = PrintJob(ledger_id, spool_file, title, dict(options),
+                       tuple(printer_names))
+
+        with self._lock:
+            self._ledger[ledger_id] = job
+            self._claimed_jobs.add(ledger_id)
+
+        try:
+            self._dispatch(job)
+        finally:
+            self._release(job)
+
+        return job
+
+    def _spool(self, ledger_id, file_path):
+        """Private Method.
+
+        Copies the given file to the spool.
+
+        @param ledger_id: int representing the
+        id of the job the file belongs to.
+
+        @param file_path: str representing the
+        file to be copied.
+
+        @return: str representing the spooled
+        file.
+        """
+        if not os.path.isdir(self._spool_path):
+            os.makedirs(self._spool_path)
+
+        extension = os.path.splitext(file_path)[1]
+        spool_file = os.path.join(self._spool_path,
+                                  '{}{}'.format(ledger_id, extension))
+        shutil.copyfile(file_path, spool_file)
+
+        return spool_file
+
+    def _release(self, job):
+        """Private Method.
+
+        Releases the claim of the current thread
+        on the given job, so that it may be polled.
+
+        @param job: PrintJob that was claimed.
+
+        @return: None
+        """
+        with self._lock:
+            self._claimed_jobs.discard(job.ledger_id)
+
+    def _dispatch(self, job):
+        """Private Method.
+
+        Submits the given job to the first
+        available printer of its route. The job
+        remains queued if no printer accepts it.
+
+        @note: The job must be claimed by the
+        current thread.
+
+        @param job: PrintJob to be submitted.
+
+        @return: bool value representing if the
+        job was submitted.
+        """
+        for printer_name in job.printer_names:
+            if not self.is_available(printer_name):
+                continue
+
+            adapter = self.get_adapter(printer_name)
+            job_id = adapter.submit(job.file_path, job.title, job.options)
+
+            with self._lock:
+                if job_id > 0:
+                    job.state = PrintJob.SUBMITTED
+                    job.printer_name = printer_name
+                    job.job_id = job_id
+                    job.attempts += 1
+                    job.submitted_time = time()
+
+                    if printer_name != job.printer_names[0]:
+                        logger.warning('print job %s routed to fallback printer %s',
+                                       job.ledger_id, printer_name)
+                    return True
+
+                self._available[printer_name] = False
+
+        with self._lock:
+            job.state = PrintJob.QUEUED
+            job.printer_name = None
+            job.job_id = 0
+
+        logger.warning('print job %s queued, no printer of %s is available',
+                       job.ledger_id, job.printer_names)
+        return False
+
+    def _requeue(self, job):
+        """Private Method.
+
+        Re-queues the given job after it has
+        failed, unless it has already failed the
+        maximum number of times.
+
+        @note: The job must be claimed by the
+        current thread.
+
+        @param job: PrintJob to be re-queued.
+
+        @return: None
+        """
+        with self._lock:
+            job.failures += 1
+            has_failed = job.failures >= self._max_failures
+
+        if has_failed:
+            self._finish(job, PrintJob.FAILED)
+            logger.error('print job %s failed after %s attempts',
+                         job.ledger_id, job.attempts)
+        else:
+            self._dispatch(job)
+
+    def _finish(self, job, state):
+        """Private Method.
+
+        Finishes the given job, removing its
+        spooled file and pruning the ledger.
+
+        @param job: PrintJob to be finished.
+
+        @param state: str representing the final
+        state of the job.
+
+        @return: None
+        """
+        with self._lock:
+            job.state = state
+
+            finished = [ledger_id for ledger_id, ledger_job in
+                        self._ledger.iteritems() if ledger_job.is_finished]
+
+            for ledger_id in finished[:-self._ledger_size or None]:
+                del self._ledger[ledger_id]
+
+        if os.path.exists(job.file_path):
+            os.remove(job.file_path)
+
+    #==========================================================================
+    # This block contains methods that poll the printers and jobs.
+    #==========================================================================
+    def poll(self):
+        """Polls the printers and the unfinished
+        jobs. Completed jobs are acknowledged, while
+        failed jobs and jobs that were not printed in
+        time are re-queued. Queued jobs are submitted
+        if a printer has become available.
+
+        @note: Jobs that are being submitted are
+        left for the next poll.
+
+        @return: None
+        """
+        with self._poll_lock:
+            with self._lock:
+                printer_names = self._adapters.keys()
+
+            for printer_name in printer_names:
+                self._poll_printer(printer_name)
+
+            with self._lock:
+                jobs = [job for job in self.get_unfinished_jobs()
+                        if job.ledger_id not in self._claimed_jobs]
+                self._claimed_jobs.update(job.ledger_id for job in jobs)
+
+            for job in jobs:
+                try:
+                    if job.state == PrintJob.QUEUED:
+                        self._dispatch(job)
+                    else:
+                        self._poll_job(job)
+                finally:
+                    self._release(job)
+
+    def _poll_printer(self, printer_name):
+        """Private Method.
+
+        Polls whether the given printer is
+        available.
+
+        @param printer_name: str representing
+        the name of the printer.
+
+        @return: bool value representing if the
+        printer is available.
+        """
+        available = self.get_adapter(printer_name).is_available()
+
+        with self._lock:
+            was_available = self._available.get(printer_name, True)
+            self._available[printer_name] = available
+
+        if was_available and not available:
+            logger.warning('printer %s is unavailable', printer_name)
+
+        return available
+
+    def _poll_job(self, job):
+        """Private Method.
+
+        Polls the state of the given submitted
+        job.
+
+        @note: The job must be claimed by the
+        current thread.
+
+        @param job: PrintJob that has been submitted.
+
+        @return: None
+        """
+        adapter = self.get_adapter(job.printer_name)
+        state = adapter.get_job_state(job.job_id)
+
+        with self._lock:
+            is_available = self._available[job.printer_name]
+
+        if state == AbstractPrinterAdapter.JOB_COMPLETED:
+            self._finish(job, PrintJob.COMPLETED)
+
+        elif state == AbstractPrinterAdapter.JOB_FAILED:
+            self._requeue(job)
+
+        elif not is_available:
+            # the job isn't at fault, so it is routed again without failing
+            adapter.cancel_job(job.job_id)
+            self._dispatch(job)
+
+        elif time() - job.submitted_time > self._job_timeout:
+            adapter.cancel_job(job.job_id)
+            self._requeue(job)
+
+    def get_unfinished_jobs(self):
+        """Gets the jobs that haven't been
+        printed or given up on.
+
+        @return: list of PrintJob
+        """
+        with self._lock:
+            return [job for job in self._ledger.itervalues()
+                    if not job.is_finished]
+
+    def get_ledger(self):
+        """Gets the records of the jobs in
+        the ledger, in the order they were
+        submitted.
+
+        @return: list of dict representing
+        each job.
+        """
+        with self._lock:
+            return [job.to_dict() for job in self._ledger.itervalues()]
+
+    #==========================================================================
+    # This block contains methods that control the background polling.
+    #==========================================================================
+    def start(self, interval=PRINTER_POLL_INTERVAL):
+        """Starts polling the printers and jobs
+        on a background thread at the given
+        interval.
+
+        @keyword interval: number representing the
+        seconds between polls. Default is
+        PRINTER_POLL_INTERVAL.
+
+        @return: None
+        """
+        if self._poll_thread is not None:
+            return
+
+        self._stop_event.clear()
+        self._poll_thread = threading.Thread(target=self._run_poll,
+                                             args=(interval,))
+        self._poll_thread.daemon = True
+        self._poll_thread.start()
+        atexit.register(self.stop)
+
+    def _run_poll(self, interval):
+        """Private Method.
+
+        Runs the loop that polls the printers
+        and jobs until the polling is stopped.
+
+        @param interval: number representing the
+        seconds between polls.
+
+        @return: None
+        """
+        while not self._stop_event.wait(interval):
+            try:
+                self.poll()
+            except Exception as e:
+                logger.exception('printer poll failed: %s', e)
+
+    def stop(self):
+        """Stops polling the printers and jobs.
+
+        @return: None
+        """
+        if self._poll_thread is None:
+            return
+
+        self._stop_event.set()
+        self._poll_thread.join()
+        self._poll_thread = None
+
+
+printer_manager = PrinterManager()
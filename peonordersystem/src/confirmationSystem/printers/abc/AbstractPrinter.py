@@ -38,6 +38,20 @@ class AbstractPrinter(object):
         objects that represents the order
         to be sent to the front.
 
+        @return: bool value representing
+        if the print was successful
+        """
+        pass
+
+    @abstractmethod
+    def print_batch_to_front(self, data_list):
+        """Prints each of the given data
+        to the front as a single job.
+
+        @param data_list: list of data that
+        each represents an order to be sent
+        to the front.
+
         @return: bool value representing
         if the print was successful
         """
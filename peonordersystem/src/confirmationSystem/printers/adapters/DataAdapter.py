@@ -38,6 +38,12 @@ class DataAdapter(AbstractDataAdapter):
             'order'             :   list of MenuItem objects representing
                                     the non-priority order associated with
                                     this data.
+
+        The optional key value pair is:
+
+            'tax_breakdown'     :   dict of str tax classes mapped to the
+                                    float tax of the items of that class.
+                                    Default is an empty dict.
         """
         self._number = data['number']
         self._name = data['name']
@@ -45,7 +51,8 @@ class DataAdapter(AbstractDataAdapter):
         self._totals = {
             'total':    data['total'],
             'subtotal': data['subtotal'],
-            'tax':      data['tax']
+            'tax':      data['tax'],
+            'tax_breakdown': dict(data.get('tax_breakdown', {}))
         }
 
         self._priority_order = tuple(data['priority_order'])
@@ -83,6 +90,9 @@ class DataAdapter(AbstractDataAdapter):
 
             'tax'       :   float representing data tax
 
+            'tax_breakdown' :   dict of str tax classes mapped
+                                to the float tax of the class
+
         @return: dict
         """
         return self._totals
@@ -8,6 +8,7 @@ methods print_data.
 @contact: cjmcgraw( at )u.washington.edu
 @version: 1.0
 """
+import cups
 from cups import Connection
 
 from .abc.AbstractPrinterAdapter import AbstractPrinterAdapter
@@ -18,6 +19,9 @@ class PrinterAdapter(AbstractPrinterAdapter):
     the printer and allowing data to be printed.
     """
 
+    # CUPS job states that mean the job will never be printed.
+    FAILED_JOB_STATES = (cups.IPP_JOB_CANCELED, cups.IPP_JOB_ABORTED)
+
     def __init__(self, printer_name):
         """Initializes the adapter"""
         self._printer_name = printer_name
@@ -41,6 +45,85 @@ class PrinterAdapter(AbstractPrinterAdapter):
         printer was successful in scheduling the
         job.
         """
-        value = self._connection.printFile(self._printer_name, data_file_str,
-                                           title_str, options)
-        return value > 0
+        return self.submit(data_file_str, title_str, options) > 0
+
+    def submit(self, data_file_str, title_str, options):
+        """Submits the given data to be printed.
+
+        @param data_file_str: str representing the
+        file to be printed.
+
+        @param title_str: str representing the title
+        that the printer job should be associated
+        with.
+
+        @param options: dict of options that the
+        should be associated with the printer job.
+
+        @return: int representing the id of the job.
+        0 if the job was not accepted.
+        """
+        try:
+            return self._connection.printFile(self._printer_name, data_file_str,
+                                              title_str, options)
+        except (cups.IPPError, RuntimeError):
+            return 0
+
+    def is_available(self):
+        """Checks if the printer exists, isn't
+        stopped and is accepting jobs.
+
+        @return: bool
+        """
+        try:
+            attributes = self._connection.getPrinterAttributes(
+                self._printer_name,
+                requested_attributes=['printer-state',
+                                      'printer-is-accepting-jobs'])
+        except (cups.IPPError, RuntimeError):
+            return False
+
+        return (attributes.get('printer-state') != cups.IPP_PRINTER_STOPPED and
+                bool(attributes.get('printer-is-accepting-jobs')))
+
+    def get_job_state(self, job_id):
+        """Gets the state of the given job.
+
+        @param job_id: int representing the id
+        of a job submitted to the printer.
+
+        @return: str representing the state of
+        the job. Either JOB_PENDING, JOB_COMPLETED
+        or JOB_FAILED.
+        """
+        try:
+            attributes = self._connection.getJobAttributes(
+                job_id, requested_attributes=['job-state'])
+        except cups.IPPError:
+            # the job is unknown to the server
+            return self.JOB_FAILED
+        except RuntimeError:
+            return self.JOB_PENDING
+
+        state = attributes.get('job-state')
+
+        if state == cups.IPP_JOB_COMPLETED:
+            return self.JOB_COMPLETED
+        if state in self.FAILED_JOB_STATES:
+            return self.JOB_FAILED
+        return self.JOB_PENDING
+
+    def cancel_job(self, job_id):
+        """Cancels the given job.
+
+        @param job_id: int representing the id
+        of a job submitted to the printer.
+
+        @return: bool value representing if the
+        job was cancelled.
+        """
+        try:
+            self._connection.cancelJob(job_id)
+        except (cups.IPPError, RuntimeError):
+            return False
+        return True
@@ -0,0 +1,171 @@
+"""This module provides the simulated
+printer adapter that stands in for a
+CUPS printer. Jobs are kept in memory
+and their outcome is controlled through
+the adapter, so that printing may be run
+without a printer.
+
+@author: Carl McGraw
+@contact: cjmcgraw( at )u.washington.edu
+@version: 1.0
+"""
+from itertools import count
+from collections import OrderedDict
+
+from .abc.AbstractPrinterAdapter import AbstractPrinterAdapter
+
+
+class SimulatedPrinterAdapter(AbstractPrinterAdapter):
+    """Simulates a printer. Submitted jobs stay
+    pending until they are completed or failed
+    through the adapter.
+    """
+
+    # ids are shared by all simulated printers, as they are by a CUPS server.
+    _job_ids = count(1)
+
+    def __init__(self, printer_name, available=True, auto_complete=False):
+        """Initializes the adapter.
+
+        @param printer_name: str representing the
+        name of the simulated printer.
+
+        @keyword available: bool value representing
+        if the printer is accepting jobs. Default is
+        True.
+
+        @keyword auto_complete: bool value representing
+        if submitted jobs are completed immediately.
+        Default is False.
+        """
+        self._printer_name = printer_name
+        self.available = available
+        self.auto_complete = auto_complete
+
+        self.jobs = OrderedDict()
+
+    def print_data(self, data_file_str, title_str, options):
+        """Prints the given data with the given
+        information.
+
+        @param data_file_str: str representing the
+        file to be printed.
+
+        @param title_str: str representing the title
+        that the printer job should be associated
+        with.
+
+        @param options: dict of options that the
+        should be associated with the printer job.
+
+        @return: bool value representing if the
+        printer accepted the job.
+        """
+        return self.submit(data_file_str, title_str, options) > 0
+
+    def submit(self, data_file_str, title_str, options):
+        """Submits the given data to be printed.
+
+        @param data_file_str: str representing the
+        file to be printed.
+
+        @param title_str: str representing the title
+        that the printer job should be associated
+        with.
+
+        @param options: dict of options that the
+        should be associated with the printer job.
+
+        @return: int representing the id of the job.
+        0 if the printer is unavailable.
+        """
+        if not self.available:
+            return 0
+
+        job_id = next(self._job_ids)
+        state = self.JOB_COMPLETED if self.auto_complete else self.JOB_PENDING
+
+        self.jobs[job_id] = {'file': data_file_str,
+                             'title': title_str,
+                             'options': dict(options),
+                             'state': state}
+        return job_id
+
+    def is_available(self):
+        """Checks if the printer is accepting
+        jobs.
+
+        @return: bool
+        """
+        return self.available
+
+    def get_job_state(self, job_id):
+        """Gets the state of the given job.
+
+        @param job_id: int representing the id
+        of a job submitted to the printer.
+
+        @return: str representing the state of
+        the job. JOB_FAILED if the job is unknown.
+        """
+        if job_id not in self.jobs:
+            return self.JOB_FAILED
+        return self.jobs[job_id]['state']
+
+    def cancel_job(self, job_id):
+        """Cancels the given job.
+
+        @param job_id: int representing the id
+        of a job submitted to the printer.
+
+        @return: bool value representing if the
+        job was pending and has been cancelled.
+        """
+        return self.fail_job(job_id)
+
+    #==========================================================================
+    # This block contains methods that control the outcome of the jobs.
+    #==========================================================================
+    def complete_jobs(self):
+        """Completes all of the pending jobs,
+        as a printer that is available would.
+
+        @return: int representing the number of
+        jobs completed.
+        """
+        if not self.available:
+            return 0
+
+        pending = [job_id for job_id, job in self.jobs.iteritems()
+                   if job['state'] == self.JOB_PENDING]
+
+        for job_id in pending:
+            self.jobs[job_id]['state'] = self.JOB_COMPLETED
+
+        return len(pending)
+
+    def fail_job(self, job_id):
+        """Fails the given job.
+
+        @param job_id: int representing the id
+        of a job submitted to the printer.
+
+        @return: bool value representing if the
+        job was pending and has been failed.
+        """
+        job = self.jobs.get(job_id)
+
+        if job is None or job['state'] != self.JOB_PENDING:
+            return False
+
+        job['state'] = self.JOB_FAILED
+        return True
+
+    def get_pending_jobs(self):
+        """Gets the ids of the jobs that
+        are pending.
+
+        @return: list of int
+        """
+        return [job_id for job_id, job in self.jobs.iteritems()
+                if job['state'] == self.JOB_PENDING]
@@ -50,6 +50,9 @@ class AbstractDataAdapter(object):
             'tax'       :   float value representing the tax of all
                             items associated with this data.
 
+            'tax_breakdown' :   dict of str tax classes mapped to the
+                                float tax of the items of that class.
+
         @return: dict
         """
         pass
@@ -35,3 +35,60 @@ class AbstractPrinterAdapter(object):
         system received the job.
         """
         pass
+
+    # States of the jobs submitted to the printer.
+    JOB_PENDING = 'pending'
+    JOB_COMPLETED = 'completed'
+    JOB_FAILED = 'failed'
+
+    @abstractmethod
+    def submit(self, data_file_str, title_str, options):
+        """Submits the data to be printed.
+
+        @param data_file_str: str representing the file
+        name of the data to be printed.
+
+        @param title_str: str representing the title
+        that the job should be associated with.
+
+        @param options: dict of options that represent
+        the options associated with the printing job.
+
+        @return: int representing the id of the job. 0
+        if the job was not accepted.
+        """
+        pass
+
+    @abstractmethod
+    def is_available(self):
+        """Checks if the printer exists and
+        is accepting jobs.
+
+        @return: bool
+        """
+        pass
+
+    @abstractmethod
+    def get_job_state(self, job_id):
+        """Gets the state of the given job.
+
+        @param job_id: int representing the id
+        of a job submitted to the printer.
+
+        @return: str representing the state of
+        the job. Either JOB_PENDING, JOB_COMPLETED
+        or JOB_FAILED.
+        """
+        pass
+
+    @abstractmethod
+    def cancel_job(self, job_id):
+        """Cancels the given job.
+
+        @param job_id: int representing the id
+        of a job submitted to the printer.
+
+        @return: bool value representing if the
+        job was cancelled.
+        """
+        pass
@@ -6,7 +6,8 @@ area.
 @contact: cjmcgraw( at )u.washington.edu
 @version: 1.0
 """
-from peonordersystem.src.Settings import FRONT_PRINTER_NAME
+from peonordersystem.src.Settings import (FRONT_PRINTER_NAME,
+                                          FRONT_FALLBACK_PRINTER_NAME)
 
 from .LocationPrinter import LocationPrinter
 
@@ -19,4 +20,5 @@ class FrontPrinter(LocationPrinter):
 
     def __init__(self):
         """Initializes the printer"""
-        super(FrontPrinter, self).__init__(FRONT_PRINTER_NAME)
\ No newline at end of file
+        super(FrontPrinter, self).__init__(FRONT_PRINTER_NAME,
+                                           FRONT_FALLBACK_PRINTER_NAME)
\ No newline at end of file
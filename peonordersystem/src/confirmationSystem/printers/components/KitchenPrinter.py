@@ -6,7 +6,8 @@ the kitchen printer.
 @contact: cjmcgraw( at )u.washington.edu
 @version: 1.0
 """
-from peonordersystem.src.Settings import KITCHEN_PRINTER_NAME
+from peonordersystem.src.Settings import (KITCHEN_PRINTER_NAME,
+                                          KITCHEN_FALLBACK_PRINTER_NAME)
 
 from .LocationPrinter import LocationPrinter
 
@@ -18,7 +19,8 @@ class KitchenPrinter(LocationPrinter):
 
     def __init__(self):
         """Initializes the printer"""
-        super(KitchenPrinter, self).__init__(KITCHEN_PRINTER_NAME)
+        super(KitchenPrinter, self).__init__(KITCHEN_PRINTER_NAME,
+                                             KITCHEN_FALLBACK_PRINTER_NAME)
 
     def _get_title(self):
         """Gets the title data associated
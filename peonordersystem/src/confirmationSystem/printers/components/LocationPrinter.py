@@ -17,15 +17,20 @@ class LocationPrinter(AbstractLocationPrinter):
     location.
     """
 
-    def __init__(self, printer_name):
+    def __init__(self, printer_name, fallback_printer_name=None):
         """Initializes the printer that
         prints to the given name.
 
         @param printer_name: str representing
         the printer name to be printed to.
+
+        @keyword fallback_printer_name: str representing
+        the printer name to be printed to while the
+        printer is unavailable. Default is None.
         """
         self._order_counter = 0
-        super(LocationPrinter, self).__init__(printer_name)
+        super(LocationPrinter, self).__init__(printer_name,
+                                              fallback_printer_name)
 
     def send_to_printer(self, data):
         """Sends the data to the printer
@@ -36,13 +41,16 @@ class LocationPrinter(AbstractLocationPrinter):
 
         @return: bool value representing
         if the printer job was successfully
-        passed to the printer.
+        passed to a printer. If no printer
+        was available the job is queued
+        and printed once one is.
         """
         title = self._get_title()
         options = self._get_options()
 
         self._order_counter += 1
-        return self._printer.print_data(data, title, options)
+        job = self._manager.submit(data, title, options, self._printer_names)
+        return job.state == job.SUBMITTED
 
     def _get_title(self):
         """Gets the title for the
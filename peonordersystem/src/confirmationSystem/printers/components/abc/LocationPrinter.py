@@ -7,8 +7,8 @@ base class for the LocationPrinter
 """
 from abc import ABCMeta, abstractmethod
 
-from peonordersystem.src.confirmationSystem.printers.adapters.PrinterAdapter \
-    import PrinterAdapter
+from peonordersystem.src.confirmationSystem.printers.PrinterManager \
+    import printer_manager
 
 
 class AbstractLocationPrinter(object):
@@ -19,15 +19,30 @@ class AbstractLocationPrinter(object):
 
     __metaclass__ = ABCMeta
 
-    def __init__(self, printer_name):
+    def __init__(self, printer_name, fallback_printer_name=None,
+                 manager=printer_manager):
         """Initializes the location printer
         with the given name.
 
         @param printer_name: str representing
         the name to be associated with the
         location printer.
+
+        @keyword fallback_printer_name: str representing
+        the name of the printer that jobs are routed to
+        while the location printer is unavailable. Default
+        is None, for no fallback.
+
+        @keyword manager: PrinterManager that the jobs
+        are submitted through. Default is the shared
+        printer_manager.
         """
-        self._printer = PrinterAdapter(printer_name)
+        self._printer_names = (printer_name,)
+
+        if fallback_printer_name and fallback_printer_name != printer_name:
+            self._printer_names += (fallback_printer_name,)
+
+        self._manager = manager
 
     @abstractmethod
     def send_to_printer(self, file_path):
@@ -10,3 +10,12 @@ from reportlab.lib.units import cm
 
 # Constants used for defining the paper characteristics
 DEFAULT_FRONT_PRINTER_WIDTH = 7.2 * cm
+
+# Constants used for defining the receipt layout
+# if the items on a receipt are laid out as a single table rather than
+# one table per item.
+SINGLE_TABLE_RECEIPT = True
+
+# Constants used for measuring text
+# number of measured (text, font, size, width) line counts that are cached.
+TEXT_MEASURE_CACHE_SIZE = 4096
@@ -0,0 +1,184 @@
+"""This module defines the TextMeasurer
+class which is used to measure how many
+lines text takes up when it is wrapped
+to a given width, using the metrics of
+the font it is displayed in.
+
+@author: Carl McGraw
+@contact: cjmcgraw( at )u.washington.edu
+@version: 1.0
+"""
+from collections import OrderedDict
+
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.pdfbase.pdfmetrics import stringWidth
+
+from .PrinterSettings import TEXT_MEASURE_CACHE_SIZE
+
+
+class TextMeasurer(object):
+    """Measures the number of wrapped
+    lines of text. Measurements are kept
+    in a least recently used cache so that
+    they are reused across tickets.
+    """
+
+    # fraction of its width each space on a line may shrink by, so that
+    # lines are broken in the same place as paragraphs break them.
+    SPACE_SHRINKAGE = ParagraphStyle.defaults.get('spaceShrinkage', 0)
+
+    def __init__(self, cache_size=TEXT_MEASURE_CACHE_SIZE):
+        """Initializes the TextMeasurer.
+
+        @keyword cache_size: int representing the
+        maximum number of measurements cached.
+        Default is TEXT_MEASURE_CACHE_SIZE.
+        """
+        self._cache_size = cache_size
+        self._cache = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def count_lines(self, text, font, size, width):
+        """Counts the number of lines the given
+        text takes up when it is wrapped to the
+        given width. Text is wrapped between
+        words, as done by paragraphs.
+
+        @param text: str representing the text.
+        Markup is not supported.
+
+        @param font: str representing the name of
+        the font the text is displayed in.
+
+        @param size: number representing the size
+        of the font.
+
+        @param width: number representing the width
+        the text is wrapped to.
+
+        @return: int representing the number of lines.
+        0 if the text is empty.
+        """
+        key = text, font, size, width
+
+        try:
+            num_of_lines = self._cache.pop(key)
+            self.hits += 1
+
+        except KeyError:
+            num_of_lines = self._count_lines(text, font, size, width)
+            self.misses += 1
+
+            if len(self._cache) >= self._cache_size:
+                self._cache.popitem(last=False)
+
+        self._cache[key] = num_of_lines
+        return num_of_lines
+
+    @staticmethod
+    def _count_lines(text, font, size, width):
+        """Private Method.
+
+        Counts the number of lines the given
+        text takes up when it is wrapped to the
+        given width.
+
+        @param text: str representing the text.
+
+        @param font: str representing the name of
+        the font.
+
+        @param size: number representing the size
+        of the font.
+
+        @param width: number representing the width
+        the text is wrapped to.
+
+        @return: int representing the number of lines.
+        """
+        words = text.split()
+
+        if not words:
+            return 0
+
+        space_width = stringWidth(' ', font, size)
+        space_shrink = TextMeasurer.SPACE_SHRINKAGE * space_width
+
+        # no space precedes the first word of a line
+        line_width = -space_width
+        line_shrink = 0
+        num_of_lines = 1
+
+        for word in words:
+            word_width = stringWidth(word, font, size)
+            new_width = line_width + space_width + word_width
+
+            if new_width <= width + line_shrink:
+                # each space between the words of a line may shrink
+                if line_width > 0:
+                    line_shrink += space_shrink
+                line_width = new_width
+
+            elif word_width > width:
+                split_lines, line_width = TextMeasurer._split_word(
+                    word, font, size, width, line_width + space_width)
+                num_of_lines += split_lines
+                line_shrink = 0
+
+            else:
+                num_of_lines += 1
+                line_width = word_width
+                line_shrink = 0
+
+        return num_of_lines
+
+    @staticmethod
+    def _split_word(word, font, size, width, line_width):
+        """Private Method.
+
+        Splits a word that is too long for a
+        line between its characters, as done by
+        paragraphs.
+
+        @param word: str representing the word.
+
+        @param font: str representing the name of
+        the font.
+
+        @param size: number representing the size
+        of the font.
+
+        @param width: number representing the width
+        the text is wrapped to.
+
+        @param line_width: number representing the
+        width of the line the word starts on.
+
+        @return: 2 tuple of (int, float) representing
+        the number of lines added and the width of
+        the last line.
+        """
+        num_of_lines = 0
+
+        for char in word:
+            char_width = stringWidth(char, font, size)
+
+            if line_width + char_width > width:
+                num_of_lines += 1
+                line_width = char_width
+            else:
+                line_width += char_width
+
+        return num_of_lines, line_width
+
+    def clear(self):
+        """Clears the cached measurements.
+
+        @return: None
+        """
+        self._cache.clear()
+
+
+text_measurer = TextMeasurer()
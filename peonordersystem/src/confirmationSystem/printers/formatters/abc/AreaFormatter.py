@@ -95,6 +95,28 @@ class AreaFormatter(AbstractFormatter):
         self._clear_state()
         return self.file_path
 
+    def format_batch(self, data_list):
+        """Formats each of the given data
+        as a page of a single file.
+
+        @param data_list: list of dict that
+        each contain the necessary keys defined
+        by required_keys property.
+
+        @return: str representing the path to
+        the file formatted with the given data.
+        """
+        canvas = Canvas(self.file_path)
+
+        for data in data_list:
+            self._clear_state()
+            self.generate_display_areas(data)
+            self._write_page(canvas)
+
+        canvas.save()
+        self._clear_state()
+        return self.file_path
+
     @abstractmethod
     def generate_display_areas(self, data):
         """Generates the display areas.
@@ -168,4 +190,20 @@ class AreaFormatter(AbstractFormatter):
 
         for display in self._displays:
             display.write(canvas)
-        canvas.save()
\ No newline at end of file
+        canvas.save()
+
+    def _write_page(self, canvas):
+        """Writes the display containers
+        to a new page of the given canvas,
+        sized to their area.
+
+        @param canvas: reportlab.pdfgen.canvas.Canvas
+        object that the page is written to.
+
+        @return: None
+        """
+        canvas.setPageSize(self.area)
+
+        for display in self._displays:
+            display.write(canvas)
+        canvas.showPage()
\ No newline at end of file
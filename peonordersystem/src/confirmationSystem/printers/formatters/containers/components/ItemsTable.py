@@ -9,7 +9,7 @@ display for items on the receipt.
 from reportlab.platypus import Paragraph, Table
 
 from peonordersystem.src.confirmationSystem.printers.formatters.PrinterSettings \
-    import DEFAULT_FRONT_PRINTER_WIDTH
+    import DEFAULT_FRONT_PRINTER_WIDTH, SINGLE_TABLE_RECEIPT
 
 from .abc.TableComponent import TableComponent
 
@@ -30,19 +30,54 @@ class ItemsTable(TableComponent):
 
     DEFAULT_TABLE_COL_WIDTH = ([15] + 4 * [(DEFAULT_FRONT_PRINTER_WIDTH - 15) / 4])
 
-    def __init__(self, items_data):
+    # Font size of the plain string item numbers in the single table.
+    NUMBER_FONT_SIZE = 7
+
+    # Option paragraphs of the single table are indented by the cell padding.
+    SINGLE_SUB_FORMAT = """
+        <para align=left size=%s>
+            <i>{data}</i>
+        </para>
+    """ % str(TableComponent.SUB_SIZE)
+
+    SINGLE_TABLE_STYLE = (
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('LEFTPADDING', (0, 0), (-1, -1), -1),
+        ('RIGHTPADDING', (0, 0), (-1, -1), -1),
+        ('ALIGN', (0, 0), (0, -1), 'CENTER'),
+        ('FONT', (0, 0), (0, -1), TableComponent.NUMBER_FONT,
+         NUMBER_FONT_SIZE),
+        ('FONT', (1, 0), (-1, -1), TableComponent.MAIN_FONT,
+         TableComponent.MAIN_SIZE)
+    )
+
+    SPAN_WIDTH = sum(DEFAULT_TABLE_COL_WIDTH[TABLE_SPAN_COLS[0]:
+                                             TABLE_SPAN_COLS[1] + 1])
+
+    # width available to the text of the spanned cells, which have
+    # a padding of -1 on either side.
+    TEXT_WIDTH = SPAN_WIDTH + 2
+
+    # default top and bottom padding of each row.
+    ROW_PADDING = 6
+
+    def __init__(self, items_data, single_table=SINGLE_TABLE_RECEIPT):
         """Initializes the items table.
 
         @param items_data: list of MenuItem
         objects that represents the order to
         be displayed.
+
+        @keyword single_table: bool value representing
+        if all of the items should be laid out as a single
+        table rather than a table for each item. Default
+        is SINGLE_TABLE_RECEIPT.
         """
         # Stateful fields
+        self._single_table = single_table
         self._item_number = 0
         self._current_style = []
-
-        self._item_rows = 0.0
-        self._option_rows = 0.0
+        self._height = 0.0
 
         super(ItemsTable, self).__init__(items_data)
 
@@ -51,13 +86,13 @@ class ItemsTable(TableComponent):
         """Gets the height taken
         up by the components area.
 
+        @note: The height is measured
+        as the rows are generated.
+
         @return: float representing
         the height.
         """
-        item_lines = self.MAIN_SIZE * self._item_rows
-        option_lines = self.SUB_SIZE * self._option_rows
-
-        return (item_lines + option_lines) * self.ROW_SPACE_MULTIPLIER
+        return self._height
 
     def generate_tables(self, items):
         """Generates the tables for display.
@@ -68,9 +103,150 @@ class ItemsTable(TableComponent):
 
         @return: None
         """
-        for item in items:
-            table = self._generate_table(item)
+        if self._single_table:
+            table = self._generate_single_table(items)
             self.add_table(table)
+        else:
+            for item in items:
+                table = self._generate_table(item)
+                self.add_table(table)
+
+    def _generate_single_table(self, items):
+        """Generates a single table for
+        all of the given items. Cells that
+        fit on one line are given as plain
+        strings styled by the table rather
+        than as paragraphs.
+
+        @param items: list of MenuItem objects
+        that the table is to be generated for.
+
+        @return: reportlab.platypus.Table
+        object that represents the table
+        associated with the given MenuItems.
+        """
+        rows = []
+        style = list(self.SINGLE_TABLE_STYLE)
+
+        for item in items:
+            rows.append(self._create_single_item_row(item))
+
+            for option in item.options:
+                style += self._get_single_option_style(len(rows))
+                rows.append(self._create_single_option_row(option))
+
+        first_col, last_col = self.TABLE_SPAN_COLS
+        style += [('SPAN', (first_col, row), (last_col, row))
+                  for row in xrange(len(rows))]
+
+        return Table(rows, self.DEFAULT_TABLE_COL_WIDTH, style=style)
+
+    def _create_single_item_row(self, item):
+        """Creates the item row for the
+        given item in the single table.
+
+        @param item: MenuItem object
+        that is to have the main item
+        row generated for it.
+
+        @return: list of values
+        representing the objects to
+        display the MenuItems data.
+        """
+        self._item_number += 1
+        name = item.get_name()
+
+        number = '{}.'.format(self._item_number)
+        name_cell, name_height = self._get_cell(name, self.MAIN_FORMAT,
+                                                self.MAIN_FONT, self.MAIN_SIZE,
+                                                self.TEXT_WIDTH)
+
+        self._add_row_height(name_height,
+                             self.get_string_height(self.NUMBER_FONT_SIZE),
+                             self.get_string_height(self.MAIN_SIZE))
+
+        return [number, name_cell, '', '', str(item.get_price())]
+
+    def _create_single_option_row(self, option):
+        """Creates the option row for the
+        given option in the single table.
+
+        @param option: OptionItem that is
+        to have display data generated for
+        it.
+
+        @return: list of values representing
+        the row associated with the given
+        OptionItem.
+        """
+        name = str(option)
+
+        name_cell, name_height = self._get_cell(name, self.SINGLE_SUB_FORMAT,
+                                                self.SUB_FONT, self.SUB_SIZE,
+                                                self.TEXT_WIDTH - self.SUB_INDENT)
+
+        self._add_row_height(name_height,
+                             self.get_string_height(self.NUMBER_FONT_SIZE),
+                             self.get_string_height(self.SUB_SIZE))
+
+        return ['', name_cell, '', '', str(option.get_price())]
+
+    def _get_single_option_style(self, row):
+        """Gets the style commands for an
+        option row of the single table.
+
+        @param row: int representing the
+        index of the option row.
+
+        @return: list of style commands.
+        """
+        return [('FONT', (1, row), (-1, row), self.SUB_FONT, self.SUB_SIZE),
+                ('LEFTPADDING', (1, row), (1, row), self.SUB_INDENT - 1)]
+
+    def _get_cell(self, text, paragraph_format, font, size, width):
+        """Gets the cell that displays the
+        given text and its height. Text that
+        fits on one line is given as a plain
+        string, otherwise a paragraph is created
+        so it is wrapped.
+
+        @param text: str representing the text.
+
+        @param paragraph_format: str representing
+        the format of the paragraph.
+
+        @param font: str representing the font of
+        the plain string.
+
+        @param size: int representing the font size
+        of the plain string.
+
+        @param width: float representing the width
+        available to the cell.
+
+        @return: 2 tuple of (str or reportlab.platypus.Paragraph,
+        float) representing the cell and its height.
+        """
+        if self.count_lines(text, font, size, width) <= 1:
+            return text, self.get_string_height(size)
+
+        height = self.get_paragraph_height(text, font, size, width)
+        text = paragraph_format.format(data=text)
+        return Paragraph(text, self.DEFAULT_PARAGRAPH_STYLE), height
+
+    def _add_row_height(self, *cell_heights):
+        """Private Method.
+
+        Adds the height of a row, which is the
+        height of its tallest cell, to the height
+        of the table.
+
+        @param cell_heights: floats representing
+        the height of each cell in the row.
+
+        @return: None
+        """
+        self._height += max(cell_heights) + self.ROW_PADDING
 
     def _generate_table(self, item):
         """Generates a table for the
@@ -127,13 +303,18 @@ class ItemsTable(TableComponent):
         """
         row = []
         self._item_number += 1
-        self._item_rows += self._get_row_number(item.get_name())
+        name = item.get_name()
+
+        name_height = self.get_paragraph_height(name, self.MAIN_FONT,
+                                                self.MAIN_SIZE, self.TEXT_WIDTH)
+        number_height = self.get_number_height(self._item_number,
+                                               self.DEFAULT_TABLE_COL_WIDTH[0] + 2)
+        self._add_row_height(number_height, name_height)
 
         text = self.NUMBER_FORMAT.format(number=self._item_number)
         p_num = Paragraph(text, self.DEFAULT_PARAGRAPH_STYLE)
         row.append(p_num)
 
-        name = item.get_name()
         text = self.MAIN_FORMAT.format(data=name)
         p_name = Paragraph(text, self.DEFAULT_PARAGRAPH_STYLE)
         row.append(p_name)
@@ -163,9 +344,13 @@ class ItemsTable(TableComponent):
         """
         # initial filler column for item number
         row = ['']
-        self._option_rows += self._get_row_number(str(option))
         self._update_style()
 
+        name_height = self.get_paragraph_height(str(option), self.SUB_FONT,
+                                                self.SUB_SIZE,
+                                                self.TEXT_WIDTH - self.SUB_INDENT)
+        self._add_row_height(name_height, self.PARAGRAPH_LEADING)
+
         text = self.SUB_FORMAT.format(data=option)
         p_name = Paragraph(text, self.DEFAULT_PARAGRAPH_STYLE)
         row.append(p_name)
@@ -181,20 +366,6 @@ class ItemsTable(TableComponent):
 
         return row
 
-    def _get_row_number(self, name):
-        """Gets the number of rows to
-        set given the name value to be
-        displayed in the row.
-
-        @param name: str representing the
-        name associated with the row.
-
-        @return: float value representing
-        the number of rows to add.
-        """
-        row_length = len(name) / 15.0
-        return max(row_length, 1.0)
-
     def _update_style(self):
         """Updates the table style to
         incorporate an additional item.
@@ -16,7 +16,9 @@ class KitchenTable(TableComponent):
     for displaying items to the kitchen.
     """
     OPTION_FORMAT = '{option}<br/>'
-    NAME_SIZE = 12
+
+    # default font size of plain string table cells.
+    TABLE_FONT_SIZE = 10
 
     def __init__(self, items_data):
         """Initializes the KitchenTable
@@ -27,9 +29,7 @@ class KitchenTable(TableComponent):
         be generated for display to the kitchen.
         """
         self._item_number = 0
-        self._item_rows = 0
-
-        self._option_rows = 0
+        self._height = 0.0
 
         self.sub_table_col_width = [45] + [self.DEFAULT_TABLE_COL_WIDTH[1] - 45]
 
@@ -41,10 +41,13 @@ class KitchenTable(TableComponent):
         represents the height necessary
         for the table.
 
-        @return: int representing the
+        @note: The height is measured
+        as the rows are generated.
+
+        @return: float representing the
         height.
         """
-        return self._item_rows * self.NAME_SIZE + self._option_rows * self.SUB_SIZE
+        return self._height
 
     def generate_tables(self, data):
         """Generates the tables that
@@ -87,13 +90,20 @@ class KitchenTable(TableComponent):
         row = []
 
         self._item_number += 1
-        self._item_rows += 1
+        name = item.get_name()
+
+        name_height = self.get_paragraph_height(name, self.MAIN_FONT,
+                                                self.MAIN_SIZE,
+                                                self.DEFAULT_TABLE_COL_WIDTH[1])
+        number_height = self.get_number_height(self._item_number,
+                                               self.DEFAULT_TABLE_COL_WIDTH[0])
+        self._add_row_height(number_height, name_height)
 
         text = self.NUMBER_FORMAT.format(number=self._item_number)
         p_num = Paragraph(text, self.DEFAULT_PARAGRAPH_STYLE)
         row.append(p_num)
 
-        text = self.MAIN_FORMAT.format(data=item.get_name())
+        text = self.MAIN_FORMAT.format(data=name)
         p_name = Paragraph(text, self.DEFAULT_PARAGRAPH_STYLE)
         row.append(p_name)
 
@@ -112,8 +122,6 @@ class KitchenTable(TableComponent):
         """
         row = ['']
 
-        self._item_rows += 1
-
         table = self._create_option_table(item)
         row.append(table)
 
@@ -146,6 +154,9 @@ class KitchenTable(TableComponent):
             notes_row = self._create_notes_row(item.notes)
             data.append(notes_row)
 
+        if not data:
+            self._height += self.get_string_height(self.TABLE_FONT_SIZE)
+
         return Table(data or [''],
                      colWidths=self.sub_table_col_width,
                      style=self.DEFAULT_TABLE_STYLE)
@@ -170,7 +181,7 @@ class KitchenTable(TableComponent):
         p_num = Paragraph(text, self.DEFAULT_PARAGRAPH_STYLE)
         row.append(p_num)
 
-        self._option_rows += 1
+        self._add_sub_row_height('stars: ', self._get_sub_lines(str(num)))
 
         return row
 
@@ -192,16 +203,16 @@ class KitchenTable(TableComponent):
         row.append(p_name)
 
         data = ''
+        num_of_lines = 0
         for option in options:
-            self._option_rows += 1
             data += self.OPTION_FORMAT.format(option=option)
+            num_of_lines += self._get_sub_lines(str(option))
 
         text = self.SUB_FORMAT.format(data=data)
         p_opt = Paragraph(text, self.DEFAULT_PARAGRAPH_STYLE)
         row.append(p_opt)
 
-        # For fencepost problem of break
-        self._option_rows += 1
+        self._add_sub_row_height('options: ', num_of_lines)
 
         return row
 
@@ -225,6 +236,56 @@ class KitchenTable(TableComponent):
         p_note = Paragraph(text, self.DEFAULT_PARAGRAPH_STYLE)
         row.append(p_note)
 
-        self._option_rows += (len(note) / 12) + 1
+        self._add_sub_row_height('note: ', self._get_sub_lines(str(note)))
+
+        return row
+
+    def _get_sub_lines(self, text):
+        """Private Method.
+
+        Counts the lines the given text takes
+        up in the value column of the options
+        table.
+
+        @param text: str representing the text.
+
+        @return: int representing the number
+        of lines.
+        """
+        width = self.sub_table_col_width[1] - self.SUB_INDENT
+        return self.count_lines(text, self.SUB_FONT, self.SUB_SIZE, width)
+
+    def _add_sub_row_height(self, label, num_of_lines):
+        """Private Method.
+
+        Adds the height of a row of the options
+        table to the height of the table.
+
+        @param label: str representing the label
+        of the row.
+
+        @param num_of_lines: int representing the
+        number of lines of the rows value.
+
+        @return: None
+        """
+        width = self.sub_table_col_width[0] - self.SUB_INDENT
+        label_height = self.get_paragraph_height(label, self.SUB_FONT,
+                                                 self.SUB_SIZE, width)
+
+        self._add_row_height(label_height,
+                             num_of_lines * self.PARAGRAPH_LEADING)
+
+    def _add_row_height(self, *cell_heights):
+        """Private Method.
 
-        return row
\ No newline at end of file
+        Adds the height of a row, which is the
+        height of its tallest cell, to the height
+        of the table.
+
+        @param cell_heights: floats representing
+        the height of each cell in the row.
+
+        @return: None
+        """
+        self._height += max(cell_heights)
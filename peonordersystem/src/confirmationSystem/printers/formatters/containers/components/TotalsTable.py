@@ -28,7 +28,6 @@ class TotalsTable(Component):
     """ % str(TOTAL_SIZE)
 
     SUBTOTAL_SIZE = 8
-    SUBTOTAL_LINES = 2
 
     SUBTOTAL_FORMAT = """
         <para align=left size=%s>
@@ -55,8 +54,17 @@ class TotalsTable(Component):
             'subtotal'  :   float representing the subtotal
             'tax'       :   float representing the tax.
             'total'     :   float representing the total.
+
+        The optional key value pair is:
+
+            'tax_breakdown' :   dict of str tax classes mapped
+                                to the float tax of the class.
+                                When it holds more than one
+                                class, a tax row is displayed
+                                for each class.
         """
         super(TotalsTable, self).__init__()
+        self._subtotal_lines = 0
         self._generate_tables(total_data)
 
     @property
@@ -68,7 +76,7 @@ class TotalsTable(Component):
         height of this component.
         """
         total_lines = self.TOTAL_SIZE * self.TOTAL_LINES
-        subtotal_lines = self.SUBTOTAL_LINES * self.SUBTOTAL_SIZE
+        subtotal_lines = self._subtotal_lines * self.SUBTOTAL_SIZE
         return (total_lines + subtotal_lines) * self.ROW_SPACE_MULTIPLIER
 
     @property
@@ -111,14 +119,38 @@ class TotalsTable(Component):
                                  self.SUBTOTAL_FORMAT)
         rows.append(row)
 
-        row = self._generate_row('tax: ', total_data['tax'], self.SUBTOTAL_FORMAT)
-        rows.append(row)
+        rows += self._generate_tax_rows(total_data)
+        self._subtotal_lines = len(rows)
 
         row = self._generate_row('total: ', total_data['total'], self.TOTAL_FORMAT)
         rows.append(row)
 
         return rows
 
+    def _generate_tax_rows(self, total_data):
+        """Generates the tax rows for display
+        in the table. A row is generated for
+        each tax class when the order has more
+        than one, otherwise a single tax row
+        is generated.
+
+        @param total_data: dict which holds
+        values associated with the totals.
+
+        @return: list of lists representing
+        the tax rows.
+        """
+        tax_breakdown = total_data.get('tax_breakdown', {})
+
+        if len(tax_breakdown) <= 1:
+            return [self._generate_row('tax: ', total_data['tax'],
+                                       self.SUBTOTAL_FORMAT)]
+
+        return [self._generate_row('tax ({}): '.format(tax_class),
+                                   tax_breakdown[tax_class],
+                                   self.SUBTOTAL_FORMAT)
+                for tax_class in sorted(tax_breakdown)]
+
     def _generate_row(self, title, total, frmt):
         """Generates the data row for a given
         total.
@@ -11,6 +11,8 @@ from .Component import Component
 
 from peonordersystem.src.confirmationSystem.printers.formatters.PrinterSettings \
     import DEFAULT_FRONT_PRINTER_WIDTH
+from peonordersystem.src.confirmationSystem.printers.formatters.TextMeasurer \
+    import text_measurer
 
 
 class TableComponent(Component):
@@ -48,11 +50,24 @@ class TableComponent(Component):
     """ % str(MAIN_SIZE)
 
     SUB_SIZE = 9
+    SUB_INDENT = 10
     SUB_FORMAT = """
-        <para align=left leftIndent=10 size=%s>
+        <para align=left leftIndent=%s size=%s>
             <i>{data}</i>
         </para>
-    """ % str(SUB_SIZE)
+    """ % (str(SUB_INDENT), str(SUB_SIZE))
+
+    # Fonts that the NUMBER_FORMAT, MAIN_FORMAT and SUB_FORMAT
+    # paragraphs are displayed in.
+    NUMBER_FONT = 'Helvetica'
+    NUMBER_SUPER_SIZE = 8
+    MAIN_FONT = 'Helvetica-Bold'
+    SUB_FONT = 'Helvetica-Oblique'
+
+    PARAGRAPH_LEADING = Component.DEFAULT_PARAGRAPH_STYLE.leading
+
+    # Leading of plain string cells, relative to their font size.
+    STRING_LEADING_RATIO = 1.2
 
     def __init__(self, data):
         """Initializes the TableComponent.
@@ -98,3 +113,76 @@ class TableComponent(Component):
         @return: None
         """
         self._flowables.append(table)
+
+    @staticmethod
+    def count_lines(text, font, size, width):
+        """Counts the number of lines the
+        given text takes up when wrapped to
+        the given width.
+
+        @param text: str representing the text.
+
+        @param font: str representing the name
+        of the font.
+
+        @param size: number representing the size
+        of the font.
+
+        @param width: number representing the width
+        the text is wrapped to.
+
+        @return: int representing the number of lines.
+        """
+        return text_measurer.count_lines(text, font, size, width)
+
+    def get_paragraph_height(self, text, font, size, width):
+        """Gets the height of a paragraph
+        displaying the given text.
+
+        @param text: str representing the text.
+
+        @param font: str representing the name
+        of the font.
+
+        @param size: number representing the size
+        of the font.
+
+        @param width: number representing the width
+        available to the paragraph.
+
+        @return: float representing the height.
+        """
+        num_of_lines = self.count_lines(text, font, size, width)
+        return num_of_lines * self.PARAGRAPH_LEADING
+
+    def get_number_height(self, number, width):
+        """Gets the height of a paragraph
+        displaying the given item number in
+        the NUMBER_FORMAT.
+
+        @param number: int representing the
+        item number.
+
+        @param width: number representing the width
+        available to the paragraph.
+
+        @return: float representing the height.
+        """
+        text = '{}.'.format(number)
+        height = self.get_paragraph_height(text, self.NUMBER_FONT,
+                                           self.NUMBER_SUPER_SIZE, width)
+        return max(height, self.PARAGRAPH_LEADING)
+
+    def get_string_height(self, size, num_of_lines=1):
+        """Gets the height of a plain string
+        cell in the given font size.
+
+        @param size: number representing the size
+        of the font.
+
+        @keyword num_of_lines: int representing the
+        number of lines of the string. Default is 1.
+
+        @return: float representing the height.
+        """
+        return num_of_lines * size * self.STRING_LEADING_RATIO
@@ -11,6 +11,7 @@ from gi.repository import Gtk
 
 from peonordersystem.src import ErrorLogger
 from peonordersystem.src.CustomExceptions import InvalidItemError, InvalidOrderError
+from peonordersystem.src.Settings import ORDER_TYPE_STANDARD
 from .dialogs.depreciated import Dialog
 from .dialogs.depreciated.MenuDisplaySelectionDialog import MenuDisplaySelectionDialog
 
@@ -104,7 +105,7 @@ class Editor(object):
 
             return value
 
-    def confirm(self, order_list, confirm_dialog, confirm_function):
+    def confirm(self, order_list, confirm_dialog, confirm_function, **kwargs):
         """Generates and runs the given ConfirmationDialog with
         the given parameters as arguments.
 
@@ -120,13 +121,16 @@ class Editor(object):
         @param confirm_function: function pointer that is executed
         when confirmation of the dialog occurs.
 
+        @param kwargs: keyword arguments that are passed on to
+        the dialog.
+
         @return: int representing the Gtk.ResponseType emitted by
         the dialog window, or None if no dialog window was
         executed.
         """
         if order_check(order_list):
             dialog_window = confirm_dialog(self.parent, confirm_function,
-                                           order_list)
+                                           order_list, **kwargs)
             response = dialog_window.run_dialog()
             del dialog_window
 
@@ -203,7 +207,8 @@ class Editor(object):
 
         return response == ACCEPT_RESPONSE
     
-    def checkout_order(self, order_list, confirm_function):
+    def checkout_order(self, order_list, confirm_function,
+                       order_type=ORDER_TYPE_STANDARD):
         """Calls the checkout confirmation dialog on the given
         order list. If confirmed this dialog calls the given
         confirm function. Confirm checkout displays information
@@ -216,14 +221,18 @@ class Editor(object):
         @param confirm_function: function pointer that points to the
         function to be executed if the checkout is confirmed.
 
+        @keyword order_type: str representing the type of the order,
+        which its tax rates depend on. Default is ORDER_TYPE_STANDARD.
+
         @return: bool representing if the dialog window was confirmed
         or cancelled. True for confirmed, False for cancelled.
         """
         response = self.confirm(order_list, Dialog.CheckoutConfirmationDialog,
-                                confirm_function)
+                                confirm_function, order_type=order_type)
         return response
 
-    def split_check_order(self, order_list, confirm_function):
+    def split_check_order(self, order_list, confirm_function,
+                          order_type=ORDER_TYPE_STANDARD):
         """Calls the split confirmation dialog on the given
         order list. If confirmed this dialog calls the given
         confirmation function.
@@ -234,11 +243,15 @@ class Editor(object):
         @param confirm_function: function that is to be called when
         the split check confirmation occurs.
 
+        @keyword order_type: str representing the type of the order,
+        which the tax rates of each check depend on. Default is
+        ORDER_TYPE_STANDARD.
+
         @return: bool representing of the dialog window was confirmed
         or cancelled. True for confirmed, False for cancelled.
         """
         response = self.confirm(order_list, Dialog.SplitCheckConfirmationDialog,
-                                confirm_function)
+                                confirm_function, order_type=order_type)
         return response == ACCEPT_RESPONSE
 
     def comp_item_order(self, order_list, confirm_function):
@@ -247,7 +260,7 @@ class Editor(object):
         in the given order list will be operated on. If confirmed
         this dialog calls the given confirm function with the first
         argument as a list of MenuItem objects that represents the
-        edited order.
+        edited clones of the MenuItems whose comp status changed.
 
         @param order_list: list of MenuItem objects that represents
         the order to have the dialog performed on it.
@@ -287,7 +300,8 @@ class Editor(object):
                                                          name_list)
         return dialog.run_dialog() == ACCEPT_RESPONSE
 
-    def discount_item_order(self, order_list, confirm_function, discount_templates):
+    def discount_item_order(self, order_list, confirm_function, discount_templates,
+                            order_type=ORDER_TYPE_STANDARD):
         """Calls the discount item confirmation dialog on the
         given order list. This confirmation dialog allows the
         user to edit the given order by opening a new dialog
@@ -306,6 +320,9 @@ class Editor(object):
         @param discount_templates: list of tuple that represents
         the stored discount template information.
 
+        @keyword order_type: str representing the type of the order,
+        which its tax rates depend on. Default is ORDER_TYPE_STANDARD.
+
         @return: bool representing if the discount dialog window was
         confirmed. True if the dialog was confirmed, False otherwise.
         """
@@ -314,7 +331,8 @@ class Editor(object):
             dialog = Dialog.DiscountCheckoutConfirmationDialog(self.parent,
                                                                confirm_function,
                                                                order_list,
-                                                               discount_templates)
+                                                               discount_templates,
+                                                               order_type=order_type)
             response = dialog.run_dialog()
             return response == ACCEPT_RESPONSE
 
@@ -431,27 +449,27 @@ class Editor(object):
         del dialog
         return response == ACCEPT_RESPONSE
 
-    def undo_checkout_order(self, checked_out_data, confirm_function):
+    def undo_checkout_order(self, checkout_history, confirm_function):
         """Calls a dialog window that allows the user to retrieve
         previously checked out orders and return them to UI for editing
         or adjustment. Calls the confirm function upon confirmation.
         Runs the dialog window via this method.
 
-        @param checked_out_data: dict of tuple keys, represented as
-        (str, str) -> (name, date). Keys are mapped to values
-        representing the associated order as a list of MenuItem
-        objects.
+        @param checkout_history: CheckoutHistory object that lists
+        the checked out orders of each day, a page at a time, and
+        decodes each order as it is selected.
 
         @param confirm_function: Function that is to be called upon
         confirmation. This function will be called with a dict of
         key tuple (str, str, str) -> (name, _, date) to lists of
-        MenuItem objects.
+        MenuItem objects, and a list of 2 tuple of (CheckoutEntry,
+        str) representing each undone checkout and its new name.
 
         @return: bool value representing if the dialog window
         was confirmed or not. True representing if the dialog
         was confirmed. False if it was cancelled.
         """
-        dialog = Dialog.UndoCheckoutSelectionDialog(self.parent, checked_out_data,
+        dialog = Dialog.UndoCheckoutSelectionDialog(self.parent, checkout_history,
                                                     confirm_function)
         response = dialog.run_dialog()
 
@@ -509,6 +527,20 @@ class Editor(object):
         response = dialog.run_dialog()
         return response == ACCEPT_RESPONSE
 
+    def view_latency_metrics(self, metrics):
+        """Calls a dialog window that displays
+        the recorded latencies of each timed
+        operation.
+
+        @param metrics: dict of str keys representing
+        the operation mapped to the dict summary of its
+        latencies.
+
+        @return: None
+        """
+        dialog = Dialog.LatencyMetricsDialog(self.parent, metrics)
+        dialog.run_dialog()
+
 
 #===========================================================================
 # This block contains functions that are called as conditionals to
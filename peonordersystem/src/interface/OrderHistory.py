@@ -0,0 +1,414 @@
+"""This module defines the commands that
+edit an order and the OrderHistory class
+that keeps the log of commands performed on
+an order so that they may be undone and redone.
+
+Each command stores only the MenuItems that it
+changed, with their positions in the order, so
+that undoing or redoing a step never copies or
+rewrites the whole order. Commands are applied
+to an OrderStore.
+
+@author: Carl McGraw
+@contact: cjmcgraw( at )u.washington.edu
+@version: 1.0
+"""
+from abc import ABCMeta, abstractmethod
+
+#====================================================================================
+# This block represents the kinds of commands that edit an order.
+#====================================================================================
+ADD_COMMAND = 'add'
+REMOVE_COMMAND = 'remove'
+NOTE_COMMAND = 'note'
+STARS_COMMAND = 'stars'
+OPTIONS_COMMAND = 'options'
+COMP_COMMAND = 'comp'
+DISCOUNT_COMMAND = 'discount'
+EDIT_COMMAND = 'edit'
+UNCONFIRM_COMMAND = 'unconfirm'
+
+#====================================================================================
+# This block represents the steps taken on the history of an order, as they are
+# recorded in the order journal. A command recorded as a reset step is applied
+# and then clears the history, as it can't be undone.
+#====================================================================================
+DO_STEP = 'do'
+UNDO_STEP = 'undo'
+REDO_STEP = 'redo'
+RESET_STEP = 'reset'
+
+
+#====================================================================================
+# This block represents the commands that edit an order.
+#====================================================================================
+class OrderCommand(object):
+    """Abstract Class.
+
+    Represents a single step of editing an
+    order that may be applied and reverted.
+
+    @var kind: str representing the kind of
+    command, such as ADD_COMMAND.
+    """
+    __metaclass__ = ABCMeta
+
+    def __init__(self, kind):
+        """Initializes the OrderCommand.
+
+        @param kind: str representing the kind
+        of command.
+        """
+        self.kind = kind
+
+    @abstractmethod
+    def apply(self, order_store):
+        """Abstract Method.
+
+        Applies the command to the given
+        OrderStore.
+
+        @param order_store: OrderStore object.
+
+        @return: None
+        """
+        pass
+
+    @abstractmethod
+    def revert(self, order_store):
+        """Abstract Method.
+
+        Reverts the command on the given
+        OrderStore. The OrderStore is expected
+        to be as the command left it.
+
+        @param order_store: OrderStore object.
+
+        @return: None
+        """
+        pass
+
+    def __repr__(self):
+        """Gets a string representation of
+        the command.
+
+        @return: str
+        """
+        return '{}({})'.format(type(self).__name__, self.kind)
+
+
+class ChangeItemsCommand(OrderCommand):
+    """Represents a command that removes
+    and inserts MenuItems, such as adding or
+    removing an item or applying discounts.
+
+    @var removed: list of 2 tuple of (int, MenuItem)
+    representing the index in the order before the
+    command and a clone of each removed MenuItem, in
+    ascending order of index.
+
+    @var inserted: list of 2 tuple of (int, MenuItem)
+    representing the index in the order after the
+    command and a clone of each inserted MenuItem, in
+    ascending order of index.
+    """
+
+    def __init__(self, kind, removed=(), inserted=()):
+        """Initializes the ChangeItemsCommand.
+
+        @param kind: str representing the kind
+        of command.
+
+        @keyword removed: iterable of 2 tuple of
+        (int, MenuItem) representing the removed
+        MenuItems and their index before the command.
+
+        @keyword inserted: iterable of 2 tuple of
+        (int, MenuItem) representing the inserted
+        MenuItems and their index after the command.
+        """
+        super(ChangeItemsCommand, self).__init__(kind)
+        self.removed = sorted((index, menu_item.clone()) for
+                              index, menu_item in removed)
+        self.inserted = sorted((index, menu_item.clone()) for
+                               index, menu_item in inserted)
+
+    def apply(self, order_store):
+        """Override Method.
+
+        Removes the removed MenuItems and then
+        inserts the inserted MenuItems.
+
+        @param order_store: OrderStore object.
+
+        @return: None
+        """
+        _change_items(order_store, self.removed, self.inserted)
+
+    def revert(self, order_store):
+        """Override Method.
+
+        Removes the inserted MenuItems and then
+        inserts the removed MenuItems back.
+
+        @param order_store: OrderStore object.
+
+        @return: None
+        """
+        _change_items(order_store, self.inserted, self.removed)
+
+
+class ReplaceItemsCommand(OrderCommand):
+    """Represents a command that edits
+    MenuItems of the order in place, such as
+    editing their notes, stars, options or
+    comp status.
+
+    @var before: list of 2 tuple of (int, MenuItem)
+    representing the index and a clone of each
+    MenuItem before it was edited.
+
+    @var after: list of 2 tuple of (int, MenuItem)
+    representing the index and a clone of each
+    MenuItem after it was edited.
+    """
+
+    def __init__(self, kind, before, after):
+        """Initializes the ReplaceItemsCommand.
+
+        @param kind: str representing the kind
+        of command.
+
+        @param before: iterable of 2 tuple of
+        (int, MenuItem) representing the edited
+        MenuItems before they were edited.
+
+        @param after: iterable of 2 tuple of
+        (int, MenuItem) representing the edited
+        MenuItems after they were edited. Each
+        shares its item id with a MenuItem of
+        before.
+        """
+        super(ReplaceItemsCommand, self).__init__(kind)
+        self.before = [(index, menu_item.clone()) for
+                       index, menu_item in before]
+        self.after = [(index, menu_item.clone()) for
+                      index, menu_item in after]
+
+    def apply(self, order_store):
+        """Override Method.
+
+        Replaces the edited MenuItems with
+        their version after the edit.
+
+        @param order_store: OrderStore object.
+
+        @return: None
+        """
+        _replace_items(order_store, self.after)
+
+    def revert(self, order_store):
+        """Override Method.
+
+        Replaces the edited MenuItems with
+        their version before the edit.
+
+        @param order_store: OrderStore object.
+
+        @return: None
+        """
+        _replace_items(order_store, self.before)
+
+
+def _find_index(order_store, index, menu_item):
+    """Private Function.
+
+    Finds the index of the given MenuItem in
+    the given OrderStore. The given index is
+    checked first, so that the search is only
+    made if the order was changed elsewhere.
+
+    @param order_store: OrderStore object.
+
+    @param index: int representing the index the
+    MenuItem is expected at.
+
+    @param menu_item: MenuItem object whose item
+    id is to be found.
+
+    @raise ValueError: If the MenuItem isn't in
+    the order.
+
+    @return: int representing the index.
+    """
+    order_list = order_store.order_list
+    item_id = menu_item.get_item_id()
+
+    if index < len(order_list) and order_list[index].get_item_id() == item_id:
+        return index
+
+    for found_index, order_item in enumerate(order_list):
+        if order_item.get_item_id() == item_id:
+            return found_index
+
+    raise ValueError('Expected {} in the order'.format(menu_item))
+
+
+def _change_items(order_store, removed, inserted):
+    """Private Function.
+
+    Removes and then inserts the given
+    MenuItems in the given OrderStore.
+
+    @param order_store: OrderStore object.
+
+    @param removed: list of 2 tuple of (int, MenuItem)
+    in ascending order of index, representing the
+    MenuItems to be removed.
+
+    @param inserted: list of 2 tuple of (int, MenuItem)
+    in ascending order of index, representing the
+    MenuItems to be inserted, of which clones are
+    inserted.
+
+    @return: None
+    """
+    for index, menu_item in reversed(removed):
+        index = _find_index(order_store, index, menu_item)
+        order_store.remove(order_store.get_iter((index,)))
+
+    for index, menu_item in inserted:
+        order_store.insert_item(index, menu_item.clone())
+
+
+def _replace_items(order_store, edited):
+    """Private Function.
+
+    Replaces the MenuItems of the given
+    OrderStore with clones of the given
+    MenuItems.
+
+    @param order_store: OrderStore object.
+
+    @param edited: list of 2 tuple of (int, MenuItem)
+    representing the MenuItems to be stored at each
+    index.
+
+    @return: None
+    """
+    for index, menu_item in edited:
+        index = _find_index(order_store, index, menu_item)
+        order_store.replace_item(index, menu_item.clone())
+
+
+#====================================================================================
+# This block represents the history of the commands performed on an order.
+#====================================================================================
+class OrderHistory(object):
+    """Keeps the commands performed on an
+    order so that they may be undone and
+    redone. Recording a new command discards
+    the commands that were undone.
+
+    @var _undo: list of OrderCommand objects that
+    may be undone, the most recent last.
+
+    @var _redo: list of OrderCommand objects that
+    may be redone, the most recently undone last.
+    """
+
+    def __init__(self):
+        """Initializes the OrderHistory."""
+        self._undo = []
+        self._redo = []
+
+    def record(self, command):
+        """Records the given command, that
+        has been applied to the order.
+
+        @param command: OrderCommand object.
+
+        @return: None
+        """
+        self._undo.append(command)
+        del self._redo[:]
+
+    def can_undo(self):
+        """Checks if there is a command
+        to be undone.
+
+        @return: bool
+        """
+        return len(self._undo) > 0
+
+    def can_redo(self):
+        """Checks if there is a command
+        to be redone.
+
+        @return: bool
+        """
+        return len(self._redo) > 0
+
+    def undo(self, order_store):
+        """Reverts the most recent command
+        on the given OrderStore.
+
+        @param order_store: OrderStore object
+        that the commands were applied to.
+
+        @return: OrderCommand object that was
+        undone, or None if there was none.
+        """
+        if self._undo:
+            command = self._undo.pop()
+            command.revert(order_store)
+            self._redo.append(command)
+            return command
+
+        return None
+
+    def redo(self, order_store):
+        """Applies the most recently undone
+        command to the given OrderStore.
+
+        @param order_store: OrderStore object
+        that the commands were applied to.
+
+        @return: OrderCommand object that was
+        redone, or None if there was none.
+        """
+        if self._redo:
+            command = self._redo.pop()
+            command.apply(order_store)
+            self._undo.append(command)
+            return command
+
+        return None
+
+    def clear(self):
+        """Discards every command. This is
+        done once the order has been confirmed
+        or checked out, which can't be undone
+        by reverting commands.
+
+        @return: None
+        """
+        del self._undo[:]
+        del self._redo[:]
+
+    def __len__(self):
+        """Gets the number of commands that
+        may be undone.
+
+        @return: int
+        """
+        return len(self._undo)
+
+    def __repr__(self):
+        """Gets a string representation of
+        the history.
+
+        @return: str
+        """
+        return 'OrderHistory({} undo, {} redo)'.format(len(self._undo),
+                                                      len(self._redo))
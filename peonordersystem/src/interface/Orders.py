@@ -25,9 +25,22 @@ where changes are made that would
 """
 from gi.repository import Gtk  # IGNORE:E0611 @UnresolvedImport
 from copy import copy
+from bisect import bisect_left
+from collections import Counter
 
 from peonordersystem.src.standardoperations import tree_view_changed
+from peonordersystem.src.interface.RefreshScheduler import DirtyRows
+from peonordersystem.src.interface.OrderHistory import (OrderHistory,
+                                                        ChangeItemsCommand,
+                                                        ReplaceItemsCommand,
+                                                        ADD_COMMAND,
+                                                        REMOVE_COMMAND,
+                                                        EDIT_COMMAND,
+                                                        UNCONFIRM_COMMAND,
+                                                        DO_STEP, UNDO_STEP,
+                                                        REDO_STEP, RESET_STEP)
 from peonordersystem.src.MenuItem import MenuItem
+from peonordersystem.src.OrderTotals import OrderTotals
 from peonordersystem.src import ErrorLogger
 from peonordersystem.src import CustomExceptions
 from peonordersystem.src.Settings import (STANDARD_TEXT, STANDARD_TEXT_BOLD,
@@ -35,7 +48,9 @@ from peonordersystem.src.Settings import (STANDARD_TEXT, STANDARD_TEXT_BOLD,
                                           MENU_ITEM_NON_CONFIRMED_COLOR_HEXADECIMAL,
                                           STANDARD_TABLE_NAME,
                                           NUM_OF_TABLES_TO_DISPLAY,
-                                          TOGO_SEPARATOR)
+                                          TOGO_SEPARATOR,
+                                          ORDER_TYPE_STANDARD,
+                                          ORDER_TYPE_TOGO)
 
 
 class OrderTreeView(Gtk.TreeView):
@@ -144,10 +159,10 @@ class OrderStore(Gtk.TreeStore):
     as well as additional menu item and order
     information.
     
-    @attention: Append is the only valid method
-    for adding items to the OrderStore. All other
-    methods (swap, insert, prepend, ..etc) are not
-    supported.
+    @attention: Append and insert_item are the only
+    valid methods for adding items to the OrderStore.
+    All other methods (swap, insert, prepend, ..etc)
+    are not supported.
     
     @group Orders_Components: a member of the
     Orders_Components group. This class is used
@@ -155,11 +170,27 @@ class OrderStore(Gtk.TreeStore):
     
     @var order_list: list of MenuItem objects that
     is the current orders selected menu items.
+
+    @var _dirty_rows: DirtyRows object that writes the
+    updated values of the top level rows once per
+    refresh.
+
+    @var totals: OrderTotals object that maintains the
+    totals of the order_list as MenuItems are added,
+    removed and updated.
+
+    @var history: OrderHistory object that keeps the
+    commands performed on the order so that they may
+    be undone and redone.
     """
     
-    def __init__(self):
+    def __init__(self, order_type=ORDER_TYPE_STANDARD):
         """Initalizes the OrderStore object. Generates
         a new OrderStore that stores a 3 str types.
+
+        @keyword order_type: str representing the type
+        of the order, which its tax rates depend on.
+        Default is ORDER_TYPE_STANDARD.
         """
         # Complicated list store. Stores information to be displayed.
         #
@@ -172,6 +203,9 @@ class OrderStore(Gtk.TreeStore):
         
         super(OrderStore, self).__init__(str, str, str, str, bool, int)
         self.order_list = []
+        self.totals = OrderTotals(order_type=order_type)
+        self.history = OrderHistory()
+        self._dirty_rows = DirtyRows(self)
     
     def clear(self):
         """Clears the current order from the 
@@ -180,9 +214,12 @@ class OrderStore(Gtk.TreeStore):
         @return: list of MenuItems that represents
         the order cleared.
         """
+        self._dirty_rows.clear()
         super(OrderStore, self).clear()
         order_list = self.order_list
         self.order_list = []
+        self.totals.reset()
+        self.history.clear()
         return order_list
     
     def append(self, menu_item):
@@ -200,12 +237,68 @@ class OrderStore(Gtk.TreeStore):
         item.
         """
         if _check_if_menu_item(menu_item):
-            
             self.order_list.append(menu_item)
-            new_entry = []
+            self.totals.add(menu_item)
+            new_entry = self._generate_row(menu_item)
 
-            name = menu_item.get_name()
-            stars = ''
+            return super(OrderStore, self).append(None, new_entry)
+
+    def insert_item(self, position, menu_item):
+        """Inserts the given menu_item into the
+        OrderStore at the given position and displays
+        its notes and options. This is used when a
+        removed MenuItem is restored.
+
+        @param position: int representing the index
+        that the menu_item will be stored at.
+
+        @param menu_item: MenuItem object that is to
+        be inserted.
+
+        @return: Gtk.TreeIter pointing to the inserted
+        item.
+        """
+        tree_iter = self._insert(position, menu_item)
+        return self.update_item(tree_iter)
+
+    def _insert(self, position, menu_item):
+        """Private Method.
+
+        Inserts the given menu_item into the
+        OrderStore at the given position. Only
+        the top level row is generated.
+
+        @param position: int representing the index
+        that the menu_item will be stored at.
+
+        @param menu_item: MenuItem object that is to
+        be inserted.
+
+        @return: Gtk.TreeIter pointing to the inserted
+        item.
+        """
+        if _check_if_menu_item(menu_item):
+            self.order_list.insert(position, menu_item)
+            self.totals.add(menu_item)
+            new_entry = self._generate_row(menu_item)
+
+            return super(OrderStore, self).insert(None, position, new_entry)
+
+    def _generate_row(self, menu_item):
+        """Private Method.
+
+        Generates the top level row values that
+        represent the given menu_item.
+
+        @param menu_item: MenuItem object that is
+        to be displayed.
+
+        @return: list representing the row values.
+        """
+        new_entry = []
+
+        name = menu_item.get_name()
+        stars = ''
         
         if menu_item.is_editable():
             stars = str(menu_item.stars)
@@ -232,8 +325,8 @@ class OrderStore(Gtk.TreeStore):
         # the menu item. This weight is a reference to if it was
         # given priority status from the user.
         new_entry.append(self._get_weight(False))
-        
-        return super(OrderStore, self).append(None, new_entry)
+
+        return new_entry
     
     def _get_color(self, is_confirmed):
         """Private Method.
@@ -339,8 +432,12 @@ class OrderStore(Gtk.TreeStore):
         index = self.get_index(tree_iter)
 
         if index is not None:
+            self._dirty_rows.discard(tree_iter)
             super(OrderStore, self).remove(tree_iter)
-            return self.order_list.pop(index)
+
+            menu_item = self.order_list.pop(index)
+            self.totals.remove(menu_item)
+            return menu_item
 
         return None
 
@@ -358,38 +455,45 @@ class OrderStore(Gtk.TreeStore):
         the updated MenuItem has priority. Default is
         False
         
+        @note: The top level row is written on the
+        next refresh, or when flush is called.
+
         @return: Gtk.TreeIter pointing to the updated
         MenuItem
         """
         tree_iter = self._ensure_top_level_iter(tree_iter)
         
         menu_item = self.get_menu_item(tree_iter)
+        self.totals.update(menu_item)
 
         if has_priority:
             is_priority = self._get_weight(has_priority)
         else:
-            is_priority = self[tree_iter][5]
-        
-        # remove pre-update information
-        while self.iter_has_child(tree_iter):
-            itr = self.iter_children(tree_iter)
-            super(OrderStore, self).remove(itr)
+            is_priority = self._dirty_rows.get_value(tree_iter, 5)
         
         text_color = self._get_color(menu_item.confirmed)
         is_comped = menu_item.is_comped()
         
-        # add post-update information
-        if menu_item.has_note() and not is_comped:
-            data = menu_item.notes, '', None, text_color, False, is_priority
+        children = []
 
-            super(OrderStore, self).append(tree_iter, data)
+        if menu_item.has_note() and not is_comped:
+            children.append((menu_item.notes, '', None, text_color, False,
+                             is_priority))
 
         for option in menu_item.options:
 
             name = option.get_option_relation() + ": " + option.get_name()
+            children.append((name, '', None, text_color, False, is_priority))
+
+        # children are only replaced if the information changed
+        if children != self._get_children_rows(tree_iter):
 
-            data = (name, '', None, text_color, False, is_priority)
-            super(OrderStore, self).append(tree_iter, data)
+            while self.iter_has_child(tree_iter):
+                itr = self.iter_children(tree_iter)
+                super(OrderStore, self).remove(itr)
+
+            for data in children:
+                super(OrderStore, self).append(tree_iter, data)
 
         name = menu_item.get_name()
         stars = str(menu_item.stars)
@@ -403,13 +507,59 @@ class OrderStore(Gtk.TreeStore):
         elif not menu_item.is_locked() and menu_item.confirmed:
             stars = ''
 
-        self[tree_iter][0] = name
-        self[tree_iter][1] = stars
-        self[tree_iter][3] = text_color
-        self[tree_iter][4] = has_note
-        self[tree_iter][5] = is_priority
+        self._dirty_rows.mark(tree_iter, [0, 1, 3, 4, 5],
+                              [name, stars, text_color, has_note, is_priority])
         
         return tree_iter
+
+    def _get_children_rows(self, tree_iter):
+        """Private Method.
+
+        Gets the values of the rows displayed
+        as children of the given row.
+
+        @param tree_iter: Gtk.TreeIter pointing to
+        a top level row.
+
+        @return: list of tuple representing the
+        values of each child row.
+        """
+        children = []
+        itr = self.iter_children(tree_iter)
+
+        while itr:
+            children.append(tuple(self[itr]))
+            itr = self.iter_next(itr)
+
+        return children
+
+    def flush(self):
+        """Writes any updated values that are
+        waiting for the next refresh now.
+
+        @return: None
+        """
+        self._dirty_rows.flush()
+
+    def update_items(self, rows):
+        """Updates each of the given rows so that
+        they accurately display any changed information.
+
+        @note: This is akin to performing update_item
+        on each of the given rows. Callers displaying
+        this OrderStore should detach it from its view
+        while this method runs so that the view is only
+        redrawn once.
+
+        @param rows: iterable of 2-tuples of
+        (Gtk.TreeIter, bool) representing the row to
+        be updated and if the MenuItem at that row has
+        priority.
+
+        @return: None
+        """
+        for tree_iter, has_priority in rows:
+            self.update_item(tree_iter, has_priority=has_priority)
         
     def confirm_order(self, tree_iter, priority_order):
         """Sets all MenuItem's in the order to confirmed,
@@ -420,23 +570,40 @@ class OrderStore(Gtk.TreeStore):
 
         @param priority_order: list of MenuItem objects
         that represents the priority orders associated with
-        the confirmed order.
+        the confirmed order. Each MenuItem that is matched
+        is removed from the list, so that it only gives
+        priority to a single MenuItem of the order.
         """
-        if tree_iter:
+        priority_counts = Counter(priority_order)
+        updated_rows = []
+
+        while tree_iter:
             menu_item = self.get_menu_item(tree_iter)
             if not menu_item.confirmed and not menu_item.is_locked():
                 menu_item.confirmed = True
                 menu_item.editable = False
                 menu_item.toggle_lock_menu_item()
 
-                if menu_item in priority_order:
-                    has_priority = True
-                    priority_order.remove(menu_item)
-                else:
-                    has_priority = False
+                has_priority = priority_counts[menu_item] > 0
+
+                if has_priority:
+                    priority_counts[menu_item] -= 1
+
+                updated_rows.append((tree_iter, has_priority))
 
-                self.update_item(tree_iter, has_priority=has_priority)
-            self.confirm_order(self.iter_next(tree_iter), priority_order)
+            tree_iter = self.iter_next(tree_iter)
+
+        # the unmatched MenuItems are left in the list, in their order
+        remaining = []
+
+        for menu_item in reversed(priority_order):
+            if priority_counts[menu_item] > 0:
+                priority_counts[menu_item] -= 1
+                remaining.append(menu_item)
+
+        priority_order[:] = reversed(remaining)
+
+        self.update_items(updated_rows)
 
     def unconfirm_order(self):
         """unconfirms the order"""
@@ -458,36 +625,93 @@ class OrderStore(Gtk.TreeStore):
         objects that is to be the new updated
         order to display.
 
-        @return: None
+        @return: 2 tuple of (list, list) representing
+        the removed and inserted MenuItems. Each is a
+        list of 2 tuple of (int, MenuItem) representing
+        the index of the MenuItem, in the previous order
+        if removed and the updated order if inserted.
         """
-        update_index = 0
-        display_index = 0
+        removed, inserted, kept = _diff_order(self.order_list, updated_order)
+        priority_weight = self._get_weight(True)
 
-        while update_index < len(updated_order):
-            updated_item = updated_order[update_index]
+        row_iters = [row.iter for row in self]
+        updated_rows = []
 
-            if display_index < len(self.order_list):
-                displayed_item = self.order_list[display_index]
+        for display_index, update_index in kept:
+            tree_iter = row_iters[display_index]
+            weight = self._dirty_rows.get_value(tree_iter, 5)
+            updated_rows.append((tree_iter, weight == priority_weight))
 
-                row = self[display_index]
-                is_priority = row[5] is self._get_weight(True)
+        removed_items = [(index, self.order_list[index]) for index in removed]
+        inserted_items = [(index, updated_order[index]) for index in inserted]
 
-                if updated_item == displayed_item:
-                    self.order_list[display_index] = updated_item
-                    self.update_item(row.iter, has_priority=is_priority)
-                    display_index += 1
-                    update_index += 1
-                else:
-                    self.remove(row.iter)
+        for display_index in reversed(removed):
+            self._dirty_rows.discard(row_iters[display_index])
+            super(OrderStore, self).remove(row_iters[display_index])
+            self.totals.remove(self.order_list.pop(display_index))
 
-            else:
-                itr = self.append(updated_item)
-                self.update_item(itr)
-                update_index += 1
-                display_index += 1
+        for update_index in inserted:
+            tree_iter = self._insert(update_index, updated_order[update_index])
+            updated_rows.append((tree_iter, False))
+
+        self.order_list[:] = updated_order
+        self.update_items(updated_rows)
+
+        return removed_items, inserted_items
 
-        while display_index < len(self.order_list):
-                self.remove(self[display_index].iter)
+    def replace_items(self, menu_items):
+        """Replaces the MenuItems of the order
+        that share an item id with the given
+        MenuItems, such as the edited clones of
+        an OrderSnapshot. Only the rows of the
+        replaced MenuItems are updated.
+
+        @param menu_items: list of MenuItem objects
+        that are to replace the MenuItems with the
+        same item id. MenuItems that aren't in the
+        order are ignored.
+
+        @return: list of 2 tuple of (int, MenuItem)
+        representing the index and the MenuItem that
+        was replaced, for each replaced MenuItem.
+        """
+        indices = dict((menu_item.get_item_id(), index) for
+                       index, menu_item in enumerate(self.order_list))
+        priority_weight = self._get_weight(True)
+        updated_rows = []
+        replaced = []
+
+        for menu_item in menu_items:
+            index = indices.get(menu_item.get_item_id())
+
+            if index is not None:
+                replaced.append((index, self.order_list[index]))
+                self.order_list[index] = menu_item
+                tree_iter = self.get_iter((index,))
+                weight = self._dirty_rows.get_value(tree_iter, 5)
+                updated_rows.append((tree_iter, weight == priority_weight))
+
+        self.update_items(updated_rows)
+        return replaced
+
+    def replace_item(self, index, menu_item):
+        """Replaces the MenuItem at the given
+        index with the given MenuItem and updates
+        its row.
+
+        @param index: int representing the index of
+        the MenuItem to be replaced.
+
+        @param menu_item: MenuItem object that is to
+        be stored at the index.
+
+        @return: MenuItem object that was replaced.
+        """
+        if _check_if_menu_item(menu_item):
+            replaced = self.order_list[index]
+            self.order_list[index] = menu_item
+            self.update_item(self.get_iter((index,)))
+            return replaced
 
     def update_order(self):
         """Updates each entry of the
@@ -501,12 +725,11 @@ class OrderStore(Gtk.TreeStore):
 
         @return: None
         """
-        itr = self.get_iter_first()
-
-        while itr:
-            priority = self[itr][5] is self._get_weight(True)
-            self.update_item(itr, has_priority=priority)
-            itr = self.iter_next(itr)
+        priority_weight = self._get_weight(True)
+        get_value = self._dirty_rows.get_value
+        rows = [(row.iter, get_value(row.iter, 5) == priority_weight)
+                for row in self]
+        self.update_items(rows)
 
     def _dump(self):
         """Gives a 2-tuple of the associated MenuItems and
@@ -520,6 +743,7 @@ class OrderStore(Gtk.TreeStore):
         a list of tuples that represent the associated
         rows.
         """
+        self.flush()
         dump_menu_items = self.order_list
 
         dump_row_info = []
@@ -565,9 +789,22 @@ class Orders(object):
     placed. Keys are 2-tupes represented by name and phone
     number. Values are OrderStores that represent that
     order.
+
+    @var _order_keys: dict of OrderStore keys mapped to the
+    key that the OrderStore is stored under in either the
+    orders_dict or to_go_dict. This is the reverse index of
+    both dicts.
+
+    @var _active_orders: set of keys whose associated
+    OrderStore currently has at least one MenuItem.
+
+    @var _journal: object that records each step taken
+    on the history of an order, such as an OrderJournal,
+    or None if the steps aren't recorded.
     """
     
-    def __init__(self, load_data=None, num_of_tables=NUM_OF_TABLES_TO_DISPLAY):
+    def __init__(self, load_data=None, num_of_tables=NUM_OF_TABLES_TO_DISPLAY,
+                 journal=None):
         """Initializes and creates the Orders object.
         
         @keyword load_data: represents the data that the
@@ -578,17 +815,25 @@ class Orders(object):
         
         @keyword num_of_tables: represents the number
         of tables for orders to be generated for.
+
+        @keyword journal: object with a record method
+        that each step taken on the history of an order
+        is passed to, such as an OrderJournal. Default
+        is None, where the steps aren't recorded.
         """
         self.tree_view = OrderTreeView()
-        
+        self._journal = journal
+
+        self._order_keys = {}
+        self._active_orders = set()
+
         self.orders_dict = {}
+        self.to_go_dict = {}
+
         for num in range(num_of_tables):
-            value = OrderStore()
             key = STANDARD_TABLE_NAME + ' ' + str(num)
-            
-            self.orders_dict[key] = value
+            self._add_order_store(self.orders_dict, key, OrderStore())
 
-        self.to_go_dict = {}
         self.current_order = None
         
         if load_data:
@@ -652,17 +897,147 @@ class Orders(object):
         """
         if is_table:
             order_dict = self.orders_dict
-            key = key
+            order_type = ORDER_TYPE_STANDARD
         else:
             order_dict = self.to_go_dict
+            order_type = ORDER_TYPE_TOGO
 
-        order_dict[key] = OrderStore()
-        order = order_dict[key]
+        order = self._add_order_store(order_dict, key, OrderStore(order_type))
 
         for menu_item in order_info:
             itr = order.append(menu_item)
             order.update_item(itr)
 
+        self._update_active_order(order)
+
+    def _add_order_store(self, order_dict, key, order):
+        """Private Method.
+
+        Stores the given OrderStore under the given
+        key in the given order dict and indexes it. If
+        an OrderStore was previously stored under the key
+        it is removed from the index.
+
+        @param order_dict: dict that the OrderStore will
+        be stored in. Expected orders_dict or to_go_dict.
+
+        @param key: str or tuple that represents the key
+        the OrderStore will be stored under.
+
+        @param order: OrderStore object that is to be
+        stored.
+
+        @return: OrderStore that was stored.
+        """
+        if key in order_dict:
+            self._remove_order_store(order_dict, key)
+
+        order_dict[key] = order
+        self._order_keys[order] = key
+        return order
+
+    def _remove_order_store(self, order_dict, key):
+        """Private Method.
+
+        Removes the OrderStore stored under the given
+        key from the given order dict and the index.
+
+        @param order_dict: dict that the OrderStore is
+        stored in.
+
+        @param key: str or tuple that represents the key
+        the OrderStore is stored under.
+
+        @return: OrderStore that was removed.
+        """
+        order = order_dict.pop(key)
+        del self._order_keys[order]
+        self._active_orders.discard(key)
+        return order
+
+    def _update_active_order(self, order):
+        """Private Method.
+
+        Updates the set of active orders to reflect
+        if the given OrderStore currently has any
+        MenuItems stored in it.
+
+        @param order: OrderStore object that has been
+        modified.
+
+        @return: None
+        """
+        key = self._order_keys.get(order)
+
+        if key is not None:
+            if len(order.order_list):
+                self._active_orders.add(key)
+            else:
+                self._active_orders.discard(key)
+
+    def _get_order_name(self, order, togo_separator=TOGO_SEPARATOR):
+        """Private Method.
+
+        Gets the name of the given OrderStore,
+        as given by get_order_info.
+
+        @param order: OrderStore object.
+
+        @return: str representing the name of the
+        order.
+        """
+        key = self._order_keys[order]
+
+        if key in self.to_go_dict:
+            key = key[0] + togo_separator + key[1]
+
+        return key
+
+    def _record(self, order, command, step=DO_STEP):
+        """Private Method.
+
+        Records the given command, which has
+        been applied to the given OrderStore, in
+        its history and the journal.
+
+        @param order: OrderStore object the command
+        was applied to.
+
+        @param command: OrderCommand object.
+
+        @keyword step: str representing the step taken.
+        Default is DO_STEP, RESET_STEP clears the history
+        instead.
+
+        @return: None
+        """
+        if step == RESET_STEP:
+            order.history.clear()
+        else:
+            order.history.record(command)
+
+        self._journal_step(order, step, command)
+
+    def _journal_step(self, order, step, command=None):
+        """Private Method.
+
+        Records the given step taken on the
+        history of the given OrderStore in the
+        journal, if there is one.
+
+        @param order: OrderStore object.
+
+        @param step: str representing the step taken.
+
+        @keyword command: OrderCommand object of the
+        step, or None for undo and redo steps.
+
+        @return: None
+        """
+        if self._journal is not None and order in self._order_keys:
+            self._journal.record(self._get_order_name(order),
+                                 self._order_keys[order], step, command)
+
     def _get_selected_iter(self):
         """Private Method.
 
@@ -709,8 +1084,8 @@ class Orders(object):
         if key in self.to_go_dict:
             self.current_order = self.to_go_dict[key]
         else:
-            self.current_order = OrderStore()
-            self.to_go_dict[key] = self.current_order
+            self.current_order = self._add_order_store(self.to_go_dict, key,
+                                                       OrderStore(ORDER_TYPE_TOGO))
         self._set_model()
 
     def _set_model(self):
@@ -721,6 +1096,28 @@ class Orders(object):
         self.tree_view.set_model(self.current_order)
         self.tree_view.show_all()
 
+    def _freeze_view(self):
+        """Private Method.
+
+        Detaches the current order from the tree
+        view so that bulk updates to the OrderStore
+        are not redrawn row by row. Must be followed
+        by a call to _thaw_view.
+        """
+        self.tree_view.set_model(None)
+
+    def _thaw_view(self):
+        """Private Method.
+
+        Reattaches the current order to the tree
+        view after a call to _freeze_view. Any
+        updated rows are written before the order
+        is reattached.
+        """
+        if self.current_order is not None:
+            self.current_order.flush()
+        self._set_model()
+
     def set_current_table(self, table):
         """Sets the current table and order considered
         to the given value.
@@ -729,8 +1126,8 @@ class Orders(object):
         table
         """
         if table not in self.orders_dict:
-            self.orders_dict[table] = OrderStore()
-            
+            self._add_order_store(self.orders_dict, table, OrderStore())
+
         self.current_order = self.orders_dict[table]
         self._set_model()
     
@@ -745,6 +1142,26 @@ class Orders(object):
             order_list = self.current_order.order_list
             return copy(order_list)
     
+    def get_current_totals(self):
+        """Gets the totals of the current order.
+
+        @return: OrderTotals object that maintains
+        the totals of the current order. None if no
+        order has been selected.
+        """
+        if _check_order(self.current_order):
+            return self.current_order.totals
+
+    def get_current_order_type(self):
+        """Gets the type of the current order.
+
+        @return: str representing the order type,
+        which its tax rates depend on. None if no
+        order has been selected.
+        """
+        if _check_order(self.current_order):
+            return self.current_order.totals.order_type
+
     def get_selected(self):
         """Gets the selected MenuItem.
         
@@ -765,7 +1182,13 @@ class Orders(object):
         if _check_order(self.current_order) and \
                 _check_valid_menu_item(menu_item):
 
+            index = len(self.current_order.order_list)
             itr = self.current_order.append(menu_item)
+            self._record(self.current_order,
+                         ChangeItemsCommand(ADD_COMMAND,
+                                            inserted=[(index, menu_item)]))
+
+            self._update_active_order(self.current_order)
             self.tree_view.select_iter(itr)
     
     def remove(self):
@@ -779,7 +1202,14 @@ class Orders(object):
             itr = self._get_selected_iter()
             menu_item = self.get_selected()
             if _check_valid_menu_item(menu_item):
-                return self.current_order.remove(itr)
+                index = self.current_order.get_index(itr)
+                menu_item = self.current_order.remove(itr)
+                self._record(self.current_order,
+                             ChangeItemsCommand(REMOVE_COMMAND,
+                                                removed=[(index, menu_item)]))
+
+                self._update_active_order(self.current_order)
+                return menu_item
     
     def update_item(self):
         """Updates the currently selected MenuItem
@@ -788,6 +1218,30 @@ class Orders(object):
         if _check_order(self.current_order):
             itr = self._get_selected_iter()
             self.current_order.update_item(itr)
+
+    def update_edited_item(self, kind, original):
+        """Updates the currently selected MenuItem,
+        which has been edited, and records the edit
+        so that it may be undone.
+
+        @param kind: str representing the kind of
+        edit, such as NOTE_COMMAND.
+
+        @param original: MenuItem object that is a
+        clone of the selected MenuItem before it was
+        edited.
+
+        @return: None
+        """
+        if _check_order(self.current_order):
+            itr = self._get_selected_iter()
+            index = self.current_order.get_index(itr)
+            menu_item = self.current_order.get_menu_item(itr)
+
+            self.current_order.update_item(itr)
+            self._record(self.current_order,
+                         ReplaceItemsCommand(kind, [(index, original)],
+                                             [(index, menu_item)]))
     
     def get_order_info(self, togo_separator=TOGO_SEPARATOR):
         """Gets the label associated with the
@@ -823,13 +1277,31 @@ class Orders(object):
                 raise RuntimeError(message)
 
             tree_iter = self.current_order.get_iter_first()
-            self.current_order.confirm_order(tree_iter, priority_order[:])
+
+            self._freeze_view()
+            try:
+                self.current_order.confirm_order(tree_iter, priority_order[:])
+            finally:
+                self._thaw_view()
+
+            # the ticket has been sent, so the edits before it can't be undone
+            self.current_order.history.clear()
 
     def unconfirm_order(self):
         """unconfirms the currently
         selected order
         """
-        self.current_order.unconfirm_order()
+        order = self.current_order
+
+        self._freeze_view()
+        try:
+            order.unconfirm_order()
+        finally:
+            self._thaw_view()
+
+        command = ReplaceItemsCommand(UNCONFIRM_COMMAND, (),
+                                      enumerate(order.order_list))
+        self._record(order, command, step=RESET_STEP)
 
     def update_order(self):
         """Updates every item in the
@@ -837,9 +1309,41 @@ class Orders(object):
 
         @return: None
         """
-        self.current_order.update_order()
+        self._freeze_view()
+        try:
+            self.current_order.update_order()
+        finally:
+            self._thaw_view()
+
+    def replace_items(self, menu_items, kind=EDIT_COMMAND):
+        """Replaces the MenuItems of the currently
+        selected order that share an item id with
+        the given MenuItems.
+
+        @param menu_items: list of MenuItem objects
+        that are to replace the MenuItems with the
+        same item id.
+
+        @keyword kind: str representing the kind of
+        edit, which is recorded so that it may be
+        undone. Default is EDIT_COMMAND.
+
+        @return: None
+        """
+        if _check_order(self.current_order):
+            order = self.current_order
+
+            self._freeze_view()
+            try:
+                replaced = order.replace_items(menu_items)
+            finally:
+                self._thaw_view()
 
-    def edit_order(self, edited_order):
+            if replaced:
+                edited = [(index, order.order_list[index]) for index, _ in replaced]
+                self._record(order, ReplaceItemsCommand(kind, replaced, edited))
+
+    def edit_order(self, edited_order, kind=EDIT_COMMAND):
         """Edits the order so that the given
         edited order is displayed in lieu of
         the currently stored order.
@@ -854,10 +1358,160 @@ class Orders(object):
         be updated. This order will replace the
         currently stored order.
 
+        @keyword kind: str representing the kind of
+        edit, which is recorded so that the removed
+        and inserted MenuItems may be undone. Default
+        is EDIT_COMMAND.
+
         @return: None
         """
         order = self.current_order
-        order.edit_order(edited_order)
+
+        self._freeze_view()
+        try:
+            removed, inserted = order.edit_order(edited_order)
+        finally:
+            self._thaw_view()
+
+        if removed or inserted:
+            self._record(order, ChangeItemsCommand(kind, removed, inserted))
+
+        self._update_active_order(order)
+
+    def can_undo(self):
+        """Checks if the current order has
+        an edit that may be undone.
+
+        @return: bool
+        """
+        return (self.current_order is not None and
+                self.current_order.history.can_undo())
+
+    def can_redo(self):
+        """Checks if the current order has
+        an undone edit that may be redone.
+
+        @return: bool
+        """
+        return (self.current_order is not None and
+                self.current_order.history.can_redo())
+
+    def undo(self):
+        """Undoes the most recent edit of the
+        current order.
+
+        @return: OrderCommand object that was
+        undone, or None if there was none.
+        """
+        if _check_order(self.current_order):
+            return self._take_step(self.current_order, UNDO_STEP)
+
+    def redo(self):
+        """Redoes the most recently undone
+        edit of the current order.
+
+        @return: OrderCommand object that was
+        redone, or None if there was none.
+        """
+        if _check_order(self.current_order):
+            return self._take_step(self.current_order, REDO_STEP)
+
+    def _take_step(self, order, step):
+        """Private Method.
+
+        Undoes or redoes a command on the given
+        OrderStore and records the step in the
+        journal.
+
+        @param order: OrderStore object.
+
+        @param step: str representing the step,
+        either UNDO_STEP or REDO_STEP.
+
+        @return: OrderCommand object that was
+        undone or redone, or None if there was none.
+        """
+        if step == UNDO_STEP:
+            take_step = order.history.undo
+        else:
+            take_step = order.history.redo
+
+        self._freeze_view()
+        try:
+            command = take_step(order)
+        finally:
+            self._thaw_view()
+
+        if command is not None:
+            self._journal_step(order, step)
+            self._update_active_order(order)
+
+        return command
+
+    def replay_journal(self, records):
+        """Replays the given steps recorded in the
+        journal since each order was last saved, so
+        that edits that weren't saved are recovered.
+        The steps aren't recorded in the journal again.
+
+        If the steps of an order can't be replayed the
+        error is logged, the order is returned to how it
+        was saved and its steps are dropped from the
+        journal. The other orders are still replayed.
+
+        @param records: iterable of 3 tuple of
+        (str, str or tuple, list) representing the
+        order name, the key of the order and a list of
+        2 tuple of (str, OrderCommand) representing each
+        step and its command, or None for undo and redo
+        steps.
+
+        @return: None
+        """
+        for order_name, order_key, steps in records:
+            order = self._get_journal_order(order_name, order_key)
+            saved_order = list(order.order_list)
+
+            try:
+                _replay_steps(order, steps)
+
+            except Exception as e:
+                ErrorLogger.logger.exception('dropped the journal steps of order '
+                                             '%s, they could not be replayed: %s',
+                                             order_name, e)
+                order.edit_order(saved_order)
+                order.history.clear()
+
+                if self._journal is not None:
+                    self._journal.checkpoint(order_name)
+
+            order.flush()
+            self._update_active_order(order)
+
+    def _get_journal_order(self, order_name, order_key):
+        """Private Method.
+
+        Gets the OrderStore with the given name,
+        which is created if it doesn't exist.
+
+        @param order_name: str representing the
+        name of the order.
+
+        @param order_key: str representing the table
+        or tuple representing the togo order, that the
+        OrderStore is created under.
+
+        @return: OrderStore object.
+        """
+        for order in self._order_keys:
+            if self._get_order_name(order) == order_name:
+                return order
+
+        if isinstance(order_key, tuple):
+            return self._add_order_store(self.to_go_dict, order_key,
+                                         OrderStore(ORDER_TYPE_TOGO))
+
+        return self._add_order_store(self.orders_dict, order_key, OrderStore())
 
     def clear_order(self):
         """Clears the current order.
@@ -868,8 +1522,10 @@ class Orders(object):
         if _check_order(self.current_order):
             found_key, order_list = self._get_order_key()
             if found_key in self.to_go_dict:
-                del self.to_go_dict[found_key]
+                self._remove_order_store(self.to_go_dict, found_key)
+            # clearing the order also clears its history
             self.current_order.clear()
+            self._update_active_order(self.current_order)
             self.current_order = None
             self._set_model()
     
@@ -881,14 +1537,10 @@ class Orders(object):
         or 3-tuple that is the key, the second index is
         the order_list that contains that key.
         """
-        for order_list in (self.orders_dict, self.to_go_dict):
-            
-            itr = order_list.iteritems()
-            
-            for key, value in itr:
-                if value is self.current_order:
-                    return key, self.get_current_order()
-        
+        if self.current_order in self._order_keys:
+            key = self._order_keys[self.current_order]
+            return key, self.get_current_order()
+
         return None
 
     def _dump(self):
@@ -918,9 +1570,8 @@ class Orders(object):
         @return: generator that yields
         available order names
         """
-        for name, model in self.orders_dict.items() + self.to_go_dict.items():
-            if len(model):
-                yield name
+        for name in list(self._active_orders):
+            yield name
     
     def __repr__(self):
         """Gets a string representation of the
@@ -932,6 +1583,114 @@ class Orders(object):
         return str(self.__dict__)
 
 
+def _replay_steps(order, steps):
+    """Private Function.
+
+    Replays the given steps recorded in the
+    journal on the given OrderStore.
+
+    @param order: OrderStore object.
+
+    @param steps: list of 2 tuple of (str, OrderCommand)
+    representing each step and its command, or None
+    for undo and redo steps.
+
+    @raise ValueError: If the order doesn't match
+    the steps, such as when a MenuItem that a step
+    edits isn't in the order.
+
+    @return: None
+    """
+    for step, command in steps:
+        if step == UNDO_STEP:
+            order.history.undo(order)
+
+        elif step == REDO_STEP:
+            order.history.redo(order)
+
+        else:
+            command.apply(order)
+
+            if step == RESET_STEP:
+                order.history.clear()
+            else:
+                order.history.record(command)
+
+
+def _diff_order(displayed_order, updated_order):
+    """Computes the minimal set of changes that
+    transforms the displayed order into the
+    updated order.
+
+    MenuItems are matched by their item id. Since each
+    MenuItem appears at most once in an order the
+    longest common subsequence of the two orders is
+    the longest increasing run of displayed indices
+    taken in updated order, which is found in
+    O(n log n).
+
+    @param displayed_order: list of MenuItem objects
+    that represents the currently displayed order.
+
+    @param updated_order: list of MenuItem objects
+    that represents the order to be displayed.
+
+    @return: 3-tuple of (list, list, list). The first
+    is the ascending indices of displayed_order to be
+    removed, the second is the ascending indices of
+    updated_order to be inserted, and the third is a
+    list of (display index, update index) pairs of
+    MenuItems that are kept.
+    """
+    display_indices = dict((menu_item.get_item_id(), index)
+                           for index, menu_item in enumerate(displayed_order))
+
+    # (display index, update index) for every item present in both
+    candidates = []
+    for update_index, menu_item in enumerate(updated_order):
+        display_index = display_indices.get(menu_item.get_item_id())
+
+        if display_index is not None:
+            candidates.append((display_index, update_index))
+
+    # patience sorting for the longest increasing subsequence
+    tails = []
+    tail_positions = []
+    previous = [None] * len(candidates)
+
+    for position, (display_index, _) in enumerate(candidates):
+        tail_index = bisect_left(tails, display_index)
+
+        if tail_index > 0:
+            previous[position] = tail_positions[tail_index - 1]
+
+        if tail_index == len(tails):
+            tails.append(display_index)
+            tail_positions.append(position)
+        else:
+            tails[tail_index] = display_index
+            tail_positions[tail_index] = position
+
+    kept = []
+    position = tail_positions[-1] if tail_positions else None
+
+    while position is not None:
+        kept.append(candidates[position])
+        position = previous[position]
+
+    kept.reverse()
+
+    kept_display = set(display_index for display_index, _ in kept)
+    kept_update = set(update_index for _, update_index in kept)
+
+    removed = [index for index in range(len(displayed_order))
+               if index not in kept_display]
+    inserted = [index for index in range(len(updated_order))
+                if index not in kept_update]
+
+    return removed, inserted, kept
+
+
 def _check_if_menu_item(menu_item):
     """Checks if the given MenuItem is
     an instance or subclass of MenuItem.
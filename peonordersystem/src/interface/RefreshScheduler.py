@@ -0,0 +1,268 @@
+"""This module provides the RefreshScheduler and DirtyRows
+classes that are used to coalesce updates to the displayed
+widgets and models.
+
+Rather than writing to a widget or model on every mutation,
+updates are scheduled and performed together at most once per
+iteration of the main loop, before the display is redrawn.
+Updates scheduled under the same key replace each other so that
+only the latest is performed.
+
+@author: Carl McGraw
+@contact: cjmcgraw( at )u.washington.edu
+@version: 1.0
+"""
+from collections import OrderedDict
+from gi.repository import GObject  # IGNORE:E0611 @UnresolvedImport
+
+
+class RefreshScheduler(object):
+    """Coalesces refreshes of the display into
+    a single batch that is flushed when the main
+    loop is idle.
+    """
+
+    # Runs before GTK's redraw, so refreshes are displayed the same frame.
+    PRIORITY = GObject.PRIORITY_HIGH_IDLE
+
+    def __init__(self, priority=PRIORITY):
+        """Initializes the RefreshScheduler.
+
+        @keyword priority: int representing the
+        priority of the idle flush. Default is
+        PRIORITY.
+        """
+        self._priority = priority
+        self._pending = OrderedDict()
+        self._source_id = None
+
+    def schedule(self, key, func, *args):
+        """Schedules the given function to be called
+        on the next flush. If a function was already
+        scheduled under the given key it is replaced.
+
+        @param key: hashable object that identifies
+        the refresh.
+
+        @param func: function that is to be called.
+
+        @param args: arguments supplied to the function.
+
+        @return: None
+        """
+        self._pending[key] = func, args
+
+        if self._source_id is None:
+            self._source_id = GObject.idle_add(self._on_idle,
+                                               priority=self._priority)
+
+    def cancel(self, key):
+        """Cancels the refresh scheduled under
+        the given key.
+
+        @param key: hashable object that identifies
+        the refresh.
+
+        @return: bool value representing if a refresh
+        was scheduled under the key.
+        """
+        return self._pending.pop(key, None) is not None
+
+    def is_pending(self, key):
+        """Checks if a refresh is scheduled under
+        the given key.
+
+        @param key: hashable object that identifies
+        the refresh.
+
+        @return: bool
+        """
+        return key in self._pending
+
+    def flush(self):
+        """Performs all of the scheduled refreshes
+        now, in the order they were first scheduled.
+
+        @return: int representing the number of
+        refreshes performed.
+        """
+        if self._source_id is not None:
+            GObject.source_remove(self._source_id)
+            self._source_id = None
+
+        return self._run_pending()
+
+    def _run_pending(self):
+        """Private Method.
+
+        Performs the scheduled refreshes. Refreshes
+        scheduled while running are also performed.
+
+        @return: int representing the number of
+        refreshes performed.
+        """
+        num_of_refreshes = 0
+
+        while self._pending:
+            key, (func, args) = self._pending.popitem(last=False)
+            func(*args)
+            num_of_refreshes += 1
+
+        return num_of_refreshes
+
+    def _on_idle(self):
+        """Private Method.
+
+        Callback Method. Called when the main
+        loop is idle. Performs the scheduled
+        refreshes.
+
+        @return: bool value representing if the
+        callback should be called again. Always
+        False.
+        """
+        self._source_id = None
+        self._run_pending()
+        return False
+
+
+refresh_scheduler = RefreshScheduler()
+
+
+class DirtyRows(object):
+    """Tracks the values written to the rows of
+    a Gtk.ListStore or Gtk.TreeStore and writes
+    them in a single batch through the
+    RefreshScheduler. Each row is written at most
+    once per flush, and only if its values have
+    changed.
+
+    @attention: The model must remove rows through
+    discard before removing them from the model.
+    """
+
+    def __init__(self, model, scheduler=refresh_scheduler):
+        """Initializes the DirtyRows.
+
+        @param model: Gtk.ListStore or Gtk.TreeStore
+        whose rows are written.
+
+        @keyword scheduler: RefreshScheduler that the
+        writes are scheduled with. Default is the
+        shared refresh_scheduler.
+        """
+        self._model = model
+        self._scheduler = scheduler
+        self._rows = OrderedDict()
+
+    @staticmethod
+    def _get_key(tree_iter):
+        """Private Method.
+
+        Gets the key that identifies the row
+        pointed at by the given iter. The iters of
+        list and tree stores persist, so they point
+        at the same row until it is removed.
+
+        @param tree_iter: Gtk.TreeIter pointing at
+        the row.
+
+        @return: int
+        """
+        return tree_iter.user_data
+
+    def mark(self, tree_iter, columns, values):
+        """Marks the given row as dirty with the
+        given values.
+
+        @param tree_iter: Gtk.TreeIter pointing at
+        the row.
+
+        @param columns: list of int representing the
+        columns to be written.
+
+        @param values: list representing the values
+        to be written to the columns.
+
+        @return: None
+        """
+        key = self._get_key(tree_iter)
+
+        if key not in self._rows:
+            self._rows[key] = tree_iter.copy(), {}
+
+        self._rows[key][1].update(zip(columns, values))
+        self._scheduler.schedule(self, self.flush)
+
+    def get_value(self, tree_iter, column):
+        """Gets the value of the given column of
+        the given row, including any value that
+        hasn't been written yet.
+
+        @param tree_iter: Gtk.TreeIter pointing at
+        the row.
+
+        @param column: int representing the column.
+
+        @return: value of the column.
+        """
+        key = self._get_key(tree_iter)
+
+        if key in self._rows and column in self._rows[key][1]:
+            return self._rows[key][1][column]
+
+        return self._model.get_value(tree_iter, column)
+
+    def discard(self, tree_iter):
+        """Discards the values of the given row
+        that haven't been written yet.
+
+        @param tree_iter: Gtk.TreeIter pointing at
+        the row.
+
+        @return: None
+        """
+        self._rows.pop(self._get_key(tree_iter), None)
+
+    def clear(self):
+        """Discards all values that haven't
+        been written yet.
+
+        @return: None
+        """
+        self._rows.clear()
+        self._scheduler.cancel(self)
+
+    def flush(self):
+        """Writes the values of each dirty row
+        now. Columns that already hold their value
+        are skipped, so that a row-changed signal is
+        only emitted for rows that actually changed.
+
+        @return: int representing the number of rows
+        written.
+        """
+        rows = self._rows
+        self._rows = OrderedDict()
+        self._scheduler.cancel(self)
+
+        model = self._model
+        num_of_rows = 0
+
+        for tree_iter, values in rows.itervalues():
+            changed = [(column, value) for column, value in values.iteritems()
+                       if model.get_value(tree_iter, column) != value]
+
+            if changed:
+                columns, values = zip(*changed)
+                model.set(tree_iter, list(columns), list(values))
+                num_of_rows += 1
+
+        return num_of_rows
+
+    def __len__(self):
+        """Gets the number of dirty rows.
+
+        @return: int
+        """
+        return len(self._rows)
@@ -38,10 +38,15 @@ members:
 @version: 1.0
 """
 
+import heapq
+from uuid import uuid4
+from bisect import bisect_right
+from itertools import count
 from datetime import datetime
 from gi.repository import Gtk, GObject  # IGNORE:E0611 @UnresolvedImport
 
 from peonordersystem.src.standardoperations import tree_view_changed
+from peonordersystem.src.interface.RefreshScheduler import DirtyRows
 from peonordersystem.src.Settings import (RESERVATION_UPDATE_TIME_FRAME,
                                           RESERVATION_NOTIFICATION_TIME_MAX,
                                           RESERVATION_NOTIFICATION_TIME_MIN)
@@ -72,6 +77,10 @@ class Reserver(object):
     @var _curr_time: float representing the time that the order
     was placed. This value is utilized for determining an accurate
     percentage. As such it should not be altered.
+
+    @var _reservation_id: str representing the stable id of the
+    reservation. This is used to identify the reservation in the
+    database.
     """
     def __init__(self, name, number, arrival_time):
         """Initializes a new Reserver object.
@@ -98,6 +107,20 @@ class Reserver(object):
         self.name = name
         self.number = number
         self._arrival_time = arrival_time
+        self._reservation_id = uuid4().hex
+
+    def get_reservation_id(self):
+        """Gets the stable id of the reservation.
+
+        @note: Reserver objects that were stored
+        before ids were introduced are assigned
+        a new id on first access.
+
+        @return: str representing the id.
+        """
+        if not getattr(self, '_reservation_id', None):
+            self._reservation_id = uuid4().hex
+        return self._reservation_id
 
     def get_arrival_time(self):
         """Gets the current arrival time in
@@ -262,6 +285,27 @@ class ReservationStore(Gtk.ListStore):
     is representative of the information displayed. This
     list is sorted, and changes in it will have unintended
     consequences.
+
+    @var _arrival_times: list of datetime objects that
+    represents the arrival times of the Reserver objects
+    in the _reservation_list, in the same order. Used to
+    find insertion points.
+
+    @var _upcoming_reservations: list used as a min-heap
+    of (datetime, int, Reserver) tuples ordered by arrival
+    time, for the reservations that have not yet entered
+    the notification window.
+
+    @var _upcoming_ids: set of int representing the ids
+    of the Reserver objects in the _upcoming_reservations
+    heap.
+
+    @var _removed_reservations: set of int representing
+    the ids of Reserver objects that were removed while
+    still present in the _upcoming_reservations heap.
+
+    @var _dirty_rows: DirtyRows object that writes the
+    updated ETA of each row once per refresh.
     
     @var _timeout_id: GObject id that runs every 10 minutes
     to update the displayed ETA. 
@@ -273,7 +317,15 @@ class ReservationStore(Gtk.ListStore):
         """
         super(ReservationStore, self).__init__(str, str, str, float)
         self._reservation_list = []
+        self._arrival_times = []
         self._reservation_notifications = []
+
+        self._upcoming_reservations = []
+        self._upcoming_ids = set()
+        self._removed_reservations = set()
+        self._heap_counter = count()
+        self._dirty_rows = DirtyRows(self)
+
         self._timeout_id = GObject.timeout_add(RESERVATION_UPDATE_TIME_FRAME,
                                                self._on_timeout, None)
     
@@ -294,10 +346,16 @@ class ReservationStore(Gtk.ListStore):
         and Reserver containing the data that is pointed
         to.
         """
-        # find insertion
-        index = self._insertion_index(reserver, self._reservation_list)
+        arrival_time = reserver.get_arrival_time()
+        index = bisect_right(self._arrival_times, arrival_time)
 
         self._reservation_list.insert(index, reserver)
+        self._arrival_times.insert(index, arrival_time)
+
+        heapq.heappush(self._upcoming_reservations,
+                       (arrival_time, next(self._heap_counter), reserver))
+        self._upcoming_ids.add(id(reserver))
+
         values = (reserver.name, reserver.number,
                   reserver.get_arrival_time_str(),
                   reserver.get_eta())
@@ -306,38 +364,6 @@ class ReservationStore(Gtk.ListStore):
         
         return itr, reserver
     
-    def _insertion_index(self, other, curr_list):
-        """Private Method.
-        Performs a search on the given list to find
-        the index that the given value should be placed.
-        
-        @param other: Reserver object that is to be placed
-        in the list.
-        
-        @param curr_list: list of Reserver objects that is
-        to have the other placed into it.
-        
-        @return: int representing the index that the value
-        should be inserted at.
-        """
-        if len(curr_list) > 0:
-            start = curr_list[0].__cmp__(other)
-            end = curr_list[-1].__cmp__(other)
-            if start > 0 or end <= 0:
-                if end <= 0:
-                    return len(curr_list) + 1
-                    
-            else:
-                new_length = len(curr_list) / 2
-                middle = curr_list[new_length].__cmp__(other)
-                
-                if middle > 0:
-                    return self._insertion_index(other, curr_list[1:new_length]) + 1
-                else:
-                    new_list = curr_list[new_length:-1 - 2]
-                    return self._insertion_index(other, new_list) + new_length + 1
-        return 0
-    
     def _get_index(self, itr):
         """Gets the index of the given
         iter.
@@ -378,11 +404,19 @@ class ReservationStore(Gtk.ListStore):
         from the model
         """
         index = self._get_index(itr)
+        self._dirty_rows.discard(itr)
         self.remove(itr)
         reserver = self._reservation_list.pop(index)
+        self._arrival_times.pop(index)
 
-        if reserver in self._reservation_notifications:
-            self._reservation_notifications.remove(reserver)
+        if id(reserver) in self._upcoming_ids:
+            self._removed_reservations.add(id(reserver))
+
+        notifications = self._reservation_notifications
+        for notification_index, notification in enumerate(notifications):
+            if notification is reserver:
+                del notifications[notification_index]
+                break
 
         return reserver
 
@@ -413,18 +447,50 @@ class ReservationStore(Gtk.ListStore):
         @return bool that lets the _timeout_id know
         if the process should continue. 
         """
-        for row, reserver in zip(self, self._reservation_list):
-            row[3] = reserver.get_eta()
+        self._update_eta()
+        self._update_notifications()
+        return True
+
+    def _update_eta(self):
+        """Private Method.
+
+        Updates the displayed ETA of
+        each reservation. The ETAs are
+        written on the next refresh.
+
+        @return: None
+        """
+        itr = self.get_iter_first()
 
-            until_reservation = reserver.get_time_until_arrival()
+        for reserver in self._reservation_list:
+            self._dirty_rows.mark(itr, [3], [reserver.get_eta()])
+            itr = self.iter_next(itr)
 
-            if (until_reservation <= RESERVATION_NOTIFICATION_TIME_MAX) and \
-               (until_reservation > RESERVATION_NOTIFICATION_TIME_MIN) and \
-               (reserver not in self._reservation_notifications):
+    def _update_notifications(self):
+        """Private Method.
 
-                self._reservation_notifications.append(reserver)
+        Moves the reservations that have
+        entered the notification window from
+        the upcoming reservations heap to the
+        reservation notifications. Reservations
+        that have already arrived are discarded.
 
-        return True
+        @return: None
+        """
+        curr_time = datetime.now()
+        window_end = curr_time + RESERVATION_NOTIFICATION_TIME_MAX
+        window_start = curr_time + RESERVATION_NOTIFICATION_TIME_MIN
+        upcoming = self._upcoming_reservations
+
+        while upcoming and upcoming[0][0] <= window_end:
+            arrival_time, _, reserver = heapq.heappop(upcoming)
+            self._upcoming_ids.discard(id(reserver))
+
+            if id(reserver) in self._removed_reservations:
+                self._removed_reservations.discard(id(reserver))
+
+            elif arrival_time > window_start:
+                self._reservation_notifications.append(reserver)
 
     def _dump(self):
         """Dumps the information stored in this
@@ -437,6 +503,7 @@ class ReservationStore(Gtk.ListStore):
         a list of tuples, that represent the
         rows that were being displayed.
         """
+        self._dirty_rows.flush()
         reserver_dump = self._reservation_list
         reserver_info = []
 
@@ -480,12 +547,13 @@ class Reservations(object):
         self.tree_view = ReservationTreeView()
         self.model = ReservationStore()
         parent.add(self.tree_view)
-        
-        self.tree_view.set_model(self.model)
-        self.tree_view.show_all()
 
+        # loaded before the model is displayed so the view is built once
         for reserver in reservation_data:
             self.model.add_reservation(reserver)
+        
+        self.tree_view.set_model(self.model)
+        self.tree_view.show_all()
 
     def _get_selected_iter(self):
         """Private Method.
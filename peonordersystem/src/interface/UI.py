@@ -15,7 +15,10 @@ from .builder.Builder import Builder
 from .Reservations import Reservations
 from .UpcomingOrders import UpcomingOrders
 from .Orders import Orders
+from .OrderHistory import (NOTE_COMMAND, STARS_COMMAND, OPTIONS_COMMAND,
+                           COMP_COMMAND, DISCOUNT_COMMAND)
 from peonordersystem.src import ErrorLogger
+from peonordersystem.src import Metrics
 from peonordersystem.src import CustomExceptions
 from peonordersystem.src import Settings
 from peonordersystem.src.interface.dialogs.depreciated import Dialog
@@ -97,19 +100,24 @@ class UI(object):
     """
     @non_fatal_error_notification
     @ErrorLogger.log_func_data
-    def __init__(self, title, load_data=None, reservation_data=None):
+    def __init__(self, title, load_data=None, reservation_data=None,
+                 journal=None):
         """Initializes a new object. Generates the base GUI
         from XML file obtained from Path. Instantiates the
         component objects.
         
         @param title: str representing the current title to
         be displayed on the GUI
+
+        @keyword journal: object that records each edit of
+        an order, such as an OrderJournal. Default is None,
+        where the edits aren't recorded.
         """
         self.builder = Builder(title)
         self.builder.connect_signals(self)
         
         # These objects control the main orders and their displays
-        self.orders = Orders(load_data=load_data)
+        self.orders = Orders(load_data=load_data, journal=journal)
         self.builder.set_order_view(self.orders.get_display_view())
         
         # These objects control secondary displays
@@ -207,11 +215,37 @@ class UI(object):
         
         @param *args: wildcard that represents a catch
         for selected widget 
+
+        @return: Reserver object that was removed.
         """
         self.update_status('Removing selected reservation...')
         reserver = self.reservations.remove_selected_reservation()
         self.update_status('Removed reservation for '
                            '{} at {}'.format(reserver.name,reserver._arrival_time))
+        return reserver
+
+    @non_fatal_error_notification
+    @ErrorLogger.log_func_data
+    def cancel_selected_reservation(self, *args):  # @IGNORE:W0613
+        """Callback method called when cancel reservation
+        has been clicked. Removes the selected reservation
+        from the reservations list, as the reservation
+        has been cancelled.
+
+        @note: Unlike remove_selected_reservation, the
+        reservation is also deleted from the stored
+        reservations.
+
+        @param *args: wildcard that represents a catch
+        for selected widget
+
+        @return: Reserver object that was cancelled.
+        """
+        self.update_status('Cancelling selected reservation...')
+        reserver = self.reservations.remove_selected_reservation()
+        self.update_status('Cancelled reservation for '
+                           '{} at {}'.format(reserver.name, reserver._arrival_time))
+        return reserver
 
     @non_fatal_error_notification
     @ErrorLogger.log_func_data
@@ -258,6 +292,7 @@ class UI(object):
         @param *args: wildcard representing the button clicked.
         """
         menu_item = self.orders.get_selected()
+        original = menu_item.clone()
         name = menu_item.get_name()
         self.update_status('Waiting for new note to be' +
                            ' edited on {}...'.format(name))
@@ -266,7 +301,7 @@ class UI(object):
         message = 'updated note on ' + name
 
         if confirmed:
-            self.orders.update_item()
+            self.orders.update_edited_item(NOTE_COMMAND, original)
             message = 'Confirmed ' + message
         else:
             message = 'Canceled ' + message
@@ -284,6 +319,7 @@ class UI(object):
         @param *args: wildcard representing the button clicked
         """
         menu_item = self.orders.get_selected()
+        original = menu_item.clone()
         name = menu_item.get_name()
         self.update_status("Waiting for stars value to be" +
                            " edited on {}...".format(name))
@@ -292,7 +328,7 @@ class UI(object):
         message = 'updated stars rating on ' + name
 
         if confirmed:
-            self.orders.update_item()
+            self.orders.update_edited_item(STARS_COMMAND, original)
             message = 'Confirmed ' + message
         else:
             message = 'Canceled ' + message
@@ -312,6 +348,7 @@ class UI(object):
         @return: None
         """
         menu_item = self.orders.get_selected()
+        original = menu_item.clone()
         name = menu_item.get_name()
         self.update_status('Waiting for options to be ' +
                            'selected on {}...'.format(name))
@@ -320,7 +357,7 @@ class UI(object):
         message = 'updated options on ' + name
         if response == Editor.ACCEPT_RESPONSE:
             message = 'Confirmed ' + message
-            self.orders.update_item()
+            self.orders.update_edited_item(OPTIONS_COMMAND, original)
 
         elif response == Editor.GENERAL_OPTIONS_RESPONSE:
             self.edit_general_options()
@@ -346,6 +383,7 @@ class UI(object):
         @return:
         """
         menu_item = self.orders.get_selected()
+        original = menu_item.clone()
         name = menu_item.get_name()
         self.update_status('Opening general options to edit ' +
                            '{}'.format(name))
@@ -355,7 +393,7 @@ class UI(object):
         message = ''
 
         if response == Editor.ACCEPT_RESPONSE:
-            self.orders.update_item()
+            self.orders.update_edited_item(OPTIONS_COMMAND, original)
 
             message = 'Adding options to {}... done'.format(name)
 
@@ -437,7 +475,8 @@ class UI(object):
         """
         self.update_status('Waiting for checkout confirmation...')
         current_order = self.orders.get_current_order()
-        response = self.editor.checkout_order(current_order, self.checkout_confirm)
+        response = self.editor.checkout_order(current_order, self.checkout_confirm,
+                                              self.orders.get_current_order_type())
 
         if response == Editor.ACCEPT_RESPONSE:
             self.update_status('Checking out table. Clearing order... done')
@@ -461,7 +500,8 @@ class UI(object):
         self.update_status('Waiting for split check confirmation...')
         current_order = self.orders.get_current_order()
         confirmed = self.editor.split_check_order(current_order,
-                                                  self.checkout_confirm)
+                                                  self.checkout_confirm,
+                                                  self.orders.get_current_order_type())
 
         if confirmed:
             self.update_status('Splitting Checking... Clearing order')
@@ -498,7 +538,7 @@ class UI(object):
         """
         self.update_status('Waiting for comp confirmation...')
         current_order = self.orders.get_current_order()
-        confirmed = self.editor.comp_item_order(current_order, self.update_order)
+        confirmed = self.editor.comp_item_order(current_order, self.items_comped)
 
         if confirmed:
             message = 'Selected menu items comped. Retrieving order.. done'
@@ -522,8 +562,10 @@ class UI(object):
         self.update_status('Waiting for discount confirmation...')
         current_order = self.orders.get_current_order()
         discount_templates = self.builder.get_discount_templates_data()
-        confirmed = self.editor.discount_item_order(current_order, self.edit_order,
-                                                    discount_templates)
+        confirmed = self.editor.discount_item_order(current_order,
+                                                    self.discount_confirmed,
+                                                    discount_templates,
+                                                    self.orders.get_current_order_type())
 
         if confirmed:
             message = 'Applying Discounts... done'
@@ -533,20 +575,62 @@ class UI(object):
 
     @non_fatal_error_notification
     @ErrorLogger.log_func_data
-    def undo_checkout_order(self, checkout_data):
+    def undo_order_edit(self, *args):
+        """Callback method when undo edit has been
+        clicked. Undoes the most recent edit of the
+        current order since it was last confirmed.
+
+        @param args: wildcard catchall that is used to
+        catch the Gtk.Widget that called this method.
+
+        @return: None
+        """
+        command = self.orders.undo()
+
+        if command is not None:
+            message = 'Undoing {} on current order... done'.format(command.kind)
+        else:
+            message = 'No edit to undo on current order'
+        self.update_status(message)
+
+    @non_fatal_error_notification
+    @ErrorLogger.log_func_data
+    def redo_order_edit(self, *args):
+        """Callback method when redo edit has been
+        clicked. Redoes the most recently undone edit
+        of the current order.
+
+        @param args: wildcard catchall that is used to
+        catch the Gtk.Widget that called this method.
+
+        @return: None
+        """
+        command = self.orders.redo()
+
+        if command is not None:
+            message = 'Redoing {} on current order... done'.format(command.kind)
+        else:
+            message = 'No edit to redo on current order'
+        self.update_status(message)
+
+    @non_fatal_error_notification
+    @ErrorLogger.log_func_data
+    def undo_checkout_order(self, checkout_history):
         """Called when the associated Gtk.Widget
         has been clicked. Allows user to interact
         with a window that will undo previously
         checked out orders and return them to the UI.
+        Orders that have been moved into the orders
+        database may only be browsed.
 
-        @param checkout_data: dict where each key is represented
-        by a tuple of (str, time.struct_time) -> (name, date),
-        and each value mapped is a list of MenuItem objects.
+        @param checkout_history: CheckoutHistory object
+        that lists the checked out orders of each day
+        and decodes each order as it is selected.
 
         @return: None
         """
         self.update_status('Waiting for Undo Checkout confirmation...')
-        confirmed = self.editor.undo_checkout_order(checkout_data,
+        confirmed = self.editor.undo_checkout_order(checkout_history,
                                                     self.add_checkout_order)
 
         if confirmed:
@@ -562,6 +646,7 @@ class UI(object):
     #===========================================================================
     @non_fatal_error_notification
     @ErrorLogger.log_func_data
+    @Metrics.timed('UI.confirm_order')
     def order_confirmed(self, priority_order, *args):
         """Method called when the order has been
         confirmed as is to be sent to the kitchen.
@@ -669,6 +754,36 @@ class UI(object):
         # argument to update it's order.
         self.orders.update_order()
 
+    @non_fatal_error_notification
+    @ErrorLogger.log_func_data
+    def replace_items(self, edited_items):
+        """Callback Method that is called to replace
+        the edited MenuItems of the order.
+
+        @param edited_items: list of MenuItem objects
+        that are the edited versions of MenuItems in
+        the order. Each replaces the MenuItem with the
+        same item id.
+
+        @return: None
+        """
+        self.orders.replace_items(edited_items)
+
+    @non_fatal_error_notification
+    @ErrorLogger.log_func_data
+    def items_comped(self, edited_items):
+        """Callback Method that is called when the
+        comp dialog has been confirmed, to replace the
+        MenuItems whose comp status changed.
+
+        @param edited_items: list of MenuItem objects
+        that are the comped or uncomped versions of
+        MenuItems in the order.
+
+        @return: None
+        """
+        self.orders.replace_items(edited_items, kind=COMP_COMMAND)
+
     @non_fatal_error_notification
     @ErrorLogger.log_func_data
     def edit_order(self, edited_order):
@@ -684,6 +799,20 @@ class UI(object):
         """
         self.orders.edit_order(edited_order)
 
+    @non_fatal_error_notification
+    @ErrorLogger.log_func_data
+    def discount_confirmed(self, edited_order):
+        """Callback Method that is called when the
+        discount dialog has been confirmed, to edit the
+        order with the discounts added or removed.
+
+        @param edited_order: list of MenuItem objects
+        that is the order with its discounts.
+
+        @return: None
+        """
+        self.orders.edit_order(edited_order, kind=DISCOUNT_COMMAND)
+
     @non_fatal_error_notification
     @ErrorLogger.log_func_data
     def add_checkout_order(self, imported_order, checkout_keys):
@@ -695,9 +824,10 @@ class UI(object):
         was previously checked out and is being
         imported.
 
-        @param checkout_keys: list of tuples that
-        represents the keys that are associated
-        with each stored checkout order.
+        @param checkout_keys: list of 2 tuple of
+        (CheckoutEntry, str) that represents the
+        checkout history entry and the new name of
+        each undone checkout order.
 
         @return: None
         """
@@ -819,6 +949,20 @@ class UI(object):
         """
         response = self.editor.get_audit_info(self.perform_audit)
 
+    @non_fatal_error_notification
+    @ErrorLogger.log_func_data
+    def view_latency_metrics(self, *args):
+        """This method is called when an associated Gtk.Widget
+        is clicked. This method displays the recorded latencies
+        of each timed operation.
+
+        @param args: wildcard catchall that is used to catch
+        the Gtk.Widget that called this method.
+
+        @return: None
+        """
+        self.editor.view_latency_metrics(Metrics.snapshot())
+
     @non_fatal_error_notification
     @ErrorLogger.log_func_data
     def perform_audit(self, start_date, end_date, **kwargs):
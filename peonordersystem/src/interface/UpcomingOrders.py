@@ -22,6 +22,7 @@ from gi.repository import Gtk
 
 from peonordersystem.src import ErrorLogger
 from peonordersystem.src.standardoperations import tree_view_changed
+from peonordersystem.src.interface.RefreshScheduler import DirtyRows
 from peonordersystem.src.confirmationSystem.ConfirmationSystem import TOGO_SEPARATOR
 from peonordersystem.src.CustomExceptions import NoSuchSelectionError
 
@@ -119,6 +120,9 @@ class UpcomingOrderStore(Gtk.ListStore):
     class of the UpcomingOrders group. As such any changes
     in this class with alter the functionality of any class
     participating in the UpcomingOrders group
+
+    @var _dirty_rows: DirtyRows object that writes the
+    updated rows once per refresh.
     """
     
     def __init__(self):
@@ -127,6 +131,7 @@ class UpcomingOrderStore(Gtk.ListStore):
         3 str types.
         """
         super(UpcomingOrderStore, self).__init__(str, str, str)
+        self._dirty_rows = DirtyRows(self)
 
     def remove(self, itr):
         """Removes the selected item from
@@ -139,6 +144,7 @@ class UpcomingOrderStore(Gtk.ListStore):
         the UpcomingOrder removed.
         """
         name = self[itr][0]
+        self._dirty_rows.discard(itr)
         super(UpcomingOrderStore, self).remove(itr)
         return name
 
@@ -180,17 +186,16 @@ class UpcomingOrderStore(Gtk.ListStore):
         """
         order_name = order_name.replace('_', ' ')
 
-        index = 0
-
-        while index < len(self):
-            value = self[index]
+        itr = self.get_iter_first()
 
-            if value[0] == order_name:
-                itr = value.iter
+        while itr:
+            if self.get_value(itr, 0) == order_name:
+                # iters persist, so the next row remains valid
+                next_itr = self.iter_next(itr)
                 self.remove(itr)
-
+                itr = next_itr
             else:
-                index += 1
+                itr = self.iter_next(itr)
 
     def update_priority(self, itr):
         """Updates the priority of the given
@@ -202,9 +207,9 @@ class UpcomingOrderStore(Gtk.ListStore):
         @return: str representing the name of the
         priority order confirmed.
         """
-        self[itr][2] = ''
+        self._dirty_rows.mark(itr, [2], [''])
 
-        return self[itr][0]
+        return self.get_value(itr, 0)
 
     def _dump(self):
         """Gets the information associated
@@ -214,6 +219,7 @@ class UpcomingOrderStore(Gtk.ListStore):
         @return: list that represents the rows
         that are stored in this object.
         """
+        self._dirty_rows.flush()
         info = []
 
         for row in self:
@@ -274,11 +280,18 @@ class UpcomingOrders(object):
         of the table orders, the second entry is
         the dict of the misc orders
         """
-        for order in load_data:
-            for order_name, order_time in order:
+        # detached so that the view is only built once
+        self.tree_view.set_model(None)
 
-                order_data = order[order_name, order_time]
-                self.add_order(order_name, order_data, curr_time=order_time)
+        try:
+            for order in load_data:
+                for order_name, order_time in order:
+
+                    order_data = order[order_name, order_time]
+                    self._append_order(order_name, order_data,
+                                       curr_time=order_time)
+        finally:
+            self.tree_view.set_model(self.model)
 
     def _get_selected_iter(self):
         """Private method.
@@ -319,12 +332,39 @@ class UpcomingOrders(object):
         @keyword curr_time: datetime that represents the time
         that the order was placed at.
         """
+        itr = self._append_order(order_name, current_order,
+                                 priority_order=priority_order,
+                                 curr_time=curr_time)
+        self.tree_view.select_iter(itr)
+
+    def _append_order(self, order_name, current_order, priority_order=[],
+                      curr_time=None):
+        """Private Method.
+
+        Appends the given order to the model
+        without selecting it.
+
+        @param order_name: str that will be used as the display
+        name for the given order.
+
+        @param current_order: list of MenuItem objects that
+        is the current order list being confirmed
+
+        @keyword priority_order: list of MenuItem objects that
+        represent the priority order associated with the
+        current order. By default this value is an empty list.
+
+        @keyword curr_time: datetime that represents the time
+        that the order was placed at.
+
+        @return: Gtk.TreeIter pointing at the added order.
+        """
         order_name = order_name.replace(TOGO_SEPARATOR, ' ')
 
         priority_info = [menu_item.get_name() for menu_item in priority_order]
 
-        itr = self.model.append(order_name, str(priority_info)[1:-1], curr_time)
-        self.tree_view.select_iter(itr)
+        return self.model.append(order_name, str(priority_info)[1:-1],
+                                 curr_time)
     
     def remove_selected_order(self):
         """Removes the selected order from the
@@ -6,6 +6,9 @@ GUI for the user to interact with.
 @contact: cjmcgraw( at )u.washington.edu
 @version: 1.0
 """
+import time
+from functools import partial
+
 import jsonpickle
 jsonpickle.set_encoder_options('simplejson', sort_keys=True, indent=4)
 from gi.repository import Gtk
@@ -13,14 +16,20 @@ from gi.repository import Gtk
 from .abc.Builder import AbstractBuilder
 from .parsers.DataParser import DataParser
 from .misc.MenuButton import MenuButton
+from .misc.MenuSearch import MenuSearch
+from .misc.QuickAddPanel import QuickAddPanel
+from .parsers.catalogs.MenuSearchIndex import MenuSearchIndex
 
 from .containers.MenuContainer import MenuContainer
 from .containers.components.MenuComponent import MenuComponent
 from .containers.components.areas.ItemsArea import ItemsArea
 
+from peonordersystem.src import ErrorLogger
 from peonordersystem.SystemPath import MAIN_UI_PATH
-from peonordersystem.src.Settings import NUM_OF_TABLES_TO_DISPLAY
+from peonordersystem.src.Settings import (NUM_OF_TABLES_TO_DISPLAY,
+                                          QUICK_ADD_NUM_OF_ITEMS)
 from peonordersystem.src.interface.connectors.Connector import Connector
+from peonordersystem.src.interface.RefreshScheduler import refresh_scheduler
 
 
 class Builder(AbstractBuilder):
@@ -34,12 +43,16 @@ class Builder(AbstractBuilder):
 
     def __init__(self, title):
         """Initializes the Builder"""
+        self._start_time = time.time()
+        self._map_handler_id = None
+
         self._title = title
         self._gtk_builder = Gtk.Builder()
         self._gtk_builder.add_from_file(MAIN_UI_PATH)
 
         self._status_label = None
         self._order_label = None
+        self._quick_add_panel = None
 
         self._connector = Connector()
         self._data_parser = DataParser()
@@ -127,6 +140,8 @@ class Builder(AbstractBuilder):
 
         self._create_tables()
         self._create_menu_notebook()
+        self._create_menu_search()
+        self._create_quick_add_panel()
 
         self._set_window_properties()
 
@@ -137,10 +152,34 @@ class Builder(AbstractBuilder):
         @return: None
         """
         self.window.set_title(self._title)
+        self._map_handler_id = self.window.connect(self._data_parser.FLAGS['map'],
+                                                   self._first_window_mapped)
         self.window.show_all()
         self.window.maximize()
         self.window.connect(self._data_parser.FLAGS['destroy'], Gtk.main_quit)
 
+    def _first_window_mapped(self, window, *args):
+        """Private Method.
+
+        Callback Method. Called when the main
+        window is first mapped to the screen.
+        Reports the time taken to display the
+        first window and disconnects itself.
+
+        @param window: Gtk.Window that was
+        mapped.
+
+        @param args: wildcard catchall used to
+        catch the Gdk.Event.
+
+        @return: bool False so that the event
+        continues to propagate.
+        """
+        window.disconnect(self._map_handler_id)
+        self._map_handler_id = None
+        ErrorLogger.first_window_fencepost(self._start_time)
+        return False
+
     def _create_status_label(self):
         """Creates the status label
         area.
@@ -250,11 +289,77 @@ class Builder(AbstractBuilder):
         """Creates the notebook that
         displays the menu.
 
+        Each page is added as a placeholder
+        and its component is only built when
+        the page is first displayed. The
+        initially displayed page is built
+        immediately.
+
         @return: None
         """
         for label, categories in self._data_parser.categories_data.items():
-            component = self._create_menu_notebook_component(label, categories)
-            self._menu_notebook.add(component)
+            component_factory = partial(self._create_menu_notebook_component,
+                                        label, categories)
+            self._menu_notebook.add_deferred(label, component_factory)
+
+        self._menu_notebook.load_current_page()
+
+    def _create_menu_search(self):
+        """Creates the search area that is
+        displayed above the menu notebook and
+        registers it as a menu button so that
+        selected results are added the same as
+        clicked MenuButtons.
+
+        @return: None
+        """
+        search_index = MenuSearchIndex(self._data_parser.menu_data)
+        menu_search = MenuSearch(search_index)
+
+        self._add_to_menu_area(menu_search.main_widget)
+        self._register_menu_button(menu_search)
+
+    def _create_quick_add_panel(self):
+        """Creates the panel that displays the
+        most popular MenuItems above the menu
+        notebook and registers it as a menu
+        button so that its MenuItems are added
+        the same as clicked MenuButtons.
+
+        @return: None
+        """
+        self._quick_add_panel = QuickAddPanel(QUICK_ADD_NUM_OF_ITEMS)
+        self._add_to_menu_area(self._quick_add_panel.main_widget)
+        self._register_menu_button(self._quick_add_panel)
+
+    def _add_to_menu_area(self, widget):
+        """Adds the given widget to the top of
+        the area that contains the menu notebook.
+
+        @param widget: Gtk.Widget to be added.
+
+        @return: None
+        """
+        name = self._data_parser.WIDGET_NAMES['menu_notebook']
+        menu_area = self._get_widget(name).get_parent()
+        menu_area.pack_start(widget, False, False, self.BORDER_SEPARATOR_VALUE)
+        menu_area.reorder_child(widget, 0)
+
+    def update_quick_add_items(self, item_names):
+        """Updates the MenuItems displayed by
+        the quick add panel.
+
+        @param item_names: list of str representing
+        the names of the MenuItems to display, ordered
+        from the most to the least popular. Names that
+        are no longer on the menu are ignored.
+
+        @return: None
+        """
+        snapshot = self._data_parser.menu_catalog.snapshot
+        menu_items = [snapshot.get_item(name) for name in item_names]
+        self._quick_add_panel.set_items([menu_item for menu_item in menu_items
+                                         if menu_item is not None])
 
     def _create_menu_notebook_component(self, label, categories):
         """Creates the menu notebook component
@@ -325,8 +430,8 @@ class Builder(AbstractBuilder):
         """Registers the given button as
         a menu button with the connector.
 
-        @param button: MenuButton object
-        that is to be registered.
+        @param button: MenuButton, MenuSearch or
+        QuickAddPanel object that is to be registered.
 
         @return: None
         """
@@ -386,11 +491,16 @@ class Builder(AbstractBuilder):
             'bold'  :   bold
             'italic':   italic
 
+        @note: The display is updated on the next
+        refresh. Only the latest message given
+        before then is displayed.
+
         @return: None
         """
         parsed_style = self._parse_style(styles)
         msg = parsed_style.format(status_msg)
-        self._status_label.set_markup(msg)
+        refresh_scheduler.schedule(self._status_label,
+                                   self._status_label.set_markup, msg)
 
     def _parse_style(self, styles):
         """Parses the given styles
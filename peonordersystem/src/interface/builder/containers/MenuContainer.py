@@ -17,8 +17,15 @@ class MenuContainer(AbstractContainer):
     """Provides a wrapper for the Gtk.Notebook
     that allows for components to be added as
     new pages to the notebook.
+
+    Pages may also be deferred, in which case a
+    lightweight placeholder is displayed until the
+    page is first switched to, at which point the
+    component is built and displayed.
     """
 
+    SWITCH_PAGE_FLAG = 'switch-page'
+
     def __init__(self, menu_notebook):
         """Initializes the container.
 
@@ -29,6 +36,9 @@ class MenuContainer(AbstractContainer):
         self._check_notebook(menu_notebook)
         self._notebook = menu_notebook
 
+        self._deferred_pages = {}
+        self._notebook.connect(self.SWITCH_PAGE_FLAG, self._page_switched)
+
     @staticmethod
     def _check_notebook(notebook):
         """Checks if the given notebook
@@ -75,6 +85,78 @@ class MenuContainer(AbstractContainer):
         title = component.name
         self._notebook.append_page(widget, tab_label=Gtk.Label(title))
 
+    def add_deferred(self, name, component_factory):
+        """Adds a placeholder page to the
+        notebook. The component for the page is
+        not built until the page is first
+        displayed.
+
+        @param name: str representing the title
+        of the page.
+
+        @param component_factory: callable that
+        takes no arguments and returns the
+        AbstractComponent subclass that is to be
+        displayed on the page.
+
+        @return: None
+        """
+        placeholder = Gtk.VBox()
+        self._deferred_pages[placeholder] = component_factory
+        self._notebook.append_page(placeholder, tab_label=Gtk.Label(name))
+
+    def load_current_page(self):
+        """Builds the component for the page
+        currently displayed by the notebook if
+        it has been deferred.
+
+        @return: None
+        """
+        page_num = self._notebook.get_current_page()
+
+        if page_num >= 0:
+            self._load_page(self._notebook.get_nth_page(page_num))
+
+    def _page_switched(self, notebook, page, page_num):
+        """Private Method.
+
+        Callback Method. Called when the notebook
+        switches pages. Builds the page being
+        switched to if it has been deferred.
+
+        @param notebook: Gtk.Notebook that
+        emitted the signal.
+
+        @param page: Gtk.Widget that represents
+        the page being switched to.
+
+        @param page_num: int representing the
+        index of the page.
+
+        @return: None
+        """
+        self._load_page(page)
+
+    def _load_page(self, page):
+        """Private Method.
+
+        Builds the deferred component associated
+        with the given placeholder page and
+        displays it in the placeholder.
+
+        @param page: Gtk.Widget that represents
+        the placeholder page.
+
+        @return: None
+        """
+        component_factory = self._deferred_pages.pop(page, None)
+
+        if component_factory:
+            component = component_factory()
+            self._check_component(component)
+            page.pack_start(component.main_widget, True, True, 0)
+            page.show_all()
+
     @staticmethod
     def _check_component(component):
         """Checks if the given component
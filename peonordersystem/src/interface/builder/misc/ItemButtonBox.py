@@ -0,0 +1,162 @@
+"""This provides the ItemButtonBox class
+
+@author: Carl McGraw
+@contact: cjmcgraw( at )u.washington.edu
+@version: 1.0
+"""
+from gi.repository import Gtk
+
+
+class ItemButtonBox(object):
+    """This class is used to display a changing
+    list of MenuItems as buttons. A fixed number
+    of buttons are created and reused each time
+    the displayed MenuItems change. Clicking a
+    button behaves the same as clicking the
+    MenuButton of its MenuItem.
+    """
+
+    def __init__(self, num_of_buttons):
+        """Initializes the ItemButtonBox.
+
+        @param num_of_buttons: int representing the
+        maximum number of MenuItems displayed.
+        """
+        self._items = []
+        self._callbacks = []
+
+        self._buttons = self._create_buttons(num_of_buttons)
+        self._widget = self._set_up_main_widget()
+
+    @property
+    def main_widget(self):
+        """Gets the associated
+        widget.
+
+        @return: Gtk.Widget
+        """
+        return self._widget
+
+    @property
+    def items(self):
+        """Gets the displayed
+        MenuItems.
+
+        @return: list of MenuItem
+        """
+        return list(self._items)
+
+    def _create_buttons(self, num_of_buttons):
+        """Private Method.
+
+        Creates the buttons that are used to
+        display the MenuItems.
+
+        @param num_of_buttons: int representing
+        the number of buttons to create.
+
+        @return: list of Gtk.Button
+        """
+        buttons = []
+
+        for index in range(num_of_buttons):
+            button = Gtk.Button()
+            button.set_focus_on_click(False)
+            button.set_no_show_all(True)
+            button.connect('clicked', self._button_clicked, index)
+            buttons.append(button)
+
+        return buttons
+
+    def _set_up_main_widget(self):
+        """Private Method.
+
+        Sets up the main widget.
+
+        @return: Gtk.Widget
+        """
+        main_box = Gtk.HBox()
+
+        for button in self._buttons:
+            main_box.pack_start(button, True, True, 2.5)
+
+        return main_box
+
+    def set_items(self, menu_items):
+        """Sets the MenuItems displayed. Any
+        MenuItems beyond the number of buttons
+        are ignored.
+
+        @param menu_items: list of MenuItem
+        objects to be displayed.
+
+        @return: None
+        """
+        self._items = list(menu_items[:len(self._buttons)])
+
+        for index, button in enumerate(self._buttons):
+            if index < len(self._items):
+                button.set_label(self._items[index].get_name())
+                button.show()
+            else:
+                button.hide()
+
+    def connect(self, signal, func, *args):
+        """Connects the given function to be
+        called when a MenuItem is selected. The
+        function is called with the widget that
+        selected the MenuItem, the MenuItem and the
+        given args, matching the MenuButton.
+
+        @param signal: str representing the signal.
+        MenuItems are only selected on click so this
+        is expected to be 'clicked'.
+
+        @param func: function that is to be called.
+
+        @param args: additional arguments supplied
+        to the function.
+
+        @return: None
+        """
+        self._callbacks.append((func, args))
+
+    def select(self, widget, index=0):
+        """Selects the displayed MenuItem at the
+        given index and calls the connected
+        functions with it.
+
+        @param widget: Gtk.Widget that selected
+        the MenuItem.
+
+        @keyword index: int representing the index
+        of the MenuItem. Default is 0, the first
+        MenuItem.
+
+        @return: bool value representing if a
+        MenuItem was selected.
+        """
+        if index >= len(self._items):
+            return False
+
+        menu_item = self._items[index]
+        for func, args in self._callbacks:
+            func(widget, menu_item, *args)
+
+        return True
+
+    def _button_clicked(self, button, index):
+        """Private Method.
+
+        Callback Method. Called when a button
+        is clicked.
+
+        @param button: Gtk.Button that was
+        clicked.
+
+        @param index: int representing the
+        index of the button.
+
+        @return: None
+        """
+        self.select(button, index)
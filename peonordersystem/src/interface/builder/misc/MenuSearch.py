@@ -0,0 +1,115 @@
+"""This provides the MenuSearch class
+
+@author: Carl McGraw
+@contact: cjmcgraw( at )u.washington.edu
+@version: 1.0
+"""
+from gi.repository import Gtk
+
+from .ItemButtonBox import ItemButtonBox
+
+
+class MenuSearch(object):
+    """This class is used to create a search
+    entry that displays the MenuItems matching
+    the typed text as buttons. Clicking a result,
+    or pressing enter for the best result, behaves
+    the same as clicking the MenuButton of that
+    MenuItem.
+    """
+
+    NUM_OF_RESULTS = 6
+    PLACEHOLDER_TEXT = 'Search menu...'
+
+    def __init__(self, search_index):
+        """Initializes the MenuSearch.
+
+        @param search_index: MenuSearchIndex object
+        that is used to find the MenuItems matching
+        the typed text.
+        """
+        self._index = search_index
+
+        self._entry = self._create_entry()
+        self._results = ItemButtonBox(self.NUM_OF_RESULTS)
+        self._widget = self._set_up_main_widget()
+
+    @property
+    def main_widget(self):
+        """Gets the associated
+        widget.
+
+        @return: Gtk.Widget
+        """
+        return self._widget
+
+    def _create_entry(self):
+        """Creates the entry that the
+        user types the search into.
+
+        @return: Gtk.Entry
+        """
+        entry = Gtk.Entry()
+        entry.set_placeholder_text(self.PLACEHOLDER_TEXT)
+        entry.connect('changed', self._search_changed)
+        entry.connect('activate', self._search_activated)
+        return entry
+
+    def _set_up_main_widget(self):
+        """Sets up the main widget.
+
+        @return: Gtk.Widget
+        """
+        main_box = Gtk.VBox()
+        main_box.pack_start(self._entry, False, False, 5.0)
+        main_box.pack_start(self._results.main_widget, False, False, 0)
+        return main_box
+
+    def connect(self, signal, func, *args):
+        """Connects the given function to be
+        called when a result is selected. The
+        function is called with the widget that
+        selected the result, the MenuItem and the
+        given args, matching the MenuButton.
+
+        @param signal: str representing the signal.
+        Results are only selected on click so this
+        is expected to be 'clicked'.
+
+        @param func: function that is to be called.
+
+        @param args: additional arguments supplied
+        to the function.
+
+        @return: None
+        """
+        self._results.connect(signal, func, *args)
+
+    def _search_changed(self, entry):
+        """Private Method.
+
+        Callback Method. Called when the text
+        in the entry changes. Updates the
+        displayed results.
+
+        @param entry: Gtk.Entry that changed.
+
+        @return: None
+        """
+        results = self._index.search(entry.get_text(),
+                                     limit=self.NUM_OF_RESULTS)
+        self._results.set_items(results)
+
+    def _search_activated(self, entry):
+        """Private Method.
+
+        Callback Method. Called when enter
+        is pressed in the entry. Selects the
+        best result.
+
+        @param entry: Gtk.Entry that was
+        activated.
+
+        @return: None
+        """
+        self._results.select(entry)
@@ -0,0 +1,74 @@
+"""This provides the QuickAddPanel class
+
+@author: Carl McGraw
+@contact: cjmcgraw( at )u.washington.edu
+@version: 1.0
+"""
+from gi.repository import Gtk
+
+from .ItemButtonBox import ItemButtonBox
+
+
+class QuickAddPanel(object):
+    """This class is used to display the most
+    popular MenuItems as buttons so that they
+    can be added with a single click.
+    """
+
+    TITLE = 'Popular:'
+
+    def __init__(self, num_of_items):
+        """Initializes the QuickAddPanel.
+
+        @param num_of_items: int representing the
+        maximum number of MenuItems displayed.
+        """
+        self._items = ItemButtonBox(num_of_items)
+        self._widget = self._set_up_main_widget()
+
+    @property
+    def main_widget(self):
+        """Gets the associated
+        widget.
+
+        @return: Gtk.Widget
+        """
+        return self._widget
+
+    def _set_up_main_widget(self):
+        """Sets up the main widget.
+
+        @return: Gtk.Widget
+        """
+        main_box = Gtk.HBox()
+        main_box.pack_start(Gtk.Label(self.TITLE), False, False, 5.0)
+        main_box.pack_start(self._items.main_widget, True, True, 0)
+        return main_box
+
+    def set_items(self, menu_items):
+        """Sets the displayed MenuItems.
+
+        @param menu_items: list of MenuItem
+        objects ordered from the most to
+        the least popular.
+
+        @return: None
+        """
+        self._items.set_items(menu_items)
+
+    def connect(self, signal, func, *args):
+        """Connects the given function to be
+        called when a MenuItem is selected,
+        matching the MenuButton.
+
+        @param signal: str representing the
+        signal. Expected to be 'clicked'.
+
+        @param func: function that is to be called.
+
+        @param args: additional arguments supplied
+        to the function.
+
+        @return: None
+        """
+        self._items.connect(signal, func, *args)
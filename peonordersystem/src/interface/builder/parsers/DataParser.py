@@ -10,6 +10,7 @@ from .abc.DataParser import AbstractDataParser
 
 from .packers.Packer import Packer
 from .unpackers.Unpacker import Unpacker
+from .catalogs.MenuCatalog import MenuCatalog
 
 
 class DataParser(AbstractDataParser):
@@ -35,12 +36,14 @@ class DataParser(AbstractDataParser):
 
     # Gtk.Widget flags that are useful.
     FLAGS = {'button': 'clicked',
-             'destroy': 'delete-event'}
+             'destroy': 'delete-event',
+             'map': 'map-event'}
 
     def __init__(self):
         """Initializes the DataParser"""
         self._packer = Packer()
         self._unpacker = Unpacker()
+        self._catalog = MenuCatalog(self._unpacker, self._packer)
 
         self._categories_display_data = self.unpack_categories_data()
         self._menu_items_data = self.unpack_menu_data()
@@ -54,6 +57,15 @@ class DataParser(AbstractDataParser):
         """
         return self._menu_items_data
 
+    @property
+    def menu_catalog(self):
+        """Gets the catalog that serves the
+        stored menu data.
+
+        @return: MenuCatalog
+        """
+        return self._catalog
+
     @property
     def categories_data(self):
         """Gets the stored categories
@@ -73,7 +85,7 @@ class DataParser(AbstractDataParser):
 
         @return: dict
         """
-        return self._unpacker.unpack_menu_data()
+        return self._catalog.get_menu_data()
 
     def unpack_categories_data(self):
         """Unpacks the categories data
@@ -85,7 +97,7 @@ class DataParser(AbstractDataParser):
 
         @return: dict
         """
-        return self._unpacker.unpack_categories_data()
+        return self._catalog.get_categories_data()
 
     def unpack_options_data(self):
         """Unpacks the stored options
@@ -93,7 +105,7 @@ class DataParser(AbstractDataParser):
 
         @return: dict
         """
-        return self._unpacker.unpack_options_data()
+        return self._catalog.get_options_data()
 
     def unpack_discount_templates_data(self):
         """Unpacks the discount templates
@@ -101,7 +113,7 @@ class DataParser(AbstractDataParser):
 
         @return: dict
         """
-        return self._unpacker.unpack_discount_templates_data()
+        return self._catalog.get_discount_templates_data()
 
     def pack_menu_data(self, menu_data):
         """Updates the stored menu
@@ -120,7 +132,7 @@ class DataParser(AbstractDataParser):
 
         @return: None
         """
-        self._packer.pack_menu_data(menu_data)
+        self._catalog.update_menu_data(menu_data)
 
     def pack_categories_data(self, categories_data):
         """Updates the stored categories
@@ -139,7 +151,7 @@ class DataParser(AbstractDataParser):
 
         @return: None
         """
-        self._packer.pack_categories_data(categories_data)
+        self._catalog.update_categories_data(categories_data)
 
     def pack_options_data(self, option_data):
         """Updates the stored options
@@ -151,7 +163,7 @@ class DataParser(AbstractDataParser):
 
         @return: None
         """
-        self._packer.pack_options_data(option_data)
+        self._catalog.update_options_data(option_data)
 
     def pack_discount_templates_data(self, discount_templates_data):
         """Updates the stored discount
@@ -163,4 +175,4 @@ class DataParser(AbstractDataParser):
 
         @return: None
         """
-        self._packer.pack_discount_template_data(discount_templates_data)
+        self._catalog.update_discount_templates_data(discount_templates_data)
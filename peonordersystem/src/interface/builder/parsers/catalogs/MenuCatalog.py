@@ -0,0 +1,374 @@
+"""This module provides the MenuCatalog
+class that is used to load the stored menu
+data once and serve it to the builder and
+the dialogs that display or edit it.
+
+@author: Carl McGraw
+@contact: cjmcgraw( at )u.washington.edu
+@version: 1.0
+"""
+from copy import deepcopy
+
+from peonordersystem.src.TaxEngine import tax_engine
+
+
+class MenuSnapshot(object):
+    """Represents an immutable view of the
+    stored menu data along with the lookup
+    indexes built over it.
+
+    @note: The MenuItem and OptionItem objects
+    served by the snapshot are shared. They
+    are expected to be copied before they
+    are modified.
+    """
+
+    __slots__ = ('_menu_data', '_options_data', '_categories_data',
+                 '_discount_templates_data', '_items_by_name',
+                 '_options_by_name')
+
+    def __init__(self, menu_data, options_data, categories_data,
+                 discount_templates_data):
+        """Initializes the snapshot.
+
+        @param menu_data: dict of str keys representing
+        the categories mapped to list of MenuItem objects.
+
+        @param options_data: dict of str keys representing
+        the option categories mapped to list of OptionItem
+        objects.
+
+        @param categories_data: dict of str keys representing
+        the page labels mapped to list of str representing
+        the categories displayed on that page.
+
+        @param discount_templates_data: list of tuples
+        representing the discount templates.
+        """
+        set_value = super(MenuSnapshot, self).__setattr__
+
+        set_value('_menu_data', self._freeze_mapping(menu_data))
+        set_value('_options_data', self._freeze_mapping(options_data))
+        set_value('_categories_data', self._freeze_mapping(categories_data))
+        set_value('_discount_templates_data', tuple(discount_templates_data))
+
+        set_value('_items_by_name', self._index_by_name(self._menu_data))
+        set_value('_options_by_name', self._index_by_name(self._options_data))
+
+    def __setattr__(self, key, value):
+        """Prevents the snapshot from
+        being altered.
+
+        @raise AttributeError: Always.
+        """
+        raise AttributeError('MenuSnapshot objects are immutable')
+
+    @staticmethod
+    def _freeze_mapping(data):
+        """Private Method.
+
+        Creates a copy of the given mapping
+        with each of its values stored as
+        a tuple.
+
+        @param data: dict of keys mapped to
+        list values.
+
+        @return: dict of keys mapped to
+        tuple values.
+        """
+        return dict((key, tuple(values)) for key, values in data.iteritems())
+
+    @staticmethod
+    def _index_by_name(data):
+        """Private Method.
+
+        Creates an index of the items in the
+        given mapping by their names.
+
+        @param data: dict of keys mapped to
+        tuples of items that have a get_name
+        method.
+
+        @return: dict of str keys representing
+        the item names mapped to the items.
+        """
+        index = {}
+
+        for items in data.itervalues():
+            for item in items:
+                index[item.get_name()] = item
+
+        return index
+
+    @property
+    def categories(self):
+        """Gets the menu categories.
+
+        @return: tuple of str
+        """
+        return tuple(self._menu_data.keys())
+
+    @property
+    def option_categories(self):
+        """Gets the option categories.
+
+        @return: tuple of str
+        """
+        return tuple(self._options_data.keys())
+
+    @property
+    def page_labels(self):
+        """Gets the labels of the pages
+        that display the menu.
+
+        @return: tuple of str
+        """
+        return tuple(self._categories_data.keys())
+
+    @property
+    def discount_templates(self):
+        """Gets the discount templates.
+
+        @return: tuple
+        """
+        return self._discount_templates_data
+
+    def get_items(self, category):
+        """Gets the MenuItems in the given
+        category.
+
+        @param category: str representing
+        the category.
+
+        @return: tuple of MenuItem objects. Empty
+        if the category doesn't exist.
+        """
+        return self._menu_data.get(category, ())
+
+    def get_item(self, name):
+        """Gets the MenuItem with the
+        given name.
+
+        @param name: str representing the
+        name of the MenuItem.
+
+        @return: MenuItem object or None if
+        no item has the given name.
+        """
+        return self._items_by_name.get(name)
+
+    def get_options(self, option_category):
+        """Gets the OptionItems in the given
+        option category.
+
+        @param option_category: str representing
+        the option category.
+
+        @return: tuple of OptionItem objects. Empty
+        if the option category doesn't exist.
+        """
+        return self._options_data.get(option_category, ())
+
+    def get_option(self, name):
+        """Gets the OptionItem with the
+        given name.
+
+        @param name: str representing the
+        name of the OptionItem.
+
+        @return: OptionItem object or None if
+        no option has the given name.
+        """
+        return self._options_by_name.get(name)
+
+    def get_page_categories(self, page_label):
+        """Gets the categories displayed on
+        the page with the given label.
+
+        @param page_label: str representing the
+        label of the page.
+
+        @return: tuple of str. Empty if the
+        page doesn't exist.
+        """
+        return self._categories_data.get(page_label, ())
+
+    def items(self):
+        """Gets all of the MenuItems.
+
+        @return: Generator object
+
+        @yield: tuple of (str, MenuItem)
+        representing the category and
+        the item.
+        """
+        for category, items in self._menu_data.iteritems():
+            for item in items:
+                yield category, item
+
+
+class MenuCatalog(object):
+    """Loads the stored menu data once and
+    serves it as a MenuSnapshot. Mutable copies
+    in the stored format are supplied to the
+    dialogs that edit the data, and updates are
+    written through to the stored data.
+    """
+
+    def __init__(self, unpacker, packer):
+        """Initializes the catalog.
+
+        @param unpacker: AbstractUnpacker subclass
+        used to retrieve the stored data.
+
+        @param packer: AbstractPacker subclass
+        used to update the stored data.
+        """
+        self._unpacker = unpacker
+        self._packer = packer
+        self._snapshot = None
+
+    @property
+    def snapshot(self):
+        """Gets the current snapshot of the
+        stored menu data. The data is loaded
+        on first access.
+
+        @return: MenuSnapshot
+        """
+        if self._snapshot is None:
+            self._snapshot = self._load_snapshot()
+        return self._snapshot
+
+    def _load_snapshot(self):
+        """Private Method.
+
+        Loads the stored data and creates
+        a snapshot from it. The tax engine is
+        given the category of each MenuItem.
+
+        @return: MenuSnapshot
+        """
+        unpacker = self._unpacker
+        snapshot = MenuSnapshot(unpacker.unpack_menu_data(),
+                                unpacker.unpack_options_data(),
+                                unpacker.unpack_categories_data(),
+                                unpacker.unpack_discount_templates_data())
+
+        tax_engine.set_menu_categories(snapshot.items())
+        return snapshot
+
+    def invalidate(self):
+        """Discards the current snapshot so
+        that the stored data is loaded again
+        on the next access.
+
+        @return: None
+        """
+        self._snapshot = None
+
+    def get_menu_data(self):
+        """Gets a copy of the menu data.
+
+        @return: dict of str keys representing
+        the categories mapped to list of MenuItem
+        objects.
+        """
+        snapshot = self.snapshot
+        return self._thaw_mapping(snapshot.categories, snapshot.get_items)
+
+    def get_options_data(self):
+        """Gets a copy of the options data.
+
+        @return: dict of str keys representing
+        the option categories mapped to list of
+        OptionItem objects.
+        """
+        snapshot = self.snapshot
+        return self._thaw_mapping(snapshot.option_categories,
+                                  snapshot.get_options)
+
+    def get_categories_data(self):
+        """Gets a copy of the categories data.
+
+        @return: dict of str keys representing
+        the page labels mapped to list of str
+        representing the categories.
+        """
+        snapshot = self.snapshot
+        return self._thaw_mapping(snapshot.page_labels,
+                                  snapshot.get_page_categories)
+
+    def get_discount_templates_data(self):
+        """Gets a copy of the discount templates
+        data.
+
+        @return: list of tuples
+        """
+        return deepcopy(list(self.snapshot.discount_templates))
+
+    @staticmethod
+    def _thaw_mapping(keys, get_values):
+        """Private Method.
+
+        Creates a mutable copy of the snapshot
+        data associated with the given keys.
+
+        @param keys: tuple of str representing
+        the keys to be copied.
+
+        @param get_values: function that takes
+        a key and returns the tuple of values
+        associated with it.
+
+        @return: dict of keys mapped to list
+        values.
+        """
+        return deepcopy(dict((key, list(get_values(key))) for key in keys))
+
+    def update_menu_data(self, menu_data):
+        """Updates the stored menu data.
+
+        @param menu_data: dict representing
+        the updated menu data.
+
+        @return: None
+        """
+        self._packer.pack_menu_data(menu_data)
+        self.invalidate()
+
+    def update_options_data(self, options_data):
+        """Updates the stored options data.
+
+        @param options_data: dict representing
+        the updated options data.
+
+        @return: None
+        """
+        self._packer.pack_options_data(options_data)
+        self.invalidate()
+
+    def update_categories_data(self, categories_data):
+        """Updates the stored categories data.
+
+        @param categories_data: dict representing
+        the updated categories data.
+
+        @return: None
+        """
+        self._packer.pack_categories_data(categories_data)
+        self.invalidate()
+
+    def update_discount_templates_data(self, discount_templates_data):
+        """Updates the stored discount templates
+        data.
+
+        @param discount_templates_data: list of
+        tuples representing the updated discount
+        templates.
+
+        @return: None
+        """
+        self._packer.pack_discount_template_data(discount_templates_data)
+        self.invalidate()
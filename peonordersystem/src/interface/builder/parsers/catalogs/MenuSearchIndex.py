@@ -0,0 +1,353 @@
+"""This module provides the MenuSearchIndex
+class that is used to look up MenuItems by
+partial names or categories as the user types.
+
+@author: Carl McGraw
+@contact: cjmcgraw( at )u.washington.edu
+@version: 1.0
+"""
+import re
+import heapq
+from itertools import islice
+from collections import defaultdict
+
+
+class MenuSearchIndex(object):
+    """Precomputed index over the names and
+    categories of the stored MenuItems.
+
+    Words in item names and categories are
+    indexed by each of their prefixes, which
+    answers the common case of typing the start
+    of a word. A trigram index over the full
+    names is used to fill the remaining results
+    when the query doesn't match a word prefix.
+
+    Entries are numbered in order of their name
+    length and name, so that within each rank the
+    best results are the lowest numbered entries.
+    """
+
+    # Longer query words are matched against the
+    # prefix of this length and then filtered.
+    MAX_PREFIX_LENGTH = 8
+    TRIGRAM_LENGTH = 3
+
+    # Fraction of the query trigrams that must be
+    # present in a name for it to be considered.
+    TRIGRAM_THRESHOLD = .5
+
+    DEFAULT_LIMIT = 8
+
+    WORD_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+    def __init__(self, menu_data):
+        """Initializes the index.
+
+        @param menu_data: dict of str keys representing
+        the categories mapped to list of MenuItem objects.
+        """
+        self._items = []
+        self._names = []
+        self._name_words = []
+        self._categories = []
+
+        self._full_prefixes = defaultdict(set)
+        self._name_prefixes = defaultdict(set)
+        self._category_prefixes = defaultdict(set)
+        self._trigrams = defaultdict(set)
+
+        data = [(self._normalize(menu_item.get_name()), category, menu_item)
+                for category, items in menu_data.iteritems()
+                for menu_item in items]
+        data.sort(key=lambda entry_data: (len(entry_data[0]), entry_data[0]))
+
+        for name, category, menu_item in data:
+            self._add(name, category, menu_item)
+
+    def __len__(self):
+        """Gets the number of items
+        in the index.
+
+        @return: int
+        """
+        return len(self._items)
+
+    def _add(self, name, category, menu_item):
+        """Private Method.
+
+        Adds the given MenuItem to the index.
+
+        @param name: str representing the
+        normalized name of the item.
+
+        @param category: str representing the
+        category of the item.
+
+        @param menu_item: MenuItem object that
+        is to be indexed.
+
+        @return: None
+        """
+        entry = len(self._items)
+        name_words = self._split_words(name)
+        category_words = self._split_words(self._normalize(category))
+
+        self._items.append(menu_item)
+        self._names.append(name)
+        self._name_words.append(name_words)
+        self._categories.append(category_words)
+
+        for prefix in self._prefixes(name):
+            self._full_prefixes[prefix].add(entry)
+
+        for word in name_words:
+            for prefix in self._prefixes(word):
+                self._name_prefixes[prefix].add(entry)
+
+        for word in category_words:
+            for prefix in self._prefixes(word):
+                self._category_prefixes[prefix].add(entry)
+
+        for trigram in self._generate_trigrams(name):
+            self._trigrams[trigram].add(entry)
+
+    @staticmethod
+    def _normalize(text):
+        """Private Method.
+
+        Normalizes the given text for
+        comparison.
+
+        @param text: str to be normalized.
+
+        @return: str
+        """
+        return ' '.join(text.lower().split())
+
+    @classmethod
+    def _split_words(cls, text):
+        """Private Method.
+
+        Splits the given normalized text
+        into its words.
+
+        @param text: str to be split.
+
+        @return: tuple of str
+        """
+        return tuple(cls.WORD_PATTERN.findall(text))
+
+    @classmethod
+    def _prefixes(cls, word):
+        """Private Method.
+
+        Generates the indexed prefixes
+        of the given word.
+
+        @param word: str representing the
+        word.
+
+        @return: Generator object
+
+        @yield: str representing a prefix.
+        """
+        for length in xrange(1, min(len(word), cls.MAX_PREFIX_LENGTH) + 1):
+            yield word[:length]
+
+    @classmethod
+    def _generate_trigrams(cls, text):
+        """Private Method.
+
+        Generates the trigrams of the given
+        text.
+
+        @param text: str representing the text.
+
+        @return: set of str representing the
+        trigrams.
+        """
+        padded = ' ' + text + ' '
+        n = cls.TRIGRAM_LENGTH
+        return set(padded[i:i + n] for i in xrange(len(padded) - n + 1))
+
+    def search(self, query, limit=DEFAULT_LIMIT):
+        """Searches the index for MenuItems that
+        match the given query.
+
+        @param query: str representing the text that
+        was typed by the user.
+
+        @keyword limit: int representing the maximum
+        number of results to return. Default is
+        DEFAULT_LIMIT.
+
+        @return: list of MenuItem objects ordered from
+        the best to the worst match.
+        """
+        query = self._normalize(query)
+        query_words = self._split_words(query)
+
+        if not query_words:
+            return []
+
+        results = []
+        matchers = (lambda: self._match_name_prefix(query),
+                    lambda: self._match_words(query_words, self._name_prefixes,
+                                              self._name_words),
+                    lambda: self._match_category(query_words))
+
+        for matcher in matchers:
+            if len(results) >= limit:
+                break
+
+            found = set(results)
+            candidates = (entry for entry in matcher() if entry not in found)
+            results.extend(heapq.nsmallest(limit - len(results), candidates))
+
+        if len(results) < limit:
+            found = set(results)
+            candidates = (entry for entry in self._match_trigrams(query, limit)
+                          if entry not in found)
+            results.extend(islice(candidates, limit - len(results)))
+
+        return [self._items[entry] for entry in results]
+
+    def _match_name_prefix(self, query):
+        """Private Method.
+
+        Finds the entries whose names start
+        with the given query.
+
+        @param query: str representing the
+        normalized query.
+
+        @return: set of int representing the
+        matching entries.
+        """
+        candidates = self._full_prefixes.get(query[:self.MAX_PREFIX_LENGTH], set())
+
+        if len(query) > self.MAX_PREFIX_LENGTH:
+            return set(entry for entry in candidates
+                       if self._names[entry].startswith(query))
+
+        return candidates
+
+    def _match_words(self, query_words, prefix_index, entry_words):
+        """Private Method.
+
+        Finds the entries where every query
+        word is the prefix of one of the
+        entries words.
+
+        @param query_words: tuple of str representing
+        the words in the query.
+
+        @param prefix_index: dict of str keys
+        representing prefixes mapped to set of
+        int representing the entries.
+
+        @param entry_words: list of tuple of str
+        representing the words of each entry.
+
+        @return: set of int representing the
+        matching entries.
+        """
+        matches = None
+
+        for word in query_words:
+            candidates = prefix_index.get(word[:self.MAX_PREFIX_LENGTH], set())
+
+            if len(word) > self.MAX_PREFIX_LENGTH:
+                candidates = set(entry for entry in candidates
+                                 if self._has_word_prefix(entry_words[entry],
+                                                          word))
+
+            if matches is None:
+                matches = set(candidates)
+            else:
+                matches &= candidates
+
+            if not matches:
+                break
+
+        return matches or set()
+
+    @staticmethod
+    def _has_word_prefix(words, prefix):
+        """Private Method.
+
+        Checks if any of the given words
+        start with the given prefix.
+
+        @param words: tuple of str
+
+        @param prefix: str
+
+        @return: bool
+        """
+        return any(word.startswith(prefix) for word in words)
+
+    def _match_category(self, query_words):
+        """Private Method.
+
+        Finds the entries where every query
+        word is the prefix of a word in the
+        entries category or name.
+
+        @param query_words: tuple of str representing
+        the words in the query.
+
+        @return: set of int representing the
+        matching entries.
+        """
+        matches = None
+
+        for word in query_words:
+            key = word[:self.MAX_PREFIX_LENGTH]
+            candidates = (self._category_prefixes.get(key, set()) |
+                          self._name_prefixes.get(key, set()))
+
+            if len(word) > self.MAX_PREFIX_LENGTH:
+                candidates = set(entry for entry in candidates
+                                 if self._has_word_prefix(
+                                     self._categories[entry] +
+                                     self._name_words[entry], word))
+
+            if matches is None:
+                matches = candidates
+            else:
+                matches &= candidates
+
+            if not matches:
+                break
+
+        return matches or set()
+
+    def _match_trigrams(self, query, limit):
+        """Private Method.
+
+        Finds the best entries whose names
+        share enough trigrams with the query.
+
+        @param query: str representing the
+        normalized query.
+
+        @param limit: int representing the
+        number of entries to find.
+
+        @return: list of int representing the
+        matching entries ordered by the number
+        of shared trigrams.
+        """
+        query_trigrams = self._generate_trigrams(query)
+        hits = defaultdict(int)
+
+        for trigram in query_trigrams:
+            for entry in self._trigrams.get(trigram, ()):
+                hits[entry] += 1
+
+        required = len(query_trigrams) * self.TRIGRAM_THRESHOLD
+        matches = ((-count, entry) for entry, count in hits.iteritems()
+                   if count >= required)
+        return [entry for count, entry in heapq.nsmallest(limit, matches)]
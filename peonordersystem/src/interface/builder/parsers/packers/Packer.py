@@ -11,6 +11,7 @@ import jsonpickle
 jsonpickle.set_encoder_options('simplejson', sort_keys=True, indent=4)
 
 from .abc.Packer import AbstractPacker
+from peonordersystem.src.AtomicWriter import atomic_write
 from peonordersystem.SystemPath import (MENU_DATA, OPTION_DATA,
                                         DISCOUNT_DATA, CATEGORIES_DISPLAY_DATA)
 
@@ -82,6 +83,5 @@ class Packer(AbstractPacker):
 
         @return: None
         """
-        with open(filepath, 'w') as f_data:
-            encoded_data = jsonpickle.encode(data)
-            f_data.write(encoded_data)
\ No newline at end of file
+        encoded_data = jsonpickle.encode(data)
+        atomic_write(filepath, encoded_data)
\ No newline at end of file
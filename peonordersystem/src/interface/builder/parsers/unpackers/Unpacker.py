@@ -7,9 +7,12 @@ by the builder object.
 @contact: cjmcgraw( at )u.washington.edu
 @version: 1.0
 """
+import os
+import cPickle
 import jsonpickle
 
 from .abc.Unpacker import AbstractUnpacker
+from peonordersystem.src.AtomicWriter import atomic_write
 from peonordersystem.SystemPath import (MENU_DATA, OPTION_DATA,
                                         DISCOUNT_DATA, CATEGORIES_DISPLAY_DATA)
 
@@ -17,8 +20,17 @@ from peonordersystem.SystemPath import (MENU_DATA, OPTION_DATA,
 class Unpacker(AbstractUnpacker):
     """Retrieves stored data that
     is used by the builder object.
+
+    Each decoded file is also stored as a
+    compiled snapshot next to its source.
+    The compiled snapshot is used in place
+    of the source whenever the modification
+    time and size of the source match those
+    recorded in the snapshot.
     """
 
+    COMPILED_SUFFIX = '.compiled'
+
     def unpack_menu_data(self):
         """Unpacks the menu data
 
@@ -60,5 +72,109 @@ class Unpacker(AbstractUnpacker):
         that was stored in the file and
         unpacked via jsonpickle.
         """
-        f_data = open(filepath, 'r')
-        return jsonpickle.decode(f_data.read())
\ No newline at end of file
+        signature = self._get_file_signature(filepath)
+        compiled_path = filepath + self.COMPILED_SUFFIX
+
+        data = self._load_compiled_data(compiled_path, signature)
+
+        if data is None:
+            data = self._decode_data(filepath)
+            self._dump_compiled_data(compiled_path, signature, data)
+
+        return data
+
+    @staticmethod
+    def _get_file_signature(filepath):
+        """Private Method.
+
+        Gets the signature used to determine
+        if a compiled snapshot is up to date
+        with its source.
+
+        @param filepath: str representing the
+        path to the source file.
+
+        @return: tuple of (float, int) representing
+        the modification time and size of the file.
+        """
+        stats = os.stat(filepath)
+        return stats.st_mtime, stats.st_size
+
+    @staticmethod
+    def _decode_data(filepath):
+        """Private Method.
+
+        Decodes the data stored at the given
+        filepath via jsonpickle.
+
+        @param filepath: str representing the
+        path to the source file.
+
+        @return: obj representing the decoded
+        data.
+        """
+        with open(filepath, 'r') as f_data:
+            return jsonpickle.decode(f_data.read())
+
+    @staticmethod
+    def _load_compiled_data(compiled_path, signature):
+        """Private Method.
+
+        Loads the compiled snapshot at the
+        given path if its recorded signature
+        matches the given signature.
+
+        @param compiled_path: str representing
+        the path to the compiled snapshot.
+
+        @param signature: tuple representing the
+        current signature of the source file.
+
+        @return: obj representing the stored data,
+        or None if no valid snapshot exists.
+        """
+        if not os.path.exists(compiled_path):
+            return None
+
+        try:
+            with open(compiled_path, 'rb') as f_data:
+                stored_signature, data = cPickle.load(f_data)
+        except (IOError, EOFError, ValueError, TypeError,
+                AttributeError, ImportError, cPickle.UnpicklingError):
+            return None
+
+        if stored_signature != signature:
+            return None
+
+        return data
+
+    @staticmethod
+    def _dump_compiled_data(compiled_path, signature, data):
+        """Private Method.
+
+        Stores the given data as a compiled
+        snapshot at the given path. The snapshot
+        is written atomically, so that a crash
+        never leaves a partial snapshot. Failures
+        are ignored since the source file
+        remains the authoritative copy.
+
+        @param compiled_path: str representing
+        the path to the compiled snapshot.
+
+        @param signature: tuple representing the
+        signature of the source file the data
+        was decoded from.
+
+        @param data: obj representing the decoded
+        data.
+
+        @return: None
+        """
+        try:
+            compiled_data = cPickle.dumps((signature, data),
+                                          cPickle.HIGHEST_PROTOCOL)
+            atomic_write(compiled_path, compiled_data, sync_directory=False)
+        except (IOError, OSError, TypeError, cPickle.PicklingError):
+            if os.path.exists(compiled_path):
+                os.remove(compiled_path)
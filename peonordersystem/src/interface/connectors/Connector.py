@@ -43,8 +43,30 @@ class Connector(AbstractConnector):
         @return: None
         """
         for obj, (signals, func_name, args) in self._connection_data.items():
-            func = getattr(self._ref, func_name)
-            obj.connect(signals, func, *args)
+            self._connect_obj(obj, signals, func_name, args)
+
+    def _connect_obj(self, obj, signals, func_name, args):
+        """Private Method.
+
+        Connects the given object to the
+        function on the reference.
+
+        @param obj: Gtk.Object that is to be
+        connected.
+
+        @param signals: str representing the
+        flag that triggers the function.
+
+        @param func_name: str representing the
+        function name on the reference.
+
+        @param args: tuple of additional arguments
+        supplied to the function.
+
+        @return: None
+        """
+        func = getattr(self._ref, func_name)
+        obj.connect(signals, func, *args)
 
     def register(self, obj, flag, func_name, *args):
         """Registers an object for the connector
@@ -68,6 +90,14 @@ class Connector(AbstractConnector):
         that will be supplied to the function
         when the flag is triggered.
 
+        @note: Objects registered after the
+        connector has been connected are connected
+        immediately. This allows objects that are
+        built on demand to be registered.
+
         @return: None
         """
         self._connection_data[obj] = (flag, func_name, args)
+
+        if self._ref is not None:
+            self._connect_obj(obj, flag, func_name, args)
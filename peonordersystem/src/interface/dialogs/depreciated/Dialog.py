@@ -47,10 +47,11 @@ import os
 import math
 from gi.repository import Gtk  # IGNORE:E0611 @UnresolvedImport
 from datetime import datetime, timedelta, date, time
-from copy import copy, deepcopy
+from copy import copy
 from abc import ABCMeta, abstractmethod
 
-from peonordersystem.src import CheckOperations
+from peonordersystem.src.OrderTotals import OrderTotals
+from peonordersystem.src.OrderSnapshot import OrderSnapshot
 from peonordersystem.src.standardoperations import tree_view_changed
 from peonordersystem.src.MenuItem import MenuItem, DiscountItem
 from peonordersystem.src.MenuItem import OptionItem
@@ -61,7 +62,8 @@ from peonordersystem.src.Settings import (STANDARD_TEXT,
                                           CTIME_STR,
                                           DEFAULT_AUDIT_NAME,
                                           AUDIT_FILE_TYPE,
-                                          FILE_TYPE_SEPARATOR)
+                                          FILE_TYPE_SEPARATOR,
+                                          ORDER_TYPE_STANDARD)
 from peonordersystem.SystemPath import SYSTEM_AUDIT_REQUESTS_PATH
 
 #========================================================
@@ -75,6 +77,9 @@ COMP_DIALOG_RESPONSE = PRINT_DIALOG_RESPONSE - 1
 DISCOUNT_DIALOG_RESPONSE = COMP_DIALOG_RESPONSE - 1
 GENERAL_OPTIONS_DIALOG_RESPONSE = DISCOUNT_DIALOG_RESPONSE - 1
 
+# marks the listed checkouts that are in the orders database, which can't be undone
+STORED_CHECKOUT_SUFFIX = ' (browse only)'
+
 
 #=========================================================
 # This block represents windows that form the
@@ -1001,8 +1006,11 @@ class OptionEntryDialog(EntryDialog):
 
             option_toggle = Gtk.ToggleButton(option_name)
             option_toggle.option_item = option_item
-            
-            if option_item in self.menu_item.options:
+
+            chosen_option = self._get_chosen_option(option_item)
+
+            if chosen_option is not None:
+                option_toggle.option_item = chosen_option
                 option_toggle.set_active(True)
             
             # connect signals to add_option for dynamic adds
@@ -1010,6 +1018,26 @@ class OptionEntryDialog(EntryDialog):
             button_box.pack_start(option_toggle, True, True, 5)
             content_boxes.append(button_box)
     
+    def _get_chosen_option(self, option_item):
+        """Private Method.
+
+        Gets the option of the current options
+        that represents the given option choice.
+        Options are matched by id, or by value for
+        options that were stored without ids.
+
+        @param option_item: OptionItem object that
+        represents an option choice.
+
+        @return: OptionItem object of the current
+        options, or None if the choice wasn't chosen.
+        """
+        for option in self.options:
+            if option == option_item or option.is_equal_value(option_item):
+                return option
+
+        return None
+
     def add_option(self, button):
         """Adds the selected option to the current
         options for the MenuItem. If the button toggle
@@ -1544,6 +1572,9 @@ class CheckoutConfirmationDialog(ConfirmationDialog):
     @var order_list: list of MenuItem object that represents
     the current order being considered for checkout
 
+    @var order_totals: OrderTotals object that maintains the
+    totals of the order_list as MenuItems are added and removed.
+
     @var tree_view: defined in super class. Gtk.TreeView associated
     with the display.
 
@@ -1552,7 +1583,7 @@ class CheckoutConfirmationDialog(ConfirmationDialog):
     """
 
     def __init__(self, parent, confirm_func, order_list, dialog=None,
-                 title='Checkout Confirmation'):
+                 title='Checkout Confirmation', order_type=ORDER_TYPE_STANDARD):
         """Initializes the CheckoutConfirmationDialog window
         and generates the layout for the dialog. Calls super
         class functionality
@@ -1565,8 +1596,13 @@ class CheckoutConfirmationDialog(ConfirmationDialog):
         
         @param order_list: list of MenuItem object that represents
         the current order being considered for checkout
+
+        @keyword order_type: str representing the type of the
+        order, which its tax rates depend on. Default is
+        ORDER_TYPE_STANDARD.
         """
         self.order_list = order_list
+        self.order_totals = OrderTotals(order_list, order_type=order_type)
         self.tree_view = None
         self.total_row_reference = None
         self.confirm_func = confirm_func
@@ -1690,7 +1726,8 @@ class CheckoutConfirmationDialog(ConfirmationDialog):
             if not path == self.total_row_reference.get_path() and not menu_item.is_locked():
                 model.remove(itr)
                 self.order_list.pop(index)
-                self._update_check_total(-1 * menu_item.get_price())
+                self.order_totals.remove(menu_item)
+                self._update_check_total()
 
     def add_new_menu_item(self, menu_item):
         """Adds the given MenuItem object to
@@ -1703,6 +1740,7 @@ class CheckoutConfirmationDialog(ConfirmationDialog):
         @return: None
         """
         self.order_list.append(menu_item)
+        self.order_totals.add(menu_item)
 
         name = menu_item.get_name()
         price = menu_item.get_price()
@@ -1753,7 +1791,7 @@ class CheckoutConfirmationDialog(ConfirmationDialog):
         @return: None
         """
         model = self.tree_view.get_model()
-        total = CheckOperations.get_order_subtotal(self.order_list)
+        total = self.order_totals.get_subtotal()
         
         path = self.total_row_reference.get_path()
         itr = model.get_iter(path)
@@ -1763,13 +1801,11 @@ class CheckoutConfirmationDialog(ConfirmationDialog):
         if added_itr != None:
             model.swap(added_itr, itr)
 
-    def _update_check_total(self, price):
+    def _update_check_total(self):
         """Private Method.
 
-        Updates the total associated with the check.
-
-        @param price: float value to be added to the
-        total of the given check.
+        Updates the displayed total associated with
+        the check to the subtotal of the order_totals.
 
         @return: Gtk.TreeIter pointing to the location
         of the total.
@@ -1778,10 +1814,9 @@ class CheckoutConfirmationDialog(ConfirmationDialog):
         path = self.total_row_reference.get_path()
         itr = model.get_iter(path)
 
-        previous_total = float(model[itr][1])
-        value = previous_total + price
+        value = self.order_totals.get_subtotal()
 
-        if int(value * 100) <= 0:
+        if value <= 0:
             value = 0.0
 
         model[itr][1] = str(value)
@@ -1832,6 +1867,7 @@ class CheckoutConfirmationDialog(ConfirmationDialog):
         @return: None
         """
         self.order_list = order_list
+        self.order_totals.reset(order_list)
 
         if not model:
             model = self.tree_view.get_model()
@@ -1853,7 +1889,7 @@ class CheckoutConfirmationDialog(ConfirmationDialog):
                     model.append(location, data)
 
         itr = model.append(None, ('Sub-Total',
-                            str(CheckOperations.get_order_subtotal(order_list)), False))
+                            str(self.order_totals.get_subtotal()), False))
         self.total_row_reference = Gtk.TreeRowReference.new(model, model.get_path(itr))
 
     def select_all(self, *args):
@@ -2176,12 +2212,28 @@ class UndoCheckoutSelectionDialog(SelectionDialog):
     access previously checked out orders and return them to the
     main GUI for user interactions.
 
+    The checked out orders are listed a page at a time for a
+    single day from the checkout history, which doesn't decode
+    the orders. An order is decoded when it is first selected.
+
+    Orders that have been moved into the orders database are
+    listed so that they may be browsed, but only orders that
+    are still stored as checkout files may be undone.
+
     @group SelectionDialog: This class is a subclass member of the
     SelectionDialog group. As such it inherits functionality
     from the SelectionDialog super class. Any changes in the
     SelectionDialog class could effect the functionality
     of this class.
 
+    @var checkout_history: CheckoutHistory object that lists
+    the checked out orders and decodes them.
+
+    @var set_date: date object representing the day whose
+    checked out orders are listed.
+
+    @var page: int representing the listed page of the day.
+
     @var name_entry: Gtk.Entry object that allows for entry of
     a name to be displayed when the checked out order is undone.
 
@@ -2194,10 +2246,12 @@ class UndoCheckoutSelectionDialog(SelectionDialog):
     @var imported_view: Gtk.TreeView object that displays the imported
     orders that will be passed back to the UI for user interaction.
 
+    @var page_label: Gtk.Label that displays the listed day and page.
+
     @var confirm_func: Function that will be called upon confirmation.
     """
 
-    def __init__(self, parent, checkout_information, confirm_func,
+    def __init__(self, parent, checkout_history, confirm_func,
                  title='Undo Checkout Dialog Window'):
         """Initializes a new UndoCheckoutDialog window that allows
         the user to retrieve previously checked out orders.
@@ -2207,23 +2261,28 @@ class UndoCheckoutSelectionDialog(SelectionDialog):
         interacted with until this dialog window is confirmed or
         canceled.
 
-        @param checkout_information: dict where each key is a str
-        representing an order previously checked out, and each
-        value is a list of MenuItem objects that is associated
-        with the order that was checked out.
+        @param checkout_history: CheckoutHistory object that lists
+        the orders that were previously checked out and decodes
+        each order as it is selected.
 
         @param confirm_func: function that is to be called upon
         confirmation of this dialog window.
 
         @param title: str representing the
         """
-        self.checkout_information = checkout_information
+        self.checkout_history = checkout_history
+        self.set_date = datetime.now().date()
+        self.page = 0
+
+        self._entries = {}
+        self._loaded_orders = {}
         self._prev_imports = {}
         self.orders = Orders(num_of_tables=0)
 
         self.name_entry = None
         self.orders_view = None
         self.imported_view = None
+        self.page_label = None
 
         self.update_label = None
 
@@ -2251,12 +2310,16 @@ class UndoCheckoutSelectionDialog(SelectionDialog):
 
         scrolled_window.add(self.orders_view)
         main_box.pack_start(scrolled_window, True, True, 5.0)
+        main_box.pack_start(self._generate_page_area(), False, False, 5.0)
 
         frame.add(main_box)
+
+        self._load_page()
         return frame
 
     def _generate_orders_view(self, cols=('Order Name:',
-                                          'Original Checkout Date/Time')):
+                                          'Original Checkout Date/Time',
+                                          'Total')):
         """ Private Method.
 
         Generates the orders view column to be
@@ -2293,24 +2356,176 @@ class UndoCheckoutSelectionDialog(SelectionDialog):
         """ Private method.
 
         Generates the orders view model that will store the
-        data for displaying. Populates the model with the
-        data from the checkout information.
+        data for displaying. The model is populated a page
+        at a time by _load_page.
 
         @return: Gtk.TreeModel that represents the model
-        that will be displaying the data.
+        that will be displaying the data. Each row stores
+        the name, time and total of the order, and the id
+        of its CheckoutEntry.
+        """
+        return Gtk.ListStore(str, str, str, str)
+
+    def _generate_page_area(self):
+        """Private Method.
+
+        Generates the area that changes the listed
+        day and page.
+
+        @return: Gtk.Container holding the widgets
+        that change the listed day and page.
+        """
+        sub_box = Gtk.HBox()
+
+        for label, callback in (('<< Day', self._previous_day),
+                                ('< Page', self._previous_page)):
+            button = Gtk.Button(label)
+            button.connect('clicked', callback)
+            sub_box.pack_start(button, False, False, 5.0)
+
+        self.page_label = Gtk.Label()
+        sub_box.pack_start(self.page_label, True, True, 5.0)
+
+        for label, callback in (('Page >', self._next_page),
+                                ('Day >>', self._next_day)):
+            button = Gtk.Button(label)
+            button.connect('clicked', callback)
+            sub_box.pack_start(button, False, False, 5.0)
+
+        return sub_box
+
+    def _get_num_of_pages(self):
+        """Private Method.
+
+        Gets the number of pages of the
+        listed day.
+
+        @return: int
+        """
+        num_of_orders = self.checkout_history.count_day(self.set_date)
+        page_size = self.checkout_history.DEFAULT_PAGE_SIZE
+        return max(1, int(math.ceil(num_of_orders / float(page_size))))
+
+    def _load_page(self):
+        """Private Method.
+
+        Lists the checked out orders of the
+        current page. Orders that have been
+        imported aren't listed.
+
+        @return: None
+        """
+        model = self.orders_view.get_model()
+        model.clear()
+
+        imported = set(self._prev_imports.itervalues())
+
+        for entry in self.checkout_history.get_page(self.page, self.set_date):
+            entry_id = entry.get_id()
+            self._entries[entry_id] = entry
+
+            if entry_id not in imported:
+                name = entry.name
+
+                if entry.is_stored():
+                    name += STORED_CHECKOUT_SUFFIX
+
+                model.append((name, entry.checkout_time.ctime(),
+                              '{:.2f}'.format(entry.total), entry_id))
+
+        self.page_label.set_text('{}    Page {} of {}'.format(
+            self.set_date.strftime('%a %b %d %Y'), self.page + 1,
+            self._get_num_of_pages()))
+
+    def _previous_page(self, *args):
+        """Private Method.
+
+        Lists the previous page of the day.
+
+        @param args: wildcard catchall used to
+        catch the Gtk.Widget that called this method.
+
+        @return: None
+        """
+        if self.page > 0:
+            self.page -= 1
+            self._load_page()
+
+    def _next_page(self, *args):
+        """Private Method.
+
+        Lists the next page of the day.
+
+        @param args: wildcard catchall used to
+        catch the Gtk.Widget that called this method.
+
+        @return: None
+        """
+        if self.page + 1 < self._get_num_of_pages():
+            self.page += 1
+            self._load_page()
+
+    def _previous_day(self, *args):
+        """Private Method.
+
+        Lists the most recent day before the
+        listed day that has checked out orders.
+
+        @param args: wildcard catchall used to
+        catch the Gtk.Widget that called this method.
+
+        @return: None
+        """
+        set_date = self.checkout_history.get_previous_day(self.set_date)
+
+        if set_date is not None:
+            self.set_date = set_date
+            self.page = 0
+            self._load_page()
+
+    def _next_day(self, *args):
+        """Private Method.
+
+        Lists the earliest day after the listed
+        day that has checked out orders.
+
+        @param args: wildcard catchall used to
+        catch the Gtk.Widget that called this method.
+
+        @return: None
         """
-        orders_model = Gtk.ListStore(str, str)
+        set_date = self.checkout_history.get_next_day(self.set_date)
 
-        for order_name, order_time in self.checkout_information:
-            orders_model.append((order_name, order_time.ctime()))
+        if set_date is not None:
+            self.set_date = set_date
+            self.page = 0
+            self._load_page()
+
+    def _get_order(self, entry):
+        """Private Method.
 
-        return orders_model
+        Gets the order of the given entry, which
+        is decoded the first time it is needed.
+
+        @param entry: CheckoutEntry object.
+
+        @return: list of MenuItem objects that
+        represents the order.
+        """
+        try:
+            return self._loaded_orders[entry]
+
+        except KeyError:
+            order = self.checkout_history.get_order(entry)
+            self._loaded_orders[entry] = order
+            return order
 
     def _orders_selection_function(self, selection, model, path, is_selected,
                                    user_data):
         """ Private Method.
 
         Method called when an order has been selected.
+        The order is decoded and displayed.
 
         @param selection: Gtk.TreeSelection that represents
         the selection that called this method.
@@ -2332,9 +2547,11 @@ class UndoCheckoutSelectionDialog(SelectionDialog):
         be accepted. True if ok, False if not.
         """
         itr = model.get_iter(path)
+        entry = self._entries[model[itr][3]]
+        key = entry.name, '', entry.checkout_time
 
-        name, time_str = model[itr]
-        key = name, '', datetime.strptime(time_str, CTIME_STR)
+        if key not in self.orders.to_go_dict:
+            self.orders.load_new_order(key, self._get_order(entry))
 
         self.orders.select_togo_order(key)
         return True
@@ -2381,11 +2598,10 @@ class UndoCheckoutSelectionDialog(SelectionDialog):
         Generates the item displays area. This
         utilizes the previously generated self.orders.
 
-        Populates the orders with every key from
-        checkout information that was available. Each
-        key is stored in the orders as a togo order with
+        Orders are added to self.orders as they are
+        selected. Each is stored as a togo order with
         the key of (str, '', datetime) representing the
-        items name, a blank string and then finally the
+        orders name, a blank string and then finally the
         time represented as a datetime object.
 
         @return: Gtk.Container that holds the display
@@ -2397,13 +2613,6 @@ class UndoCheckoutSelectionDialog(SelectionDialog):
 
         main_box.pack_start(scrolled_window, True, True, 5.0)
 
-
-        for order_name, order_time in self.checkout_information:
-            data = self.checkout_information[order_name, order_time]
-            key = (order_name, '', order_time)
-
-            self.orders.load_new_order(key, data)
-
         return main_box
 
     def _generate_import_area(self):
@@ -2478,24 +2687,21 @@ class UndoCheckoutSelectionDialog(SelectionDialog):
         Generates the imported view model that is used
         to store the data to be displayed that represents
         the checkout orders name, the name it will be imported
-        as and the time that is associated with it.
-
-        @param types: tuple representing the data types the
-        model should display. By default is (str, str, float)
-        that represents the original name, the new name and
-        the number of seconds since the epoch when it was
-        ordered.
+        as, the time that is associated with it and the id of
+        its CheckoutEntry.
 
         @return: Gtk.TreeModel that stores the data to be
         displayed in the imported view.
         """
-        tree_model = Gtk.ListStore(str, str, str)
+        tree_model = Gtk.ListStore(str, str, str, str)
         return tree_model
 
     def _add_import_data(self, *args):
         """ Adds the currently selected import from the
         orders view to the imported view under the
-        name specified by the name entry.
+        name specified by the name entry. Orders that
+        have been moved into the orders database are
+        not imported.
 
         @param args: wildcard catchall used to
         catch the Gtk.Widget that called this method.
@@ -2505,21 +2711,25 @@ class UndoCheckoutSelectionDialog(SelectionDialog):
         selection = self.orders_view.get_selection()
         view, itr = selection.get_selected()
 
+        if itr and self._entries[view[itr][3]].is_stored():
+            return
+
         name = self.name_entry.get_text().strip()
         self.name_entry.set_text('')
 
         if itr and name and name not in self._prev_imports:
-            order_name, order_time_str = view[itr]
+            order_name, order_time_str, _, entry_id = view[itr]
             imported_model = self.imported_view.get_model()
-            imported_model.append((order_name, name, order_time_str))
+            imported_model.append((order_name, name, order_time_str, entry_id))
 
-            self._prev_imports[name] = order_name, order_time_str
+            self._prev_imports[name] = entry_id
 
             view.remove(itr)
 
     def _remove_import_data(self, *args):
         """Removes the currently selected import
-        from the imported list.
+        from the imported list. The import is listed
+        again if it is on the current page.
 
         @param args: wildcard catchall that catches
         the Gtk.Widget that called this method.
@@ -2533,12 +2743,8 @@ class UndoCheckoutSelectionDialog(SelectionDialog):
             name = view[itr][1]
             view.remove(itr)
 
-            self._update_order(self._prev_imports[name])
             self._clear_prev_import(name)
-
-    def _update_order(self, data):
-        model = self.orders_view.get_model()
-        model.append(data)
+            self._load_page()
 
     def _clear_prev_import(self, name):
         del self._prev_imports[name]
@@ -2547,7 +2753,8 @@ class UndoCheckoutSelectionDialog(SelectionDialog):
         """Override Method.
 
         Confirms the selected data and sends
-        it to the confirm function.
+        it to the confirm function. Only the
+        imported orders are decoded.
 
         @param args: wildcard catchall that
         represents the Gtk.Widget that called
@@ -2558,9 +2765,9 @@ class UndoCheckoutSelectionDialog(SelectionDialog):
         imported_data = {}
         undone_checkout_keys = []
 
-        for order_name, name, order_time_str in self.imported_view.get_model():
-            order_time = datetime.strptime(order_time_str, CTIME_STR)
-            order_data = self.checkout_information[order_name, order_time]
+        for _, name, _, entry_id in self.imported_view.get_model():
+            entry = self._entries[entry_id]
+            order_data = self._get_order(entry)
 
             # Normalize the datetime now allow for accuracy between stored
             # datetimes.
@@ -2568,7 +2775,7 @@ class UndoCheckoutSelectionDialog(SelectionDialog):
 
             imported_data[name, UNDONE_CHECKOUT_SEPARATOR, curr_time] = order_data
 
-            undone_checkout_keys.append((order_name, order_time, name))
+            undone_checkout_keys.append((entry, name))
 
         self.confirm_func(imported_data, undone_checkout_keys)
 
@@ -3353,6 +3560,7 @@ class UpdateMenuItemsDialog(SelectionDialog):
             model[itr][0] = name
 
             menu_item._price = price
+            menu_item.invalidate_price()
             model[itr][1] = price
 
             menu_item.stars = stars
@@ -4328,15 +4536,23 @@ class SplitCheckConfirmationDialog(CheckoutConfirmationDialog):
     @var check_dict: dict representing the checks as keys and lists
     of MenuItems that are stored in the checks.
 
+    @var check_totals: dict representing the checks as keys and the
+    OrderTotals objects that maintain the totals of the checks.
+
     @var checks_view: Gtk.TreeView associated with the checks to be
     displayed.
 
-    @var _original_order_list: list of MenuItem objects that represents
-    the pre-edited/copied order_list
+    @var snapshot: OrderSnapshot of the order being split. The
+    MenuItems of the order are shared rather than copied, only
+    the shares of split MenuItems are new MenuItems.
+
+    @var _split_keys: dict of str item ids of the shares of split
+    MenuItems mapped to the item id of the MenuItem they were split
+    from. Shares with the same key are merged when pulled back.
     """
 
     def __init__(self, parent, confirm_func, order_list, dialog=None,
-                 title='Split Check'):
+                 title='Split Check', order_type=ORDER_TYPE_STANDARD):
         """Initializes the SplitCheckConfirmationDialog.
 
 
@@ -4355,21 +4571,24 @@ class SplitCheckConfirmationDialog(CheckoutConfirmationDialog):
         @keyword title: str representing the title to be displayed
         on the dialog window
 
+        @keyword order_type: str representing the type of the
+        order, which the tax rates of each check depend on.
+        Default is ORDER_TYPE_STANDARD.
+
         @return: None
         """
         self.check_dict = {}
-        self._original_order_list = order_list
-        order_copy = []
-        for menu_item in order_list:
-            menu_item = copy(menu_item)
-            menu_item._hash = hash(menu_item)
-            order_copy.append(menu_item)
+        self.check_totals = {}
+        self.snapshot = OrderSnapshot(order_list)
+        self._split_keys = {}
 
         self.checks_view = None
         self.confirm_func = confirm_func
 
-        super(SplitCheckConfirmationDialog, self).__init__(parent, confirm_func, order_copy,
-                                                           dialog=dialog, title=title)
+        super(SplitCheckConfirmationDialog, self).__init__(parent, confirm_func,
+                                                           self.snapshot.get_items(),
+                                                           dialog=dialog, title=title,
+                                                           order_type=order_type)
         
         self.dialog.set_default_size(1100, 700)
         self.set_selection_type(Gtk.SelectionMode.MULTIPLE)
@@ -4617,6 +4836,8 @@ class SplitCheckConfirmationDialog(CheckoutConfirmationDialog):
             counter = counter + 1
         
         self.check_dict[key] = []
+        order_type = self.order_totals.order_type
+        self.check_totals[key] = OrderTotals(order_type=order_type)
         itr = model.append(None, (key, '0.0'))
 
     def remove_selected_check(self, *args):
@@ -4643,6 +4864,7 @@ class SplitCheckConfirmationDialog(CheckoutConfirmationDialog):
             key = model[itr][0]
             model.remove(itr)
             del self.check_dict[key]
+            del self.check_totals[key]
 
     def select_all(self, *args):
         """ Override Method.
@@ -4681,8 +4903,6 @@ class SplitCheckConfirmationDialog(CheckoutConfirmationDialog):
 
             denominator = len(check_paths)
 
-            items_subtracted_total = 0.0
-
             for item_ref in item_refs:
                 item_path = item_ref.get_path()
                 item_itr = item_model.get_iter(item_path)
@@ -4692,13 +4912,18 @@ class SplitCheckConfirmationDialog(CheckoutConfirmationDialog):
 
                 item_model.remove(item_itr)
                 menu_item = self.order_list.pop(index)
-                items_subtracted_total = items_subtracted_total + menu_item.get_price()
+                self.order_totals.remove(menu_item)
                 cost = math.ceil(menu_item.get_price() * 100 / denominator) / 100
                 name = menu_item.get_name()
+                split_key = self._get_split_key(menu_item)
 
                 for check_path in check_paths:
-                    new_menu_item = deepcopy(menu_item)
-                    new_menu_item.edit_price(cost)
+                    new_menu_item = menu_item
+
+                    if denominator > 1:
+                        new_menu_item = copy(menu_item)
+                        new_menu_item.edit_price(cost)
+                        self._split_keys[new_menu_item.get_item_id()] = split_key
 
                     check_itr = check_model.get_iter(check_path)
                     check_itr = ensure_top_level_item(check_model, check_itr)
@@ -4707,17 +4932,17 @@ class SplitCheckConfirmationDialog(CheckoutConfirmationDialog):
 
                     check_order = self.check_dict[key]
                     check_order.append(new_menu_item)
+                    self.check_totals[key].add(new_menu_item)
                     check_model.append(check_itr, (name, str(new_menu_item.get_price())))
 
-                    self._update_check_total(check_model, check_itr, new_menu_item.get_price())
+                    self._update_check_total(check_model, check_itr)
 
-            super(SplitCheckConfirmationDialog, self)._update_check_total(-1 * items_subtracted_total)
+            super(SplitCheckConfirmationDialog, self)._update_check_total()
 
-    def _update_check_total(self, model, itr, price):
-        """Updates the total associated with
-        the selected check information passed in.
-        The total is then modified by adding the price
-        to the total.
+    def _update_check_total(self, model, itr):
+        """Updates the displayed total associated
+        with the selected check information passed
+        in to the subtotal of its OrderTotals.
 
         @param model: Gtk.TreeModel that stores the
         selected check's information.
@@ -4725,16 +4950,11 @@ class SplitCheckConfirmationDialog(CheckoutConfirmationDialog):
         @param itr: Gtk.TreeIter that points to the
         selected check.
 
-        @param price: float value that will be added
-        to the total of the check, pointed to by the
-        itr parameter. This value should be negative if
-        it is to be subtracted.
-
         @return: Gtk.TreeIter pointing to the updated
         check.
         """
-        total = float(model[itr][1])
-        model[itr][1] = str(total + price)
+        key = model[itr][0]
+        model[itr][1] = str(self.check_totals[key].get_subtotal())
         return itr
 
     def pull_items(self, *args):
@@ -4776,6 +4996,7 @@ class SplitCheckConfirmationDialog(CheckoutConfirmationDialog):
                     check_model.insert_after(None, itr, (key, '0.0'))
                     check_model.remove(itr)
                     self.check_dict[key] = []
+                    self.check_totals[key].reset()
 
                 # If a single menu item is selected
                 elif check_model.iter_parent(itr):
@@ -4786,32 +5007,46 @@ class SplitCheckConfirmationDialog(CheckoutConfirmationDialog):
 
                     current_check = self.check_dict[key]
                     curr_menu_item = current_check.pop(index)
+                    self.check_totals[key].remove(curr_menu_item)
 
                     menu_items.append(curr_menu_item)
                     check_model.remove(itr)
 
-                    price = curr_menu_item.get_price()
-
-                    self._update_check_total(check_model, parent_itr, -1*price)
+                    self._update_check_total(check_model, parent_itr)
 
             menu_items = self._sort_and_merge_items(menu_items)
 
             self.update_items(menu_items)
 
+    def _get_split_key(self, menu_item):
+        """Private Method.
+
+        Gets the key of the given MenuItem, which
+        is shared by all of the shares of a split
+        MenuItem.
+
+        @param menu_item: MenuItem object.
+
+        @return: str representing the item id of
+        the MenuItem the given MenuItem was split
+        from, or its own item id if it wasn't split.
+        """
+        item_id = menu_item.get_item_id()
+        return self._split_keys.get(item_id, item_id)
+
     def _sort_and_merge_items(self, curr_list):
         """ Private Method.
 
         Sorts a list of MenuItem objects by their
-        stored hash values.
+        split keys.
 
-        @param curr_list: list of MenuItem objects that
-        all contain values for MenuItem._hash
+        @param curr_list: list of MenuItem objects.
 
         @return: list of MenuItem objects that have been
-        sorted according to their MenuItem._hash values.
-        If two items shared the same MenuItem._hash value
-        then they are combined. Increasing the price of
-        that MenuItem by adding the two prices together.
+        sorted according to their split keys. If two items
+        shared the same split key then they are combined.
+        Increasing the price of that MenuItem by adding the
+        two prices together.
         """
         if len(curr_list) < 2:
             return curr_list
@@ -4860,14 +5095,17 @@ class SplitCheckConfirmationDialog(CheckoutConfirmationDialog):
                 first_item = list_one[first_index]
                 second_item = list_two[second_index]
 
-                if first_item._hash == second_item._hash:
+                first_key = self._get_split_key(first_item)
+                second_key = self._get_split_key(second_item)
+
+                if first_key == second_key:
                     first_item.edit_price(first_item.get_price() + second_item.get_price())
                     result.append(first_item)
                     first_index += 1
                     second_index += 1
                 else:
 
-                    if first_item._hash < second_item._hash:
+                    if first_key < second_key:
                         result.append(first_item)
                         first_index += 1
                     else:
@@ -4975,6 +5213,8 @@ class CompItemsOrderConfirmationDialog(OrderConfirmationDialog):
     @var message_entry: Gtk.TextView that represents the area
     that users enter messages to to added to comped items.
 
+    @var snapshot: OrderSnapshot of the order. Only the MenuItems
+    whose comp status is changed are cloned on confirmation.
     """
 
     def __init__(self, parent, confirm_func, order_list, dialog=None,
@@ -4999,8 +5239,10 @@ class CompItemsOrderConfirmationDialog(OrderConfirmationDialog):
         Default = 'Comp Dialog Window'
         """
         self.message_entry = None
+        self.snapshot = OrderSnapshot(order_list)
         super(CompItemsOrderConfirmationDialog, self).__init__(parent, confirm_func,
-                                                               order_list, title=title)
+                                                               self.snapshot.get_items(),
+                                                               title=title)
 
     def generate_misc_widgets(self):
         """Override Method.
@@ -5174,7 +5416,11 @@ class CompItemsOrderConfirmationDialog(OrderConfirmationDialog):
     def confirm_data(self):
         """Override Method.
 
-        Confirms the comped menu items
+        Confirms the comped menu items. The
+        confirm function is called with the
+        MenuItems whose comp status changed,
+        which are edited clones of those in
+        the order.
 
         @return: None
         """
@@ -5191,15 +5437,21 @@ class CompItemsOrderConfirmationDialog(OrderConfirmationDialog):
             if is_comp:
                 row_child = child_itr.next()
                 message = row_child[0]
-                menu_item.comp(True, message)
-                self.order_list[index] = menu_item
+
+                if not menu_item.is_comped() or \
+                        menu_item.get_comp_message() != message:
+                    menu_item = self.snapshot.edit(menu_item)
+                    menu_item.comp(True, message)
+                    self.order_list[index] = menu_item
 
             elif menu_item.is_comped():
+                menu_item = self.snapshot.edit(menu_item)
                 menu_item.comp(False, '')
+                self.order_list[index] = menu_item
 
             index += 1
 
-        self.confirm_func(self.order_list)
+        self.confirm_func(self.snapshot.get_edited())
 
 
 class DiscountCheckoutConfirmationDialog(CheckoutConfirmationDialog):
@@ -5229,7 +5481,8 @@ class DiscountCheckoutConfirmationDialog(CheckoutConfirmationDialog):
     """
 
     def __init__(self, parent, confirm_func, order_list, discount_templates,
-                 dialog=None,title='Add Discount Dialog Window'):
+                 dialog=None,title='Add Discount Dialog Window',
+                 order_type=ORDER_TYPE_STANDARD):
         """ Initializes a new DiscountCheckoutConfirmationDialog window.
 
         @param parent: Gtk.Object that will be used as the parent of this
@@ -5249,6 +5502,9 @@ class DiscountCheckoutConfirmationDialog(CheckoutConfirmationDialog):
 
         @param title: str representing the title to be displayed by the
         dialog window.
+
+        @keyword order_type: str representing the type of the order,
+        which its tax rates depend on. Default is ORDER_TYPE_STANDARD.
         """
         self.discount_templates = discount_templates
         self.discount_button_group = None
@@ -5256,7 +5512,8 @@ class DiscountCheckoutConfirmationDialog(CheckoutConfirmationDialog):
         self.message_entry = None
         self.discount_view = None
         super(DiscountCheckoutConfirmationDialog, self).__init__(parent, confirm_func,
-                                                                 order_list, title=title)
+                                                                 order_list, title=title,
+                                                                 order_type=order_type)
 
     def generate_layout(self):
         """Override Method.
@@ -5505,7 +5762,7 @@ class DiscountCheckoutConfirmationDialog(CheckoutConfirmationDialog):
             data, is_percentage = self.parse_discount_data()
 
             if is_percentage:
-                price = round(CheckOperations.get_order_subtotal(self.order_list) * data / 100, 2)
+                price = round(self.order_totals.get_subtotal() * data / 100, 2)
 
                 name += str(data) + '%'
             else:
@@ -6209,6 +6466,76 @@ class UpdateGeneralOptionSelectionDialog(GeneralOptionSelectionDialog):
         self.confirm_func(self.option_data)
 
 
+class LatencyMetricsDialog(ConfirmationDialog):
+    """LatencyMetricsDialog displays a dialog window
+    that shows the recorded latencies of each timed
+    operation.
+
+    @group Dialog: subclass member of the Dialog window,
+    extends all of its functionality, overriding some.
+
+    @group ConfirmationDialog: subclass member of the
+    ConfirmationDialog window, extends or overrides
+    all/some of its functionality.
+
+    @var metrics: dict of str keys representing the
+    operation mapped to the dict summary of its latencies.
+    """
+
+    SUMMARY_KEYS = ('count', 'p50', 'p95', 'p99', 'mean', 'max')
+
+    def __init__(self, parent, metrics, dialog=None,
+                 title='Latency Metrics'):
+        """Initializes the LatencyMetricsDialog window.
+
+        @param parent: Object representing the parent that this
+        dialog window was called on. Expected Gtk.Window
+
+        @param metrics: dict of str keys representing the
+        operation mapped to the dict summary of its latencies,
+        as given by the Metrics module.
+        """
+        self.metrics = metrics
+        super(LatencyMetricsDialog, self).__init__(parent, title, dialog,
+                                                   default_size=(700, 400))
+
+    def generate_columns(self):
+        """Generates the columns for the
+        LatencyMetricsDialog.
+
+        @return: list of Gtk.TreeViewColumn
+        """
+        column_list = []
+        titles = ('Operation', 'Count', 'p50 (ms)', 'p95 (ms)', 'p99 (ms)',
+                  'Mean (ms)', 'Max (ms)')
+
+        for index, title in enumerate(titles):
+            renderer = Gtk.CellRendererText()
+            column = Gtk.TreeViewColumn(title, renderer, text=index)
+            column_list.append(column)
+
+        return column_list
+
+    def generate_model(self):
+        """Generates the model that stores
+        the latencies of each operation.
+
+        @return: Gtk.ListStore
+        """
+        model = Gtk.ListStore(str, str, str, str, str, str, str)
+
+        for name in sorted(self.metrics):
+            summary = self.metrics[name]
+            row = [name, str(summary['count'])]
+
+            for key in self.SUMMARY_KEYS[1:]:
+                row.append('{:.1f}'.format(summary[key]))
+
+            model.append(row)
+
+        return model
+
+
 #===========================================================
 # This block represents module wide functions that are
 # utilized in classes throughout this module to perform
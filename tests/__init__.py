@@ -0,0 +1,5 @@
+"""
+@author: Carl McGraw
+@contact: cjmcgraw@u.washington.edu
+@version: 1.0
+"""
\ No newline at end of file
@@ -0,0 +1,107 @@
+"""This module tests the atomic writes and the
+batched directory syncs of the AtomicWriter
+module. Run from the root of the repository
+with:
+
+    python -m unittest discover -s tests -t .
+
+@author: Carl McGraw
+@contact: cjmcgraw@u.washington.edu
+@version: 1.0
+"""
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from peonordersystem.src.AtomicWriter import atomic_write, DirectorySyncer
+
+NUM_OF_WRITERS = 8
+
+WRITES_PER_WRITER = 10
+
+
+class AtomicWriteTest(unittest.TestCase):
+    """Tests that atomic writes replace the
+    file and leave no temporary files.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.directory, 'order')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_write_replaces_file(self):
+        for group_commit in (True, False):
+            atomic_write(self.file_path, 'first', group_commit=group_commit)
+            atomic_write(self.file_path, 'second', group_commit=group_commit)
+
+            with open(self.file_path) as order_file:
+                self.assertEqual(order_file.read(), 'second')
+
+            self.assertEqual(os.listdir(self.directory), ['order'])
+
+    def test_concurrent_writes(self):
+
+        def write(writer):
+            for number in xrange(WRITES_PER_WRITER):
+                atomic_write(self.file_path + str(writer), str(number))
+
+        threads = [threading.Thread(target=write, args=(writer,))
+                   for writer in xrange(NUM_OF_WRITERS)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        for writer in xrange(NUM_OF_WRITERS):
+            with open(self.file_path + str(writer)) as order_file:
+                self.assertEqual(order_file.read(), str(WRITES_PER_WRITER - 1))
+
+
+class DirectorySyncerTest(unittest.TestCase):
+    """Tests that each sync request returns once
+    the batch covering it has been synced.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.syncer = DirectorySyncer()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_request_returns_after_its_batch_is_synced(self):
+        synced = []
+
+        def request():
+            for _ in xrange(WRITES_PER_WRITER):
+                batch = self.syncer._batch
+                self.syncer.request_sync(self.directory)
+                synced.append(self.syncer._synced_batch >= batch)
+
+        threads = [threading.Thread(target=request)
+                   for _ in xrange(NUM_OF_WRITERS)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(synced, [True] * NUM_OF_WRITERS * WRITES_PER_WRITER)
+        self.assertFalse(self.syncer._pending)
+        self.assertFalse(self.syncer._is_syncing)
+
+    def test_flush_without_requests(self):
+        self.syncer.flush()
+        self.assertEqual(self.syncer._synced_batch, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,252 @@
+"""This module tests the integer cents
+functions of CheckOperations against the
+float arithmetic they replaced.
+
+Each test generates random orders from a
+seeded random number generator, so that a
+failure is repeatable. Run from the root of
+the repository with:
+
+    python -m unittest discover -s tests -t .
+
+@author: Carl McGraw
+@contact: cjmcgraw@u.washington.edu
+@version: 1.0
+"""
+import math
+import random
+import unittest
+from fractions import Fraction
+
+from peonordersystem.src import CheckOperations
+from peonordersystem.src.CheckOperations import to_cents, from_cents
+from peonordersystem.src.MenuItem import MenuItem, OptionItem
+from peonordersystem.src.Settings import SALES_TAX
+
+# number of random orders generated by each test
+NUM_OF_ORDERS = 1000
+
+SEED = 45
+
+
+#====================================================================================
+# This block represents the float arithmetic that the integer cents engine replaced.
+#====================================================================================
+def _float_item_price(menu_item):
+    """Private Function.
+
+    Gets the price of the given MenuItem as
+    the float arithmetic calculated it.
+
+    @param menu_item: MenuItem object.
+
+    @return: float representing the price.
+    """
+    price = menu_item._price
+    for option in menu_item.options:
+        price += option.get_price()
+
+    return menu_item._price_scalar * price
+
+
+def _float_subtotal(order_list):
+    """Private Function.
+
+    Gets the subtotal of the given order as
+    the float arithmetic calculated it.
+
+    @param order_list: list of MenuItem objects.
+
+    @return: float representing the subtotal.
+    """
+    total = 0.0
+
+    for menu_item in order_list:
+        total = total + _float_item_price(menu_item)
+
+    return round(total, 2)
+
+
+def _float_tax(subtotal):
+    """Private Function.
+
+    Gets the tax of the given subtotal as
+    the float arithmetic calculated it.
+
+    @param subtotal: float representing the
+    subtotal.
+
+    @return: float representing the tax.
+    """
+    tax = math.ceil(subtotal * SALES_TAX * 100) / 100
+    return round(tax, 2)
+
+
+#====================================================================================
+# This block represents functions that generate random orders.
+#====================================================================================
+def _random_amount(rng, max_cents=5000):
+    """Private Function.
+
+    Gets a random amount in whole cents.
+
+    @param rng: random.Random object.
+
+    @keyword max_cents: int representing the
+    largest amount in cents. Default is 5000.
+
+    @return: float representing the amount.
+    """
+    return rng.randint(0, max_cents) / 100.0
+
+
+def _random_item(rng, comped=False):
+    """Private Function.
+
+    Gets a random MenuItem with random options.
+
+    @param rng: random.Random object.
+
+    @keyword comped: bool value representing if
+    the item may be comped. Default is False.
+
+    @return: MenuItem object.
+    """
+    menu_item = MenuItem('item', _random_amount(rng))
+    menu_item.options = [OptionItem('option', 'ADD', _random_amount(rng, 300))
+                         for _ in xrange(rng.randint(0, 3))]
+
+    if comped and rng.random() < .25:
+        menu_item.comp(True, 'comped')
+
+    return menu_item
+
+
+def _random_order(rng, comped=False):
+    """Private Function.
+
+    Gets a random order of up to 40 MenuItems.
+
+    @param rng: random.Random object.
+
+    @keyword comped: bool value representing if
+    the items may be comped. Default is False.
+
+    @return: list of MenuItem objects.
+    """
+    return [_random_item(rng, comped=comped) for _ in xrange(rng.randint(0, 40))]
+
+
+#====================================================================================
+# This block represents the tests.
+#====================================================================================
+class CentsConversionTest(unittest.TestCase):
+    """Tests the conversion of amounts to and
+    from integer cents.
+    """
+
+    def test_whole_cents_round_trip(self):
+        rng = random.Random(SEED)
+
+        for _ in xrange(NUM_OF_ORDERS):
+            cents = rng.randint(-10 ** 7, 10 ** 7)
+            self.assertEqual(to_cents(from_cents(cents)), cents)
+
+    def test_half_cents_round_away_from_zero(self):
+        self.assertEqual(to_cents(1.005), 101)
+        self.assertEqual(to_cents(2.675), 268)
+        self.assertEqual(to_cents(-1.005), -101)
+
+
+class OrderTotalsTest(unittest.TestCase):
+    """Tests the totals of random orders against
+    the float arithmetic.
+    """
+
+    def setUp(self):
+        self.rng = random.Random(SEED)
+
+    def test_subtotal_matches_float_subtotal(self):
+        for _ in xrange(NUM_OF_ORDERS):
+            order_list = _random_order(self.rng, comped=True)
+
+            self.assertEqual(CheckOperations.get_order_subtotal(order_list),
+                             _float_subtotal(order_list))
+
+    def test_tax_is_exact_ceiling(self):
+        rate = Fraction(repr(SALES_TAX))
+
+        for _ in xrange(NUM_OF_ORDERS):
+            subtotal = to_cents(_random_amount(self.rng, 10 ** 6))
+            tax = CheckOperations.get_total_tax_cents(subtotal)
+
+            # the smallest number of cents that isn't less than the exact tax
+            self.assertTrue(tax >= subtotal * rate)
+            self.assertTrue(tax - 1 < subtotal * rate)
+
+    def test_tax_never_exceeds_float_tax(self):
+        for _ in xrange(NUM_OF_ORDERS):
+            subtotal = _random_amount(self.rng, 10 ** 6)
+            tax = CheckOperations.get_total_tax(subtotal)
+            float_tax = _float_tax(subtotal)
+
+            # the float ceiling only differs where it overcharged by a cent
+            self.assertTrue(to_cents(float_tax) - to_cents(tax) in (0, 1))
+
+    def test_totals_are_consistent(self):
+        for _ in xrange(NUM_OF_ORDERS):
+            order_list = _random_order(self.rng, comped=True)
+            subtotal, tax, total = CheckOperations.get_totals_cents(order_list)
+
+            self.assertEqual(subtotal,
+                             CheckOperations.get_order_subtotal_cents(order_list))
+            self.assertEqual(tax, CheckOperations.get_total_tax_cents(subtotal))
+            self.assertEqual(total, subtotal + tax)
+            self.assertEqual(CheckOperations.get_total(order_list),
+                             from_cents(total))
+
+
+class PriceCacheTest(unittest.TestCase):
+    """Tests that the cached price of a MenuItem
+    is cleared as the MenuItem is edited.
+    """
+
+    def setUp(self):
+        self.rng = random.Random(SEED)
+
+    def _check_price(self, menu_item):
+        self.assertEqual(menu_item.get_price_cents(),
+                         to_cents(_float_item_price(menu_item)))
+
+    def test_price_follows_edits(self):
+        for _ in xrange(NUM_OF_ORDERS):
+            menu_item = _random_item(self.rng)
+            self._check_price(menu_item)
+
+            menu_item.options = menu_item.options + [OptionItem('option', 'ADD',
+                                                                _random_amount(self.rng,
+                                                                               300))]
+            self._check_price(menu_item)
+
+            menu_item.comp(True, 'comped')
+            self.assertEqual(menu_item.get_price_cents(), 0)
+
+            menu_item.comp(False, None)
+            self._check_price(menu_item)
+
+            if menu_item.get_price_cents():
+                menu_item.edit_price(menu_item.get_price() / 2)
+                self._check_price(menu_item)
+
+    def test_invalidate_price_follows_base_price(self):
+        for _ in xrange(NUM_OF_ORDERS):
+            menu_item = _random_item(self.rng)
+            self._check_price(menu_item)
+
+            menu_item._price = _random_amount(self.rng)
+            menu_item.invalidate_price()
+            self._check_price(menu_item)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+"""This module tests the CheckoutHistory
+against an in memory database, with orders
+both in checkout files and in the OrderData
+table. Run from the root of the repository
+with:
+
+    python -m unittest discover -s tests -t .
+
+@author: Carl McGraw
+@contact: cjmcgraw@u.washington.edu
+@version: 1.0
+"""
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from datetime import date, datetime, timedelta
+
+import jsonpickle
+
+from peonordersystem.src.MenuItem import MenuItem
+from peonordersystem.src.Settings import SQLITE_DATE_TIME_FORMAT_STR
+from peonordersystem.src.confirmationSystem.CheckoutHistory import (CheckoutHistory,
+                                                                    CHECKOUT_FILE_SOURCE,
+                                                                    CHECKOUT_DATABASE_SOURCE)
+
+MONDAY = date(2014, 6, 2)
+WEDNESDAY = date(2014, 6, 4)
+FRIDAY = date(2014, 6, 6)
+
+PAGE_SIZE = 4
+
+
+class CheckoutHistoryTest(unittest.TestCase):
+    """Tests listing the checked out orders
+    of each day.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.database = sqlite3.connect(':memory:')
+        self.database.execute('CREATE TABLE OrderData '
+                              '    (   OrderNumber INT, '
+                              '        OrderDate NUMERIC, '
+                              '        OrderName TEXT, '
+                              '        OrderSubtotal REAL, '
+                              '        OrderTax REAL, '
+                              '        OrderTotal REAL, '
+                              '        OrderData_json TEXT,'
+                              '        PRIMARY KEY (OrderNumber)'
+                              '    );')
+
+        self.history = CheckoutHistory(self.database, self.directory)
+
+        # monday was moved into the database, friday is still in checkout files
+        for number in xrange(6):
+            self._store_order(number, 'stored ' + str(number),
+                              datetime.combine(MONDAY, datetime.min.time()) +
+                              timedelta(hours=number + 10))
+
+        for number in xrange(3):
+            self._save_file('file ' + str(number),
+                            datetime.combine(FRIDAY, datetime.min.time()) +
+                            timedelta(hours=number + 10))
+
+        # a stored order that was checked out on friday before the files
+        self._store_order(6, 'stored 6',
+                          datetime.combine(FRIDAY, datetime.min.time()) +
+                          timedelta(hours=9))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _store_order(self, number, name, checkout_time):
+        order = [MenuItem(name, 10.0)]
+        self.database.execute('INSERT INTO OrderData VALUES '
+                              '(?, datetime(?), ?, ?, ?, ?, ?);',
+                              (number, checkout_time.strftime(SQLITE_DATE_TIME_FORMAT_STR),
+                               name, 10.0, 1.0, 11.0, jsonpickle.encode(order)))
+        self.database.commit()
+
+    def _save_file(self, name, checkout_time):
+        file_name = name.replace(' ', '_') + '.checkout'
+
+        with open(os.path.join(self.directory, file_name), 'w') as checkout_file:
+            checkout_file.write(jsonpickle.encode([MenuItem(name, 5.0)]))
+
+        self.history.add(file_name, name, checkout_time, (5.0, .5, 5.5))
+
+    def test_get_day_lists_most_recent_first(self):
+        entries = self.history.get_day(MONDAY)
+
+        self.assertEqual([entry.name for entry in entries],
+                         ['stored ' + str(number) for number in reversed(xrange(6))])
+        self.assertTrue(all(entry.is_stored() for entry in entries))
+        self.assertEqual(entries[0].key, 5)
+        self.assertEqual(entries[0].total, 11.0)
+
+    def test_get_day_combines_files_and_database(self):
+        entries = self.history.get_day(FRIDAY)
+
+        self.assertEqual([entry.name for entry in entries],
+                         ['file 2', 'file 1', 'file 0', 'stored 6'])
+        self.assertEqual([entry.source for entry in entries],
+                         [CHECKOUT_FILE_SOURCE] * 3 + [CHECKOUT_DATABASE_SOURCE])
+        self.assertEqual(entries[0].key, 'file_2.checkout')
+
+    def test_get_day_without_orders(self):
+        self.assertEqual(self.history.get_day(WEDNESDAY), [])
+        self.assertEqual(self.history.count_day(WEDNESDAY), 0)
+
+    def test_get_page(self):
+        entries = self.history.get_day(MONDAY)
+        pages = [self.history.get_page(page, MONDAY, page_size=PAGE_SIZE)
+                 for page in xrange(3)]
+
+        self.assertEqual(pages[0], entries[:PAGE_SIZE])
+        self.assertEqual(pages[1], entries[PAGE_SIZE:])
+        self.assertEqual(pages[2], [])
+
+    def test_count_day(self):
+        self.assertEqual(self.history.count_day(MONDAY), 6)
+        self.assertEqual(self.history.count_day(FRIDAY), 4)
+
+    def test_previous_and_next_day_skip_empty_days(self):
+        self.assertEqual(self.history.get_previous_day(FRIDAY), MONDAY)
+        self.assertEqual(self.history.get_next_day(MONDAY), FRIDAY)
+        self.assertEqual(self.history.get_next_day(WEDNESDAY), FRIDAY)
+        self.assertEqual(self.history.get_previous_day(WEDNESDAY), MONDAY)
+
+    def test_no_previous_or_next_day(self):
+        self.assertEqual(self.history.get_previous_day(MONDAY), None)
+        self.assertEqual(self.history.get_next_day(FRIDAY), None)
+
+    def test_discarded_file_is_not_listed(self):
+        self.assertTrue(self.history.discard('file_1.checkout'))
+        self.assertFalse(self.history.discard('file_1.checkout'))
+
+        self.assertEqual([entry.name for entry in self.history.get_day(FRIDAY)],
+                         ['file 2', 'file 0', 'stored 6'])
+        self.assertEqual(self.history.get_indexed_files(),
+                         set(['file_0.checkout', 'file_2.checkout']))
+
+    def test_get_order_decodes_entry(self):
+        for entry in self.history.get_day(FRIDAY):
+            order = self.history.get_order(entry)
+            self.assertEqual([menu_item.get_name() for menu_item in order],
+                             [entry.name])
+
+
+if __name__ == '__main__':
+    unittest.main()
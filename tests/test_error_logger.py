@@ -0,0 +1,104 @@
+"""This module tests the logging handlers and
+the logging decorator of the ErrorLogger. Run
+from the root of the repository with:
+
+    python -m unittest discover -s tests -t .
+
+@author: Carl McGraw
+@contact: cjmcgraw@u.washington.edu
+@version: 1.0
+"""
+import logging
+import unittest
+from Queue import Queue
+
+from peonordersystem.src import ErrorLogger
+from peonordersystem.src.ErrorLogger import QueueHandler, QueueListener
+
+
+class RecordingHandler(logging.Handler):
+    """Handler that keeps the messages
+    it writes.
+    """
+
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(self.format(record))
+
+
+class QueueHandlerTest(unittest.TestCase):
+    """Tests that records placed on the queue are
+    written once, with their traceback.
+    """
+
+    def setUp(self):
+        self.queue = Queue()
+        self.handler = QueueHandler(self.queue)
+        self.handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
+
+        self.recorder = RecordingHandler()
+        self.listener = QueueListener(self.queue, self.recorder)
+
+        self.logger = logging.getLogger('peon_test_logger')
+        self.logger.propagate = 0
+        self.logger.addHandler(self.handler)
+
+        self.listener.start()
+
+    def tearDown(self):
+        self.logger.removeHandler(self.handler)
+        self.listener.stop()
+
+    def test_message_is_formatted_before_queued(self):
+        values = ['first']
+        self.logger.error('value %s', values)
+        values.append('second')
+        self.listener.stop()
+
+        self.assertEqual(self.recorder.messages, ["ERROR: value ['first']"])
+
+    def test_traceback_is_written_once(self):
+        try:
+            raise ValueError('failed')
+        except ValueError:
+            self.logger.exception('caught')
+
+        self.listener.stop()
+        message, = self.recorder.messages
+
+        self.assertTrue(message.startswith('ERROR: caught'))
+        self.assertEqual(message.count('Traceback (most recent call last)'), 1)
+        self.assertTrue(message.endswith('ValueError: failed'))
+
+
+class LogFuncDataTest(unittest.TestCase):
+    """Tests that wrapped functions keep their
+    results, errors and names.
+    """
+
+    def test_wrapped_function(self):
+
+        def add(a, b=1):
+            """Adds."""
+            return a + b
+
+        wrapped = ErrorLogger.log_func_data(add)
+
+        self.assertEqual(wrapped(1, b=2), 3)
+        self.assertEqual(wrapped.__name__, 'add')
+        self.assertEqual(wrapped.__doc__, 'Adds.')
+
+    def test_errors_are_raised(self):
+
+        def fail():
+            raise KeyError('missing')
+
+        wrapped = ErrorLogger.log_func_data(fail)
+        self.assertRaises(KeyError, wrapped)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+"""This module tests the ranking of the
+results of the MenuSearchIndex. Run from
+the root of the repository with:
+
+    python -m unittest discover -s tests -t .
+
+@author: Carl McGraw
+@contact: cjmcgraw@u.washington.edu
+@version: 1.0
+"""
+import unittest
+
+from peonordersystem.src.MenuItem import MenuItem
+from peonordersystem.src.interface.builder.parsers.catalogs.MenuSearchIndex import \
+    MenuSearchIndex
+
+MENU_DATA = {'Burgers': ['Burger', 'Cheeseburger', 'Bacon Cheeseburger'],
+             'Starters': ['Cheese Plate', 'Onion Rings'],
+             'Salads': ['Caesar Salad', 'Bacon Salad']}
+
+
+class MenuSearchIndexTest(unittest.TestCase):
+    """Tests that the results are ranked by name
+    prefix, then word prefix, then category and
+    then trigrams, with shorter names first within
+    each rank.
+    """
+
+    def setUp(self):
+        menu_data = dict((category, [MenuItem(name, 1.0) for name in names])
+                         for category, names in MENU_DATA.iteritems())
+        self.index = MenuSearchIndex(menu_data)
+
+    def _search(self, query, **kwargs):
+        return [menu_item.get_name() for menu_item in
+                self.index.search(query, **kwargs)]
+
+    def test_indexes_every_item(self):
+        self.assertEqual(len(self.index), 7)
+
+    def test_name_prefix_ranks_before_word_prefix(self):
+        self.assertEqual(self._search('chee'),
+                         ['Cheese Plate', 'Cheeseburger', 'Bacon Cheeseburger'])
+
+    def test_word_prefix_ranks_before_category(self):
+        self.assertEqual(self._search('sal'),
+                         ['Bacon Salad', 'Caesar Salad'])
+        self.assertEqual(self._search('burg'),
+                         ['Burger', 'Cheeseburger', 'Bacon Cheeseburger'])
+
+    def test_category_matches_items_without_the_word(self):
+        self.assertEqual(self._search('starters'),
+                         ['Onion Rings', 'Cheese Plate'])
+
+    def test_every_query_word_must_match(self):
+        # the remaining results are filled by trigrams
+        self.assertEqual(self._search('cheese bac')[0], 'Bacon Cheeseburger')
+        self.assertEqual(self._search('bacon sal')[0], 'Bacon Salad')
+
+    def test_trigrams_fill_misspelled_queries(self):
+        self.assertEqual(self._search('cheesburger', limit=1), ['Cheeseburger'])
+
+    def test_multi_word_query_with_unknown_word(self):
+        results = self._search('cheese xyz')
+
+        self.assertNotIn('Onion Rings', results)
+        self.assertEqual(len(results), len(set(results)))
+
+    def test_limit_and_empty_query(self):
+        self.assertEqual(len(self._search('b', limit=2)), 2)
+        self.assertEqual(self._search('  '), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
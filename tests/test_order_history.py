@@ -0,0 +1,273 @@
+"""This module tests undoing and redoing the
+edits of an order, and recovering them from
+the order journal.
+
+Run from the root of the repository with:
+
+    python -m unittest discover -s tests -t .
+
+@author: Carl McGraw
+@contact: cjmcgraw@u.washington.edu
+@version: 1.0
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+from peonordersystem.src.MenuItem import MenuItem
+from peonordersystem.src.interface.Orders import Orders, OrderStore
+from peonordersystem.src.interface.OrderHistory import (ChangeItemsCommand,
+                                                        ReplaceItemsCommand,
+                                                        ADD_COMMAND,
+                                                        REMOVE_COMMAND,
+                                                        NOTE_COMMAND,
+                                                        DO_STEP)
+from peonordersystem.src.confirmationSystem.OrderJournal import OrderJournal
+
+ITEM_NAMES = ('burger', 'fries', 'beer', 'salad')
+
+
+def _get_names(order_list):
+    """Private Function.
+
+    Gets the names of the given MenuItems.
+
+    @param order_list: list of MenuItem objects.
+
+    @return: list of str
+    """
+    return [menu_item.get_name() for menu_item in order_list]
+
+
+def _get_ids(order_list):
+    """Private Function.
+
+    Gets the item ids of the given MenuItems.
+
+    @param order_list: list of MenuItem objects.
+
+    @return: list of str
+    """
+    return [menu_item.get_item_id() for menu_item in order_list]
+
+
+class OrderHistoryTest(unittest.TestCase):
+    """Tests undoing and redoing the edits
+    of the current order.
+    """
+
+    def setUp(self):
+        self.orders = Orders(num_of_tables=1)
+        self.orders.set_current_table(self.orders.get_orders_list()[0])
+
+        for name in ITEM_NAMES:
+            self.orders.add(MenuItem(name, 5.0))
+
+    def test_undo_and_redo_adds(self):
+        for index in reversed(xrange(len(ITEM_NAMES))):
+            self.orders.undo()
+            self.assertEqual(_get_names(self.orders.get_current_order()),
+                             list(ITEM_NAMES[:index]))
+
+        self.assertFalse(self.orders.can_undo())
+        self.assertEqual(self.orders.undo(), None)
+
+        for index in xrange(len(ITEM_NAMES)):
+            self.orders.redo()
+            self.assertEqual(_get_names(self.orders.get_current_order()),
+                             list(ITEM_NAMES[:index + 1]))
+
+        self.assertFalse(self.orders.can_redo())
+
+    def test_undo_keeps_totals(self):
+        self.orders.undo()
+        self.assertEqual(self.orders.get_current_totals().get_subtotal(), 15.0)
+
+        self.orders.redo()
+        self.assertEqual(self.orders.get_current_totals().get_subtotal(), 20.0)
+
+    def test_undo_and_redo_edit(self):
+        original = self.orders.get_current_order()[1]
+        edited = original.clone()
+        edited.notes = 'no salt'
+
+        self.orders.replace_items([edited], kind=NOTE_COMMAND)
+        self.assertEqual(self.orders.get_current_order()[1].notes, 'no salt')
+
+        self.orders.undo()
+        self.assertEqual(self.orders.get_current_order()[1].notes, '')
+
+        self.orders.redo()
+        self.assertEqual(self.orders.get_current_order()[1].notes, 'no salt')
+        self.assertEqual(_get_ids(self.orders.get_current_order()),
+                         _get_ids(self.orders.current_order.order_list))
+
+    def test_new_edit_discards_redo(self):
+        self.orders.undo()
+        self.assertTrue(self.orders.can_redo())
+
+        self.orders.add(MenuItem('soda', 2.0))
+
+        self.assertFalse(self.orders.can_redo())
+        self.assertEqual(_get_names(self.orders.get_current_order()),
+                         list(ITEM_NAMES[:-1]) + ['soda'])
+
+    def test_confirm_clears_history(self):
+        self.orders.confirm_order()
+        self.assertFalse(self.orders.can_undo())
+
+
+class FindIndexTest(unittest.TestCase):
+    """Tests that commands find their MenuItems
+    after the order was changed elsewhere.
+    """
+
+    def setUp(self):
+        self.order = OrderStore()
+
+        for name in ITEM_NAMES:
+            self.order.append(MenuItem(name, 5.0))
+
+    def test_remove_after_order_shifted(self):
+        menu_item = self.order.order_list[2]
+        command = ChangeItemsCommand(REMOVE_COMMAND, removed=[(2, menu_item)])
+
+        self.order.insert_item(0, MenuItem('soda', 2.0))
+        command.apply(self.order)
+
+        self.assertEqual(_get_names(self.order.order_list),
+                         ['soda', 'burger', 'fries', 'salad'])
+
+    def test_replace_after_order_shifted(self):
+        edited = self.order.order_list[3].clone()
+        edited.notes = 'no dressing'
+        command = ReplaceItemsCommand(NOTE_COMMAND, [(3, self.order.order_list[3])],
+                                      [(3, edited)])
+
+        self.order.remove(self.order.get_iter((0,)))
+        command.apply(self.order)
+
+        self.assertEqual(self.order.order_list[2].notes, 'no dressing')
+
+    def test_missing_item_raises(self):
+        command = ChangeItemsCommand(REMOVE_COMMAND,
+                                     removed=[(0, MenuItem('soda', 2.0))])
+
+        self.assertRaises(ValueError, command.apply, self.order)
+
+
+class OrderJournalTest(unittest.TestCase):
+    """Tests recovering the edits of orders
+    from the journal.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.journal = OrderJournal(os.path.join(self.directory, 'journal'))
+
+        self.orders = Orders(num_of_tables=2, journal=self.journal)
+        self.table_names = sorted(self.orders.get_orders_list())
+
+    def tearDown(self):
+        self.journal.close()
+        shutil.rmtree(self.directory)
+
+    def _edit_table(self, table_name, names):
+        self.orders.set_current_table(table_name)
+
+        for name in names:
+            self.orders.add(MenuItem(name, 5.0))
+
+    def _recover(self):
+        """Replays the journal on new Orders,
+        as it is on startup.
+        """
+        orders = Orders(num_of_tables=2, journal=self.journal)
+        orders.replay_journal(self.journal.get_pending_records())
+        return orders
+
+    def _get_table(self, orders, table_name):
+        orders.set_current_table(table_name)
+        return orders.get_current_order()
+
+    def test_replay_recovers_edits(self):
+        self._edit_table(self.table_names[0], ITEM_NAMES)
+        self.orders.undo()
+        self.orders.undo()
+        self.orders.redo()
+
+        recovered = self._get_table(self._recover(), self.table_names[0])
+        expected = self._get_table(self.orders, self.table_names[0])
+
+        self.assertEqual(_get_ids(recovered), _get_ids(expected))
+        self.assertEqual(_get_names(recovered), list(ITEM_NAMES[:-1]))
+
+    def test_checkpoint_drops_steps(self):
+        self._edit_table(self.table_names[0], ITEM_NAMES)
+        self._edit_table(self.table_names[1], ITEM_NAMES[:2])
+        self.journal.checkpoint(self.table_names[0])
+
+        records = self.journal.get_pending_records()
+
+        self.assertEqual([record[0] for record in records], [self.table_names[1]])
+        self.assertEqual(len(records[0][2]), 2)
+
+    def test_compact_keeps_pending_steps(self):
+        self._edit_table(self.table_names[0], ITEM_NAMES)
+        self._edit_table(self.table_names[1], ITEM_NAMES[:2])
+        self.journal.checkpoint(self.table_names[0])
+
+        self.journal.compact()
+
+        with open(self.journal.file_path) as journal_file:
+            self.assertEqual(len(journal_file.readlines()), 2)
+
+        recovered = self._get_table(self._recover(), self.table_names[1])
+        self.assertEqual(_get_names(recovered), list(ITEM_NAMES[:2]))
+
+    def test_undecodable_order_is_dropped(self):
+        self._edit_table(self.table_names[0], ITEM_NAMES)
+
+        with open(self.journal.file_path, 'a') as journal_file:
+            journal_file.write('{"name": "%s", "key": "%s", "step": "do", '
+                               '"command": "not a command"}\n' % ((self.table_names[1],) * 2))
+
+        records = self.journal.get_pending_records()
+
+        self.assertEqual([record[0] for record in records], [self.table_names[0]])
+        self.assertEqual([record[0] for record in self.journal.get_pending_records()],
+                         [self.table_names[0]])
+
+    def test_unreplayable_order_is_restored(self):
+        self._edit_table(self.table_names[0], ITEM_NAMES)
+        self.orders.set_current_table(self.table_names[1])
+        self.orders.add(MenuItem('soda', 2.0))
+
+        # removes a MenuItem the saved order doesn't have
+        self.journal.record(self.table_names[1], self.table_names[1], DO_STEP,
+                            ChangeItemsCommand(REMOVE_COMMAND,
+                                               removed=[(0, MenuItem('wine', 9.0))]))
+        self.journal.record(self.table_names[1], self.table_names[1], DO_STEP,
+                            ChangeItemsCommand(ADD_COMMAND,
+                                               inserted=[(0, MenuItem('tea', 2.0))]))
+
+        orders = self._recover()
+
+        self.assertEqual(_get_names(self._get_table(orders, self.table_names[0])),
+                         list(ITEM_NAMES))
+        self.assertEqual(self._get_table(orders, self.table_names[1]), [])
+        self.assertFalse(orders.can_undo())
+        self.assertEqual([record[0] for record in self.journal.get_pending_records()],
+                         [self.table_names[0]])
+
+    def test_sync_writes_lines(self):
+        self._edit_table(self.table_names[0], ITEM_NAMES)
+        self.journal.sync()
+
+        with open(self.journal.file_path) as journal_file:
+            self.assertEqual(len(journal_file.readlines()), len(ITEM_NAMES))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,190 @@
+"""This module tests that the totals kept by
+OrderTotals as an order is edited match the
+totals of CheckOperations, which sum the
+whole order.
+
+Each test edits random orders from a seeded
+random number generator, so that a failure is
+repeatable. Run from the root of the repository
+with:
+
+    python -m unittest discover -s tests -t .
+
+@author: Carl McGraw
+@contact: cjmcgraw@u.washington.edu
+@version: 1.0
+"""
+import random
+import unittest
+
+from peonordersystem.src import CheckOperations
+from peonordersystem.src.MenuItem import MenuItem, DiscountItem, OptionItem
+from peonordersystem.src.OrderTotals import OrderTotals
+from peonordersystem.src.Settings import ORDER_TYPE_STANDARD, ORDER_TYPE_TOGO
+from peonordersystem.src.TaxEngine import TaxEngine
+
+# number of random edits made by each test
+NUM_OF_EDITS = 2000
+
+SEED = 46
+
+ORDER_TYPES = ORDER_TYPE_STANDARD, ORDER_TYPE_TOGO
+
+
+#====================================================================================
+# This block represents functions that generate random orders.
+#====================================================================================
+def _random_item(rng):
+    """Private Function.
+
+    Gets a random MenuItem with random options,
+    or a random DiscountItem.
+
+    @param rng: random.Random object.
+
+    @return: MenuItem object.
+    """
+    if rng.random() < .1:
+        return DiscountItem('discount', -rng.randint(0, 2000) / 100.0, 'discount')
+
+    menu_item = MenuItem(rng.choice(('burger', 'fries', 'beer')),
+                         rng.randint(0, 5000) / 100.0)
+    menu_item.options = [OptionItem('option', 'ADD', rng.randint(0, 300) / 100.0)
+                         for _ in xrange(rng.randint(0, 2))]
+    return menu_item
+
+
+def _edit_item(rng, menu_item):
+    """Private Function.
+
+    Randomly comps, edits the price of or
+    changes the options of the given MenuItem.
+
+    @param rng: random.Random object.
+
+    @param menu_item: MenuItem object.
+
+    @return: None
+    """
+    edit = rng.randint(0, 2)
+
+    if edit == 0:
+        menu_item.comp(not menu_item.is_comped(), 'comped')
+
+    elif edit == 1 and menu_item.get_price_cents() > 0:
+        menu_item.edit_price(rng.randint(0, menu_item.get_price_cents()) / 100.0)
+
+    else:
+        menu_item.options = [OptionItem('option', 'ADD', rng.randint(0, 300) / 100.0)]
+
+
+def _edit_order(rng, order_list, totals):
+    """Private Function.
+
+    Makes a random edit to the given order,
+    and reports it to the given totals as the
+    interface would.
+
+    @param rng: random.Random object.
+
+    @param order_list: list of MenuItem objects.
+
+    @param totals: OrderTotals of the order.
+
+    @return: None
+    """
+    edit = rng.randint(0, 9)
+
+    if edit < 4 or not order_list:
+        menu_item = _random_item(rng)
+        order_list.append(menu_item)
+        totals.add(menu_item)
+
+    elif edit < 7:
+        menu_item = order_list.pop(rng.randrange(len(order_list)))
+        totals.remove(menu_item)
+
+    elif edit < 9:
+        menu_item = rng.choice(order_list)
+        _edit_item(rng, menu_item)
+        totals.update(menu_item)
+
+    else:
+        del order_list[rng.randrange(len(order_list) + 1):]
+        totals.reset(order_list)
+
+
+#====================================================================================
+# This block represents the tests.
+#====================================================================================
+class OrderTotalsTest(unittest.TestCase):
+    """Tests OrderTotals against the totals
+    of CheckOperations.
+    """
+
+    def setUp(self):
+        self.rng = random.Random(SEED)
+
+    def _check_totals(self, order_list, totals):
+        self.assertEqual(totals.get_totals_cents(),
+                         CheckOperations.get_totals_cents(order_list,
+                                                          totals.order_type))
+        self.assertEqual(totals.get_totals(),
+                         CheckOperations.get_totals(order_list, totals.order_type))
+        self.assertEqual(totals.get_tax_breakdown(),
+                         CheckOperations.get_tax_breakdown(order_list,
+                                                           totals.order_type))
+        self.assertEqual(len(totals), len(order_list))
+
+    def test_initial_order(self):
+        for order_type in ORDER_TYPES:
+            order_list = [_random_item(self.rng) for _ in xrange(40)]
+            self._check_totals(order_list, OrderTotals(order_list, order_type))
+
+    def test_edits_match_totals(self):
+        for order_type in ORDER_TYPES:
+            order_list = []
+            totals = OrderTotals(order_type=order_type)
+
+            for _ in xrange(NUM_OF_EDITS):
+                _edit_order(self.rng, order_list, totals)
+                self._check_totals(order_list, totals)
+
+    def test_adding_counted_item_updates_it(self):
+        menu_item = MenuItem('burger', 10.0)
+        totals = OrderTotals([menu_item])
+
+        menu_item.comp(True, 'comped')
+        totals.add(menu_item)
+
+        self._check_totals([menu_item], totals)
+
+    def test_removing_uncounted_item_is_ignored(self):
+        order_list = [MenuItem('burger', 10.0)]
+        totals = OrderTotals(order_list)
+
+        totals.remove(MenuItem('fries', 4.0))
+
+        self._check_totals(order_list, totals)
+
+    def test_edits_match_tax_classes(self):
+        engine = TaxEngine(class_rates={'sales': .10, 'alcohol': .15},
+                           category_classes={'bar': 'alcohol'})
+        engine.set_menu_categories([('bar', MenuItem('beer', 0.0)),
+                                    ('food', MenuItem('burger', 0.0))])
+
+        order_list = []
+        totals = OrderTotals(engine=engine)
+
+        for _ in xrange(NUM_OF_EDITS):
+            _edit_order(self.rng, order_list, totals)
+
+            class_subtotals = engine.get_class_subtotals_cents(order_list)
+            self.assertEqual(totals.get_tax_breakdown_cents(),
+                             engine.get_tax_breakdown_cents(class_subtotals))
+            self.assertEqual(totals.get_subtotal_cents(),
+                             CheckOperations.get_order_subtotal_cents(order_list))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+"""This module tests the functions of the
+Orders module that don't need a display.
+
+Each test generates random orders from a
+seeded random number generator, so that a
+failure is repeatable. Run from the root of
+the repository with:
+
+    python -m unittest discover -s tests -t .
+
+@author: Carl McGraw
+@contact: cjmcgraw@u.washington.edu
+@version: 1.0
+"""
+import random
+import unittest
+
+from peonordersystem.src.MenuItem import MenuItem
+from peonordersystem.src.interface.Orders import _diff_order
+
+# number of random orders generated by each test
+NUM_OF_ORDERS = 500
+
+SEED = 28
+
+
+#====================================================================================
+# This block represents the reference longest common subsequence.
+#====================================================================================
+def _lcs_length(displayed_order, updated_order):
+    """Private Function.
+
+    Gets the length of the longest common
+    subsequence of item ids of the given orders,
+    by dynamic programming.
+
+    @param displayed_order: list of MenuItem objects.
+
+    @param updated_order: list of MenuItem objects.
+
+    @return: int representing the length.
+    """
+    displayed_ids = [menu_item.get_item_id() for menu_item in displayed_order]
+    updated_ids = [menu_item.get_item_id() for menu_item in updated_order]
+
+    lengths = [0] * (len(updated_ids) + 1)
+
+    for displayed_id in displayed_ids:
+        previous = 0
+
+        for index, updated_id in enumerate(updated_ids):
+            current = lengths[index + 1]
+
+            if displayed_id == updated_id:
+                lengths[index + 1] = previous + 1
+            else:
+                lengths[index + 1] = max(current, lengths[index])
+
+            previous = current
+
+    return lengths[-1]
+
+
+#====================================================================================
+# This block represents functions that generate random orders.
+#====================================================================================
+def _random_orders(rng):
+    """Private Function.
+
+    Gets a random displayed order and a random
+    edit of it. The edit removes, reorders and
+    adds MenuItems.
+
+    @param rng: random.Random object.
+
+    @return: 2-tuple of (list, list) representing
+    the displayed and updated orders.
+    """
+    displayed_order = [MenuItem('item', 1.0) for _ in xrange(rng.randint(0, 30))]
+
+    updated_order = [menu_item for menu_item in displayed_order
+                     if rng.random() < .8]
+
+    for _ in xrange(rng.randint(0, 5)):
+        index = rng.randint(0, len(updated_order))
+        updated_order.insert(index, MenuItem('new item', 1.0))
+
+    for _ in xrange(rng.randint(0, 3)):
+        if updated_order:
+            menu_item = updated_order.pop(rng.randrange(len(updated_order)))
+            updated_order.insert(rng.randint(0, len(updated_order)), menu_item)
+
+    return displayed_order, updated_order
+
+
+#====================================================================================
+# This block represents the tests.
+#====================================================================================
+class DiffOrderTest(unittest.TestCase):
+    """Tests the minimal diff of two orders
+    against a reference longest common
+    subsequence.
+    """
+
+    def setUp(self):
+        self.rng = random.Random(SEED)
+
+    def test_kept_items_are_a_longest_common_subsequence(self):
+        for _ in xrange(NUM_OF_ORDERS):
+            displayed_order, updated_order = _random_orders(self.rng)
+            _, _, kept = _diff_order(displayed_order, updated_order)
+
+            self.assertEqual(len(kept), _lcs_length(displayed_order, updated_order))
+
+            for display_index, update_index in kept:
+                self.assertEqual(displayed_order[display_index].get_item_id(),
+                                 updated_order[update_index].get_item_id())
+
+            # both sides of the kept pairs are strictly increasing
+            for (display_a, update_a), (display_b, update_b) in zip(kept, kept[1:]):
+                self.assertTrue(display_a < display_b)
+                self.assertTrue(update_a < update_b)
+
+    def test_diff_transforms_displayed_order(self):
+        for _ in xrange(NUM_OF_ORDERS):
+            displayed_order, updated_order = _random_orders(self.rng)
+            removed, inserted, kept = _diff_order(displayed_order, updated_order)
+
+            self.assertEqual(removed, sorted(removed))
+            self.assertEqual(inserted, sorted(inserted))
+            self.assertEqual(len(removed) + len(kept), len(displayed_order))
+            self.assertEqual(len(inserted) + len(kept), len(updated_order))
+
+            # removes then inserts in ascending order, as OrderStore.edit_order does
+            order = list(displayed_order)
+
+            for index in reversed(removed):
+                order.pop(index)
+
+            for index in inserted:
+                order.insert(index, updated_order[index])
+
+            self.assertEqual([menu_item.get_item_id() for menu_item in order],
+                             [menu_item.get_item_id() for menu_item in updated_order])
+
+    def test_unchanged_order_keeps_every_item(self):
+        displayed_order = [MenuItem('item', 1.0) for _ in xrange(10)]
+
+        self.assertEqual(_diff_order(displayed_order, list(displayed_order)),
+                         ([], [], [(index, index) for index in xrange(10)]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+"""This module tests the PopularityRollup
+against an in memory database. Run from the
+root of the repository with:
+
+    python -m unittest discover -s tests -t .
+
+@author: Carl McGraw
+@contact: cjmcgraw@u.washington.edu
+@version: 1.0
+"""
+import sqlite3
+import unittest
+from datetime import datetime
+from collections import Counter
+
+import jsonpickle
+
+from peonordersystem.src.MenuItem import MenuItem
+from peonordersystem.src.Settings import SQLITE_DATE_TIME_FORMAT_STR
+from peonordersystem.src.confirmationSystem.PopularityRollup import PopularityRollup
+
+MONDAY_NOON = datetime(2014, 6, 2, 12, 15)
+MONDAY_EVENING = datetime(2014, 6, 2, 18, 0)
+TUESDAY_MORNING = datetime(2014, 6, 3, 9, 30)
+
+
+def _items(*names):
+    """Private Function.
+
+    Gets a MenuItem for each of the
+    given names.
+
+    @param names: str representing the names.
+
+    @return: list of MenuItem objects.
+    """
+    return [MenuItem(name, 1.0) for name in names]
+
+
+class PopularItemsTest(unittest.TestCase):
+    """Tests that the popular items of a slot
+    are filled with the most popular items
+    overall.
+    """
+
+    def setUp(self):
+        self.database = sqlite3.connect(':memory:')
+        self.rollup = PopularityRollup(self.database)
+
+        self.rollup.record(_items('soup', 'soup', 'soup', 'salad'),
+                           set_time=MONDAY_NOON)
+        self.rollup.record(_items('eggs', 'eggs', 'eggs', 'eggs', 'eggs'),
+                           set_time=TUESDAY_MORNING)
+
+    def test_slot_items_rank_first(self):
+        self.assertEqual(self.rollup.get_popular_items(2, set_time=MONDAY_NOON),
+                         ['soup', 'salad'])
+
+    def test_slot_is_filled_from_totals(self):
+        self.assertEqual(self.rollup.get_popular_items(3, set_time=MONDAY_NOON),
+                         ['soup', 'salad', 'eggs'])
+
+    def test_empty_slot_uses_totals(self):
+        self.assertEqual(self.rollup.get_popular_items(3, set_time=MONDAY_EVENING),
+                         ['eggs', 'soup', 'salad'])
+        self.assertEqual(self.rollup.get_popular_items(1, set_time=MONDAY_EVENING),
+                         ['eggs'])
+
+    def test_notifications_are_not_counted(self):
+        menu_item = MenuItem('cake', 1.0)
+        menu_item.comp(True, 'birthday')
+        self.rollup.record([menu_item], set_time=MONDAY_NOON)
+
+        self.assertNotIn('cake', self.rollup.get_popular_items(5,
+                                                               set_time=MONDAY_NOON))
+
+    def test_counts_are_stored(self):
+        rollup = PopularityRollup(self.database)
+
+        for set_time in (MONDAY_NOON, MONDAY_EVENING):
+            self.assertEqual(rollup.get_popular_items(3, set_time=set_time),
+                             self.rollup.get_popular_items(3, set_time=set_time))
+
+
+class SeedTest(unittest.TestCase):
+    """Tests that a new ItemPopularityData table
+    is seeded from the stored orders.
+    """
+
+    def setUp(self):
+        self.database = sqlite3.connect(':memory:')
+        self.database.execute('CREATE TABLE OrderData '
+                              '    (   OrderDate NUMERIC,'
+                              '        OrderNotifications_json TEXT,'
+                              '        OrderItemFrequency_json TEXT'
+                              '    );')
+
+        notification = MenuItem('cake', 1.0)
+        notification.comp(True, 'birthday')
+
+        for set_time, names, notifications in ((MONDAY_NOON, ('soup', 'soup'), []),
+                                               (MONDAY_NOON, ('soup', 'salad', 'cake'),
+                                                [notification]),
+                                               (TUESDAY_MORNING, ('eggs',), [])):
+            self.database.execute('INSERT INTO OrderData VALUES (?, ?, ?);',
+                                  (set_time.strftime(SQLITE_DATE_TIME_FORMAT_STR),
+                                   jsonpickle.encode(notifications),
+                                   jsonpickle.encode(Counter(names))))
+
+    def test_seeded_from_stored_orders(self):
+        rollup = PopularityRollup(self.database)
+
+        self.assertEqual(rollup.get_popular_items(5, set_time=MONDAY_NOON),
+                         ['soup', 'salad', 'eggs'])
+        self.assertEqual(rollup.get_popular_items(1, set_time=TUESDAY_MORNING),
+                         ['eggs'])
+
+    def test_seeded_once(self):
+        PopularityRollup(self.database)
+        rollup = PopularityRollup(self.database)
+
+        self.assertEqual(rollup._totals, Counter(soup=3, salad=1, eggs=1))
+
+
+if __name__ == '__main__':
+    unittest.main()
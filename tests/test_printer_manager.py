@@ -0,0 +1,190 @@
+"""This module tests the routing, queueing and
+retrying of print jobs by the PrinterManager,
+using simulated printers.
+
+Run from the root of the repository with:
+
+    python -m unittest discover -s tests -t .
+
+@author: Carl McGraw
+@contact: cjmcgraw@u.washington.edu
+@version: 1.0
+"""
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from peonordersystem.src.confirmationSystem.printers.PrinterManager import (PrinterManager,
+                                                                             PrintJob)
+from peonordersystem.src.confirmationSystem.printers.adapters.SimulatedPrinterAdapter \
+    import SimulatedPrinterAdapter
+
+PRIMARY = 'primary'
+FALLBACK = 'fallback'
+
+
+class BlockingPrinterAdapter(SimulatedPrinterAdapter):
+    """Simulated printer that checks that the
+    manager can be used while it is being called,
+    as a slow print server would be.
+    """
+
+    def __init__(self, printer_name, manager_getter):
+        super(BlockingPrinterAdapter, self).__init__(printer_name)
+        self._manager_getter = manager_getter
+        self.was_blocked = False
+
+    def submit(self, data_file_str, title_str, options):
+        thread = threading.Thread(target=self._manager_getter().get_ledger)
+        thread.daemon = True
+        thread.start()
+        thread.join(1.0)
+        self.was_blocked = self.was_blocked or thread.is_alive()
+
+        return super(BlockingPrinterAdapter, self).submit(data_file_str, title_str,
+                                                          options)
+
+
+class PrinterManagerTest(unittest.TestCase):
+    """Tests the PrinterManager against a
+    primary and a fallback simulated printer.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.directory, 'receipt.pdf')
+
+        with open(self.file_path, 'w') as data_file:
+            data_file.write('receipt')
+
+        self.printers = {PRIMARY: SimulatedPrinterAdapter(PRIMARY),
+                         FALLBACK: SimulatedPrinterAdapter(FALLBACK)}
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _create_manager(self, **kwargs):
+        kwargs.setdefault('job_timeout', 60)
+        kwargs.setdefault('max_failures', 3)
+        kwargs.setdefault('ledger_size', 10)
+
+        return PrinterManager(adapter_factory=self.printers.__getitem__,
+                              spool_path=os.path.join(self.directory, 'spool'),
+                              **kwargs)
+
+    def _submit(self, manager):
+        return manager.submit(self.file_path, 'receipt', {}, (PRIMARY, FALLBACK))
+
+    def test_job_is_printed_on_primary(self):
+        manager = self._create_manager()
+        job = self._submit(manager)
+
+        self.assertEqual(job.state, PrintJob.SUBMITTED)
+        self.assertEqual(job.printer_name, PRIMARY)
+
+        self.printers[PRIMARY].complete_jobs()
+        manager.poll()
+
+        self.assertEqual(job.state, PrintJob.COMPLETED)
+        self.assertFalse(os.path.exists(job.file_path))
+
+    def test_job_fails_over_to_fallback(self):
+        self.printers[PRIMARY].available = False
+        manager = self._create_manager()
+        job = self._submit(manager)
+
+        self.assertEqual(job.state, PrintJob.SUBMITTED)
+        self.assertEqual(job.printer_name, FALLBACK)
+        self.assertEqual(self.printers[FALLBACK].get_pending_jobs(), [job.job_id])
+
+    def test_job_is_queued_until_a_printer_is_available(self):
+        self.printers[PRIMARY].available = False
+        self.printers[FALLBACK].available = False
+        manager = self._create_manager()
+        job = self._submit(manager)
+
+        self.assertEqual(job.state, PrintJob.QUEUED)
+        manager.poll()
+        self.assertEqual(job.state, PrintJob.QUEUED)
+
+        self.printers[FALLBACK].available = True
+        manager.poll()
+
+        self.assertEqual(job.state, PrintJob.SUBMITTED)
+        self.assertEqual(job.printer_name, FALLBACK)
+        self.assertEqual(job.failures, 0)
+
+    def test_job_is_rerouted_when_its_printer_goes_down(self):
+        manager = self._create_manager()
+        job = self._submit(manager)
+
+        self.printers[PRIMARY].available = False
+        manager.poll()
+
+        self.assertEqual(job.printer_name, FALLBACK)
+        self.assertEqual(job.failures, 0)
+        self.assertEqual(self.printers[PRIMARY].get_pending_jobs(), [])
+
+    def test_job_is_retried_after_timeout(self):
+        manager = self._create_manager(job_timeout=0)
+        job = self._submit(manager)
+        first_job_id = job.job_id
+
+        job.submitted_time -= 1
+        manager.poll()
+
+        self.assertEqual(job.state, PrintJob.SUBMITTED)
+        self.assertEqual(job.failures, 1)
+        self.assertEqual(job.attempts, 2)
+        self.assertNotEqual(job.job_id, first_job_id)
+        self.assertEqual(self.printers[PRIMARY].get_job_state(first_job_id),
+                         SimulatedPrinterAdapter.JOB_FAILED)
+
+    def test_job_fails_after_max_failures(self):
+        manager = self._create_manager(max_failures=2)
+        job = self._submit(manager)
+
+        self.printers[PRIMARY].fail_job(job.job_id)
+        manager.poll()
+        self.assertEqual(job.state, PrintJob.SUBMITTED)
+
+        self.printers[PRIMARY].fail_job(job.job_id)
+        manager.poll()
+
+        self.assertEqual(job.state, PrintJob.FAILED)
+        self.assertEqual(job.failures, 2)
+        self.assertEqual(manager.get_unfinished_jobs(), [])
+        self.assertFalse(os.path.exists(job.file_path))
+
+    def test_ledger_is_pruned_to_ledger_size(self):
+        manager = self._create_manager(ledger_size=3)
+        unfinished = manager.submit(self.file_path, 'receipt', {}, (FALLBACK,))
+
+        for _ in xrange(5):
+            job = self._submit(manager)
+            self.printers[PRIMARY].complete_jobs()
+            manager.poll()
+            self.assertEqual(job.state, PrintJob.COMPLETED)
+
+        ledger_ids = [record['ledger_id'] for record in manager.get_ledger()]
+
+        # the unfinished job is kept, along with the newest finished jobs
+        self.assertEqual(ledger_ids, [unfinished.ledger_id] +
+                         range(unfinished.ledger_id + 3, unfinished.ledger_id + 6))
+
+    def test_adapter_is_called_outside_of_lock(self):
+        manager = None
+        self.printers[PRIMARY] = BlockingPrinterAdapter(PRIMARY, lambda: manager)
+        manager = self._create_manager()
+
+        job = self._submit(manager)
+        self.printers[PRIMARY].fail_job(job.job_id)
+        manager.poll()
+
+        self.assertFalse(self.printers[PRIMARY].was_blocked)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,190 @@
+"""This module tests the ReservationsRepository
+against an in memory database. Run from the
+root of the repository with:
+
+    python -m unittest discover -s tests -t .
+
+@author: Carl McGraw
+@contact: cjmcgraw@u.washington.edu
+@version: 1.0
+"""
+import sqlite3
+import unittest
+from datetime import datetime, date, time, timedelta
+
+import jsonpickle
+
+from peonordersystem.src.Settings import SQLITE_DATE_TIME_FORMAT_STR
+from peonordersystem.src.interface.Reservations import Reserver
+from peonordersystem.src.confirmationSystem.ReservationsRepository import \
+    ReservationsRepository
+
+NUM_OF_RESERVATIONS = 10
+
+# reservations must be in the future, so they are made two days from now
+START_TIME = datetime.combine(date.today() + timedelta(days=2), time(0))
+
+
+def _hours(hours):
+    """Private Function.
+
+    Gets the time the given number of
+    hours after START_TIME.
+
+    @param hours: int
+
+    @return: datetime object.
+    """
+    return START_TIME + timedelta(hours=hours)
+
+
+def _names(reservers):
+    """Private Function.
+
+    Gets the names of the given reservations.
+
+    @param reservers: list of Reserver objects.
+
+    @return: list of str
+    """
+    return [reserver.name for reserver in reservers]
+
+
+class ReservationsRepositoryTest(unittest.TestCase):
+    """Tests the range and page queries, and
+    updating and deleting reservations by id.
+    """
+
+    def setUp(self):
+        self.repository = ReservationsRepository(sqlite3.connect(':memory:'))
+
+        # added out of order, one reservation each hour
+        self.reservers = [Reserver(str(hour), '555-0100', _hours(hour))
+                          for hour in xrange(NUM_OF_RESERVATIONS)]
+        self.repository.bulk_import(reversed(self.reservers))
+
+    def test_range_is_ordered_and_excludes_end(self):
+        self.assertEqual(_names(self.repository.get_range(_hours(2), _hours(5))),
+                         ['2', '3', '4'])
+        self.assertEqual(self.repository.count_range(_hours(2), _hours(5)), 3)
+        self.assertEqual(self.repository.count_range(_hours(0), _hours(24)),
+                         NUM_OF_RESERVATIONS)
+
+    def test_range_limit_and_offset(self):
+        self.assertEqual(_names(self.repository.get_range(_hours(0), _hours(24),
+                                                          limit=2, offset=3)),
+                         ['3', '4'])
+
+    def test_pages(self):
+        end_time = _hours(24)
+
+        self.assertEqual(_names(self.repository.get_page(_hours(0), end_time, 0,
+                                                         page_size=4)),
+                         ['0', '1', '2', '3'])
+        self.assertEqual(_names(self.repository.get_page(_hours(0), end_time, 2,
+                                                         page_size=4)),
+                         ['8', '9'])
+        self.assertEqual(self.repository.get_page(_hours(0), end_time, 3,
+                                                  page_size=4), [])
+
+    def test_range_summary(self):
+        reserver = self.reservers[1]
+
+        self.assertEqual(self.repository.get_range_summary(_hours(1), _hours(2)),
+                         [(reserver.get_reservation_id(), '1', '555-0100',
+                           _hours(1))])
+
+    def test_next_hours(self):
+        self.assertEqual(_names(self.repository.get_next_hours(2, _hours(3))),
+                         ['3', '4'])
+
+    def test_get_by_id(self):
+        reserver = self.reservers[4]
+        stored = self.repository.get(reserver.get_reservation_id())
+
+        self.assertEqual(stored.name, '4')
+        self.assertEqual(stored.get_reservation_id(), reserver.get_reservation_id())
+        self.assertEqual(self.repository.get('unknown'), None)
+
+    def test_update_by_id(self):
+        reserver = self.reservers[0]
+        reserver.name = 'moved'
+        reserver._arrival_time = _hours(20)
+
+        self.assertTrue(self.repository.update(reserver))
+        self.assertEqual(self.repository.get(reserver.get_reservation_id()).name,
+                         'moved')
+        self.assertEqual(_names(self.repository.get_range(_hours(15), _hours(24))),
+                         ['moved'])
+        self.assertEqual(self.repository.count_range(_hours(0), _hours(1)), 0)
+
+        unknown = Reserver('unknown', '555-0100', _hours(1))
+        self.assertFalse(self.repository.update(unknown))
+
+    def test_delete_by_id(self):
+        reservation_id = self.reservers[5].get_reservation_id()
+
+        self.assertTrue(self.repository.delete(reservation_id))
+        self.assertFalse(self.repository.delete(reservation_id))
+        self.assertEqual(self.repository.get(reservation_id), None)
+        self.assertEqual(self.repository.count_range(_hours(0), _hours(24)),
+                         NUM_OF_RESERVATIONS - 1)
+
+    def test_import_replaces_stored_reservations(self):
+        self.assertEqual(self.repository.bulk_import(self.reservers),
+                         NUM_OF_RESERVATIONS)
+        self.assertEqual(self.repository.count_range(_hours(0), _hours(24)),
+                         NUM_OF_RESERVATIONS)
+
+
+class MigrationTest(unittest.TestCase):
+    """Tests that a ReservationsData table created
+    before reservation ids is given the id column,
+    and its rows are given ids.
+    """
+
+    def setUp(self):
+        self.database = sqlite3.connect(':memory:')
+        self.database.execute('CREATE TABLE ReservationsData '
+                              '    (   ReservationName TEXT,'
+                              '        ReservationTime NUMERIC,'
+                              '        ReservationNumber TEXT,'
+                              '        ReservationData_json TEXT'
+                              '    );')
+
+        for hour in xrange(3):
+            reserver = Reserver(str(hour), '555-0100', _hours(hour))
+            self.database.execute('INSERT INTO ReservationsData VALUES '
+                                  '    (?, ?, ?, ?);',
+                                  (reserver.name,
+                                   _hours(hour).strftime(SQLITE_DATE_TIME_FORMAT_STR),
+                                   reserver.number, jsonpickle.encode(reserver)))
+
+        self.database.commit()
+
+    def _get_ids(self):
+        return [row[0] for row in self.database.execute(
+            'SELECT ReservationID FROM ReservationsData ORDER BY ReservationTime;')]
+
+    def test_rows_are_given_ids(self):
+        repository = ReservationsRepository(self.database)
+        reservation_ids = self._get_ids()
+
+        self.assertEqual(len(set(reservation_ids)), 3)
+        self.assertNotIn(None, reservation_ids)
+
+        # the stored id replaces the one that was serialized
+        reservers = repository.get_range(_hours(0), _hours(24))
+        self.assertEqual([reserver.get_reservation_id() for reserver in reservers],
+                         reservation_ids)
+
+    def test_ids_are_kept(self):
+        ReservationsRepository(self.database)
+        reservation_ids = self._get_ids()
+        ReservationsRepository(self.database)
+
+        self.assertEqual(self._get_ids(), reservation_ids)
+
+
+if __name__ == '__main__':
+    unittest.main()
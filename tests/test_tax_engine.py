@@ -0,0 +1,97 @@
+"""This module tests that the TaxEngine taxes
+orders with discounts by allocating the
+discounts across the tax classes.
+
+Run from the root of the repository with:
+
+    python -m unittest discover -s tests -t .
+
+@author: Carl McGraw
+@contact: cjmcgraw@u.washington.edu
+@version: 1.0
+"""
+import random
+import unittest
+from fractions import Fraction
+
+from peonordersystem.src.MenuItem import MenuItem, DiscountItem
+from peonordersystem.src.TaxEngine import TaxEngine
+
+# number of random allocations made by each test
+NUM_OF_ALLOCATIONS = 1000
+
+SEED = 47
+
+
+class DiscountAllocationTest(unittest.TestCase):
+    """Tests the allocation of discounts to
+    a food and an alcohol tax class.
+    """
+
+    def setUp(self):
+        self.rng = random.Random(SEED)
+        self.engine = TaxEngine(class_rates={'sales': .10, 'alcohol': .20},
+                                category_classes={'bar': 'alcohol'})
+        self.engine.set_menu_categories([('bar', MenuItem('beer', 0.0)),
+                                         ('food', MenuItem('burger', 0.0))])
+
+    def _get_tax_breakdown(self, order_list):
+        class_subtotals = self.engine.get_class_subtotals_cents(order_list)
+        return self.engine.get_tax_breakdown_cents(class_subtotals)
+
+    def test_discount_is_allocated_in_proportion(self):
+        order_list = [MenuItem('burger', 30.0), MenuItem('beer', 10.0),
+                      DiscountItem('discount', -8.0, 'discount')]
+
+        self.assertEqual(self.engine.get_class_subtotals_cents(order_list),
+                         {'sales': 2400, 'alcohol': 800})
+        self.assertEqual(self._get_tax_breakdown(order_list),
+                         {'sales': 240, 'alcohol': 160})
+
+    def test_discount_never_taxes_a_class_below_zero(self):
+        order_list = [MenuItem('burger', 2.0), MenuItem('beer', 10.0),
+                      DiscountItem('discount', -5.0, 'discount')]
+
+        class_subtotals = self.engine.get_class_subtotals_cents(order_list)
+
+        # the discount used to come off the food alone, taxing it at -3.00
+        self.assertTrue(all(subtotal >= 0 for subtotal in class_subtotals.itervalues()))
+        self.assertEqual(sum(class_subtotals.itervalues()), 700)
+
+    def test_discount_larger_than_order_clears_every_class(self):
+        order_list = [MenuItem('burger', 2.0), MenuItem('beer', 3.0),
+                      DiscountItem('discount', -10.0, 'discount')]
+
+        self.assertEqual(self.engine.get_class_subtotals_cents(order_list),
+                         {'sales': 0, 'alcohol': 0})
+        self.assertEqual(self._get_tax_breakdown(order_list), {})
+
+    def test_remaining_cents_go_to_largest_remainders(self):
+        class_subtotals = {'sales': 100, 'alcohol': 200}
+
+        # exact shares are 0.33 and 0.67 of a cent
+        self.assertEqual(self.engine.allocate_discount_cents(class_subtotals, -1),
+                         {'sales': 100, 'alcohol': 199})
+
+    def test_random_allocations(self):
+        for _ in xrange(NUM_OF_ALLOCATIONS):
+            class_subtotals = {'sales': self.rng.randint(0, 10 ** 5),
+                               'alcohol': self.rng.randint(0, 10 ** 5)}
+            discount = -self.rng.randint(0, 10 ** 5)
+
+            total = sum(class_subtotals.itervalues())
+            allocated = self.engine.allocate_discount_cents(class_subtotals,
+                                                            discount)
+
+            self.assertEqual(sum(allocated.itervalues()), max(total + discount, 0))
+
+            for tax_class, subtotal in class_subtotals.iteritems():
+                share = subtotal - allocated[tax_class]
+                exact_share = Fraction(min(-discount, total) * subtotal, total or 1)
+
+                self.assertTrue(0 <= allocated[tax_class] <= subtotal)
+                self.assertTrue(abs(share - exact_share) < 1)
+
+
+if __name__ == '__main__':
+    unittest.main()